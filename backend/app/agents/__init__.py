@@ -4,6 +4,12 @@ Planning Explorer AI Agents
 This package contains specialized agents for data enrichment and processing.
 """
 
-from .enrichment.applicant_agent import ApplicantEnrichmentAgent, enrich_applicant_data
-
 __all__ = ["ApplicantEnrichmentAgent", "enrich_applicant_data"]
+
+
+def __getattr__(name):
+    # Imported on first access so loading one agent subpackage doesn't pull in the enrichment stack
+    if name in __all__:
+        from .enrichment import applicant_agent
+        return getattr(applicant_agent, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
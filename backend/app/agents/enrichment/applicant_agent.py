@@ -6,15 +6,16 @@ and agent names from UK planning portal websites using multiple strategies.
 """
 
 import asyncio
+import re
 import time
 import logging
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-from bs4 import BeautifulSoup
 
 from .portal_detectors import PortalDetector
 from .utils.validators import ApplicantDataValidator
+from .utils.html_index import ParsedPage
 
 # MCP clients will be imported when available
 try:
@@ -28,6 +29,8 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DOCUMENT_COUNT_PATTERN = re.compile(r'Documents?\s*\(?\d+\)?', re.IGNORECASE)
+
 
 class ApplicantEnrichmentAgent:
     """
@@ -198,17 +201,20 @@ class ApplicantEnrichmentAgent:
             # Scrape with Firecrawl
             html_content = await self.firecrawl.fetch(details_url)
 
+            # Parse once; every extractor reads the label/value index
+            page = ParsedPage(html_content)
+
             # Extract using table parsing
-            applicant_name = self._extract_table_value(html_content, "Applicant Name")
-            agent_name = self._extract_table_value(html_content, "Agent Name")
-            ward_name = self._extract_table_value(html_content, "Ward")
-            decided_date = self._extract_table_value(html_content, "Decision Date")
+            applicant_name = self._extract_table_value(page, "Applicant Name")
+            agent_name = self._extract_table_value(page, "Agent Name")
+            ward_name = self._extract_table_value(page, "Ward")
+            decided_date = self._extract_table_value(page, "Decision Date")
 
             # Extract number of documents from the documents tab
-            n_documents = self._extract_document_count(html_content, url)
+            n_documents = self._extract_document_count(page, url)
 
             # Extract statutory days or target date
-            n_statutory_days = self._extract_statutory_days(html_content)
+            n_statutory_days = self._extract_statutory_days(page)
 
             # Build docs URL
             docs_url = self._build_docs_url(url)
@@ -239,11 +245,11 @@ class ApplicantEnrichmentAgent:
         try:
             logger.debug(f"Fetching custom portal: {url}")
 
-            html_content = await self.firecrawl.fetch(url)
+            page = ParsedPage(await self.firecrawl.fetch(url))
 
             # Extract using definition list or labeled fields
-            applicant_name = self._extract_labeled_field(html_content, "Applicant:")
-            agent_name = self._extract_labeled_field(html_content, "Agent:")
+            applicant_name = self._extract_labeled_field(page, "Applicant:")
+            agent_name = self._extract_labeled_field(page, "Agent:")
 
             return {
                 "applicant_name": applicant_name,
@@ -261,14 +267,14 @@ class ApplicantEnrichmentAgent:
             return await self._extract_adaptive(url)
 
         try:
-            html_content = await self.firecrawl.fetch(url)
+            page = ParsedPage(await self.firecrawl.fetch(url))
 
             applicant_name = self._extract_by_selector(
-                html_content,
+                page,
                 pattern['applicant_selector']
             )
             agent_name = self._extract_by_selector(
-                html_content,
+                page,
                 pattern['agent_selector']
             )
 
@@ -327,117 +333,79 @@ class ApplicantEnrichmentAgent:
             logger.error(f"Adaptive extraction failed: {e}")
             return None
 
-    def _extract_table_value(self, html: str, label: str) -> Optional[str]:
+    def _extract_table_value(self, page: Union[str, ParsedPage], label: str) -> Optional[str]:
         """
         Extract value from HTML table by label.
 
         Args:
-            html: HTML content
+            page: Parsed page (or raw HTML)
             label: Field label to search for
 
         Returns:
             Extracted value or None
         """
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Try th + td in same row (Dover Idox pattern)
-        for row in soup.find_all('tr'):
-            th = row.find('th')
-            td = row.find('td')
-
-            if th and td and label.lower() in th.get_text().lower():
-                value = td.get_text().strip()
-                return ApplicantDataValidator.clean(value)
-
-            # Also try td/td pairs (other portals)
-            cells = row.find_all('td')
-            if len(cells) >= 2:
-                if label.lower() in cells[0].get_text().lower():
-                    value = cells[1].get_text().strip()
-                    return ApplicantDataValidator.clean(value)
-
-        return None
+        value = ParsedPage.of(page).table_value(label)
+        return ApplicantDataValidator.clean(value) if value is not None else None
 
-    def _extract_labeled_field(self, html: str, label: str) -> Optional[str]:
+    def _extract_labeled_field(self, page: Union[str, ParsedPage], label: str) -> Optional[str]:
         """
         Extract value from labeled field (dt/dd structure or similar).
 
         Args:
-            html: HTML content
+            page: Parsed page (or raw HTML)
             label: Field label to search for
 
         Returns:
             Extracted value or None
         """
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Try dt/dd structure
-        for dt in soup.find_all('dt'):
-            if label.lower() in dt.get_text().lower():
-                dd = dt.find_next_sibling('dd')
-                if dd:
-                    value = dd.get_text().strip()
-                    return ApplicantDataValidator.clean(value)
-
-        # Try labeled div/span structures
-        for elem in soup.find_all(['div', 'span', 'label']):
-            if label.lower() in elem.get_text().lower():
-                # Look for next sibling or child
-                next_elem = elem.find_next_sibling()
-                if next_elem:
-                    value = next_elem.get_text().strip()
-                    return ApplicantDataValidator.clean(value)
+        page = ParsedPage.of(page)
 
-        return None
-
-    def _extract_by_selector(self, html: str, selector: str) -> Optional[str]:
-        """Extract value using CSS selector."""
-        soup = BeautifulSoup(html, 'html.parser')
-        elem = soup.select_one(selector)
+        # Try dt/dd structure, then labeled div/span structures
+        value = page.definition_value(label)
+        if value is None:
+            value = page.labeled_element_value(label)
 
-        if elem:
-            value = elem.get_text().strip()
-            return ApplicantDataValidator.clean(value)
+        return ApplicantDataValidator.clean(value) if value is not None else None
 
-        return None
+    def _extract_by_selector(self, page: Union[str, ParsedPage], selector: str) -> Optional[str]:
+        """Extract value using CSS selector."""
+        value = ParsedPage.of(page).select_text(selector)
+        return ApplicantDataValidator.clean(value) if value is not None else None
 
-    def _extract_document_count(self, html: str, base_url: str) -> Optional[int]:
+    def _extract_document_count(self, page: Union[str, ParsedPage], base_url: str) -> Optional[int]:
         """
         Extract number of documents from the summary page or documents tab.
 
         For Idox portals, this is typically shown on the summary tab.
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        page = ParsedPage.of(page)
 
         # Look for "Documents" link/button with count
         # Common patterns: "Documents (38)", "38 Documents", etc.
-        import re
-
-        # Try to find documents tab or link
-        docs_tab = soup.find(string=re.compile(r'Documents?\s*\(?\d+\)?', re.IGNORECASE))
+        docs_tab = page.find_text(DOCUMENT_COUNT_PATTERN)
         if docs_tab:
             match = re.search(r'(\d+)', docs_tab)
             if match:
                 return int(match.group(1))
 
         # Try to find in table with label "Number of Documents" or similar
-        doc_count = self._extract_table_value(html, "Number of Documents")
+        doc_count = self._extract_table_value(page, "Number of Documents")
         if doc_count and doc_count.isdigit():
             return int(doc_count)
 
         return None
 
-    def _extract_statutory_days(self, html: str) -> Optional[int]:
+    def _extract_statutory_days(self, page: Union[str, ParsedPage]) -> Optional[int]:
         """Extract statutory days or calculate from target determination date."""
-        soup = BeautifulSoup(html, 'html.parser')
+        page = ParsedPage.of(page)
 
         # Try to find statutory period directly
-        statutory = self._extract_table_value(html, "Statutory Period")
+        statutory = self._extract_table_value(page, "Statutory Period")
         if statutory and statutory.replace(' days', '').isdigit():
             return int(statutory.replace(' days', ''))
 
         # Try target determination date
-        target_date = self._extract_table_value(html, "Target Determination Date")
+        target_date = self._extract_table_value(page, "Target Determination Date")
         if target_date:
             # Could calculate days from submission to target, but for now just return standard 56
             return 56  # Standard for most applications
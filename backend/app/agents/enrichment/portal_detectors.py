@@ -40,6 +40,15 @@ class PortalDetector:
         # Add more custom portals as they're discovered and patterns learned
     }
 
+    # Crawl politeness per portal category. Idox portals share vendor
+    # infrastructure and rate-limit aggressively; unknown portals are
+    # rendered with a full browser, so keep them to one at a time.
+    CRAWL_POLICIES = {
+        "idox": {"max_concurrent": 2, "min_interval_ms": 1000},
+        "custom": {"max_concurrent": 2, "min_interval_ms": 500},
+        "unknown": {"max_concurrent": 1, "min_interval_ms": 2000},
+    }
+
     @classmethod
     def detect(cls, url: str) -> PortalType:
         """
@@ -165,6 +174,27 @@ class PortalDetector:
                 "confidence": "medium"
             }
 
+    @classmethod
+    def get_crawl_policy(cls, url: str) -> dict:
+        """
+        Get politeness limits for crawling a portal.
+
+        Args:
+            url: Planning application URL
+
+        Returns:
+            Dictionary with:
+            - domain: Portal domain the limits apply to
+            - max_concurrent: Max simultaneous requests to the domain
+            - min_interval_ms: Minimum delay between request starts
+
+        Example:
+            >>> PortalDetector.get_crawl_policy("https://publicaccess.dover.gov.uk/...")
+            {'domain': 'publicaccess.dover.gov.uk', 'max_concurrent': 2, 'min_interval_ms': 1000}
+        """
+        category = cls.get_portal_info(url)["category"]
+        return {"domain": urlparse(url).netloc.lower(), **cls.CRAWL_POLICIES[category]}
+
     @classmethod
     def add_custom_portal(cls, domain: str, portal_type: str) -> None:
         """
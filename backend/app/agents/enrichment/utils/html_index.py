@@ -0,0 +1,144 @@
+"""
+Single-parse HTML access for enrichment extractors.
+
+A portal page is parsed once (lxml when installed, html.parser otherwise)
+and every th/td, td/td and dt/dd label/value pair is indexed in one
+traversal. Extractors query the index instead of re-parsing the page.
+"""
+
+from typing import List, Optional, Pattern, Tuple
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# (lower-cased label text, value text)
+Field = Tuple[str, str]
+
+
+class ParsedPage:
+    """
+    Parsed portal page with a label -> value index.
+
+    Lookups keep the semantics of the original per-call extractors: the
+    first pair (in document order) whose label contains the requested
+    label, case-insensitively.
+    """
+
+    def __init__(self, html: str):
+        self.html = html or ""
+        self.table_fields: List[Field] = []
+        self.definition_fields: List[Field] = []
+        self._labeled_elements: Optional[List[Field]] = None
+        self._soup: Optional[BeautifulSoup] = None
+        self._root = None
+
+        if LXML_AVAILABLE and self.html.strip():
+            try:
+                self._root = lxml.html.fromstring(self.html)
+            except (ValueError, etree.ParserError):
+                self._root = None
+
+        if self._root is not None:
+            self._index_lxml()
+        else:
+            self._index_soup()
+
+    @classmethod
+    def of(cls, page) -> "ParsedPage":
+        """Accept raw HTML or an already parsed page"""
+        return page if isinstance(page, cls) else cls(page)
+
+    # ------------------------------------------------------------------
+    # Index construction (one traversal)
+    # ------------------------------------------------------------------
+
+    def _index_lxml(self):
+        for element in self._root.iter('tr', 'dt'):
+            if element.tag == 'tr':
+                self._add_row(
+                    element.find('.//th'),
+                    element.findall('.//td'),
+                    lambda e: e.text_content()
+                )
+            else:
+                dd = next((s for s in element.itersiblings() if s.tag == 'dd'), None)
+                if dd is not None:
+                    self.definition_fields.append((element.text_content().lower(), dd.text_content().strip()))
+
+    def _index_soup(self):
+        for element in self._get_soup().find_all(['tr', 'dt']):
+            if element.name == 'tr':
+                self._add_row(element.find('th'), element.find_all('td'), lambda e: e.get_text())
+            else:
+                dd = element.find_next_sibling('dd')
+                if dd is not None:
+                    self.definition_fields.append((element.get_text().lower(), dd.get_text().strip()))
+
+    def _add_row(self, th, cells, text):
+        # th + td in same row (Idox pattern), then td/td pairs (other portals)
+        if th is not None and cells:
+            self.table_fields.append((text(th).lower(), text(cells[0]).strip()))
+        if len(cells) >= 2:
+            self.table_fields.append((text(cells[0]).lower(), text(cells[1]).strip()))
+
+    def _get_soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, 'lxml' if LXML_AVAILABLE else 'html.parser')
+        return self._soup
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _find(fields: List[Field], label: str) -> Optional[str]:
+        label = label.lower()
+        for field_label, value in fields:
+            if label in field_label:
+                return value
+        return None
+
+    def table_value(self, label: str) -> Optional[str]:
+        """Value of the first table row whose label contains `label`"""
+        return self._find(self.table_fields, label)
+
+    def definition_value(self, label: str) -> Optional[str]:
+        """Value of the first dt/dd pair whose term contains `label`"""
+        return self._find(self.definition_fields, label)
+
+    def labeled_element_value(self, label: str) -> Optional[str]:
+        """Text of the element following a div/span/label containing `label`"""
+        if self._labeled_elements is None:
+            self._labeled_elements = []
+            if self._root is not None:
+                for element in self._root.iter('div', 'span', 'label'):
+                    sibling = element.getnext()
+                    while sibling is not None and not isinstance(sibling.tag, str):
+                        sibling = sibling.getnext()  # Skip comments
+                    if sibling is not None:
+                        self._labeled_elements.append((element.text_content().lower(), sibling.text_content().strip()))
+            else:
+                for element in self._get_soup().find_all(['div', 'span', 'label']):
+                    sibling = element.find_next_sibling()
+                    if sibling is not None:
+                        self._labeled_elements.append((element.get_text().lower(), sibling.get_text().strip()))
+        return self._find(self._labeled_elements, label)
+
+    def select_text(self, selector: str) -> Optional[str]:
+        """Text of the first element matching a CSS selector"""
+        element = self._get_soup().select_one(selector)
+        return element.get_text().strip() if element is not None else None
+
+    def find_text(self, pattern: Pattern) -> Optional[str]:
+        """First text node matching a compiled regex"""
+        texts = self._root.itertext() if self._root is not None else self._get_soup().find_all(string=True)
+        for text in texts:
+            if pattern.search(text):
+                return text
+        return None
@@ -4,7 +4,7 @@ LLM Client - Unified interface for Claude SDK and OpenAI API
 Provides intelligent LLM operations for autonomous agents with:
 - Claude 3.5 Sonnet for complex reasoning
 - GPT-4 Turbo for code generation
-- Prompt caching for cost optimization
+- Response caching for cost optimization (shared, content-addressed)
 - Streaming responses
 - Token budget management
 - Cost tracking
@@ -18,6 +18,8 @@ from datetime import datetime
 from enum import Enum
 import json
 
+from app.services.llm_cache import LLMResponseCache, get_llm_cache, make_cache_key
+
 try:
     from anthropic import AsyncAnthropic
     ANTHROPIC_AVAILABLE = True
@@ -93,7 +95,7 @@ class LLMClient:
 
     Features:
     - Automatic provider selection based on task
-    - Prompt caching for cost optimization
+    - Response caching for cost optimization
     - Streaming responses
     - Token budget management
     - Cost tracking and optimization
@@ -117,7 +119,8 @@ class LLMClient:
         default_model: LLMModel = LLMModel.CLAUDE_3_5_SONNET,
         max_tokens: int = 4096,
         temperature: float = 0.7,
-        token_budget: Optional[int] = None
+        token_budget: Optional[int] = None,
+        response_cache: Optional[LLMResponseCache] = None
     ):
         """
         Initialize LLM client.
@@ -129,6 +132,7 @@ class LLMClient:
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0-1)
             token_budget: Optional token budget limit
+            response_cache: Response cache (defaults to the process-wide one)
         """
         self.default_model = default_model
         self.max_tokens = max_tokens
@@ -150,8 +154,8 @@ class LLMClient:
         # Usage tracking
         self.usage_stats = LLMUsageStats()
 
-        # Prompt cache
-        self.prompt_cache: Dict[str, str] = {}
+        # Response cache, shared with the other LLM callers in the process
+        self.response_cache = response_cache or get_llm_cache()
 
     async def complete(
         self,
@@ -172,7 +176,7 @@ class LLMClient:
             system_prompt: System prompt
             max_tokens: Max tokens in response
             temperature: Sampling temperature
-            use_cache: Use prompt caching
+            use_cache: Serve identical requests from the response cache
             **kwargs: Additional provider-specific args
 
         Returns:
@@ -190,17 +194,18 @@ class LLMClient:
 
         # Check cache
         if use_cache:
-            cache_key = self._get_cache_key(messages, system_prompt)
-            if cache_key in self.prompt_cache:
+            cache_key = self._get_cache_key(messages, model, system_prompt, max_tokens, temperature, kwargs)
+            cached = await self.response_cache.get(cache_key)
+            if cached is not None:
                 logger.debug("Using cached response")
                 return LLMResponse(
-                    content=self.prompt_cache[cache_key],
+                    content=cached["content"],
                     model=model.value,
                     provider=self._get_provider(model),
                     tokens_used=0,
                     cost_usd=0.0,
                     finish_reason="cached",
-                    metadata={"cached": True}
+                    metadata={"cached": True, "cost_saved_usd": cached.get("cost_usd", 0.0)}
                 )
 
         # Route to appropriate provider
@@ -220,7 +225,11 @@ class LLMClient:
 
         # Cache response
         if use_cache:
-            self.prompt_cache[cache_key] = response.content
+            await self.response_cache.set(cache_key, {
+                "content": response.content,
+                "tokens_used": response.tokens_used,
+                "cost_usd": response.cost_usd
+            })
 
         return response
 
@@ -457,14 +466,21 @@ class LLMClient:
     def _get_cache_key(
         self,
         messages: List[LLMMessage],
-        system_prompt: Optional[str]
+        model: LLMModel,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        extra: Dict[str, Any]
     ) -> str:
-        """Generate cache key for prompt"""
-        content = system_prompt or ""
-        content += "".join([msg.content for msg in messages])
-
-        # Simple hash (could use more sophisticated caching)
-        return str(hash(content))
+        """Content-addressed cache key for the full request"""
+        return make_cache_key(
+            model.value,
+            [{"role": msg.role, "content": msg.content} for msg in messages],
+            system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **extra
+        )
 
     def _get_provider(self, model: LLMModel) -> LLMProvider:
         """Get provider for model"""
@@ -492,7 +508,8 @@ class LLMClient:
                     "cost_usd": round(self.usage_stats.cost_by_model.get(model, 0.0), 4)
                 }
                 for model in self.usage_stats.requests_by_model.keys()
-            }
+            },
+            "cache": self.response_cache.get_stats()
         }
 
     def reset_usage_stats(self):
@@ -501,6 +518,6 @@ class LLMClient:
         logger.info("Usage statistics reset")
 
     def clear_cache(self):
-        """Clear prompt cache"""
-        self.prompt_cache.clear()
-        logger.info("Prompt cache cleared")
+        """Clear the in-memory response cache"""
+        self.response_cache.clear()
+        logger.info("Response cache cleared")
@@ -7,6 +7,12 @@ Provides:
 - Progress tracking
 - Job scheduling
 - Rate limiting
+- Durable job status and results (shared task store)
+
+Handlers are in-process callables, so the queue itself stays in memory;
+job status, progress and results are also written to the task store
+(app/services/task_store.py), so they survive restarts and any worker can
+look them up. Only the most recent finished jobs are kept in memory.
 """
 
 import asyncio
@@ -15,9 +21,11 @@ from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import heapq
 
+from app.services.task_store import TaskStore, get_task_store
+
 
 logger = logging.getLogger(__name__)
 
@@ -91,22 +99,29 @@ class TaskQueue:
     - Rate limiting
     - Job scheduling
     - Concurrent worker pool
+    - Durable status/results (persist=False keeps everything in memory)
     """
 
     def __init__(
         self,
         max_workers: int = 5,
-        max_jobs_per_second: Optional[int] = None
+        max_jobs_per_second: Optional[int] = None,
+        store: Optional[TaskStore] = None,
+        persist: bool = True,
+        max_retained_jobs: int = 1000
     ):
         self.max_workers = max_workers
         self.max_jobs_per_second = max_jobs_per_second
+        self.persist = persist
+        self.max_retained_jobs = max_retained_jobs
+        self._store = store
 
         # Priority queue (min-heap with inverted priority)
         self.job_queue: List[PrioritizedJob] = []
 
         # Job tracking
         self.jobs: Dict[str, Job] = {}
-        self.job_results: Dict[str, JobResult] = {}
+        self.job_results: "OrderedDict[str, JobResult]" = OrderedDict()  # bounded, oldest evicted
         self.job_status: Dict[str, JobStatus] = {}
 
         # Worker tasks
@@ -130,6 +145,13 @@ class TaskQueue:
             "retried": 0
         }
 
+    @property
+    def store(self) -> Optional[TaskStore]:
+        """Task store for job status/results, opened on first use"""
+        if self._store is None and self.persist:
+            self._store = get_task_store("agent_jobs")
+        return self._store
+
     async def start(self):
         """Start worker pool"""
         if self.running:
@@ -196,6 +218,7 @@ class TaskQueue:
         )
 
         heapq.heappush(self.job_queue, prioritized_job)
+        await self._persist("save", job.job_id, self._job_record(job, JobStatus.QUEUED))
 
         self.stats["total_jobs"] += 1
 
@@ -224,6 +247,7 @@ class TaskQueue:
         job.scheduled_at = scheduled_time
         self.scheduled_jobs[job.job_id] = job
         self.job_status[job.job_id] = JobStatus.PENDING
+        await self._persist("save", job.job_id, self._job_record(job, JobStatus.PENDING))
 
         logger.info(
             f"Job {job.job_id} scheduled for {scheduled_time.isoformat()}"
@@ -232,20 +256,34 @@ class TaskQueue:
         return job.job_id
 
     async def get_job_status(self, job_id: str) -> Optional[JobStatus]:
-        """Get current job status"""
-        return self.job_status.get(job_id)
+        """Get current job status (falls back to the task store)"""
+        if job_id in self.job_status:
+            return self.job_status[job_id]
+
+        record = await self._persist("load", job_id)
+        return JobStatus(record["status"]) if record else None
 
     async def get_job_result(self, job_id: str) -> Optional[JobResult]:
-        """Get job result"""
-        return self.job_results.get(job_id)
+        """Get job result (falls back to the task store)"""
+        if job_id in self.job_results:
+            return self.job_results[job_id]
+        if job_id in self.job_status:
+            return None
+
+        return await self._load_result(job_id)
 
     async def get_job_progress(self, job_id: str) -> Optional[float]:
         """Get job progress (0-100)"""
-        return self.progress.get(job_id)
+        if job_id in self.progress:
+            return self.progress[job_id]
+
+        record = await self._persist("load", job_id)
+        return record.get("progress") if record else None
 
     async def update_progress(self, job_id: str, progress: float):
         """Update job progress"""
         self.progress[job_id] = min(100.0, max(0.0, progress))
+        await self._persist("update", job_id, {"progress": self.progress[job_id]})
 
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel pending job"""
@@ -254,6 +292,8 @@ class TaskQueue:
 
             if status in [JobStatus.PENDING, JobStatus.QUEUED]:
                 self.job_status[job_id] = JobStatus.CANCELLED
+                self.scheduled_jobs.pop(job_id, None)
+                await self._persist("finish", job_id, {"status": JobStatus.CANCELLED.value})
 
                 # Remove from queue if present
                 self.job_queue = [
@@ -304,6 +344,10 @@ class TaskQueue:
         )
 
         self.job_status[job.job_id] = JobStatus.RUNNING
+        await self._persist("update", job.job_id, {
+            "status": JobStatus.RUNNING.value,
+            "started_at": result.started_at.isoformat()
+        })
 
         retry_count = 0
 
@@ -325,8 +369,8 @@ class TaskQueue:
                 result.retry_count = retry_count
 
                 self.job_status[job.job_id] = JobStatus.COMPLETED
-                self.job_results[job.job_id] = result
                 self.progress[job.job_id] = 100.0
+                await self._store_result(result)
 
                 self.stats["completed"] += 1
 
@@ -350,6 +394,10 @@ class TaskQueue:
 
             if retry_count <= job.max_retries:
                 self.job_status[job.job_id] = JobStatus.RETRYING
+                await self._persist("update", job.job_id, {
+                    "status": JobStatus.RETRYING.value,
+                    "retry_count": retry_count
+                })
                 self.stats["retried"] += 1
 
                 # Exponential backoff
@@ -372,7 +420,7 @@ class TaskQueue:
         result.retry_count = retry_count
 
         self.job_status[job.job_id] = JobStatus.FAILED
-        self.job_results[job.job_id] = result
+        await self._store_result(result)
 
         self.stats["failed"] += 1
 
@@ -470,11 +518,18 @@ class TaskQueue:
             JobResult when complete
         """
         start_time = datetime.now()
+        # Jobs run by another worker/process are polled in the task store
+        local = job_id in self.job_status
+        poll_interval = 0.1 if local else 1.0
 
         while True:
             # Check if job completed
             if job_id in self.job_results:
                 return self.job_results[job_id]
+            if not local:
+                result = await self._load_result(job_id)
+                if result:
+                    return result
 
             # Check timeout
             if timeout:
@@ -484,7 +539,7 @@ class TaskQueue:
                     return None
 
             # Sleep before next check
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(poll_interval)
 
     async def wait_for_workflow(
         self,
@@ -514,3 +569,65 @@ class TaskQueue:
                 results[job_id] = result
 
         return results
+
+    def _job_record(self, job: Job, status: JobStatus) -> Dict[str, Any]:
+        """Store record for a job (its handler and arguments stay in memory)"""
+        return {
+            "job_id": job.job_id,
+            "name": job.name,
+            "status": status.value,
+            "priority": job.priority.value,
+            "workflow_id": job.workflow_id,
+            "scheduled_at": job.scheduled_at.isoformat() if job.scheduled_at else None,
+            "progress": 0.0,
+            "retry_count": 0,
+            "metadata": job.metadata
+        }
+
+    async def _store_result(self, result: JobResult):
+        """Keep a finished job's result in memory (bounded) and in the task store"""
+        self.job_results[result.job_id] = result
+        while len(self.job_results) > self.max_retained_jobs:
+            evicted, _ = self.job_results.popitem(last=False)
+            for mapping in (self.jobs, self.job_status, self.progress):
+                mapping.pop(evicted, None)
+
+        await self._persist("finish", result.job_id, {
+            "status": result.status.value,
+            "error": result.error,
+            "started_at": result.started_at.isoformat() if result.started_at else None,
+            "completed_at": result.completed_at.isoformat() if result.completed_at else None,
+            "execution_time": result.execution_time,
+            "retry_count": result.retry_count,
+            "progress": self.progress.get(result.job_id, 0.0)
+        }, result.result)
+
+    async def _load_result(self, job_id: str) -> Optional[JobResult]:
+        """Finished job's result from the task store"""
+        record = await self._persist("load", job_id)
+        if not record or record["status"] not in (JobStatus.COMPLETED.value, JobStatus.FAILED.value):
+            return None
+
+        return JobResult(
+            job_id=job_id,
+            status=JobStatus(record["status"]),
+            result=await self._persist("load_result", job_id),
+            error=record.get("error"),
+            started_at=datetime.fromisoformat(record["started_at"]) if record.get("started_at") else None,
+            completed_at=datetime.fromisoformat(record["completed_at"]) if record.get("completed_at") else None,
+            execution_time=record.get("execution_time", 0.0),
+            retry_count=record.get("retry_count", 0),
+            metadata=record.get("metadata") or {}
+        )
+
+    async def _persist(self, method: str, *args) -> Any:
+        """Call a task store method; store errors never fail the job itself"""
+        store = self.store
+        if store is None:
+            return None
+
+        try:
+            return await getattr(store, method)(*args)
+        except Exception as e:
+            logger.warning(f"Task store {method} failed: {e}")
+            return None
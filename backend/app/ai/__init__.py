@@ -12,20 +12,46 @@ This module provides the complete AI processing pipeline including:
 - Privacy-first learning system
 """
 
-# Original AI modules
-from .opportunity_scorer import OpportunityScorer
-from .summarizer import DocumentSummarizer
-from .embeddings import EmbeddingService
-from .nlp_processor import NLPProcessor
-from .market_intelligence import MarketIntelligenceEngine
+import importlib
+
+# Exports are imported on first access: the submodules pull in the provider
+# SDKs, numpy and scikit-learn, which most importers of app.ai never need.
+_EXPORTS = {
+    # Original AI modules
+    "OpportunityScorer": ".opportunity_scorer",
+    "DocumentSummarizer": ".summarizer",
+    "EmbeddingService": ".embeddings",
+    "NLPProcessor": ".nlp_processor",
+    "MarketIntelligenceEngine": ".market_intelligence",
+
+    # Advanced AI personalization modules
+    "UserBehaviorAnalyzer": ".user_analytics",
+    "InteractionType": ".user_analytics",
+    "UserSegment": ".user_analytics",
+    "PersonalizationEngine": ".personalization_engine",
+    "RecommendationType": ".personalization_engine",
+    "PersonalizationLevel": ".personalization_engine",
+    "LearningSystem": ".learning_system",
+    "FeedbackType": ".learning_system",
+    "LearningObjective": ".learning_system",
+    "UserProfilingSystem": ".user_profiling",
+    "PersonaType": ".user_profiling",
+    "ExpertiseLevel": ".user_profiling",
+    "PrivacyManager": ".privacy_manager",
+    "ConsentType": ".privacy_manager",
+    "DataCategory": ".privacy_manager",
+    "PersonalizedAI": ".personalization_integration",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Advanced AI personalization modules
-from .user_analytics import UserBehaviorAnalyzer, InteractionType, UserSegment
-from .personalization_engine import PersonalizationEngine, RecommendationType, PersonalizationLevel
-from .learning_system import LearningSystem, FeedbackType, LearningObjective
-from .user_profiling import UserProfilingSystem, PersonaType, ExpertiseLevel
-from .privacy_manager import PrivacyManager, ConsentType, DataCategory
-from .personalization_integration import PersonalizedAI
 
 __all__ = [
     # Original AI modules
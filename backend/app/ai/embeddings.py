@@ -14,13 +14,10 @@ from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import numpy as np
-import openai
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SentenceTransformer = None
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+import importlib.util
+
+# Checked without importing: sentence_transformers pulls in torch (loaded on first use)
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
 import json
 from datetime import datetime
 
@@ -81,6 +78,12 @@ class SemanticSearchResult:
     model_used: str
 
 
+def _build_sentence_transformer():
+    # Imported here (in a worker thread) - importing sentence_transformers loads torch
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer('all-MiniLM-L6-v2')
+
+
 class EmbeddingService:
     """
     Comprehensive vector embedding service for planning applications.
@@ -96,29 +99,46 @@ class EmbeddingService:
         self.similarity_threshold = 0.8
 
     def _initialize_models(self) -> None:
-        """Initialize embedding models"""
+        """Initialize embedding clients (the local model loads on first use)"""
         self.openai_client = None
         self.sentence_transformer = None
+        self._sentence_transformer_lock: Optional[asyncio.Lock] = None
+        self._sentence_transformer_failed = False
 
         # Initialize OpenAI client for embeddings
         if self.config.settings.openai_api_key:
+            import openai
             self.openai_client = openai.AsyncOpenAI(api_key=self.config.settings.openai_api_key)
             logger.info("OpenAI embedding client initialized")
 
-        # Initialize Sentence Transformer model
-        if SENTENCE_TRANSFORMERS_AVAILABLE:
-            try:
-                self.sentence_transformer = SentenceTransformer('all-MiniLM-L6-v2')
-                logger.info("Sentence Transformer model loaded")
-            except Exception as e:
-                logger.warning(f"Failed to load Sentence Transformer: {e}")
-                self.sentence_transformer = None
-        else:
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
             logger.info("Sentence Transformers not available - using OpenAI embeddings only")
-            self.sentence_transformer = None
+            if not self.openai_client:
+                logger.error("No embedding models available")
+
+    async def load_sentence_transformer(self) -> Optional[Any]:
+        """
+        Load the Sentence Transformer model once, off the event loop
+
+        Returns:
+            The model, or None if it is unavailable or failed to load
+        """
+        if self.sentence_transformer or self._sentence_transformer_failed or not SENTENCE_TRANSFORMERS_AVAILABLE:
+            return self.sentence_transformer
+
+        if self._sentence_transformer_lock is None:
+            self._sentence_transformer_lock = asyncio.Lock()
+
+        async with self._sentence_transformer_lock:
+            if self.sentence_transformer is None and not self._sentence_transformer_failed:
+                try:
+                    self.sentence_transformer = await asyncio.to_thread(_build_sentence_transformer)
+                    logger.info("Sentence Transformer model loaded")
+                except Exception as e:
+                    logger.warning(f"Failed to load Sentence Transformer: {e}")
+                    self._sentence_transformer_failed = True
 
-        if not self.openai_client and not self.sentence_transformer:
-            logger.error("No embedding models available")
+        return self.sentence_transformer
 
     async def generate_application_embedding(
         self,
@@ -285,7 +305,7 @@ class EmbeddingService:
 
     async def _generate_sentence_transformer_embedding(self, text: str) -> EmbeddingResult:
         """Generate embedding using Sentence Transformer"""
-        if not self.sentence_transformer:
+        if not await self.load_sentence_transformer():
             raise ValueError("Sentence Transformer not available")
 
         try:
@@ -449,7 +469,7 @@ class EmbeddingService:
         # Use OPENAI_SMALL (1536 dimensions) to match ES index schema
         if self.openai_client:
             return await self._generate_openai_embedding(text, EmbeddingModel.OPENAI_SMALL)
-        elif self.sentence_transformer:
+        elif await self.load_sentence_transformer():
             return await self._generate_sentence_transformer_embedding(text)
         else:
             raise ValueError("No embedding models available for text")
@@ -583,7 +603,8 @@ class EmbeddingService:
             "cache_size": len(self._cache),
             "models_available": {
                 "openai": bool(self.openai_client),
-                "sentence_transformer": bool(self.sentence_transformer)
+                "sentence_transformer": bool(self.sentence_transformer),
+                "sentence_transformer_available": SENTENCE_TRANSFORMERS_AVAILABLE and not self._sentence_transformer_failed
             },
             "similarity_threshold": self.similarity_threshold,
             "supported_embedding_types": [t.value for t in EmbeddingType],
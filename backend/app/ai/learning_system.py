@@ -9,7 +9,6 @@ from enum import Enum
 import json
 import logging
 import numpy as np
-from sklearn.metrics import accuracy_score, precision_score, recall_score
 import asyncio
 from collections import defaultdict, deque
 
@@ -373,7 +372,7 @@ class LearningSystem:
             metrics['engagement_rate'] = len(interacted_recommendations) / total_recommendations if total_recommendations > 0 else 0
 
             # Calculate relevance score based on user profile alignment
-            user_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            user_profile = await self.behavior_analyzer.get_user_profile(user_id)
             relevance_scores = []
 
             for rec in recommendations:
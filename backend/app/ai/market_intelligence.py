@@ -14,12 +14,6 @@ from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime, timedelta
 import numpy as np
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    pd = None
-    PANDAS_AVAILABLE = False
 from collections import defaultdict, Counter
 
 from app.core.ai_config import ai_config
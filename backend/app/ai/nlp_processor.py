@@ -13,8 +13,6 @@ import re
 from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
-import openai
-import anthropic
 from datetime import datetime, timedelta
 
 from app.core.ai_config import ai_config, AIModel, AIProvider
@@ -92,15 +90,17 @@ class NLPProcessor:
         self._load_query_templates()
 
     def _initialize_clients(self) -> None:
-        """Initialize AI service clients"""
+        """Initialize AI service clients (SDKs are imported only when configured)"""
         self.openai_client = None
         self.anthropic_client = None
 
         if self.config.settings.openai_api_key:
+            import openai
             self.openai_client = openai.AsyncOpenAI(api_key=self.config.settings.openai_api_key)
             logger.info("OpenAI client initialized for NLP processing")
 
         if self.config.settings.anthropic_api_key:
+            import anthropic
             self.anthropic_client = anthropic.AsyncAnthropic(
                 api_key=self.config.settings.anthropic_api_key
             )
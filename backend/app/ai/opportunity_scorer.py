@@ -129,6 +129,18 @@ class OpportunityScorer:
         Returns:
             ScoringResult with detailed scoring breakdown
         """
+        return self.score_application_sync(application, context)
+
+    def score_application_sync(
+        self,
+        application: PlanningApplication,
+        context: Optional[Dict[str, Any]] = None
+    ) -> ScoringResult:
+        """
+        Synchronous scoring core (pure CPU, no I/O).
+
+        Used directly by the background process pool for batch scoring.
+        """
         start_time = time.time()
 
         try:
@@ -136,7 +148,7 @@ class OpportunityScorer:
             features = self._extract_features(application)
 
             # Calculate individual factor scores
-            factor_scores = await self._calculate_factor_scores(features, context)
+            factor_scores = self._calculate_factor_scores(features, context)
 
             # Calculate weighted overall score
             opportunity_score = self._calculate_weighted_score(factor_scores)
@@ -182,7 +194,7 @@ class OpportunityScorer:
             location_postcode=getattr(application, 'postcode', None),
             authority=application.authority or "unknown",
             status=application.status or "unknown",
-            submission_date=application.date_received,
+            submission_date=getattr(application, 'date_received', None) or application.submission_date,
             decision_date=application.decision_date,
             site_area=getattr(application, 'site_area', None),
             description_length=len(application.description or ""),
@@ -232,7 +244,7 @@ class OpportunityScorer:
         major_indicators = ["100 units", "retail", "office", "industrial", "major"]
         return any(indicator in description for indicator in major_indicators)
 
-    async def _calculate_factor_scores(
+    def _calculate_factor_scores(
         self,
         features: ApplicationFeatures,
         context: Optional[Dict[str, Any]]
@@ -9,11 +9,10 @@ from enum import Enum
 import json
 import logging
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.feature_extraction.text import TfidfVectorizer
 import asyncio
 
 from .user_analytics import UserBehaviorAnalyzer, UserSegment, InteractionType
+from .personalization_ranker import BatchReranker
 
 logger = logging.getLogger(__name__)
 
@@ -106,7 +105,15 @@ class PersonalizationEngine:
         self.supabase = supabase_client
         self.behavior_analyzer = behavior_analyzer
         self.redis = redis_client
-        self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+        self._vectorizer = None
+
+    @property
+    def vectorizer(self):
+        """TF-IDF vectorizer, built on first use (sklearn is slow to import)"""
+        if self._vectorizer is None:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            self._vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+        return self._vectorizer
 
     async def generate_recommendations(
         self,
@@ -129,7 +136,7 @@ class PersonalizationEngine:
         """
         try:
             # Get user behavior profile
-            user_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            user_profile = await self.behavior_analyzer.get_user_profile(user_id)
             user_preferences = await self._get_user_preferences(user_id)
 
             # Generate recommendations based on type
@@ -193,37 +200,12 @@ class PersonalizationEngine:
             Personalized and reranked search results
         """
         try:
-            user_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            user_profile = await self.behavior_analyzer.get_user_profile(user_id)
             user_preferences = await self._get_user_preferences(user_id)
 
-            personalized_results = []
-
-            for result in search_results:
-                # Calculate personalization score
-                personalization_score = await self._calculate_result_personalization_score(
-                    result, user_profile, user_preferences, search_context
-                )
-
-                # Add personalization metadata
-                result['personalization_score'] = personalization_score
-                result['personalization_factors'] = await self._get_personalization_factors(
-                    result, user_profile, user_preferences
-                )
-
-                # Enhance result with personalized content
-                if personalization_score > 0.7:  # High relevance
-                    result['personalized_summary'] = await self._generate_personalized_summary(
-                        result, user_profile, user_preferences
-                    )
-
-                personalized_results.append(result)
-
-            # Rerank based on personalization scores
-            personalized_results.sort(
-                key=lambda x: (x.get('personalization_score', 0) * 0.4 +
-                             x.get('relevance_score', 0) * 0.6),
-                reverse=True
-            )
+            # Score and rerank the whole page in one vectorized pass
+            reranker = BatchReranker(user_profile, user_preferences)
+            personalized_results = reranker.rerank(list(search_results))
 
             # Track personalization effectiveness
             await self._track_personalization_usage(user_id, "search_personalization",
@@ -253,7 +235,7 @@ class PersonalizationEngine:
             Personalized AI summary
         """
         try:
-            user_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            user_profile = await self.behavior_analyzer.get_user_profile(user_id)
             user_preferences = await self._get_user_preferences(user_id)
 
             # Determine personalization level
@@ -311,7 +293,7 @@ class PersonalizationEngine:
             Personalized scoring factors
         """
         try:
-            user_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            user_profile = await self.behavior_analyzer.get_user_profile(user_id)
             user_preferences = await self._get_user_preferences(user_id)
 
             # Get user-specific scoring preferences
@@ -384,7 +366,7 @@ class PersonalizationEngine:
             Personalized market intelligence
         """
         try:
-            user_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            user_profile = await self.behavior_analyzer.get_user_profile(user_id)
             user_preferences = await self._get_user_preferences(user_id)
 
             # Filter market data based on user interests
@@ -443,7 +425,7 @@ class PersonalizationEngine:
         """
         try:
             current_preferences = await self._get_user_preferences(user_id)
-            user_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            user_profile = await self.behavior_analyzer.get_user_profile(user_id)
 
             # Analyze content preferences from interactions
             content_preferences = await self._analyze_content_preferences(interactions)
@@ -830,52 +812,6 @@ class PersonalizationEngine:
 
         return min(confidence, 1.0)
 
-    async def _calculate_result_personalization_score(
-        self, result: Dict[str, Any], user_profile, user_preferences: UserPreferences,
-        search_context: Dict[str, Any]
-    ) -> float:
-        """Calculate personalization score for a search result"""
-        score = 0.5  # Base score
-
-        # Geographic preference match
-        result_authority = result.get('local_authority', '')
-        if result_authority in user_profile.preferred_authorities:
-            score += 0.2
-
-        # Content preference match
-        result_type = result.get('development_type', '').lower()
-        for content_type, preference in user_preferences.content_preferences.items():
-            if content_type in result_type:
-                score += preference * 0.1
-
-        # User expertise level adjustment
-        if user_profile.expertise_level > 0.7:
-            # Expert users prefer detailed, complex applications
-            if result.get('proposal_description', ''):
-                description_length = len(result['proposal_description'])
-                if description_length > 500:  # Detailed application
-                    score += 0.1
-        else:
-            # Beginners prefer simpler applications
-            if result.get('application_type') in ['householder', 'certificate_of_lawfulness']:
-                score += 0.1
-
-        return min(score, 1.0)
-
-    async def _get_personalization_factors(
-        self, result: Dict[str, Any], user_profile, user_preferences: UserPreferences
-    ) -> List[str]:
-        """Get factors that influenced personalization"""
-        factors = []
-
-        if result.get('local_authority') in user_profile.preferred_authorities:
-            factors.append(f"Matches your geographic focus on {result['local_authority']}")
-
-        if user_profile.expertise_level > 0.7:
-            factors.append("Detailed content suitable for your expertise level")
-
-        return factors
-
     def _determine_personalization_level(self, expertise_level: float) -> PersonalizationLevel:
         """Determine appropriate personalization level"""
         if expertise_level < 0.25:
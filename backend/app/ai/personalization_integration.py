@@ -63,7 +63,7 @@ class PersonalizedAI:
         """
         try:
             # Get user behavior profile
-            user_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            user_profile = await self.behavior_analyzer.get_user_profile(user_id)
 
             # Get base opportunity score
             base_scoring = await self.opportunity_scorer.score_opportunity(application_data)
@@ -152,7 +152,7 @@ class PersonalizedAI:
         """
         try:
             # Get user behavior profile and persona
-            user_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            user_profile = await self.behavior_analyzer.get_user_profile(user_id)
             user_persona = await self.user_profiling.create_user_persona(user_id)
 
             # Determine personalization level
@@ -256,7 +256,7 @@ class PersonalizedAI:
         """
         try:
             # Get user behavior profile
-            user_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            user_profile = await self.behavior_analyzer.get_user_profile(user_id)
 
             # Generate base market intelligence
             base_intelligence = await self.market_intelligence.generate_market_report(
@@ -344,7 +344,7 @@ class PersonalizedAI:
         """
         try:
             # Get user behavior profile
-            user_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            user_profile = await self.behavior_analyzer.get_user_profile(user_id)
 
             # Personalize search results
             personalized_results = await self.personalization_engine.personalize_search_results(
@@ -425,7 +425,7 @@ class PersonalizedAI:
         """
         try:
             # Get user profile and persona
-            user_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            user_profile = await self.behavior_analyzer.get_user_profile(user_id)
             user_persona = await self.user_profiling.create_user_persona(user_id)
 
             # Generate feature recommendations
@@ -13,12 +13,11 @@ import re
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from enum import Enum
-import openai
-import anthropic
 from datetime import datetime
 
 from app.core.ai_config import ai_config, AIModel, AIProvider
 from app.models.planning import PlanningApplication
+from app.services.llm_cache import get_llm_cache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -75,22 +74,25 @@ class DocumentSummarizer:
 
     def __init__(self):
         self.config = ai_config
+        self.response_cache = get_llm_cache()
         self._initialize_clients()
         self._load_prompt_templates()
 
     def _initialize_clients(self) -> None:
-        """Initialize AI service clients"""
+        """Initialize AI service clients (SDKs are imported only when configured)"""
         self.openai_client = None
         self.anthropic_client = None
 
         # Initialize OpenAI client
         if self.config.settings.openai_api_key:
+            import openai
             openai.api_key = self.config.settings.openai_api_key
             self.openai_client = openai.AsyncOpenAI(api_key=self.config.settings.openai_api_key)
             logger.info("OpenAI client initialized for summarization")
 
         # Initialize Anthropic client
         if self.config.settings.anthropic_api_key:
+            import anthropic
             self.anthropic_client = anthropic.AsyncAnthropic(
                 api_key=self.config.settings.anthropic_api_key
             )
@@ -246,7 +248,8 @@ class DocumentSummarizer:
             logger.error(f"Error summarizing application {application.application_id}: {str(e)}")
             return self._generate_fallback_summary(application, summary_type, length)
 
-    def _prepare_application_content(self, application: PlanningApplication) -> str:
+    @staticmethod
+    def _prepare_application_content(application: PlanningApplication) -> str:
         """Prepare application content for summarization"""
         content_parts = []
 
@@ -258,8 +261,9 @@ class DocumentSummarizer:
         content_parts.append(f"Status: {application.status}")
 
         # Dates
-        if application.date_received:
-            content_parts.append(f"Received: {application.date_received.strftime('%Y-%m-%d')}")
+        date_received = getattr(application, 'date_received', None) or application.submission_date
+        if date_received:
+            content_parts.append(f"Received: {date_received.strftime('%Y-%m-%d')}")
         if application.decision_date:
             content_parts.append(f"Decision: {application.decision_date.strftime('%Y-%m-%d')}")
 
@@ -318,15 +322,25 @@ class DocumentSummarizer:
                 length=length.value
             )
 
-            response = await self.anthropic_client.messages.create(
-                model=model.value,
-                max_tokens=self._get_max_tokens_for_length(length),
-                temperature=self.config.settings.temperature,
-                system=prompt_template["system"],
-                messages=[{"role": "user", "content": user_prompt}]
+            request = {
+                "max_tokens": self._get_max_tokens_for_length(length),
+                "temperature": self.config.settings.temperature,
+                "system": prompt_template["system"],
+                "messages": [{"role": "user", "content": user_prompt}]
+            }
+            cache_key = make_cache_key(
+                model.value, request["messages"], request["system"],
+                max_tokens=request["max_tokens"], temperature=request["temperature"]
             )
+            cached = await self.response_cache.get(cache_key)
 
-            summary_text = response.content[0].text
+            if cached is not None:
+                summary_text, token_count = cached["content"], 0
+            else:
+                response = await self.anthropic_client.messages.create(model=model.value, **request)
+                summary_text = response.content[0].text
+                token_count = response.usage.input_tokens + response.usage.output_tokens
+                await self._cache_response(cache_key, model, summary_text, token_count)
 
             # Extract structured information
             key_points = self._extract_key_points(summary_text)
@@ -346,7 +360,7 @@ class DocumentSummarizer:
                 extracted_entities=entities,
                 recommendations=recommendations,
                 model_used=f"Claude-{model.value}",
-                token_count=response.usage.input_tokens + response.usage.output_tokens
+                token_count=token_count
             )
 
         except Exception as e:
@@ -370,18 +384,28 @@ class DocumentSummarizer:
                 length=length.value
             )
 
-            response = await self.openai_client.chat.completions.create(
-                model=model.value,
-                messages=[
+            request = {
+                "messages": [
                     {"role": "system", "content": prompt_template["system"]},
                     {"role": "user", "content": user_prompt}
                 ],
-                max_tokens=self._get_max_tokens_for_length(length),
-                temperature=self.config.settings.temperature,
-                top_p=self.config.settings.top_p
+                "max_tokens": self._get_max_tokens_for_length(length),
+                "temperature": self.config.settings.temperature,
+                "top_p": self.config.settings.top_p
+            }
+            cache_key = make_cache_key(
+                model.value, request["messages"],
+                max_tokens=request["max_tokens"], temperature=request["temperature"], top_p=request["top_p"]
             )
+            cached = await self.response_cache.get(cache_key)
 
-            summary_text = response.choices[0].message.content
+            if cached is not None:
+                summary_text, token_count = cached["content"], 0
+            else:
+                response = await self.openai_client.chat.completions.create(model=model.value, **request)
+                summary_text = response.choices[0].message.content
+                token_count = response.usage.prompt_tokens + response.usage.completion_tokens
+                await self._cache_response(cache_key, model, summary_text, token_count)
 
             # Extract structured information
             key_points = self._extract_key_points(summary_text)
@@ -401,13 +425,23 @@ class DocumentSummarizer:
                 extracted_entities=entities,
                 recommendations=recommendations,
                 model_used=f"OpenAI-{model.value}",
-                token_count=response.usage.prompt_tokens + response.usage.completion_tokens
+                token_count=token_count
             )
 
         except Exception as e:
             logger.error(f"Error with OpenAI summarization: {str(e)}")
             raise
 
+    async def _cache_response(self, cache_key: str, model: AIModel, text: str, token_count: int) -> None:
+        """Store a model response in the shared LLM response cache"""
+        model_config = self.config.get_model_config(model)
+        cost_per_1k = model_config.cost_per_1k_tokens if model_config else 0.0
+        await self.response_cache.set(cache_key, {
+            "content": text,
+            "tokens_used": token_count,
+            "cost_usd": token_count / 1000 * cost_per_1k
+        })
+
     def _get_max_tokens_for_length(self, length: SummaryLength) -> int:
         """Get appropriate max tokens for summary length"""
         token_limits = {
@@ -440,7 +474,8 @@ class DocumentSummarizer:
 
         return key_points[:5]  # Limit to 5 key points
 
-    def _analyze_sentiment(self, text: str) -> str:
+    @staticmethod
+    def _analyze_sentiment(text: str) -> str:
         """Analyze sentiment of the summary"""
         positive_words = [
             'approved', 'positive', 'favorable', 'strong', 'excellent', 'good',
@@ -462,7 +497,8 @@ class DocumentSummarizer:
         else:
             return "neutral"
 
-    def _calculate_complexity_score(self, content: str) -> float:
+    @staticmethod
+    def _calculate_complexity_score(content: str) -> float:
         """Calculate complexity score based on content characteristics"""
         score = 0.0
 
@@ -509,7 +545,8 @@ class DocumentSummarizer:
 
         return min(1.0, confidence)
 
-    def _extract_entities(self, content: str) -> Dict[str, List[str]]:
+    @staticmethod
+    def _extract_entities(content: str) -> Dict[str, List[str]]:
         """Extract entities from content using pattern matching"""
         entities = {
             "locations": [],
@@ -4,11 +4,16 @@ Tracks, analyzes, and learns from user interaction patterns
 """
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
+import asyncio
+import hashlib
+import importlib.util
 import json
 import logging
-from collections import defaultdict, Counter
+import random
+import time
+from collections import defaultdict, Counter, OrderedDict
 try:
     import numpy as np
     NUMPY_AVAILABLE = True
@@ -26,28 +31,46 @@ except ImportError:
         def std(data):
             return 1.0
 
+# scikit-learn is imported when segmentation first runs (it is slow to import)
+SKLEARN_AVAILABLE = importlib.util.find_spec("sklearn") is not None
+
+
+# Mock classes for when sklearn is not available
+class _MockKMeans:
+    def __init__(self, *args, **kwargs):
+        pass
+    def fit(self, *args, **kwargs):
+        return self
+    def predict(self, *args, **kwargs):
+        return [0]
+
+
+class _MockStandardScaler:
+    def __init__(self, *args, **kwargs):
+        pass
+    def fit(self, *args, **kwargs):
+        return self
+    def transform(self, *args, **kwargs):
+        return [[0]]
+
+
+def _clustering_models() -> Tuple[Any, Any]:
+    """(KMeans, StandardScaler) from scikit-learn, or the mocks"""
+    if SKLEARN_AVAILABLE:
+        from sklearn.cluster import KMeans
+        from sklearn.preprocessing import StandardScaler
+        return KMeans, StandardScaler
+    return _MockKMeans, _MockStandardScaler
+
 try:
-    from sklearn.cluster import KMeans
-    from sklearn.preprocessing import StandardScaler
-    SKLEARN_AVAILABLE = True
+    from redis.exceptions import WatchError
 except ImportError:
-    SKLEARN_AVAILABLE = False
-    # Mock classes for when sklearn is not available
-    class KMeans:
-        def __init__(self, *args, **kwargs):
-            pass
-        def fit(self, *args, **kwargs):
-            return self
-        def predict(self, *args, **kwargs):
-            return [0]
-
-    class StandardScaler:
-        def __init__(self, *args, **kwargs):
-            pass
-        def fit(self, *args, **kwargs):
-            return self
-        def transform(self, *args, **kwargs):
-            return [[0]]
+    # Only raised by Redis pipelines, which need the redis package
+    class WatchError(Exception):
+        pass
+
+from app.core.config import settings
+from app.services.event_pipeline import get_event_pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -121,6 +144,293 @@ class UserBehaviorProfile:
     last_updated: datetime
 
 
+# Interaction groups shared by the batch analysis and incremental profiles
+ADVANCED_INTERACTIONS = (
+    InteractionType.GENERATE_REPORT,
+    InteractionType.EXPORT_DATA,
+    InteractionType.CREATE_ALERT,
+    InteractionType.AI_SUMMARY_VIEW
+)
+CONSERVATIVE_INTERACTIONS = (
+    InteractionType.VIEW_APPLICATION,
+    InteractionType.SAVE_SEARCH
+)
+AGGRESSIVE_INTERACTIONS = (
+    InteractionType.GENERATE_REPORT,
+    InteractionType.EXPORT_DATA,
+    InteractionType.SHARE_APPLICATION
+)
+PROFESSIONAL_INTERACTIONS = (
+    InteractionType.GENERATE_REPORT,
+    InteractionType.EXPORT_DATA,
+    InteractionType.CREATE_ALERT
+)
+INTEREST_KEYWORDS = {
+    'residential': 'residential_development',
+    'commercial': 'commercial_development',
+    'retail': 'retail_development'
+}
+
+PROFILE_WINDOW_DAYS = 90
+TERM_HALF_LIFE_DAYS = 14
+MAX_TRACKED_TERMS = 100
+MAX_TRACKED_KEYS = 50
+MAX_TRACKED_SESSIONS = 50
+MAX_TRACKED_QUERIES = 1000
+
+
+def _epoch(timestamp: Any) -> float:
+    """Seconds since epoch for datetimes/ISO strings (naive values are UTC)"""
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    if timestamp.tzinfo is None:
+        return (timestamp - datetime(1970, 1, 1)).total_seconds()
+    return timestamp.timestamp()
+
+
+def _trim(counts: Dict[str, float], cap: int):
+    """Keep the `cap` largest entries once a map grows to twice that (amortized O(1))"""
+    if len(counts) > 2 * cap:
+        for key, _ in sorted(counts.items(), key=lambda x: x[1])[:len(counts) - cap]:
+            del counts[key]
+
+
+@dataclass
+class IncrementalBehaviorProfile:
+    """
+    Compact running aggregates for one user.
+
+    Every interaction is folded in with O(1) work; UserBehaviorProfile is
+    materialized from these counters on read. Search terms form a decayed
+    interest vector using forward decay: each hit adds 2^((t - landmark) /
+    half-life), so older weights never need rewriting.
+    """
+    user_id: str
+    total: int = 0
+    first_seen: Optional[float] = None
+    last_seen: Optional[float] = None
+    type_counts: Dict[str, int] = field(default_factory=dict)
+    hour_counts: Dict[str, int] = field(default_factory=dict)
+    day_counts: Dict[str, int] = field(default_factory=dict)
+    daily_counts: Dict[str, int] = field(default_factory=dict)  # day ordinal -> count (last 8 days)
+    area_counts: Dict[str, int] = field(default_factory=dict)
+    locations: int = 0
+    authority_counts: Dict[str, int] = field(default_factory=dict)
+    term_weights: Dict[str, float] = field(default_factory=dict)
+    decay_landmark: float = 0.0
+    searches: int = 0
+    query_words: int = 0
+    query_hashes: List[str] = field(default_factory=list)
+    interests: List[str] = field(default_factory=list)
+    sessions: Dict[str, List[float]] = field(default_factory=dict)  # session -> [first, last]
+    advanced: int = 0
+    conservative: int = 0
+    aggressive: int = 0
+    professional: int = 0
+    recomputed_at: float = 0.0
+
+    def apply(self, interaction: Dict[str, Any]):
+        """Fold one interaction (a user_interactions row) into the aggregates"""
+        ts = _epoch(interaction.get('timestamp') or datetime.utcnow())
+        moment = datetime.utcfromtimestamp(ts)
+        interaction_type = interaction.get('interaction_type')
+        interaction_type = getattr(interaction_type, 'value', interaction_type)
+        context = interaction.get('context') or {}
+
+        self.total += 1
+        self.first_seen = ts if self.first_seen is None else min(self.first_seen, ts)
+        self.last_seen = ts if self.last_seen is None else max(self.last_seen, ts)
+        self._incr(self.type_counts, interaction_type)
+        self._incr(self.hour_counts, str(moment.hour))
+        self._incr(self.day_counts, str(moment.weekday()))
+
+        day = moment.toordinal()
+        self._incr(self.daily_counts, str(day))
+        if len(self.daily_counts) > 8:
+            for key in [k for k in self.daily_counts if int(k) <= day - 8]:
+                del self.daily_counts[key]
+
+        location = interaction.get('location') or context.get('location')
+        if location:
+            self.locations += 1
+            if isinstance(location, dict) and 'lat' in location and 'lng' in location:
+                self._incr(self.area_counts, f"{round(location['lat'], 1)},{round(location['lng'], 1)}")
+                _trim(self.area_counts, MAX_TRACKED_KEYS)
+
+        authority = (context.get('filters') or {}).get('authority')
+        for name in ([authority] if isinstance(authority, str) else authority or []):
+            self._incr(self.authority_counts, name)
+        _trim(self.authority_counts, MAX_TRACKED_KEYS)
+
+        if interaction_type == InteractionType.SEARCH:
+            self._apply_search(interaction.get('search_query') or context.get('query'), ts)
+
+        session_id = interaction.get('session_id') or 'default'
+        span = self.sessions.get(session_id)
+        self.sessions[session_id] = [min(span[0], ts), max(span[1], ts)] if span else [ts, ts]
+        if len(self.sessions) > MAX_TRACKED_SESSIONS:
+            oldest = min(self.sessions, key=lambda k: self.sessions[k][1])
+            del self.sessions[oldest]
+
+        self.advanced += interaction_type in ADVANCED_INTERACTIONS
+        self.conservative += interaction_type in CONSERVATIVE_INTERACTIONS
+        self.aggressive += interaction_type in AGGRESSIVE_INTERACTIONS
+        self.professional += interaction_type in PROFESSIONAL_INTERACTIONS
+
+    def _apply_search(self, query: Optional[str], ts: float):
+        if not query:
+            return
+        query = query.lower()
+        words = query.split()
+        self.searches += 1
+        self.query_words += len(words)
+
+        query_hash = hashlib.sha1(query.encode()).hexdigest()[:12]
+        if len(self.query_hashes) < MAX_TRACKED_QUERIES and query_hash not in self.query_hashes:
+            self.query_hashes.append(query_hash)
+
+        if not self.decay_landmark:
+            self.decay_landmark = ts
+        boost = 2 ** ((ts - self.decay_landmark) / (TERM_HALF_LIFE_DAYS * 86400))
+        for term in words:
+            if len(term) > 2:
+                self.term_weights[term] = self.term_weights.get(term, 0.0) + boost
+        _trim(self.term_weights, MAX_TRACKED_TERMS)
+
+        for keyword, interest in INTEREST_KEYWORDS.items():
+            if keyword in query and interest not in self.interests:
+                self.interests.append(interest)
+
+    @staticmethod
+    def _incr(counts: Dict[str, int], key: Optional[str]):
+        if key is not None:
+            counts[key] = counts.get(key, 0) + 1
+
+    def interest_vector(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Search-term weights decayed to `now` (half-life TERM_HALF_LIFE_DAYS)"""
+        now = now or time.time()
+        scale = 2 ** ((now - self.decay_landmark) / (TERM_HALF_LIFE_DAYS * 86400)) if self.decay_landmark else 1.0
+        return {term: weight / scale for term, weight in self.term_weights.items()}
+
+    def recent_interactions(self, days: int = 7, now: Optional[float] = None) -> int:
+        today = datetime.utcfromtimestamp(now or time.time()).toordinal()
+        return sum(count for day, count in self.daily_counts.items() if int(day) > today - days)
+
+
+class BehaviorProfileStore:
+    """
+    Materialized incremental behavior profiles.
+
+    With a Redis client (redis.asyncio, e.g. the shared cache service's)
+    Redis is the only copy: every read goes to Redis and interactions are
+    applied in a WATCH/MULTI transaction, so concurrent workers never
+    overwrite each other's updates. Without Redis, profiles live in an
+    in-process LRU. A profile is rebuilt from the interaction history when
+    first needed and then every PERSONALIZATION_UPDATE_INTERVAL hours to
+    correct drift (interactions aging out of the 90-day window).
+    """
+
+    # Optimistic transaction attempts (with jittered backoff) before an interaction is dropped
+    MAX_UPDATE_ATTEMPTS = 10
+
+    def __init__(self, redis_client=None, max_profiles: int = 10000, recompute_interval_hours: Optional[int] = None):
+        self.redis = redis_client
+        self.max_profiles = max_profiles
+        self.recompute_interval = (recompute_interval_hours or settings.personalization_update_interval) * 3600
+        self._profiles: "OrderedDict[str, IncrementalBehaviorProfile]" = OrderedDict()
+
+    @staticmethod
+    def _redis_key(user_id: str) -> str:
+        return f"behavior_profile:{user_id}"
+
+    async def get(self, user_id: str) -> Optional[IncrementalBehaviorProfile]:
+        if self.redis:
+            try:
+                cached = await self.redis.get(self._redis_key(user_id))
+                return IncrementalBehaviorProfile(**json.loads(cached)) if cached else None
+            except Exception as e:
+                logger.warning(f"Failed to read behavior profile from Redis: {str(e)}")
+                return None
+
+        profile = self._profiles.get(user_id)
+        if profile is not None:
+            self._profiles.move_to_end(user_id)
+        return profile
+
+    async def save(self, profile: IncrementalBehaviorProfile):
+        if self.redis:
+            try:
+                await self.redis.set(
+                    self._redis_key(profile.user_id),
+                    json.dumps(asdict(profile)),
+                    ex=self.recompute_interval * 2
+                )
+            except Exception as e:
+                logger.warning(f"Failed to write behavior profile to Redis: {str(e)}")
+            return
+
+        self._profiles[profile.user_id] = profile
+        self._profiles.move_to_end(profile.user_id)
+        if len(self._profiles) > self.max_profiles:
+            self._profiles.popitem(last=False)
+
+    async def record(self, user_id: str, interaction: Dict[str, Any]) -> bool:
+        """
+        Apply an interaction to a materialized profile.
+
+        Users without one are skipped: their first read rebuilds from the
+        interaction history, which already includes this interaction.
+        """
+        if self.redis:
+            return await self._record_shared(user_id, interaction)
+
+        profile = await self.get(user_id)
+        if profile is None:
+            return False
+        profile.apply(interaction)
+        await self.save(profile)
+        return True
+
+    async def _record_shared(self, user_id: str, interaction: Dict[str, Any]) -> bool:
+        """Read-apply-write under WATCH, retried if another worker wrote first"""
+        key = self._redis_key(user_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for attempt in range(self.MAX_UPDATE_ATTEMPTS):
+                if attempt:
+                    await asyncio.sleep(random.uniform(0, 0.005 * attempt))
+                try:
+                    await pipe.watch(key)
+                    cached = await pipe.get(key)
+                    if not cached:
+                        return False
+                    profile = IncrementalBehaviorProfile(**json.loads(cached))
+                    profile.apply(interaction)
+                    pipe.multi()
+                    pipe.set(key, json.dumps(asdict(profile)), ex=self.recompute_interval * 2)
+                    await pipe.execute()
+                    return True
+                except WatchError:
+                    continue
+        logger.warning(f"Behavior profile for {user_id} kept changing, interaction not applied")
+        return False
+
+    async def rebuild(self, user_id: str, interactions: List[Dict[str, Any]]) -> IncrementalBehaviorProfile:
+        """Full recompute from interaction history (any order)"""
+        profile = IncrementalBehaviorProfile(user_id=user_id)
+        for interaction in sorted(interactions, key=lambda i: _epoch(i['timestamp'])):
+            profile.apply(interaction)
+        profile.recomputed_at = time.time()
+        await self.save(profile)
+        return profile
+
+    def needs_recompute(self, profile: Optional[IncrementalBehaviorProfile]) -> bool:
+        return profile is None or time.time() - profile.recomputed_at >= self.recompute_interval
+
+
+# Shared store for analyzers created without Redis (e.g. per-request instances)
+behavior_profile_store = BehaviorProfileStore()
+
+
 @dataclass
 class UserInsight:
     """AI-generated user insights"""
@@ -142,7 +452,8 @@ class UserBehaviorAnalyzer:
     def __init__(self, supabase_client, redis_client=None):
         self.supabase = supabase_client
         self.redis = redis_client
-        self.scaler = StandardScaler()
+        self.scaler = None  # created with the first segmentation run
+        self.profile_store = BehaviorProfileStore(redis_client) if redis_client else behavior_profile_store
 
     async def track_interaction(
         self,
@@ -181,17 +492,23 @@ class UserBehaviorAnalyzer:
                 result_count=context.get('result_count')
             )
 
-            # Store in database
-            result = self.supabase.table('user_interactions').insert(
-                asdict(interaction)
-            ).execute()
+            # Store in database (buffered for bulk insert when the pipeline is running)
+            pipeline = get_event_pipeline()
+            if pipeline:
+                pipeline.record_interaction(asdict(interaction))
+            else:
+                self.supabase.table('user_interactions').insert(
+                    asdict(interaction)
+                ).execute()
 
             # Cache recent interactions for real-time analysis
             if self.redis:
                 cache_key = f"user_interactions:{user_id}"
-                self.redis.lpush(cache_key, json.dumps(asdict(interaction), default=str))
-                self.redis.ltrim(cache_key, 0, 99)  # Keep last 100 interactions
-                self.redis.expire(cache_key, 86400)  # 24 hours
+                pipe = self.redis.pipeline()
+                pipe.lpush(cache_key, json.dumps(asdict(interaction), default=str))
+                pipe.ltrim(cache_key, 0, 99)  # Keep last 100 interactions
+                pipe.expire(cache_key, 86400)  # 24 hours
+                await pipe.execute()
 
             # Trigger real-time profile update for active users
             await self._update_real_time_profile(user_id, interaction)
@@ -226,6 +543,9 @@ class UserBehaviorAnalyzer:
 
             interactions = interactions_result.data
 
+            # Full recompute also resets the incremental aggregates (drift correction)
+            await self.profile_store.rebuild(user_id, interactions or [])
+
             if not interactions:
                 return self._create_default_profile(user_id)
 
@@ -271,6 +591,79 @@ class UserBehaviorAnalyzer:
             logger.error(f"Error analyzing user patterns: {str(e)}")
             return self._create_default_profile(user_id)
 
+    async def get_user_profile(self, user_id: str) -> UserBehaviorProfile:
+        """
+        Materialized behavior profile for request-time personalization.
+
+        Served from the incremental aggregates kept up to date by
+        track_interaction; falls back to analyze_user_patterns only when no
+        profile exists yet or the periodic drift-correction recompute is due.
+        """
+        try:
+            state = await self.profile_store.get(user_id)
+            if self.profile_store.needs_recompute(state):
+                return await self.analyze_user_patterns(user_id)
+            return self._profile_from_aggregates(state)
+
+        except Exception as e:
+            logger.error(f"Error reading materialized profile: {str(e)}")
+            return await self.analyze_user_patterns(user_id)
+
+    def _profile_from_aggregates(self, state: IncrementalBehaviorProfile) -> UserBehaviorProfile:
+        """Build UserBehaviorProfile from running aggregates (no history scan)"""
+        total = state.total
+        if not total:
+            return self._create_default_profile(state.user_id)
+
+        engagement_score = self._engagement_from_counts(state.recent_interactions(7), total)
+        type_counts = Counter(state.type_counts)
+        hour_counts = Counter({int(h): c for h, c in state.hour_counts.items()})
+        day_counts = Counter({int(d): c for d, c in state.day_counts.items()})
+
+        geographic_focus = []
+        for area, count in Counter(state.area_counts).most_common(5):
+            lat, lng = map(float, area.split(','))
+            geographic_focus.append({
+                'area': area,
+                'center': {'lat': lat, 'lng': lng},
+                'frequency': count / state.locations
+            })
+
+        search_patterns = {}
+        if state.searches:
+            terms = state.interest_vector()
+            search_patterns = {
+                'total_searches': state.searches,
+                'common_terms': [t for t, _ in sorted(terms.items(), key=lambda x: x[1], reverse=True)[:10]],
+                'avg_query_length': state.query_words / state.searches,
+                'unique_queries': len(state.query_hashes)
+            }
+
+        durations = [last - first for first, last in state.sessions.values() if last > first]
+
+        return UserBehaviorProfile(
+            user_id=state.user_id,
+            segment=self._segment_from_counts(total, engagement_score, state.professional),
+            total_interactions=total,
+            interaction_frequency=total / PROFILE_WINDOW_DAYS,
+            preferred_interaction_types=[t for t, _ in type_counts.most_common(5)],
+            geographic_focus=geographic_focus,
+            search_patterns=search_patterns,
+            time_patterns={
+                'peak_hours': [h for h, _ in hour_counts.most_common(3)],
+                'peak_days': [d for d, _ in day_counts.most_common(3)],
+                'hour_distribution': dict(hour_counts),
+                'day_distribution': dict(day_counts)
+            },
+            expertise_level=self._expertise_from_counts(state.advanced, total),
+            engagement_score=engagement_score,
+            risk_tolerance=self._risk_from_counts(state.conservative, state.aggressive),
+            interests=state.interests[:10],
+            preferred_authorities=[a for a, _ in Counter(state.authority_counts).most_common(5)],
+            session_duration_avg=float(np.mean(durations)) if durations else 60,
+            last_updated=datetime.utcfromtimestamp(state.last_seen or time.time())
+        )
+
     async def identify_user_segments(self, user_ids: Optional[List[str]] = None) -> Dict[str, UserSegment]:
         """
         Identify user segments using machine learning clustering
@@ -312,6 +705,10 @@ class UserBehaviorAnalyzer:
                 ])
                 user_id_list.append(profile['user_id'])
 
+            KMeans, StandardScaler = _clustering_models()
+            if self.scaler is None:
+                self.scaler = StandardScaler()
+
             # Normalize features
             features_scaled = self.scaler.fit_transform(features)
 
@@ -347,7 +744,7 @@ class UserBehaviorAnalyzer:
             List of predicted interests with confidence scores
         """
         try:
-            profile = await self.analyze_user_patterns(user_id)
+            profile = await self.get_user_profile(user_id)
 
             # Analyze search patterns
             search_interests = self._extract_search_interests(profile.search_patterns)
@@ -399,7 +796,7 @@ class UserBehaviorAnalyzer:
             Engagement score (0-1)
         """
         try:
-            profile = await self.analyze_user_patterns(user_id)
+            profile = await self.get_user_profile(user_id)
 
             # Factor weights
             weights = {
@@ -446,7 +843,7 @@ class UserBehaviorAnalyzer:
             List of actionable user insights
         """
         try:
-            profile = await self.analyze_user_patterns(user_id)
+            profile = await self.get_user_profile(user_id)
             insights = []
 
             # Insight 1: Usage patterns
@@ -647,17 +1044,12 @@ class UserBehaviorAnalyzer:
 
     def _calculate_expertise_level(self, interactions: List[Dict]) -> float:
         """Calculate user expertise level (0-1)"""
-        advanced_interactions = [
-            InteractionType.GENERATE_REPORT,
-            InteractionType.EXPORT_DATA,
-            InteractionType.CREATE_ALERT,
-            InteractionType.AI_SUMMARY_VIEW
-        ]
-
         advanced_count = sum(1 for i in interactions
-                           if i['interaction_type'] in advanced_interactions)
+                           if i['interaction_type'] in ADVANCED_INTERACTIONS)
+        return self._expertise_from_counts(advanced_count, len(interactions))
 
-        total_interactions = len(interactions)
+    @staticmethod
+    def _expertise_from_counts(advanced_count: int, total_interactions: int) -> float:
         if total_interactions == 0:
             return 0.0
 
@@ -679,30 +1071,26 @@ class UserBehaviorAnalyzer:
             if datetime.fromisoformat(i['timestamp'].replace('Z', '+00:00')) > recent_cutoff
         ]
 
-        recent_weight = len(recent_interactions) / 7  # per day
-        total_weight = len(interactions) / 90  # per day over 90 days
+        return self._engagement_from_counts(len(recent_interactions), len(interactions))
+
+    @staticmethod
+    def _engagement_from_counts(recent_count: int, total_count: int) -> float:
+        recent_weight = recent_count / 7  # per day
+        total_weight = total_count / PROFILE_WINDOW_DAYS  # per day over 90 days
 
         return min((recent_weight * 0.6 + total_weight * 0.4) / 5, 1.0)  # Max 5 per day
 
     def _calculate_risk_tolerance(self, interactions: List[Dict]) -> float:
         """Calculate user risk tolerance based on behavior"""
         # Simplified risk tolerance based on interaction patterns
-        conservative_interactions = [
-            InteractionType.VIEW_APPLICATION,
-            InteractionType.SAVE_SEARCH
-        ]
-
-        aggressive_interactions = [
-            InteractionType.GENERATE_REPORT,
-            InteractionType.EXPORT_DATA,
-            InteractionType.SHARE_APPLICATION
-        ]
-
         conservative_count = sum(1 for i in interactions
-                               if i['interaction_type'] in conservative_interactions)
+                               if i['interaction_type'] in CONSERVATIVE_INTERACTIONS)
         aggressive_count = sum(1 for i in interactions
-                             if i['interaction_type'] in aggressive_interactions)
+                             if i['interaction_type'] in AGGRESSIVE_INTERACTIONS)
+        return self._risk_from_counts(conservative_count, aggressive_count)
 
+    @staticmethod
+    def _risk_from_counts(conservative_count: int, aggressive_count: int) -> float:
         total = conservative_count + aggressive_count
         if total == 0:
             return 0.5  # Neutral
@@ -711,8 +1099,12 @@ class UserBehaviorAnalyzer:
 
     def _determine_user_segment(self, interactions: List[Dict], engagement_score: float) -> UserSegment:
         """Determine user segment based on behavior"""
-        total_interactions = len(interactions)
+        professional_count = sum(1 for i in interactions
+                               if i['interaction_type'] in PROFESSIONAL_INTERACTIONS)
+        return self._segment_from_counts(len(interactions), engagement_score, professional_count)
 
+    @staticmethod
+    def _segment_from_counts(total_interactions: int, engagement_score: float, professional_count: int) -> UserSegment:
         if total_interactions < 5:
             return UserSegment.NEWCOMER
         elif engagement_score < 0.2:
@@ -723,14 +1115,7 @@ class UserBehaviorAnalyzer:
             return UserSegment.REGULAR_USER
         else:
             # Check for professional indicators
-            professional_types = [
-                InteractionType.GENERATE_REPORT,
-                InteractionType.EXPORT_DATA,
-                InteractionType.CREATE_ALERT
-            ]
-
-            professional_ratio = sum(1 for i in interactions
-                                   if i['interaction_type'] in professional_types) / total_interactions
+            professional_ratio = professional_count / total_interactions
 
             if professional_ratio > 0.3:
                 return UserSegment.PROFESSIONAL
@@ -777,22 +1162,11 @@ class UserBehaviorAnalyzer:
                                          key=lambda x: x[1], reverse=True)[:5]]
 
     async def _update_real_time_profile(self, user_id: str, interaction: UserInteraction):
-        """Update user profile in real-time for critical interactions"""
-        # Only update for important interactions
-        critical_types = [
-            InteractionType.SEARCH,
-            InteractionType.SAVE_SEARCH,
-            InteractionType.CREATE_ALERT,
-            InteractionType.GENERATE_REPORT
-        ]
-
-        if interaction.interaction_type in critical_types and self.redis:
-            # Update cached profile stats
-            profile_key = f"user_profile:{user_id}"
-            self.redis.hincrby(profile_key, "total_interactions", 1)
-            self.redis.hset(profile_key, "last_interaction",
-                          interaction.timestamp.isoformat())
-            self.redis.expire(profile_key, 86400)  # 24 hours
+        """Fold the interaction into the user's materialized profile (O(1))"""
+        try:
+            await self.profile_store.record(user_id, asdict(interaction))
+        except Exception as e:
+            logger.warning(f"Incremental profile update failed for {user_id}: {str(e)}")
 
     async def _store_behavior_profile(self, profile: UserBehaviorProfile):
         """Store behavior profile in database"""
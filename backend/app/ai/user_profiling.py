@@ -9,9 +9,6 @@ from enum import Enum
 import json
 import logging
 import numpy as np
-from sklearn.cluster import KMeans, DBSCAN
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import silhouette_score
 from collections import defaultdict, Counter
 import asyncio
 
@@ -148,8 +145,8 @@ class UserProfilingSystem:
         self.behavior_analyzer = behavior_analyzer
         self.redis = redis_client
 
-        # ML models for clustering
-        self.scaler = StandardScaler()
+        # ML models for clustering (sklearn is imported on first use)
+        self.scaler = None
         self.persona_clusters = None
         self.segment_clusters = None
 
@@ -170,7 +167,7 @@ class UserProfilingSystem:
         """
         try:
             # Get user behavior profile
-            behavior_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            behavior_profile = await self.behavior_analyzer.get_user_profile(user_id)
 
             # Determine persona type
             persona_type, confidence = await self._determine_persona_type(user_id, behavior_profile)
@@ -385,7 +382,7 @@ class UserProfilingSystem:
             if not persona:
                 persona = await self.create_user_persona(user_id)
 
-            behavior_profile = await self.behavior_analyzer.analyze_user_patterns(user_id)
+            behavior_profile = await self.behavior_analyzer.get_user_profile(user_id)
 
             predictions = {
                 'likely_interactions': await self._predict_likely_interactions(
@@ -914,6 +911,9 @@ class UserProfilingSystem:
         best_score = -1
         best_clusters = 2
 
+        from sklearn.cluster import KMeans
+        from sklearn.metrics import silhouette_score
+
         for n_clusters in range(2, min(10, len(features) // 5)):
             try:
                 kmeans = KMeans(n_clusters=n_clusters, random_state=42)
@@ -931,7 +931,12 @@ class UserProfilingSystem:
 
     def _perform_clustering(self, features: np.ndarray, n_clusters: int) -> np.ndarray:
         """Perform K-means clustering"""
+        from sklearn.cluster import KMeans
+        from sklearn.preprocessing import StandardScaler
+
         # Normalize features
+        if self.scaler is None:
+            self.scaler = StandardScaler()
         features_scaled = self.scaler.fit_transform(features)
 
         # Perform clustering
@@ -553,6 +553,10 @@ async def submit_batch_processing(
     - summarization: Generate AI summaries
     - embeddings: Create vector embeddings
     - market_context: Add market intelligence
+    - text_analysis: Rule-based complexity, sentiment and entity extraction
+
+    Requests that only use CPU-bound features (opportunity_scoring,
+    text_analysis) run in a separate process pool.
 
     **Priority Levels:**
     - urgent: Process immediately
@@ -786,6 +790,7 @@ async def get_ai_service_status():
     try:
         from app.services.ai_processor import ai_processor
         from app.services.background_processor import background_processor
+        from app.services.llm_cache import get_llm_cache
 
         # Get AI processor status
         ai_status = ai_processor.get_service_status()
@@ -800,6 +805,7 @@ async def get_ai_service_status():
             "overall_status": "operational",
             "ai_processor": ai_status,
             "background_processor": bg_status,
+            "llm_cache": get_llm_cache().get_stats(),
             "health_check": health_check,
             "features_available": {
                 "opportunity_scoring": bool(ai_processor.opportunity_scorer),
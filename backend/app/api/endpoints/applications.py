@@ -17,6 +17,7 @@ from app.models.applications import (
 )
 from app.middleware.auth import get_optional_user, log_api_request
 from app.db.elasticsearch import es_client
+from app.services.enrichment_queue import get_enrichment_queue, PRIORITY_VIEWED
 
 logger = logging.getLogger(__name__)
 
@@ -163,6 +164,11 @@ async def get_application_by_id(
                 detail=f"Application {id} not found"
             )
 
+        # Viewed applications are likely to have a report requested next
+        enrichment_queue = get_enrichment_queue()
+        if enrichment_queue:
+            enrichment_queue.submit(application.application_id, application.url, PRIORITY_VIEWED)
+
         # Enhance with real-time AI insights if requested and user has access
         if include_ai_insights:
             try:
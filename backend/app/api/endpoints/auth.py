@@ -177,6 +177,7 @@ async def logout_user(
             )
 
         # Sign out with Supabase
+        auth_middleware.revoke_token(credentials.credentials)
         success = await supabase_client.sign_out_user(credentials.credentials)
 
         if success:
@@ -21,6 +21,7 @@ from app.core.dependencies import (
     rate_limit_tracker
 )
 from app.core.exceptions import error_handler
+from app.core.startup import startup_manager
 from app.middleware.auth import get_admin_user, get_optional_user
 from app.db.supabase import supabase_client
 from app.db.elasticsearch import es_client
@@ -131,21 +132,32 @@ async def readiness_probe():
     Kubernetes readiness probe endpoint
 
     Check if the application is ready to receive traffic.
+
+    Also reports which capabilities are warm (stats cache, AI models) and
+    per-component startup times. With READINESS_REQUIRE_WARM the probe
+    fails until warmup has finished.
     """
     try:
         # Check critical dependencies
-        await supabase_client.ensure_connection()
-        await es_client.ensure_connection()
+        await asyncio.gather(supabase_client.ensure_connection(), es_client.ensure_connection())
 
-        return {
+        readiness = startup_manager.get_readiness()
+        content = {
             "status": "ready",
             "timestamp": datetime.utcnow().isoformat(),
             "checks": {
                 "supabase": "healthy",
                 "elasticsearch": "healthy"
-            }
+            },
+            **readiness
         }
 
+        if settings.readiness_require_warm and not readiness["warm"]:
+            content["status"] = "warming"
+            return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=content)
+
+        return content
+
     except Exception as e:
         logger.error(f"Readiness check failed: {str(e)}")
         return JSONResponse(
@@ -223,8 +235,8 @@ async def service_status(admin_user: Dict[str, Any] = Depends(get_admin_user)):
             "status": "healthy",
             "details": {
                 "connected": True,
-                "pool_size": getattr(supabase_client.pool, 'pool_size', 1) if supabase_client.pool else 1,
-                "connection_type": "pooled" if supabase_client.pool else "single"
+                "pool_size": supabase_client.pool_size,
+                "connection_type": "pooled"
             }
         }
     except Exception as e:
@@ -9,6 +9,7 @@ import logging
 
 from app.middleware.auth import get_current_user, get_current_user_profile as get_current_active_user
 from app.db.supabase import supabase_client
+from app.services.cache_service import get_cache_service
 from app.models.user import (
     UserProfile,
     RecommendationType,
@@ -36,7 +37,10 @@ security = HTTPBearer()
 async def get_ai_services():
     """Get AI personalization services"""
     supabase = get_supabase_client()
-    behavior_analyzer = UserBehaviorAnalyzer(supabase)
+    # Shared Redis keeps materialized behavior profiles consistent across workers
+    cache_service = get_cache_service()
+    redis_client = cache_service.redis_client if cache_service and cache_service.available else None
+    behavior_analyzer = UserBehaviorAnalyzer(supabase, redis_client)
     personalization_engine = PersonalizationEngine(supabase, behavior_analyzer)
     learning_system = LearningSystem(supabase, behavior_analyzer, personalization_engine)
     privacy_manager = PrivacyManager(supabase)
@@ -271,7 +275,7 @@ async def get_user_insights(
         behavior_analyzer = services['behavior_analyzer']
 
         # Get user behavior profile
-        user_profile = await behavior_analyzer.analyze_user_patterns(user_id)
+        user_profile = await behavior_analyzer.get_user_profile(user_id)
 
         # Get user insights
         insights = await behavior_analyzer.generate_user_insights(user_id)
@@ -353,7 +357,7 @@ async def personalize_search_results(
 
             # Check if geographic preferences were applied
             behavior_analyzer = services['behavior_analyzer']
-            user_profile = await behavior_analyzer.analyze_user_patterns(current_user.user_id)
+            user_profile = await behavior_analyzer.get_user_profile(current_user.user_id)
             if user_profile.geographic_focus:
                 personalization_factors.append("Prioritized based on your geographic interests")
 
@@ -507,7 +511,7 @@ async def get_user_behavior_profile(
         behavior_analyzer = services['behavior_analyzer']
 
         # Get behavior profile
-        profile = await behavior_analyzer.analyze_user_patterns(user_id)
+        profile = await behavior_analyzer.get_user_profile(user_id)
 
         # Convert to response format (excluding sensitive data for non-admin users)
         profile_data = {
@@ -4,13 +4,18 @@ FastAPI routes for pSEO page generation, retrieval, and management
 """
 
 from typing import Optional, Dict, List
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from datetime import datetime
+import asyncio
 import logging
+import os
 
 from app.services.pseo.orchestrator import pSEOOrchestrator
 from app.services.pseo.batch_processor import BatchProcessor
+from app.services.pseo.static_export import (
+    StaticPageExporter, StaticPageStore, etag_matches, negotiate_encoding, variant_etag
+)
 from app.db.elasticsearch import es_client
 
 # Setup logging
@@ -19,6 +24,9 @@ logger = logging.getLogger(__name__)
 # Create router (no prefix - will be added by api_router inclusion)
 router = APIRouter(tags=["pSEO"])
 
+# Pre-rendered pages written by `python -m app.services.pseo.static_export`
+static_store = StaticPageStore()
+
 
 # === PAGE RETRIEVAL ENDPOINTS ===
 
@@ -125,6 +133,9 @@ async def generate_pseo_page(
                 detail=f"Page generation failed: {page.get('error')}"
             )
 
+        # The static export is served ahead of ES, so keep it in step
+        await asyncio.to_thread(StaticPageExporter().update_page, page)
+
         return JSONResponse(
             status_code=201,
             content={
@@ -354,6 +365,7 @@ async def clear_authority_cache(
     """
 
     try:
+        await asyncio.to_thread(StaticPageExporter().remove_page, authority_id)
         await es_client.client.delete(
             index="pseo_pages",
             id=authority_id
@@ -402,6 +414,7 @@ async def clear_all_cache(
         )
 
         deleted_count = result['deleted']
+        await asyncio.to_thread(StaticPageExporter().remove_all)
 
         return JSONResponse(
             status_code=200,
@@ -452,11 +465,30 @@ async def health_check(
     except Exception as e:
         logger.error(f"Health check failed: {e}")
 
+
+@router.get("/sitemap.xml")
+async def get_pseo_sitemap():
+    """
+    Stream the sitemap for all statically exported pSEO pages.
+
+    Returns:
+        XML sitemap
+    """
+
+    return StreamingResponse(
+        static_store.sitemap(os.getenv('PSEO_SITE_URL', '')),
+        media_type="application/xml"
+    )
+
+
 @router.get("/{authority_slug}")
-async def get_pseo_page(authority_slug: str):
+async def get_pseo_page(authority_slug: str, request: Request):
     """
     Get generated pSEO page for an authority by slug.
 
+    Served from the static export (precompressed, ETag/304 aware) when the
+    page has been exported, otherwise read from Elasticsearch.
+
     Args:
         authority_slug: URL slug for authority (e.g., 'birmingham')
 
@@ -464,6 +496,25 @@ async def get_pseo_page(authority_slug: str):
         Complete pSEO page data with all sections
     """
 
+    entry = static_store.lookup(authority_slug)
+    if entry is not None:
+        # Each encoding is a distinct representation with its own strong ETag
+        encoding = negotiate_encoding(request.headers.get("accept-encoding", ""), entry["encodings"])
+        etag = variant_etag(entry["etag"], encoding)
+        headers = {
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+            "Cache-Control": "public, max-age=300"
+        }
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        body = await static_store.read(entry, encoding)
+        if body is not None:
+            if encoding:
+                headers["Content-Encoding"] = encoding
+            return Response(content=body, media_type="application/json", headers=headers)
+
     try:
         # Try to get document by ID (assuming authority_id is used as doc ID)
         # If that fails, search by url_slug
@@ -11,6 +11,7 @@ from app.services.ai_processor import ai_processor, ProcessingMode
 from app.middleware.auth import get_optional_user, log_api_request, require_subscription
 from app.models.planning import PlanningApplicationResponse
 from app.services.cache_service import get_cache_service
+from app.services.enrichment_queue import get_enrichment_queue
 from app.agents.enrichment.applicant_agent import enrich_applicant_data
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,25 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+async def _enrich_inline(application_id: str, url: str) -> Optional[Dict[str, Any]]:
+    """Cache-then-scrape enrichment used when the background queue is disabled"""
+    cache_service = get_cache_service()
+    if cache_service and cache_service.available:
+        cached_enrichment = await cache_service.get_enrichment(application_id)
+        if cached_enrichment:
+            return cached_enrichment
+
+    enrichment_result = await enrich_applicant_data(url=url, application_id=application_id)
+    if not enrichment_result.get("success"):
+        logger.warning(f"[REPORT] Enrichment failed: {enrichment_result.get('error', 'Unknown error')}")
+        return None
+
+    enrichment_data = enrichment_result["data"]
+    if cache_service and cache_service.available:
+        await cache_service.set_enrichment(application_id, enrichment_data)
+    return enrichment_data
+
+
 @router.get("/report/{application_id:path}")
 async def generate_bank_grade_report(
     application_id: str = Path(..., description="Planning application ID (can contain slashes)"),
@@ -93,62 +113,30 @@ async def generate_bank_grade_report(
             try:
                 logger.info(f"[REPORT] Starting data enrichment for {application_id}")
 
-                # Check cache first
-                cache_service = get_cache_service()
-                if cache_service and cache_service.available:
-                    cached_enrichment = await cache_service.get_enrichment(application_id)
-                    if cached_enrichment:
-                        enriched_applicant_name = cached_enrichment.get("applicant_name")
-                        enriched_agent_name = cached_enrichment.get("agent_name")
-                        enriched_ward_name = cached_enrichment.get("ward_name")
-                        enriched_decided_date = cached_enrichment.get("decided_date")
-                        enriched_n_documents = cached_enrichment.get("n_documents")
-                        enriched_n_statutory_days = cached_enrichment.get("n_statutory_days")
-                        enriched_docs_url = cached_enrichment.get("docs_url")
-                        logger.info(f"[REPORT] Using cached enrichment data")
-
-                # If not cached, run enrichment agent
-                if not enriched_applicant_name:
-                    enrichment_result = await enrich_applicant_data(
-                        url=application.url,
-                        application_id=application_id
+                # Read precomputed enrichment; live scraping only with a strict timeout
+                enrichment_queue = get_enrichment_queue()
+                if enrichment_queue:
+                    enrichment_data = await enrichment_queue.get_or_enrich(application_id, application.url)
+                else:
+                    enrichment_data = await _enrich_inline(application_id, application.url)
+
+                if enrichment_data:
+                    enriched_applicant_name = enrichment_data.get("applicant_name")
+                    enriched_agent_name = enrichment_data.get("agent_name")
+                    enriched_ward_name = enrichment_data.get("ward_name")
+                    enriched_decided_date = enrichment_data.get("decided_date")
+                    enriched_n_documents = enrichment_data.get("n_documents")
+                    enriched_n_statutory_days = enrichment_data.get("n_statutory_days")
+                    enriched_docs_url = enrichment_data.get("docs_url")
+                    logger.info(
+                        f"[REPORT] Enrichment available: "
+                        f"applicant={enriched_applicant_name}, "
+                        f"agent={enriched_agent_name}, "
+                        f"ward={enriched_ward_name}, "
+                        f"docs={enriched_n_documents}"
                     )
-
-                    if enrichment_result.get("success"):
-                        enriched_applicant_name = enrichment_result["data"].get("applicant_name")
-                        enriched_agent_name = enrichment_result["data"].get("agent_name")
-                        enriched_ward_name = enrichment_result["data"].get("ward_name")
-                        enriched_decided_date = enrichment_result["data"].get("decided_date")
-                        enriched_n_documents = enrichment_result["data"].get("n_documents")
-                        enriched_n_statutory_days = enrichment_result["data"].get("n_statutory_days")
-                        enriched_docs_url = enrichment_result["data"].get("docs_url")
-
-                        logger.info(
-                            f"[REPORT] Enrichment completed: "
-                            f"applicant={enriched_applicant_name}, "
-                            f"agent={enriched_agent_name}, "
-                            f"ward={enriched_ward_name}, "
-                            f"docs={enriched_n_documents}, "
-                            f"method={enrichment_result['metadata']['extraction_method']}, "
-                            f"time={enrichment_result['metadata']['processing_time_ms']}ms"
-                        )
-
-                        # Cache the result
-                        if cache_service and cache_service.available:
-                            await cache_service.set_enrichment(
-                                application_id,
-                                {
-                                    "applicant_name": enriched_applicant_name,
-                                    "agent_name": enriched_agent_name,
-                                    "ward_name": enriched_ward_name,
-                                    "decided_date": enriched_decided_date,
-                                    "n_documents": enriched_n_documents,
-                                    "n_statutory_days": enriched_n_statutory_days,
-                                    "docs_url": enriched_docs_url
-                                }
-                            )
-                    else:
-                        logger.warning(f"[REPORT] Enrichment failed: {enrichment_result.get('error', 'Unknown error')}")
+                else:
+                    logger.info(f"[REPORT] No enrichment available yet for {application_id}")
 
             except Exception as enrichment_error:
                 logger.error(f"[REPORT] Enrichment error: {enrichment_error}", exc_info=True)
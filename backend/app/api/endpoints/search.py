@@ -14,6 +14,7 @@ from app.models.planning import (
     DevelopmentType, ApplicationType, DecisionType
 )
 from app.middleware.auth import get_optional_user, log_api_request
+from app.services.enrichment_queue import get_enrichment_queue
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -37,7 +38,14 @@ async def search_applications(
     - **include_ai_fields**: Include AI-generated insights
     """
     try:
-        return await search_service.search_applications(search_request)
+        result = await search_service.search_applications(search_request)
+
+        # Pre-enrich top hits so their reports are ready when opened
+        enrichment_queue = get_enrichment_queue()
+        if enrichment_queue:
+            enrichment_queue.submit_search_hits(result.results)
+
+        return result
     except Exception as e:
         error_trace = traceback.format_exc()
         logger.error(f"Standard search failed: {str(e)}\nTraceback: {error_trace}")
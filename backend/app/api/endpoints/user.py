@@ -3,7 +3,7 @@ User-specific features endpoints for Planning Explorer API
 """
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from app.db.supabase import supabase_client
 from app.middleware.auth import (
@@ -18,6 +18,9 @@ from app.models.user import (
     UserStatsResponse, UserRole
 )
 from app.services.notification_service import notification_service
+from app.services.alert_matcher import alert_matcher, summarize_application
+from app.services.saved_search_runner import saved_search_runner
+from app.db.elasticsearch import es_client
 
 router = APIRouter()
 
@@ -574,6 +577,8 @@ async def delete_saved_search(
                 detail="Saved search not found"
             )
 
+        saved_search_runner.invalidate(search_id)
+
         return {"message": "Saved search deleted successfully"}
 
     except Exception as e:
@@ -587,18 +592,19 @@ async def delete_saved_search(
 @router.post("/user/searches/{search_id}/run")
 async def execute_saved_search(
     search_id: str = Path(..., description="Saved search ID"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Results per page"),
     current_user: UserProfile = Depends(get_current_user_profile)
 ):
     """
     Execute a saved search and return results
 
-    Runs the saved search query and returns current results,
-    updating usage statistics and performance metrics.
+    Runs the saved search query and returns current results plus the
+    applications that are new since the previous run, updating usage
+    statistics and the search's run cursor.
     """
     try:
-        # Get saved search
-        saved_searches = await supabase_client.get_user_saved_searches(current_user.user_id)
-        saved_search = next((s for s in saved_searches if s.search_id == search_id), None)
+        saved_search = await supabase_client.get_saved_search(search_id, current_user.user_id)
 
         if not saved_search:
             raise HTTPException(
@@ -606,10 +612,17 @@ async def execute_saved_search(
                 detail="Saved search not found"
             )
 
-        # Update usage tracking
+        run = await saved_search_runner.run(saved_search, page=page, page_size=page_size)
+        response = run["response"]
+        executed_at = datetime.utcnow()
+
+        # Update usage tracking and the "new since last run" cursor
         update_data = {
-            "last_used": datetime.utcnow().isoformat(),
-            "use_count": getattr(saved_search, 'use_count', 0) + 1
+            "last_used": executed_at.isoformat(),
+            "use_count": getattr(saved_search, 'use_count', 0) + 1,
+            "last_run": executed_at.isoformat(),
+            "result_count": response.total,
+            "run_cursor": run["cursor"]
         }
 
         await supabase_client.update_saved_search(
@@ -626,18 +639,21 @@ async def execute_saved_search(
             current_user={"user_id": current_user.user_id}
         )
 
-        # TODO: Execute actual search using the search service
-        # For now, return mock response
         return {
             "search_id": search_id,
-            "executed_at": datetime.utcnow().isoformat(),
+            "executed_at": executed_at.isoformat(),
             "query": saved_search.query,
             "filters": saved_search.filters,
             "results_summary": {
-                "total_results": 42,  # Mock data
-                "new_since_last_run": 5,
-                "execution_time_ms": 150
+                "total_results": response.total,
+                "new_since_last_run": run["new_since_last_run"],
+                "previous_run": saved_search.last_run.isoformat() if saved_search.last_run else None,
+                "execution_time_ms": response.took_ms
             },
+            "results": response.results,
+            "new_applications": [summarize_application(doc) for doc in run["new_applications"]],
+            "page": response.page,
+            "total_pages": response.total_pages,
             "next_steps": {
                 "create_alert": not getattr(saved_search, 'converted_to_alert', False),
                 "optimize_query": True,
@@ -844,6 +860,9 @@ async def create_smart_alert(
                 detail="Failed to create alert"
             )
 
+        # Start matching new applications against it
+        await alert_matcher.register_alert(alert)
+
         # Track alert creation
         await track_user_interaction(
             interaction_type="create",
@@ -911,9 +930,7 @@ async def delete_alert(
                 detail="Alert not found"
             )
 
-        # TODO: Implement actual alert deletion in supabase_client
-        # For now, return success
-        success = True  # await supabase_client.delete_user_alert(alert_id, current_user.user_id)
+        success = await supabase_client.delete_user_alert(alert_id, current_user.user_id)
 
         if not success:
             raise HTTPException(
@@ -921,6 +938,8 @@ async def delete_alert(
                 detail="Failed to delete alert"
             )
 
+        await alert_matcher.unregister_alert(alert_id)
+
         # Track deletion
         await track_user_interaction(
             interaction_type="delete",
@@ -968,42 +987,35 @@ async def test_alert(
                 detail="Alert not found"
             )
 
-        # TODO: Execute alert test using search service
-        # For now, return mock test results
+        # Run the same compiled query the percolator uses against current data
+        compiled_query = await alert_matcher.compile_alert(alert)
+        started = datetime.utcnow()
+        response = await es_client.search(
+            query=compiled_query,
+            size=5,
+            sort=[{"start_date": {"order": "desc", "missing": "_last"}}],
+            source=["uid", "name", "reference", "address", "description", "area_name", "url"],
+            track_total_hits=True
+        )
+        took_ms = int((datetime.utcnow() - started).total_seconds() * 1000)
+
+        hits = response.get("hits", {})
+        last_30_days = await es_client.count(
+            query={"bool": {"must": [compiled_query], "filter": [{"range": {"start_date": {"gte": "now-30d/d"}}}]}}
+        )
+
         test_results = {
             "alert_id": alert_id,
-            "test_executed_at": datetime.utcnow().isoformat(),
+            "test_executed_at": started.isoformat(),
             "criteria": {
                 "query": alert.query,
                 "filters": alert.filters,
                 "location_filters": alert.location_filters
             },
-            "mock_results": {
-                "total_matches": 8,
-                "high_relevance": 5,
-                "medium_relevance": 2,
-                "low_relevance": 1,
-                "ai_filtered_out": 3
-            },
-            "sample_applications": [
-                {
-                    "id": "app_123",
-                    "title": "Residential development in City Center",
-                    "relevance_score": 0.92,
-                    "reason": "High keyword match and location relevance"
-                },
-                {
-                    "id": "app_124",
-                    "title": "Commercial extension project",
-                    "relevance_score": 0.78,
-                    "reason": "Moderate keyword match"
-                }
-            ],
-            "optimization_suggestions": [
-                "Consider narrowing location radius for more targeted results",
-                "Add keyword exclusions to reduce noise"
-            ],
-            "estimated_frequency": "2-3 notifications per week"
+            "total_matches": hits.get("total", {}).get("value", 0),
+            "matches_last_30_days": last_30_days,
+            "sample_applications": [summarize_application(hit["_source"]) for hit in hits.get("hits", [])],
+            "query_time_ms": took_ms
         }
 
         # Track test execution
@@ -35,11 +35,20 @@ class Settings(BaseSettings):
     supabase_url: Optional[str] = Field(default=None, alias="SUPABASE_URL")
     supabase_key: Optional[str] = Field(default=None, alias="SUPABASE_ANON_KEY")
     supabase_service_key: Optional[str] = Field(default=None, alias="SUPABASE_SERVICE_ROLE_KEY")
+    supabase_rest_url: Optional[str] = Field(default=None, alias="SUPABASE_REST_URL")  # defaults to {SUPABASE_URL}/rest/v1
+    supabase_pool_size: int = Field(default=20, alias="SUPABASE_POOL_SIZE")
+    supabase_timeout: float = Field(default=10.0, alias="SUPABASE_TIMEOUT")
 
     # JWT Configuration
     secret_key: str = Field(default="your-secret-key-change-in-production", alias="SECRET_KEY")
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    supabase_jwt_secret: Optional[str] = Field(default=None, alias="SUPABASE_JWT_SECRET")  # verify Supabase tokens locally
+    supabase_jwks_ttl: int = Field(default=600, alias="SUPABASE_JWKS_TTL")  # seconds
+    auth_token_cache_size: int = Field(default=10000, alias="AUTH_TOKEN_CACHE_SIZE")  # verified tokens, 0 disables
+    auth_token_cache_ttl: int = Field(default=300, alias="AUTH_TOKEN_CACHE_TTL")  # seconds, capped at token expiry
+    user_profile_cache_ttl: int = Field(default=30, alias="USER_PROFILE_CACHE_TTL")  # seconds, 0 disables
+    user_profile_cache_size: int = Field(default=10000, alias="USER_PROFILE_CACHE_SIZE")
 
     # AI Configuration
     openai_api_key: Optional[str] = Field(default=None, alias="OPENAI_API_KEY")
@@ -59,6 +68,10 @@ class Settings(BaseSettings):
     # Performance Configuration
     max_connections: int = 100
     request_timeout: int = 30
+    readiness_require_warm: bool = Field(default=False, alias="READINESS_REQUIRE_WARM")  # not ready until warmup finishes
+    background_process_workers: int = Field(default=2, alias="BACKGROUND_PROCESS_WORKERS")  # 0 keeps CPU tasks on the event loop
+    background_cpu_chunk_size: int = Field(default=200, alias="BACKGROUND_CPU_CHUNK_SIZE")  # applications per process-pool job
+    background_process_nice: int = Field(default=10, alias="BACKGROUND_PROCESS_NICE")  # CPU workers yield to the API
 
     # Logging Configuration
     log_level: str = "INFO"
@@ -73,9 +86,14 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_requests: int = 100
     rate_limit_period: int = 60  # seconds
+    rate_limit_redis: bool = Field(default=True, alias="RATE_LIMIT_REDIS")  # shared limits across workers
 
     # Cache Configuration
     cache_ttl: int = 300  # 5 minutes
+    cache_warm_concurrency: int = Field(default=4, alias="CACHE_WARM_CONCURRENCY")  # authorities warmed at once
+    http_cache_max_bytes: int = Field(default=64 * 1024 * 1024, alias="HTTP_CACHE_MAX_BYTES")
+    http_cache_max_body: int = Field(default=1024 * 1024, alias="HTTP_CACHE_MAX_BODY")
+    http_cache_shared: bool = Field(default=False, alias="HTTP_CACHE_SHARED")  # also store in Redis
 
     # Email Configuration
     smtp_server: Optional[str] = Field(default=None, alias="SMTP_SERVER")
@@ -89,30 +107,66 @@ class Settings(BaseSettings):
     redis_url: Optional[str] = Field(default=None, alias="REDIS_URL")
     celery_broker_url: Optional[str] = Field(default=None, alias="CELERY_BROKER_URL")
     celery_result_backend: Optional[str] = Field(default=None, alias="CELERY_RESULT_BACKEND")
+    task_store_backend: str = Field(default="sqlite", alias="TASK_STORE_BACKEND")  # sqlite (single host) or redis
+    task_store_path: str = Field(default="./outputs/task_store.sqlite", alias="TASK_STORE_PATH")
+    task_store_redis_url: Optional[str] = Field(default=None, alias="TASK_STORE_REDIS_URL")  # defaults to REDIS_URL
+    task_result_ttl: int = Field(default=86400, alias="TASK_RESULT_TTL")  # seconds finished tasks and results are kept
+    task_visibility_timeout: int = Field(default=300, alias="TASK_VISIBILITY_TIMEOUT")  # unrenewed claims are redelivered
+    task_store_max_finished: int = Field(default=10000, alias="TASK_STORE_MAX_FINISHED")  # finished records kept per namespace
 
     # Subscription Tiers Configuration
     free_tier_api_limit: int = Field(default=1000, alias="FREE_TIER_API_LIMIT")
     free_tier_saved_searches: int = Field(default=10, alias="FREE_TIER_SAVED_SEARCHES")
     free_tier_alerts: int = Field(default=5, alias="FREE_TIER_ALERTS")
+    free_tier_rate_limit: int = Field(default=200, alias="FREE_TIER_RATE_LIMIT")  # requests per rate_limit_period
 
     professional_tier_api_limit: int = Field(default=10000, alias="PROFESSIONAL_TIER_API_LIMIT")
     professional_tier_saved_searches: int = Field(default=100, alias="PROFESSIONAL_TIER_SAVED_SEARCHES")
     professional_tier_alerts: int = Field(default=50, alias="PROFESSIONAL_TIER_ALERTS")
+    professional_tier_rate_limit: int = Field(default=600, alias="PROFESSIONAL_TIER_RATE_LIMIT")
 
     enterprise_tier_api_limit: int = Field(default=100000, alias="ENTERPRISE_TIER_API_LIMIT")
     enterprise_tier_saved_searches: int = Field(default=1000, alias="ENTERPRISE_TIER_SAVED_SEARCHES")
     enterprise_tier_alerts: int = Field(default=500, alias="ENTERPRISE_TIER_ALERTS")
+    enterprise_tier_rate_limit: int = Field(default=3000, alias="ENTERPRISE_TIER_RATE_LIMIT")
 
     # Notification Configuration
     enable_email_notifications: bool = Field(default=True, alias="ENABLE_EMAIL_NOTIFICATIONS")
     enable_push_notifications: bool = Field(default=True, alias="ENABLE_PUSH_NOTIFICATIONS")
     notification_batch_size: int = Field(default=100, alias="NOTIFICATION_BATCH_SIZE")
+    notification_digest_enabled: bool = Field(default=True, alias="NOTIFICATION_DIGEST_ENABLED")
+    notification_digest_window: int = Field(default=300, alias="NOTIFICATION_DIGEST_WINDOW")  # seconds
+    smtp_pool_size: int = Field(default=4, alias="SMTP_POOL_SIZE")
+    smtp_rate_limit: float = Field(default=10.0, alias="SMTP_RATE_LIMIT")  # messages per second
+
+    # Usage/interaction event pipeline (bulk inserts off the request path)
+    event_pipeline_enabled: bool = Field(default=True, alias="EVENT_PIPELINE_ENABLED")
+    event_flush_interval: float = Field(default=5.0, alias="EVENT_FLUSH_INTERVAL")  # seconds
+    event_batch_size: int = Field(default=500, alias="EVENT_BATCH_SIZE")
+    event_max_pending: int = Field(default=50000, alias="EVENT_MAX_PENDING")
 
     # Report Generation Configuration
     report_generation_timeout: int = Field(default=300, alias="REPORT_GENERATION_TIMEOUT")  # 5 minutes
     max_report_size_mb: int = Field(default=50, alias="MAX_REPORT_SIZE_MB")
     report_storage_path: str = Field(default="/tmp/reports", alias="REPORT_STORAGE_PATH")
 
+    # Background Enrichment Configuration
+    enrichment_queue_enabled: bool = Field(default=True, alias="ENRICHMENT_QUEUE_ENABLED")
+    enrichment_workers: int = Field(default=4, alias="ENRICHMENT_WORKERS")
+    enrichment_queue_size: int = Field(default=5000, alias="ENRICHMENT_QUEUE_SIZE")
+    enrichment_live_timeout: float = Field(default=3.0, alias="ENRICHMENT_LIVE_TIMEOUT")  # seconds
+    enrichment_search_hits: int = Field(default=0, alias="ENRICHMENT_SEARCH_HITS")  # top hits queued per search, 0 disables
+    enrichment_retry_after: int = Field(default=86400, alias="ENRICHMENT_RETRY_AFTER")  # seconds before a search hit is re-queued
+    enrichment_scan_interval: int = Field(default=30, alias="ENRICHMENT_SCAN_INTERVAL")  # minutes, 0 disables
+    enrichment_scan_days: int = Field(default=14, alias="ENRICHMENT_SCAN_DAYS")
+
+    # Alert Matching Configuration
+    alert_matching_enabled: bool = Field(default=True, alias="ALERT_MATCHING_ENABLED")
+    alert_percolator_index: str = Field(default="planning_alerts", alias="ALERT_PERCOLATOR_INDEX")
+    alert_match_interval: int = Field(default=300, alias="ALERT_MATCH_INTERVAL")  # seconds
+    alert_match_batch_size: int = Field(default=100, alias="ALERT_MATCH_BATCH_SIZE")
+    alert_match_lease_seconds: int = Field(default=600, alias="ALERT_MATCH_LEASE_SECONDS")  # one worker matches per cycle
+
     # AI Personalization Configuration
     enable_ai_personalization: bool = Field(default=True, alias="ENABLE_AI_PERSONALIZATION")
     min_user_interactions: int = Field(default=10, alias="MIN_USER_INTERACTIONS")
@@ -124,17 +178,20 @@ class Settings(BaseSettings):
             "free": {
                 "api_calls": self.free_tier_api_limit,
                 "saved_searches": self.free_tier_saved_searches,
-                "alerts": self.free_tier_alerts
+                "alerts": self.free_tier_alerts,
+                "rate_limit": self.free_tier_rate_limit
             },
             "professional": {
                 "api_calls": self.professional_tier_api_limit,
                 "saved_searches": self.professional_tier_saved_searches,
-                "alerts": self.professional_tier_alerts
+                "alerts": self.professional_tier_alerts,
+                "rate_limit": self.professional_tier_rate_limit
             },
             "enterprise": {
                 "api_calls": self.enterprise_tier_api_limit,
                 "saved_searches": self.enterprise_tier_saved_searches,
-                "alerts": self.enterprise_tier_alerts
+                "alerts": self.enterprise_tier_alerts,
+                "rate_limit": self.enterprise_tier_rate_limit
             }
         }
         return tier_configs.get(tier, tier_configs["free"])
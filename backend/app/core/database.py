@@ -3,7 +3,9 @@ Database connection management and lifecycle for Planning Explorer
 """
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
+from typing import Dict, Optional
 
 from app.db.elasticsearch import es_client
 from app.db.supabase import supabase_client
@@ -11,17 +13,7 @@ from app.db.supabase import supabase_client
 logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def lifespan_manager():
-    """
-    Application lifespan manager for database connections
-
-    Handles startup and shutdown of database connections
-    """
-    # Startup
-    logger.info("Starting application...")
-
-    # Initialize Elasticsearch connection
+async def _connect_elasticsearch():
     try:
         es_connected = await es_client.connect()
         if es_connected:
@@ -31,9 +23,10 @@ async def lifespan_manager():
     except Exception as e:
         logger.error(f"❌ Elasticsearch connection error: {str(e)}")
 
-    # Initialize Supabase connection
+
+async def _connect_supabase():
     try:
-        supabase_connected = supabase_client.connect()
+        supabase_connected = await supabase_client.connect()
         if supabase_connected:
             logger.info("✅ Supabase connection established")
         else:
@@ -41,6 +34,31 @@ async def lifespan_manager():
     except Exception as e:
         logger.error(f"❌ Supabase connection error: {str(e)}")
 
+
+async def _timed(name: str, coro, timings: Optional[Dict[str, float]]):
+    start = time.perf_counter()
+    await coro
+    if timings is not None:
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+
+@asynccontextmanager
+async def lifespan_manager(timings: Optional[Dict[str, float]] = None):
+    """
+    Application lifespan manager for database connections
+
+    Handles startup and shutdown of database connections. Elasticsearch and
+    Supabase connect concurrently; connection times (ms) are recorded in
+    `timings` if given.
+    """
+    # Startup
+    logger.info("Starting application...")
+
+    await asyncio.gather(
+        _timed("elasticsearch", _connect_elasticsearch(), timings),
+        _timed("supabase", _connect_supabase(), timings)
+    )
+
     logger.info("🚀 Application startup complete")
 
     yield
@@ -57,7 +75,7 @@ async def lifespan_manager():
 
     # Close Supabase connection
     try:
-        supabase_client.disconnect()
+        await supabase_client.disconnect()
         logger.info("✅ Supabase connection closed")
     except Exception as e:
         logger.error(f"❌ Error closing Supabase connection: {str(e)}")
@@ -93,7 +111,7 @@ async def health_check() -> dict:
     # Check Supabase
     try:
         # Simple connection test
-        supabase_healthy = supabase_client.client is not None
+        supabase_healthy = supabase_client.db is not None
         health_status["services"]["supabase"] = {
             "status": "healthy" if supabase_healthy else "unhealthy",
             "connected": supabase_healthy
@@ -250,7 +250,7 @@ async def check_api_health() -> Dict[str, Any]:
         health_status["services"]["supabase"] = {
             "status": "healthy",
             "connected": True,
-            "pool_size": getattr(supabase_client.pool, 'pool_size', 1) if supabase_client.pool else 1
+            "pool_size": supabase_client.pool_size
         }
     except Exception as e:
         health_status["services"]["supabase"] = {
@@ -3,11 +3,17 @@ Application startup and initialization for Planning Explorer AI-enhanced backend
 
 Handles initialization of AI services, background processors, cache management,
 and other components required for the full AI intelligence layer.
+
+Independent initializers run concurrently and each one's duration is
+recorded in `startup_manager.timings`. Slow, optional work (cache warming,
+loading local AI models) runs as background warmup tasks once the server
+is accepting traffic; `get_readiness()` reports which capabilities are warm.
 """
 
 import asyncio
 import logging
-from typing import Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -22,28 +28,33 @@ class StartupManager:
         self.ai_processor_initialized = False
         self.background_processor_started = False
         self.cache_manager_started = False
+        # component -> startup time in ms
+        self.timings: Dict[str, float] = {}
+        # capability -> "warming" | "ready" | "failed"
+        self.capabilities: Dict[str, str] = {}
+        self._warmup_tasks: List[asyncio.Task] = []
+
+    async def run_timed(self, component: str, coro: Awaitable[Any]) -> Any:
+        """Await an initializer, recording how long it took"""
+        start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            self.timings[component] = round((time.perf_counter() - start) * 1000, 1)
 
     async def initialize_ai_services(self) -> bool:
-        """Initialize AI processing services"""
+        """
+        Initialize AI processing services
+
+        The AI components themselves are built by the "ai_models" warmup
+        (see load_ai_models) or on first use, not on the startup path.
+        """
         try:
             from app.services.ai_processor import ai_processor
 
-            # AI processor initializes components in its constructor
-            # Just verify it's working
-            health_status = await ai_processor.health_check()
-            if health_status["overall_health"] in ["healthy", "degraded"]:
-                self.ai_processor_initialized = True
-                logger.info("AI processing services initialized successfully")
-
-                # Log available components
-                components = health_status["components"]
-                available_count = sum(1 for status in components.values() if status == "healthy")
-                logger.info(f"AI components available: {available_count}/5")
-
-                return True
-            else:
-                logger.warning("AI processing services initialized with issues")
-                return False
+            self.ai_processor_initialized = True
+            logger.info("AI processing services registered (components load in background)")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to initialize AI services: {str(e)}")
@@ -81,10 +92,15 @@ class StartupManager:
         """Initialize all AI and supporting services"""
         logger.info("Starting Planning Explorer AI Intelligence Layer initialization...")
 
+        ai_services, background_processing, cache_management = await asyncio.gather(
+            self.run_timed("ai_services", self.initialize_ai_services()),
+            self.run_timed("background_processing", self.start_background_processing()),
+            self.run_timed("cache_management", self.start_cache_manager())
+        )
         results = {
-            "ai_services": await self.initialize_ai_services(),
-            "background_processing": await self.start_background_processing(),
-            "cache_management": await self.start_cache_manager()
+            "ai_services": ai_services,
+            "background_processing": background_processing,
+            "cache_management": cache_management
         }
 
         success_count = sum(1 for success in results.values() if success)
@@ -99,10 +115,74 @@ class StartupManager:
 
         return results
 
+    async def load_ai_models(self) -> None:
+        """Build the AI components and load local models ahead of first use"""
+        from app.services.ai_processor import ai_processor
+
+        # Off the event loop: importing the provider SDKs takes seconds
+        await asyncio.to_thread(ai_processor.initialize_components)
+
+        health_status = await ai_processor.health_check()
+        available_count = sum(1 for status in health_status["components"].values() if status == "healthy")
+        logger.info(f"AI components available: {available_count}/5 ({health_status['overall_health']})")
+        if available_count == 0:
+            raise RuntimeError("No AI components available")
+
+        if ai_processor.embedding_service:
+            await ai_processor.embedding_service.load_sentence_transformer()
+
+    def start_warmup(self, warmers: Dict[str, Callable[[], Awaitable[Any]]]) -> None:
+        """
+        Run warmup coroutines in the background
+
+        Args:
+            warmers: capability name -> coroutine function warming it
+        """
+        for capability, warmer in warmers.items():
+            self.capabilities[capability] = "warming"
+            self._warmup_tasks.append(asyncio.create_task(self._warm(capability, warmer)))
+
+    async def _warm(self, capability: str, warmer: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await self.run_timed(f"warmup:{capability}", warmer())
+            self.capabilities[capability] = "ready"
+            logger.info(f"{capability} warm after {self.timings[f'warmup:{capability}']}ms")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.capabilities[capability] = "failed"
+            logger.error(f"Warmup of {capability} failed: {str(e)}")
+
+    @property
+    def warm(self) -> bool:
+        """True once every warmup task has finished"""
+        return all(state != "warming" for state in self.capabilities.values())
+
+    def get_readiness(self) -> dict:
+        """Warmup state per capability and startup timings"""
+        return {
+            "warm": self.warm,
+            "capabilities": dict(self.capabilities),
+            "startup_timings_ms": dict(self.timings)
+        }
+
+    def log_timings(self) -> None:
+        """Log startup time per component, slowest first"""
+        report = ", ".join(
+            f"{component}={ms}ms"
+            for component, ms in sorted(self.timings.items(), key=lambda item: -item[1])
+        )
+        logger.info(f"Startup timings: {report}")
+
     async def shutdown_all(self) -> None:
         """Shutdown all services gracefully"""
         logger.info("Shutting down AI Intelligence Layer services...")
 
+        for task in self._warmup_tasks:
+            task.cancel()
+        await asyncio.gather(*self._warmup_tasks, return_exceptions=True)
+        self._warmup_tasks = []
+
         # Shutdown in reverse order
         if self.cache_manager_started:
             try:
@@ -169,6 +249,7 @@ def get_startup_info() -> dict:
 
         return {
             "startup_status": startup_manager.get_initialization_status(),
+            "readiness": startup_manager.get_readiness(),
             "ai_capabilities": {
                 "opportunity_scoring": bool(ai_processor.opportunity_scorer),
                 "document_summarization": bool(ai_processor.document_summarizer),
@@ -0,0 +1,237 @@
+"""
+Async PostgREST client for Planning Explorer
+
+Non-blocking replacement for supabase-py's synchronous table API. Queries
+are built with the same chained interface (table().select().eq()...) and
+awaited on execute(); requests share one httpx connection pool with a
+bounded number of keep-alive connections, so independent queries can run
+concurrently without blocking the event loop.
+"""
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class PostgrestError(Exception):
+    """Error response from PostgREST"""
+
+    def __init__(self, message: str, status_code: int, code: Optional[str] = None, details: Optional[str] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+        self.details = details
+
+
+@dataclass
+class PostgrestResponse:
+    """Result of a query (mirrors supabase-py's APIResponse); rpc() scalars are returned as-is"""
+    data: Any = field(default_factory=list)
+    count: Optional[int] = None
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _filter_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _parse_count(content_range: Optional[str]) -> Optional[int]:
+    """Total from a Content-Range header such as '0-24/3573' or '*/0'"""
+    if not content_range or "/" not in content_range:
+        return None
+    total = content_range.rsplit("/", 1)[1]
+    return int(total) if total.isdigit() else None
+
+
+class QueryBuilder:
+    """Chained query for one table; nothing is sent until execute()"""
+
+    def __init__(self, client: "AsyncPostgrestClient", table: str):
+        self._client = client
+        self._table = table
+        self._method = "GET"
+        self._params: List[Tuple[str, str]] = []
+        self._prefer: List[str] = []
+        self._body: Any = None
+
+    # ---- operations ----
+
+    def select(self, columns: str = "*", count: Optional[str] = None, head: bool = False) -> "QueryBuilder":
+        self._method = "HEAD" if head else "GET"
+        self._params.append(("select", columns))
+        if count:
+            self._prefer.append(f"count={count}")
+        return self
+
+    def insert(self, rows: Union[Dict[str, Any], List[Dict[str, Any]]], returning: bool = True) -> "QueryBuilder":
+        self._method = "POST"
+        self._body = rows
+        self._prefer.append("return=representation" if returning else "return=minimal")
+        return self
+
+    def upsert(self, rows: Union[Dict[str, Any], List[Dict[str, Any]]], on_conflict: Optional[str] = None) -> "QueryBuilder":
+        self.insert(rows)
+        self._prefer.append("resolution=merge-duplicates")
+        if on_conflict:
+            self._params.append(("on_conflict", on_conflict))
+        return self
+
+    def update(self, data: Dict[str, Any]) -> "QueryBuilder":
+        self._method = "PATCH"
+        self._body = data
+        self._prefer.append("return=representation")
+        return self
+
+    def delete(self) -> "QueryBuilder":
+        self._method = "DELETE"
+        self._prefer.append("return=representation")
+        return self
+
+    # ---- filters and modifiers ----
+
+    def _filter(self, column: str, operator: str, value: Any) -> "QueryBuilder":
+        self._params.append((column, f"{operator}.{_filter_value(value)}"))
+        return self
+
+    def eq(self, column: str, value: Any) -> "QueryBuilder":
+        return self._filter(column, "eq", value)
+
+    def neq(self, column: str, value: Any) -> "QueryBuilder":
+        return self._filter(column, "neq", value)
+
+    def gt(self, column: str, value: Any) -> "QueryBuilder":
+        return self._filter(column, "gt", value)
+
+    def gte(self, column: str, value: Any) -> "QueryBuilder":
+        return self._filter(column, "gte", value)
+
+    def lt(self, column: str, value: Any) -> "QueryBuilder":
+        return self._filter(column, "lt", value)
+
+    def lte(self, column: str, value: Any) -> "QueryBuilder":
+        return self._filter(column, "lte", value)
+
+    def in_(self, column: str, values: List[Any]) -> "QueryBuilder":
+        return self._filter(column, "in", f"({','.join(_filter_value(v) for v in values)})")
+
+    def order(self, column: str, desc: bool = False) -> "QueryBuilder":
+        self._params.append(("order", f"{column}.{'desc' if desc else 'asc'}"))
+        return self
+
+    def limit(self, count: int) -> "QueryBuilder":
+        self._params.append(("limit", str(count)))
+        return self
+
+    def range(self, start: int, end: int) -> "QueryBuilder":
+        self._params.append(("offset", str(start)))
+        self._params.append(("limit", str(end - start + 1)))
+        return self
+
+    async def execute(self) -> PostgrestResponse:
+        headers = {"Prefer": ",".join(self._prefer)} if self._prefer else {}
+        content = json.dumps(self._body, default=_json_default) if self._body is not None else None
+        return await self._client.request(self._method, self._table, self._params, headers, content)
+
+
+class AsyncPostgrestClient:
+    """
+    Pooled async client for a PostgREST endpoint (Supabase's /rest/v1).
+
+    At most `pool_size` connections are opened; further requests wait up
+    to `pool_timeout` seconds for a free connection instead of opening
+    more.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        pool_size: int = 20,
+        timeout: float = 10.0,
+        pool_timeout: float = 5.0,
+        keepalive_expiry: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        headers = {"Accept": "application/json", "Content-Type": "application/json"}
+        if api_key:
+            headers["apikey"] = api_key
+            headers["Authorization"] = f"Bearer {api_key}"
+
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=httpx.Timeout(timeout, pool=pool_timeout),
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=keepalive_expiry
+            ),
+            transport=transport
+        )
+
+    def table(self, name: str) -> QueryBuilder:
+        return QueryBuilder(self, name)
+
+    from_ = table
+
+    def rpc(self, fn: str, params: Optional[Dict[str, Any]] = None) -> QueryBuilder:
+        """Call a Postgres function (POST /rpc/{fn}) with named arguments"""
+        query = QueryBuilder(self, f"rpc/{fn}")
+        query._method = "POST"
+        query._body = params or {}
+        return query
+
+    async def request(
+        self,
+        method: str,
+        table: str,
+        params: List[Tuple[str, str]],
+        headers: Dict[str, str],
+        content: Optional[str] = None
+    ) -> PostgrestResponse:
+        response = await self._http.request(method, f"/{table}", params=params, headers=headers, content=content)
+
+        if response.status_code >= 400:
+            try:
+                error = response.json()
+            except ValueError:
+                error = {"message": response.text}
+            raise PostgrestError(
+                error.get("message") or f"PostgREST request failed ({response.status_code})",
+                status_code=response.status_code,
+                code=error.get("code"),
+                details=error.get("details")
+            )
+
+        data = response.json() if method != "HEAD" and response.content else []
+        if isinstance(data, dict):
+            data = [data]
+        return PostgrestResponse(data=data, count=_parse_count(response.headers.get("content-range")))
+
+    async def aclose(self):
+        await self._http.aclose()
+
+    @property
+    def closed(self) -> bool:
+        return self._http.is_closed
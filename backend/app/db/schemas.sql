@@ -616,6 +616,18 @@ $$ language 'plpgsql';
 CREATE TRIGGER update_usage_stats AFTER INSERT ON api_usage
     FOR EACH ROW EXECUTE FUNCTION update_user_usage_stats();
 
+-- Atomic monthly API call counter increment (called by the event pipeline
+-- so concurrent workers add their deltas instead of overwriting totals)
+CREATE OR REPLACE FUNCTION increment_api_calls(p_user_id UUID, p_delta INTEGER)
+RETURNS INTEGER AS $$
+    UPDATE user_profiles
+    SET
+        api_calls_this_month = api_calls_this_month + p_delta,
+        last_active = NOW()
+    WHERE user_id = p_user_id
+    RETURNING api_calls_this_month;
+$$ LANGUAGE sql;
+
 -- Function to clean up expired data
 CREATE OR REPLACE FUNCTION cleanup_expired_data()
 RETURNS void AS $$
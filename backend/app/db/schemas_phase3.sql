@@ -130,6 +130,11 @@ CREATE TABLE IF NOT EXISTS saved_searches (
     ai_confidence_score DECIMAL(3,2),
     ai_enhanced BOOLEAN DEFAULT false,
 
+    -- Incremental execution: newest (last_changed, uid) seen by the last run
+    last_run TIMESTAMP WITH TIME ZONE,
+    result_count INTEGER,
+    run_cursor JSONB,
+
     -- Usage tracking and performance
     last_used TIMESTAMP WITH TIME ZONE,
     use_count INTEGER DEFAULT 0,
@@ -155,6 +160,11 @@ CREATE TABLE IF NOT EXISTS saved_searches (
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Existing installations: add incremental execution columns
+ALTER TABLE saved_searches ADD COLUMN IF NOT EXISTS last_run TIMESTAMP WITH TIME ZONE;
+ALTER TABLE saved_searches ADD COLUMN IF NOT EXISTS result_count INTEGER;
+ALTER TABLE saved_searches ADD COLUMN IF NOT EXISTS run_cursor JSONB;
+
 -- ==========================================
 -- SMART ALERTS SYSTEM WITH AI
 -- ==========================================
@@ -917,6 +927,18 @@ $$ LANGUAGE plpgsql;
 CREATE TRIGGER update_usage_stats AFTER INSERT ON api_usage
     FOR EACH ROW EXECUTE FUNCTION update_api_usage_stats();
 
+-- Atomic monthly API call counter increment (called by the event pipeline
+-- so concurrent workers add their deltas instead of overwriting totals)
+CREATE OR REPLACE FUNCTION increment_api_calls(p_user_id UUID, p_delta INTEGER)
+RETURNS INTEGER AS $$
+    UPDATE user_profiles
+    SET
+        api_calls_this_month = api_calls_this_month + p_delta,
+        last_active = NOW()
+    WHERE user_id = p_user_id
+    RETURNING api_calls_this_month;
+$$ LANGUAGE sql;
+
 -- Function to clean up expired data
 CREATE OR REPLACE FUNCTION cleanup_expired_data()
 RETURNS void AS $$
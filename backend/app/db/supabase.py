@@ -3,7 +3,8 @@ Supabase client and database operations for Planning Explorer
 """
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Union
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 import time
 from functools import wraps
@@ -11,6 +12,7 @@ from functools import wraps
 from supabase import create_client, Client
 from gotrue.errors import AuthApiError
 from app.core.config import settings
+from app.db.postgrest import AsyncPostgrestClient
 from app.models.user import UserProfile, UserSettings, SavedSearch, UserAlert, UserReport, APIUsage, UserEvent
 
 logger = logging.getLogger(__name__)
@@ -37,132 +39,59 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
     return decorator
 
 
-class SupabaseConnectionPool:
-    """Connection pool for Supabase clients"""
-
-    def __init__(self, pool_size: int = 10):
-        self.pool_size = pool_size
-        self.clients: List[Client] = []
-        self.available_clients: List[Client] = []
-        self.in_use_clients: Dict[str, Client] = {}
-        self._lock = asyncio.Lock()
-        self._initialized = False
-
-    async def initialize(self) -> bool:
-        """Initialize connection pool"""
-        if self._initialized:
-            return True
-
-        try:
-            for i in range(self.pool_size):
-                client = create_client(
-                    settings.supabase_url,
-                    settings.supabase_key
-                )
-                # Test connection - using a simple ping instead of table query to avoid RLS issues
-                # Just verify the client was created successfully
-                if client:
-                    pass  # Connection successful if client object exists
-
-                self.clients.append(client)
-                self.available_clients.append(client)
-
-            self._initialized = True
-            logger.info(f"Supabase connection pool initialized with {self.pool_size} connections")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to initialize Supabase connection pool: {str(e)}")
-            return False
-
-    async def get_client(self) -> Optional[Client]:
-        """Get available client from pool"""
-        async with self._lock:
-            if self.available_clients:
-                client = self.available_clients.pop(0)
-                self.in_use_clients[id(client)] = client
-                return client
-            else:
-                # Pool exhausted, create temporary client
-                logger.warning("Connection pool exhausted, creating temporary client")
-                return create_client(settings.supabase_url, settings.supabase_key)
-
-    async def return_client(self, client: Client):
-        """Return client to pool"""
-        async with self._lock:
-            client_id = id(client)
-            if client_id in self.in_use_clients:
-                del self.in_use_clients[client_id]
-                self.available_clients.append(client)
-
-    async def close_all(self):
-        """Close all connections"""
-        async with self._lock:
-            # Supabase clients don't need explicit closing
-            self.clients.clear()
-            self.available_clients.clear()
-            self.in_use_clients.clear()
-            self._initialized = False
-            logger.info("Closed all Supabase connections")
-
-
 class SupabaseClient:
-    """Enhanced Supabase client wrapper with connection pooling and production features"""
+    """
+    Supabase wrapper for Planning Explorer.
+
+    Table queries go through a pooled async PostgREST client (self.db);
+    the supabase-py client (self.client) is only used for auth.
+    """
 
     def __init__(self):
         self.client: Optional[Client] = None
-        self.pool: Optional[SupabaseConnectionPool] = None
-        self._connection_retries = 0
-        self._max_retries = 3
-        self._use_pool = settings.max_connections > 1
+        self.db: Optional[AsyncPostgrestClient] = None
+        self._connect_lock = asyncio.Lock()
         self._health_check_interval = 300  # 5 minutes
         self._last_health_check = 0
+        # user_id -> (profile, expires_at); see get_cached_user_profile
+        self._profiles: "OrderedDict[str, Tuple[UserProfile, float]]" = OrderedDict()
 
     async def connect(self) -> bool:
         """
-        Establish connection to Supabase with connection pooling support
+        Create the auth client and the pooled PostgREST client
 
         Returns:
             bool: True if connection successful, False otherwise
         """
         try:
-            if self._use_pool:
-                # Initialize connection pool
-                self.pool = SupabaseConnectionPool(pool_size=settings.max_connections)
-                success = await self.pool.initialize()
-                if success:
-                    logger.info(f"Successfully initialized Supabase connection pool with {settings.max_connections} connections")
-                    return True
-                else:
-                    # Fallback to single connection
-                    logger.warning("Connection pool initialization failed, falling back to single connection")
-                    self._use_pool = False
-
-            if not self._use_pool:
-                # Single connection mode
-                self.client = create_client(
-                    settings.supabase_url,
-                    settings.supabase_key
+            rest_url = settings.supabase_rest_url or f"{(settings.supabase_url or '').rstrip('/')}/rest/v1"
+            if not settings.supabase_rest_url and not settings.supabase_url:
+                raise ValueError("SUPABASE_URL is not configured")
+
+            if self.db is None or self.db.closed:
+                self.db = AsyncPostgrestClient(
+                    rest_url,
+                    api_key=settings.supabase_key,
+                    pool_size=settings.supabase_pool_size,
+                    timeout=settings.supabase_timeout
                 )
 
-                # Test connection - using a simple ping instead of table query to avoid RLS issues
-                # Just verify the client was created successfully
-                if self.client:
-                    logger.info("Successfully connected to Supabase.")
-                return True
+            if self.client is None and settings.supabase_url:
+                self.client = create_client(settings.supabase_url, settings.supabase_key)
+
+            logger.info(f"Connected to Supabase ({settings.supabase_pool_size} pooled connections)")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to connect to Supabase: {str(e)}")
             return False
 
     async def disconnect(self):
-        """Close Supabase connections"""
-        if self.pool:
-            await self.pool.close_all()
-            self.pool = None
-        if self.client:
-            # Supabase client doesn't need explicit disconnection
-            self.client = None
+        """Close pooled connections"""
+        if self.db:
+            await self.db.aclose()
+            self.db = None
+        self.client = None
         logger.info("Disconnected from Supabase")
 
     async def ensure_connection(self):
@@ -174,45 +103,22 @@ class SupabaseClient:
             await self._perform_health_check()
             self._last_health_check = current_time
 
-        if not self.client and not self.pool:
-            if not await self.connect():
-                raise ConnectionError("Failed to connect to Supabase")
+        if self.db is None:
+            async with self._connect_lock:
+                if self.db is None and not await self.connect():
+                    raise ConnectionError("Failed to connect to Supabase")
 
     async def _perform_health_check(self):
         """Perform health check on connections"""
-        try:
-            if self.pool:
-                client = await self.pool.get_client()
-                if client:
-                    # Simple health check - just verify client exists
-                    await self.pool.return_client(client)
-                    logger.debug("Supabase connection pool health check passed")
-            elif self.client:
-                # Simple health check - just verify client exists
-                logger.debug("Supabase connection health check passed")
-        except Exception as e:
-            logger.warning(f"Supabase health check failed: {str(e)}")
-
-    async def get_client(self) -> Client:
-        """Get client for operations"""
-        await self.ensure_connection()
-
-        if self.pool:
-            client = await self.pool.get_client()
-            if client:
-                return client
-            # Fallback to creating new client
-            return create_client(settings.supabase_url, settings.supabase_key)
-
-        if self.client:
-            return self.client
+        if self.db and self.db.closed:
+            logger.warning("Supabase connection pool was closed, reconnecting")
+            self.db = None
+        else:
+            logger.debug("Supabase connection health check passed")
 
-        raise ConnectionError("No Supabase client available")
-
-    async def return_client(self, client: Client):
-        """Return client to pool if using pooling"""
-        if self.pool:
-            await self.pool.return_client(client)
+    @property
+    def pool_size(self) -> int:
+        return self.db.pool_size if self.db else 0
 
     # ======== AUTHENTICATION METHODS ========
 
@@ -229,10 +135,10 @@ class SupabaseClient:
         Returns:
             Dict with user data and session info
         """
-        client = await self.get_client()
+        await self.ensure_connection()
 
         try:
-            response = client.auth.sign_up({
+            response = self.client.auth.sign_up({
                 "email": email,
                 "password": password,
                 "options": {
@@ -261,8 +167,6 @@ class SupabaseClient:
                 "error": str(e),
                 "success": False
             }
-        finally:
-            await self.return_client(client)
 
     @retry_on_failure(max_retries=3)
     async def sign_in_user(self, email: str, password: str) -> Dict[str, Any]:
@@ -276,10 +180,10 @@ class SupabaseClient:
         Returns:
             Dict with user data and session info
         """
-        client = await self.get_client()
+        await self.ensure_connection()
 
         try:
-            response = client.auth.sign_in_with_password({
+            response = self.client.auth.sign_in_with_password({
                 "email": email,
                 "password": password
             })
@@ -303,8 +207,6 @@ class SupabaseClient:
                 "error": str(e),
                 "success": False
             }
-        finally:
-            await self.return_client(client)
 
     async def get_user_by_token(self, token: str) -> Optional[Dict[str, Any]]:
         """
@@ -316,7 +218,7 @@ class SupabaseClient:
         Returns:
             User data if valid, None otherwise
         """
-        self.ensure_connection()
+        await self.ensure_connection()
 
         try:
             # Set the session
@@ -341,7 +243,7 @@ class SupabaseClient:
         Returns:
             bool: True if successful
         """
-        self.ensure_connection()
+        await self.ensure_connection()
 
         try:
             self.client.auth.set_session(token, None)
@@ -363,9 +265,9 @@ class SupabaseClient:
         role: str = "free"
     ) -> Optional[UserProfile]:
         """Create user profile in database"""
-        self.ensure_connection()
-
         try:
+            await self.ensure_connection()
+
             profile_data = {
                 "user_id": user_id,
                 "email": email,
@@ -376,10 +278,10 @@ class SupabaseClient:
                 "updated_at": datetime.utcnow().isoformat()
             }
 
-            response = self.client.table("user_profiles").insert(profile_data).execute()
+            response = await self.db.table("user_profiles").insert(profile_data).execute()
 
             if response.data:
-                return UserProfile(**response.data[0])
+                return self._cache_profile(UserProfile(**response.data[0]))
             return None
 
         except Exception as e:
@@ -388,10 +290,10 @@ class SupabaseClient:
 
     async def get_user_profile(self, user_id: str) -> Optional[UserProfile]:
         """Get user profile by ID"""
-        self.ensure_connection()
-
         try:
-            response = self.client.table("user_profiles").select("*").eq("user_id", user_id).execute()
+            await self.ensure_connection()
+
+            response = await self.db.table("user_profiles").select("*").eq("user_id", user_id).execute()
 
             if response.data:
                 return UserProfile(**response.data[0])
@@ -401,31 +303,81 @@ class SupabaseClient:
             logger.error(f"Failed to get user profile: {str(e)}")
             return None
 
+    async def get_cached_user_profile(self, user_id: str) -> Optional[UserProfile]:
+        """
+        Get user profile, served from a short-TTL in-process cache
+
+        Used on the authentication path. Profile writes through this client
+        refresh the entry; other workers see changes within
+        USER_PROFILE_CACHE_TTL.
+        """
+        cached = self._profiles.get(user_id)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
+        profile = await self.get_user_profile(user_id)
+        if profile:
+            self._cache_profile(profile)
+        return profile
+
+    def invalidate_user_profile(self, user_id: str):
+        """Drop a cached profile so the next read goes to the database"""
+        self._profiles.pop(user_id, None)
+
+    def _cache_profile(self, profile: UserProfile) -> UserProfile:
+        if settings.user_profile_cache_ttl > 0:
+            self._profiles[profile.user_id] = (profile, time.monotonic() + settings.user_profile_cache_ttl)
+            self._profiles.move_to_end(profile.user_id)
+            if len(self._profiles) > settings.user_profile_cache_size:
+                self._profiles.popitem(last=False)
+        return profile
+
     async def update_user_profile(self, user_id: str, data: Dict[str, Any]) -> Optional[UserProfile]:
         """Update user profile"""
-        self.ensure_connection()
-
         try:
+            await self.ensure_connection()
+
             data["updated_at"] = datetime.utcnow().isoformat()
 
-            response = self.client.table("user_profiles").update(data).eq("user_id", user_id).execute()
+            self.invalidate_user_profile(user_id)
+            response = await self.db.table("user_profiles").update(data).eq("user_id", user_id).execute()
 
             if response.data:
-                return UserProfile(**response.data[0])
+                return self._cache_profile(UserProfile(**response.data[0]))
             return None
 
         except Exception as e:
             logger.error(f"Failed to update user profile: {str(e)}")
             return None
 
+    async def increment_api_calls(self, user_id: str, delta: int = 1) -> Optional[int]:
+        """
+        Atomically add to the user's monthly API call counter.
+
+        Returns:
+            The new api_calls_this_month, or None on failure
+        """
+        try:
+            await self.ensure_connection()
+
+            self.invalidate_user_profile(user_id)
+            response = await self.db.rpc(
+                "increment_api_calls", {"p_user_id": user_id, "p_delta": delta}
+            ).execute()
+            return response.data
+
+        except Exception as e:
+            logger.error(f"Failed to increment API calls: {str(e)}")
+            return None
+
     # ======== USER SETTINGS METHODS ========
 
     async def get_user_settings(self, user_id: str) -> Optional[UserSettings]:
         """Get user settings"""
-        self.ensure_connection()
-
         try:
-            response = self.client.table("user_settings").select("*").eq("user_id", user_id).execute()
+            await self.ensure_connection()
+
+            response = await self.db.table("user_settings").select("*").eq("user_id", user_id).execute()
 
             if response.data:
                 return UserSettings(**response.data[0])
@@ -437,13 +389,14 @@ class SupabaseClient:
 
     async def update_user_settings(self, user_id: str, settings: UserSettings) -> Optional[UserSettings]:
         """Update user settings"""
-        self.ensure_connection()
-
         try:
+            await self.ensure_connection()
+
             settings_data = settings.dict()
             settings_data["updated_at"] = datetime.utcnow().isoformat()
+            self.invalidate_user_profile(user_id)
 
-            response = self.client.table("user_settings").upsert(settings_data).execute()
+            response = await self.db.table("user_settings").upsert(settings_data).execute()
 
             if response.data:
                 return UserSettings(**response.data[0])
@@ -457,14 +410,14 @@ class SupabaseClient:
 
     async def create_saved_search(self, user_id: str, search_data: Dict[str, Any]) -> Optional[SavedSearch]:
         """Create saved search"""
-        self.ensure_connection()
-
         try:
+            await self.ensure_connection()
+
             search_data["user_id"] = user_id
             search_data["created_at"] = datetime.utcnow().isoformat()
             search_data["updated_at"] = datetime.utcnow().isoformat()
 
-            response = self.client.table("saved_searches").insert(search_data).execute()
+            response = await self.db.table("saved_searches").insert(search_data).execute()
 
             if response.data:
                 return SavedSearch(**response.data[0])
@@ -476,11 +429,11 @@ class SupabaseClient:
 
     async def get_user_saved_searches(self, user_id: str, limit: int = 50) -> List[SavedSearch]:
         """Get user's saved searches"""
-        self.ensure_connection()
-
         try:
-            response = (
-                self.client.table("saved_searches")
+            await self.ensure_connection()
+
+            response = await (
+                self.db.table("saved_searches")
                 .select("*")
                 .eq("user_id", user_id)
                 .order("created_at", desc=True)
@@ -494,15 +447,35 @@ class SupabaseClient:
             logger.error(f"Failed to get saved searches: {str(e)}")
             return []
 
+    async def get_saved_search(self, search_id: str, user_id: Optional[str] = None) -> Optional[SavedSearch]:
+        """Get a single saved search by ID (optionally scoped to its owner)"""
+        try:
+            await self.ensure_connection()
+
+            query = self.db.table("saved_searches").select("*").eq("search_id", search_id)
+
+            if user_id:
+                query = query.eq("user_id", user_id)
+
+            response = await query.limit(1).execute()
+
+            if response.data:
+                return SavedSearch(**response.data[0])
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to get saved search: {str(e)}")
+            return None
+
     async def update_saved_search(self, search_id: str, user_id: str, data: Dict[str, Any]) -> Optional[SavedSearch]:
         """Update saved search"""
-        self.ensure_connection()
-
         try:
+            await self.ensure_connection()
+
             data["updated_at"] = datetime.utcnow().isoformat()
 
-            response = (
-                self.client.table("saved_searches")
+            response = await (
+                self.db.table("saved_searches")
                 .update(data)
                 .eq("search_id", search_id)
                 .eq("user_id", user_id)
@@ -519,11 +492,11 @@ class SupabaseClient:
 
     async def delete_saved_search(self, search_id: str, user_id: str) -> bool:
         """Delete saved search"""
-        self.ensure_connection()
-
         try:
-            response = (
-                self.client.table("saved_searches")
+            await self.ensure_connection()
+
+            response = await (
+                self.db.table("saved_searches")
                 .delete()
                 .eq("search_id", search_id)
                 .eq("user_id", user_id)
@@ -540,14 +513,14 @@ class SupabaseClient:
 
     async def create_user_alert(self, user_id: str, alert_data: Dict[str, Any]) -> Optional[UserAlert]:
         """Create user alert"""
-        self.ensure_connection()
-
         try:
+            await self.ensure_connection()
+
             alert_data["user_id"] = user_id
             alert_data["created_at"] = datetime.utcnow().isoformat()
             alert_data["updated_at"] = datetime.utcnow().isoformat()
 
-            response = self.client.table("user_alerts").insert(alert_data).execute()
+            response = await self.db.table("user_alerts").insert(alert_data).execute()
 
             if response.data:
                 return UserAlert(**response.data[0])
@@ -559,15 +532,15 @@ class SupabaseClient:
 
     async def get_user_alerts(self, user_id: str, active_only: bool = True) -> List[UserAlert]:
         """Get user alerts"""
-        self.ensure_connection()
-
         try:
-            query = self.client.table("user_alerts").select("*").eq("user_id", user_id)
+            await self.ensure_connection()
+
+            query = self.db.table("user_alerts").select("*").eq("user_id", user_id)
 
             if active_only:
                 query = query.eq("is_active", True)
 
-            response = query.order("created_at", desc=True).execute()
+            response = await query.order("created_at", desc=True).execute()
 
             return [UserAlert(**item) for item in response.data]
 
@@ -575,18 +548,63 @@ class SupabaseClient:
             logger.error(f"Failed to get user alerts: {str(e)}")
             return []
 
+    async def get_active_alerts(self, limit: int = 1000, offset: int = 0) -> List[UserAlert]:
+        """Get active alerts across all users (one page, ordered by alert_id)"""
+        try:
+            await self.ensure_connection()
+
+            response = await (
+                self.db.table("user_alerts")
+                .select("*")
+                .eq("is_active", True)
+                .order("alert_id")
+                .range(offset, offset + limit - 1)
+                .execute()
+            )
+
+            return [UserAlert(**item) for item in response.data]
+
+        except Exception as e:
+            logger.error(f"Failed to get active alerts: {str(e)}")
+            return []
+
+    async def delete_user_alert(self, alert_id: str, user_id: str) -> bool:
+        """Delete user alert"""
+        try:
+            await self.ensure_connection()
+
+            response = await (
+                self.db.table("user_alerts")
+                .delete()
+                .eq("alert_id", alert_id)
+                .eq("user_id", user_id)
+                .execute()
+            )
+
+            return len(response.data) > 0
+
+        except Exception as e:
+            logger.error(f"Failed to delete user alert: {str(e)}")
+            return False
+
+    # ======== NOTIFICATION METHODS ========
+
+    async def create_notifications(self, notifications: List[Dict[str, Any]], chunk_size: int = 500) -> int:
+        """Bulk insert in-app notifications (one request per chunk)"""
+        return await self.bulk_insert("user_notifications", notifications, chunk_size=chunk_size)
+
     # ======== REPORTS METHODS ========
 
     async def create_user_report(self, user_id: str, report_data: Dict[str, Any]) -> Optional[UserReport]:
         """Create user report"""
-        self.ensure_connection()
-
         try:
+            await self.ensure_connection()
+
             report_data["user_id"] = user_id
             report_data["created_at"] = datetime.utcnow().isoformat()
             report_data["updated_at"] = datetime.utcnow().isoformat()
 
-            response = self.client.table("user_reports").insert(report_data).execute()
+            response = await self.db.table("user_reports").insert(report_data).execute()
 
             if response.data:
                 return UserReport(**response.data[0])
@@ -598,11 +616,11 @@ class SupabaseClient:
 
     async def get_user_reports(self, user_id: str, limit: int = 20) -> List[UserReport]:
         """Get user reports"""
-        self.ensure_connection()
-
         try:
-            response = (
-                self.client.table("user_reports")
+            await self.ensure_connection()
+
+            response = await (
+                self.db.table("user_reports")
                 .select("*")
                 .eq("user_id", user_id)
                 .order("created_at", desc=True)
@@ -620,13 +638,13 @@ class SupabaseClient:
 
     async def log_api_usage(self, user_id: str, usage_data: Dict[str, Any]) -> Optional[APIUsage]:
         """Log API usage"""
-        self.ensure_connection()
-
         try:
+            await self.ensure_connection()
+
             usage_data["user_id"] = user_id
             usage_data["created_at"] = datetime.utcnow().isoformat()
 
-            response = self.client.table("api_usage").insert(usage_data).execute()
+            response = await self.db.table("api_usage").insert(usage_data).execute()
 
             if response.data:
                 return APIUsage(**response.data[0])
@@ -636,15 +654,47 @@ class SupabaseClient:
             logger.error(f"Failed to log API usage: {str(e)}")
             return None
 
+    async def bulk_insert(self, table: str, rows: List[Dict[str, Any]], chunk_size: int = 500) -> int:
+        """
+        Insert rows in chunks, one request per chunk.
+
+        Chunks are sent concurrently over the connection pool.
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+
+        try:
+            await self.ensure_connection()
+        except Exception as e:
+            logger.error(f"Failed to insert {len(rows)} rows into {table}: {str(e)}")
+            return 0
+
+        chunks = [rows[start:start + chunk_size] for start in range(0, len(rows), chunk_size)]
+        responses = await asyncio.gather(
+            *(self.db.table(table).insert(chunk).execute() for chunk in chunks),
+            return_exceptions=True
+        )
+
+        inserted = 0
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Failed to insert {len(chunk)} rows into {table}: {str(response)}")
+            else:
+                inserted += len(response.data or [])
+        return inserted
+
     async def log_user_event(self, user_id: str, event_data: Dict[str, Any]) -> Optional[UserEvent]:
         """Log user event"""
-        self.ensure_connection()
-
         try:
+            await self.ensure_connection()
+
             event_data["user_id"] = user_id
             event_data["created_at"] = datetime.utcnow().isoformat()
 
-            response = self.client.table("user_events").insert(event_data).execute()
+            response = await self.db.table("user_events").insert(event_data).execute()
 
             if response.data:
                 return UserEvent(**response.data[0])
@@ -654,34 +704,37 @@ class SupabaseClient:
             logger.error(f"Failed to log user event: {str(e)}")
             return None
 
-    async def get_user_stats(self, user_id: str) -> Dict[str, Any]:
-        """Get user statistics"""
-        self.ensure_connection()
+    async def _count(self, table: str, user_id: str, **filters: Any) -> int:
+        """Exact row count for a user (HEAD request, no rows transferred)"""
+        query = self.db.table(table).select("*", count="exact", head=True).eq("user_id", user_id)
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        return (await query.execute()).count or 0
 
+    async def get_user_stats(self, user_id: str) -> Dict[str, Any]:
+        """Get user statistics (the four counts are queried concurrently)"""
         try:
-            # Get saved searches count
-            saved_searches = await self.get_user_saved_searches(user_id)
-
-            # Get active alerts count
-            active_alerts = await self.get_user_alerts(user_id, active_only=True)
+            await self.ensure_connection()
 
-            # Get reports count
-            reports = await self.get_user_reports(user_id)
-
-            # Get this month's API usage
             current_month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            api_usage_response = (
-                self.client.table("api_usage")
-                .select("count", count="exact")
+            api_usage_query = (
+                self.db.table("api_usage")
+                .select("*", count="exact", head=True)
                 .eq("user_id", user_id)
                 .gte("created_at", current_month_start.isoformat())
-                .execute()
+            )
+
+            saved_searches, active_alerts, reports, api_usage_response = await asyncio.gather(
+                self._count("saved_searches", user_id),
+                self._count("user_alerts", user_id, is_active=True),
+                self._count("user_reports", user_id),
+                api_usage_query.execute()
             )
 
             return {
-                "saved_searches": len(saved_searches),
-                "active_alerts": len(active_alerts),
-                "reports_generated": len(reports),
+                "saved_searches": saved_searches,
+                "active_alerts": active_alerts,
+                "reports_generated": reports,
                 "api_calls_this_month": api_usage_response.count or 0
             }
 
@@ -2,6 +2,12 @@
 Planning Explorer FastAPI Application
 Main application entry point
 """
+import time
+
+_import_started = time.perf_counter()
+
+import asyncio
+
 from fastapi import FastAPI, Request, Depends
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
@@ -13,10 +19,17 @@ from app.middleware.cors import setup_cors
 from app.middleware.error_handler import setup_error_handlers
 from app.middleware.logging import setup_logging_middleware, configure_logging
 from app.middleware.rate_limit import setup_rate_limiting
-from app.middleware.performance import setup_performance_middleware
+from app.middleware.performance import setup_performance_middleware, setup_response_cache
 from app.api.v1.api import api_router
 from app.api.endpoints.monitoring import router as monitoring_router
 from app.services.cache_service import init_cache_service, shutdown_cache_service
+from app.services.enrichment_queue import init_enrichment_queue, shutdown_enrichment_queue
+from app.services.alert_matcher import init_alert_matcher, shutdown_alert_matcher
+from app.services.notification_digest import init_notification_digests, shutdown_notification_digests
+from app.services.email_sender import shutdown_email_sender
+from app.services.event_pipeline import init_event_pipeline, shutdown_event_pipeline
+from app.services.task_store import shutdown_task_stores
+from app.services.cache_warmer import warm_cache_on_startup
 
 
 # Configure logging first
@@ -26,25 +39,51 @@ configure_logging()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager with AI service initialization"""
-    async with lifespan_manager():
-        # Initialize AI services
-        initialization_results = await startup_manager.initialize_all()
+    startup_started = time.perf_counter()
+    timed = startup_manager.run_timed
+
+    async with lifespan_manager(startup_manager.timings):
+        redis_url = getattr(settings, 'redis_url', 'redis://localhost:6379/0')
+
+        # Independent initializers run concurrently: AI services, buffered
+        # usage/interaction logging and the Redis cache service
+        initialization_results, _, _ = await asyncio.gather(
+            startup_manager.initialize_all(),
+            timed("event_pipeline", init_event_pipeline()),
+            timed("cache_service", init_cache_service(redis_url))
+        )
         app.state.ai_initialization = initialization_results
         app.state.startup_manager = startup_manager
 
-        # Initialize Redis cache service for enrichment
-        redis_url = getattr(settings, 'redis_url', 'redis://localhost:6379/0')
-        await init_cache_service(redis_url)
+        # Background enrichment (uses the cache service), per-user alert
+        # digests and alert percolation (uses Elasticsearch)
+        await asyncio.gather(
+            timed("enrichment_queue", init_enrichment_queue()),
+            timed("notification_digests", init_notification_digests()),
+            timed("alert_matcher", init_alert_matcher())
+        )
+
+        # Warm Content Discovery stats and load local AI models once the
+        # server is accepting traffic (see /health/readiness)
+        startup_manager.start_warmup({
+            "stats_cache": warm_cache_on_startup,
+            "ai_models": startup_manager.load_ai_models
+        })
 
-        # Warm cache for Content Discovery stats
-        from app.services.cache_warmer import warm_cache_on_startup
-        await warm_cache_on_startup()
+        startup_manager.timings["startup_total"] = round((time.perf_counter() - startup_started) * 1000, 1)
+        startup_manager.log_timings()
 
         try:
             yield
         finally:
             # Shutdown services
+            await shutdown_alert_matcher()
+            await shutdown_notification_digests()
+            await shutdown_email_sender()
+            await shutdown_enrichment_queue()
             await startup_manager.shutdown_all()
+            await shutdown_task_stores()
+            await shutdown_event_pipeline()
             await shutdown_cache_service()
 
 
@@ -60,11 +99,12 @@ app = FastAPI(
 )
 
 # Set up middleware (order matters!)
+setup_response_cache(app)          # Response cache (innermost, behind CORS and rate limits)
 setup_cors(app)                    # CORS must be first
 setup_error_handlers(app)          # Error handling
 setup_logging_middleware(app)      # Request/response logging
 setup_rate_limiting(app)          # Rate limiting
-setup_performance_middleware(app)  # Caching, compression, security
+setup_performance_middleware(app)  # Compression, security
 
 # Include API routes
 app.include_router(
@@ -331,6 +371,10 @@ async def startup_message():
     logger.info("=" * 60)
 
 
+# Time to import the application module and everything it pulls in
+startup_manager.timings["import_app"] = round((time.perf_counter() - _import_started) * 1000, 1)
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -340,4 +384,5 @@ if __name__ == "__main__":
         port=settings.port,
         reload=settings.reload,
         log_level=settings.log_level.lower()
-    )
\ No newline at end of file
+    )
+
@@ -1,10 +1,15 @@
 """
 Authentication middleware for Planning Explorer API
 """
+import asyncio
+import hashlib
 import logging
-from typing import Optional, Dict, Any
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
+import httpx
 from fastapi import HTTPException, status, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
@@ -12,12 +17,18 @@ from jose import JWTError, jwt
 from app.core.config import settings
 from app.db.supabase import supabase_client
 from app.models.user import UserProfile
+from app.services.event_pipeline import get_event_pipeline
 
 logger = logging.getLogger(__name__)
 
 # Security scheme
 security = HTTPBearer(auto_error=False)
 
+# Audience claim on Supabase user access tokens
+SUPABASE_AUDIENCE = "authenticated"
+# Minimum seconds between JWKS refetches triggered by an unknown key id
+JWKS_MIN_REFRESH = 30
+
 
 class AuthenticationError(HTTPException):
     """Custom authentication error"""
@@ -41,11 +52,25 @@ class AuthorizationError(HTTPException):
 
 
 class AuthMiddleware:
-    """Authentication and authorization middleware"""
+    """
+    Authentication and authorization middleware
+
+    Verified tokens are cached by SHA-256 hash until they expire (at most
+    AUTH_TOKEN_CACHE_TTL), and profiles come from the client's short-TTL
+    profile cache, so repeat requests with the same token make no network
+    calls. Supabase tokens are verified locally with SUPABASE_JWT_SECRET
+    or the project's JWKS; the auth API is only called when neither can
+    verify the token.
+    """
 
     def __init__(self):
         self.algorithm = settings.algorithm
         self.secret_key = settings.secret_key
+        # sha256(token) -> (user_id, claims, expires_at)
+        self._tokens: "OrderedDict[str, Tuple[str, Dict[str, Any], float]]" = OrderedDict()
+        self._jwks: Optional[Dict[str, Any]] = None
+        self._jwks_fetched_at = 0.0
+        self._jwks_lock = asyncio.Lock()
 
     async def verify_token(self, token: str) -> Dict[str, Any]:
         """
@@ -61,6 +86,15 @@ class AuthMiddleware:
             AuthenticationError: If token is invalid
         """
         try:
+            token_hash = hashlib.sha256(token.encode()).hexdigest()
+            cached = self._tokens.get(token_hash)
+            if cached and cached[2] > time.monotonic():
+                user_id, claims, _ = cached
+                user_profile = await supabase_client.get_cached_user_profile(user_id)
+                if not user_profile:
+                    raise AuthenticationError("User not found")
+                return {"user_id": user_id, "user_profile": user_profile, "token_payload": claims}
+
             # First try to decode with our secret (for locally issued tokens)
             try:
                 payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
@@ -69,10 +103,11 @@ class AuthMiddleware:
                     raise AuthenticationError("Invalid token payload")
 
                 # Get user from database
-                user_profile = await supabase_client.get_user_profile(user_id)
+                user_profile = await supabase_client.get_cached_user_profile(user_id)
                 if not user_profile:
                     raise AuthenticationError("User not found")
 
+                self._cache_token(token_hash, user_id, payload)
                 return {
                     "user_id": user_id,
                     "user_profile": user_profile,
@@ -80,30 +115,46 @@ class AuthMiddleware:
                 }
 
             except JWTError:
-                # If local decode fails, try Supabase token validation
+                pass
+
+            # Supabase-issued token: verify locally if we can
+            claims = await self._verify_supabase_token(token)
+            if claims is None:
+                # No local key material - ask the Supabase auth API
                 supabase_user = await supabase_client.get_user_by_token(token)
                 if not supabase_user or not supabase_user.get("success"):
                     raise AuthenticationError("Invalid or expired token")
 
                 user_data = supabase_user["user"]
-                user_id = user_data.id
+                claims = {
+                    **jwt.get_unverified_claims(token),
+                    "sub": user_data.id,
+                    "email": user_data.email,
+                    "user_metadata": user_data.user_metadata or {}
+                }
 
-                # Get or create user profile
-                user_profile = await supabase_client.get_user_profile(user_id)
-                if not user_profile:
-                    # Create profile if it doesn't exist
-                    user_profile = await supabase_client.create_user_profile(
-                        user_id=user_id,
-                        email=user_data.email,
-                        full_name=user_data.user_metadata.get("full_name"),
-                        company=user_data.user_metadata.get("company")
-                    )
+            user_id = claims.get("sub")
+            if not user_id:
+                raise AuthenticationError("Invalid token payload")
 
-                return {
-                    "user_id": user_id,
-                    "user_profile": user_profile,
-                    "supabase_user": user_data
-                }
+            # Get or create user profile
+            user_profile = await supabase_client.get_cached_user_profile(user_id)
+            if not user_profile:
+                # Create profile if it doesn't exist
+                metadata = claims.get("user_metadata") or {}
+                user_profile = await supabase_client.create_user_profile(
+                    user_id=user_id,
+                    email=claims.get("email"),
+                    full_name=metadata.get("full_name"),
+                    company=metadata.get("company")
+                )
+
+            self._cache_token(token_hash, user_id, claims)
+            return {
+                "user_id": user_id,
+                "user_profile": user_profile,
+                "token_payload": claims
+            }
 
         except AuthenticationError:
             raise
@@ -111,6 +162,116 @@ class AuthMiddleware:
             logger.error(f"Token verification failed: {str(e)}")
             raise AuthenticationError("Token verification failed")
 
+    async def verify_claims(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Claims of a token that can be verified locally, without the auth API
+
+        Checks the verified-token cache, our own secret, then
+        SUPABASE_JWT_SECRET / the JWKS. Used where a request only needs a
+        trustworthy subject (rate limiting), not a profile.
+
+        Returns:
+            Verified claims, or None if the token can't be verified locally
+        """
+        cached = self._tokens.get(hashlib.sha256(token.encode()).hexdigest())
+        if cached and cached[2] > time.monotonic():
+            return {**cached[1], "sub": cached[0]}
+
+        try:
+            return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+        except JWTError:
+            pass
+
+        try:
+            return await self._verify_supabase_token(token)
+        except AuthenticationError:
+            return None
+
+    def revoke_token(self, token: str):
+        """Forget a cached token (e.g. on logout)"""
+        self._tokens.pop(hashlib.sha256(token.encode()).hexdigest(), None)
+
+    def _cache_token(self, token_hash: str, user_id: str, claims: Dict[str, Any]):
+        """Cache a verified token until it expires (at most AUTH_TOKEN_CACHE_TTL)"""
+        if settings.auth_token_cache_size <= 0:
+            return
+        ttl = float(settings.auth_token_cache_ttl)
+        if claims.get("exp"):
+            ttl = min(ttl, float(claims["exp"]) - time.time())
+        if ttl <= 0:
+            return
+        self._tokens[token_hash] = (user_id, claims, time.monotonic() + ttl)
+        self._tokens.move_to_end(token_hash)
+        if len(self._tokens) > settings.auth_token_cache_size:
+            self._tokens.popitem(last=False)
+
+    async def _verify_supabase_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Verify a Supabase access token without calling the auth API
+
+        HS256 tokens are checked against SUPABASE_JWT_SECRET, asymmetric
+        ones against the project's JWKS (cached, refreshed on unknown kid).
+
+        Returns:
+            Verified claims, or None if there is no key to verify with
+
+        Raises:
+            AuthenticationError: If the token fails verification
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError:
+            raise AuthenticationError("Invalid or expired token")
+
+        algorithm = header.get("alg", "")
+        if algorithm.startswith("HS"):
+            if not settings.supabase_jwt_secret:
+                return None
+            key: Any = settings.supabase_jwt_secret
+        else:
+            key = await self._get_jwks(header.get("kid"))
+            if key is None:
+                return None
+
+        try:
+            return jwt.decode(token, key, algorithms=[algorithm], audience=SUPABASE_AUDIENCE)
+        except JWTError:
+            raise AuthenticationError("Invalid or expired token")
+
+    async def _get_jwks(self, kid: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Supabase JWKS, refetched after SUPABASE_JWKS_TTL or for an unknown key id"""
+        if not settings.supabase_url:
+            return None
+
+        def fresh() -> bool:
+            if self._jwks is None:
+                return False
+            age = time.monotonic() - self._jwks_fetched_at
+            if age > settings.supabase_jwks_ttl:
+                return False
+            # Unknown kid: keys may have rotated (refetch at most every JWKS_MIN_REFRESH seconds)
+            known = not kid or any(k.get("kid") == kid for k in self._jwks.get("keys", []))
+            return known or age < JWKS_MIN_REFRESH
+
+        if fresh():
+            return self._jwks
+
+        async with self._jwks_lock:
+            if not fresh():
+                url = f"{settings.supabase_url.rstrip('/')}/auth/v1/.well-known/jwks.json"
+                try:
+                    async with httpx.AsyncClient(timeout=settings.supabase_timeout) as client:
+                        response = await client.get(url)
+                        response.raise_for_status()
+                        self._jwks = response.json()
+                except Exception as e:
+                    logger.warning(f"Failed to fetch Supabase JWKS: {str(e)}")
+                    if self._jwks is None:
+                        return None
+                self._jwks_fetched_at = time.monotonic()
+
+        return self._jwks
+
     async def create_access_token(self, user_id: str, extra_data: Optional[Dict] = None) -> str:
         """
         Create JWT access token
@@ -248,16 +409,17 @@ class AuthMiddleware:
         """
         try:
             # Get user profile to check limits
-            user_profile = await supabase_client.get_user_profile(user_id)
+            user_profile = await supabase_client.get_cached_user_profile(user_id)
             if not user_profile:
                 return False
 
             # Check monthly API call limit
             current_month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-            # Count API calls this month
-            # This would be implemented with a proper rate limiting service in production
-            if user_profile.api_calls_this_month >= user_profile.max_api_calls_per_month:
+            # Count API calls this month, including calls not yet flushed to the profile
+            pipeline = get_event_pipeline()
+            pending_calls = pipeline.pending_api_calls(user_id) if pipeline else 0
+            if user_profile.api_calls_this_month + pending_calls >= user_profile.max_api_calls_per_month:
                 return False
 
             return True
@@ -471,14 +633,16 @@ async def log_api_request(
                 "cost_credits": 1.0  # Default cost
             }
 
+            # Buffered: bulk-inserted and counted by the background pipeline
+            pipeline = get_event_pipeline()
+            if pipeline:
+                pipeline.record_api_usage(user_id, usage_data)
+                return
+
             await supabase_client.log_api_usage(user_id, usage_data)
 
             # Update user profile API call count
-            user_profile = current_user["user_profile"]
-            await supabase_client.update_user_profile(
-                user_id,
-                {"api_calls_this_month": user_profile.api_calls_this_month + 1}
-            )
+            await supabase_client.increment_api_calls(user_id)
 
     except Exception as e:
         logger.error(f"Failed to log API request: {str(e)}")
@@ -524,13 +688,16 @@ async def track_user_interaction(
                     "ip_address": request.client.host if request.client else None
                 }
 
-            await supabase_client.log_user_event(
-                user_id=user_id,
-                event_data={
-                    "event_type": interaction_type,
-                    "event_data": interaction_data
-                }
-            )
+            event_data = {
+                "event_type": interaction_type,
+                "event_data": interaction_data
+            }
+
+            pipeline = get_event_pipeline()
+            if pipeline:
+                pipeline.record_user_event(user_id, event_data)
+            else:
+                await supabase_client.log_user_event(user_id=user_id, event_data=event_data)
 
     except Exception as e:
         logger.error(f"Failed to track user interaction: {str(e)}")
@@ -4,72 +4,87 @@ Logging middleware for Planning Explorer API
 import time
 import uuid
 import logging
-from typing import Callable
-
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import StreamingResponse
+from fastapi import FastAPI, HTTPException, Request
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
+from app.middleware.error_handler import create_error_response
 
 logger = logging.getLogger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for request/response logging and performance tracking"""
+class LoggingMiddleware:
+    """Middleware for request/response logging and performance tracking (pure ASGI)"""
 
-    def __init__(self, app: FastAPI):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
         self.app = app
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and response with logging
 
-        Args:
-            request: HTTP request
-            call_next: Next middleware/endpoint
-
-        Returns:
-            HTTP response
+        Assigns a request ID (request.state.request_id), adds X-Request-ID and
+        X-Response-Time headers and logs start, completion and failures.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate unique request ID
         request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
 
         # Start timing
         start_time = time.time()
 
-        # Get client information
+        request = Request(scope)
+        method = scope["method"]
+        path = scope["path"]
         client_ip = self._get_client_ip(request)
-        user_agent = request.headers.get("user-agent", "")
 
         # Log request
-        logger.info(
-            f"Request started: {request.method} {request.url.path}",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": dict(request.query_params),
-                "client_ip": client_ip,
-                "user_agent": user_agent,
-                "headers": dict(request.headers) if settings.log_level == "DEBUG" else {}
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Request started: {method} {path}",
+                extra={
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "query_params": dict(request.query_params),
+                    "client_ip": client_ip,
+                    "user_agent": request.headers.get("user-agent", ""),
+                    "headers": dict(request.headers) if settings.log_level == "DEBUG" else {}
+                }
+            )
+
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                processing_time_ms = round((time.time() - start_time) * 1000, 2)
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Response-Time"] = str(processing_time_ms)
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
 
         # Process request
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             # Log error and re-raise
             processing_time = time.time() - start_time
             logger.error(
-                f"Request failed: {request.method} {request.url.path}",
+                f"Request failed: {method} {path}",
                 extra={
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": method,
+                    "path": path,
                     "processing_time_ms": round(processing_time * 1000, 2),
                     "error": str(e),
                     "client_ip": client_ip
@@ -77,37 +92,24 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             )
             raise
 
-        # Calculate processing time
-        processing_time = time.time() - start_time
-        processing_time_ms = round(processing_time * 1000, 2)
-
-        # Add response headers
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Response-Time"] = str(processing_time_ms)
-
-        # Get response size
-        response_size = 0
-        if hasattr(response, "body"):
-            response_size = len(response.body)
-        elif isinstance(response, StreamingResponse):
-            # For streaming responses, we can't easily get the size
-            response_size = -1
+        # Calculate processing time (including the streamed body)
+        processing_time_ms = round((time.time() - start_time) * 1000, 2)
 
         # Log response
         log_level = logging.INFO
-        if response.status_code >= 400:
+        if status_code >= 400:
             log_level = logging.WARNING
-        if response.status_code >= 500:
+        if status_code >= 500:
             log_level = logging.ERROR
 
         logger.log(
             log_level,
-            f"Request completed: {request.method} {request.url.path} - {response.status_code}",
+            f"Request completed: {method} {path} - {status_code}",
             extra={
                 "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
+                "method": method,
+                "path": path,
+                "status_code": status_code,
                 "processing_time_ms": processing_time_ms,
                 "response_size_bytes": response_size,
                 "client_ip": client_ip
@@ -120,14 +122,12 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 f"Slow request detected: {processing_time_ms}ms",
                 extra={
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": method,
+                    "path": path,
                     "processing_time_ms": processing_time_ms
                 }
             )
 
-        return response
-
     def _get_client_ip(self, request: Request) -> str:
         """
         Get client IP address from request
@@ -155,39 +155,50 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         return "unknown"
 
 
-class RequestSizeMiddleware(BaseHTTPMiddleware):
-    """Middleware to limit request body size"""
+class RequestSizeMiddleware:
+    """Middleware to limit request body size (pure ASGI)"""
 
-    def __init__(self, app: FastAPI, max_size: int = 10 * 1024 * 1024):  # 10MB default
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, max_size: int = 10 * 1024 * 1024):  # 10MB default
+        self.app = app
         self.max_size = max_size
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Check request size limits
-
-        Args:
-            request: HTTP request
-            call_next: Next middleware/endpoint
+        Reject bodies over max_size with 413
 
-        Returns:
-            HTTP response
-
-        Raises:
-            HTTPException: If request body is too large
+        Declared Content-Length is checked up front; chunked bodies are
+        counted as they are received.
         """
-        content_length = request.headers.get("content-length")
-
-        if content_length:
-            content_length = int(content_length)
-            if content_length > self.max_size:
-                from fastapi import HTTPException, status
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail=f"Request body too large. Maximum size: {self.max_size} bytes"
-                )
-
-        return await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_size:
+            response = create_error_response(
+                status_code=413,
+                message=f"Request body too large. Maximum size: {self.max_size} bytes",
+                error_code="REQUEST_TOO_LARGE",
+                request_id=scope.get("state", {}).get("request_id")
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_wrapper() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_size:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Request body too large. Maximum size: {self.max_size} bytes"
+                    )
+            return message
+
+        await self.app(scope, receive_wrapper, send)
 
 
 def setup_logging_middleware(app: FastAPI) -> None:
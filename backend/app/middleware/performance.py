@@ -1,280 +1,674 @@
 """
 Performance optimization middleware for Planning Explorer API
 """
-import gzip
 import asyncio
-from typing import Callable, Dict, Any, Optional
-from datetime import datetime, timedelta
-
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import StreamingResponse
-from starlette.types import Message
+import base64
+import hashlib
+import json
+import logging
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
+from app.services.cache_service import get_cache_service
+
+logger = logging.getLogger(__name__)
+
+# Optional encoders - gzip is always available
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Content types worth compressing (everything else passes through)
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/x-ndjson",
+    "image/svg+xml",
+)
+COMPRESSIBLE_SUFFIXES = ("+json", "+xml")
+
+# Markup and scripts are served repeatedly and compress well at higher levels
+MARKUP_TYPES = ("text/html", "text/css", "text/javascript", "application/javascript", "image/svg+xml")
+
+# Responses above this size (or of unknown length) use the fast levels
+LARGE_RESPONSE_SIZE = 1024 * 1024
+
+# encoding -> (fast, default, markup) levels
+COMPRESSION_LEVELS = {
+    "zstd": (1, 3, 6),
+    "br": (3, 4, 6),
+    "gzip": (3, 5, 6),
+}
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level, mode=brotli.MODE_TEXT)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+# Available encoders in server preference order
+ENCODERS: Dict[str, Callable[[int], Any]] = {}
+if zstandard is not None:
+    ENCODERS["zstd"] = _ZstdEncoder
+if brotli is not None:
+    ENCODERS["br"] = _BrotliEncoder
+ENCODERS["gzip"] = _GzipEncoder
 
 
-class CompressionMiddleware(BaseHTTPMiddleware):
-    """Middleware for response compression"""
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the best available encoding from an Accept-Encoding header"""
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip()] = quality
 
-    def __init__(self, app: FastAPI, minimum_size: int = 1024):
-        super().__init__(app)
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in ENCODERS:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith(COMPRESSIBLE_TYPES) or media_type.endswith(COMPRESSIBLE_SUFFIXES)
+
+
+def compression_level(encoding: str, content_type: str, content_length: Optional[int]) -> int:
+    """Level for an encoding given the response's content type and size"""
+    fast, default, markup = COMPRESSION_LEVELS[encoding]
+    if content_length is None or content_length > LARGE_RESPONSE_SIZE:
+        return fast
+    if content_type.lower().startswith(MARKUP_TYPES):
+        return markup
+    return default
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI response compression.
+
+    Negotiates zstd/br/gzip from Accept-Encoding and compresses body
+    chunks as they stream instead of buffering the whole response.
+    Chunks of at least `offload_size` bytes are compressed in a worker
+    thread so large payloads do not stall the event loop.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, offload_size: int = 64 * 1024):
+        self.app = app
         self.minimum_size = minimum_size
+        self.offload_size = offload_size
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Apply compression to responses if appropriate
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        Args:
-            request: HTTP request
-            call_next: Next middleware/endpoint
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
 
-        Returns:
-            Potentially compressed HTTP response
-        """
-        response = await call_next(request)
-
-        # Check if client accepts gzip compression
-        accept_encoding = request.headers.get("accept-encoding", "")
-        if "gzip" not in accept_encoding.lower():
-            return response
-
-        # Skip compression for certain content types
-        content_type = response.headers.get("content-type", "")
-        skip_types = [
-            "image/",
-            "video/",
-            "audio/",
-            "application/zip",
-            "application/gzip",
-            "application/pdf"
-        ]
-
-        if any(content_type.startswith(skip_type) for skip_type in skip_types):
-            return response
-
-        # Skip compression for small responses
-        if hasattr(response, "body") and len(response.body) < self.minimum_size:
-            return response
-
-        # Compress response body
-        if hasattr(response, "body"):
-            compressed_body = gzip.compress(response.body)
-
-            # Only use compression if it actually reduces size
-            if len(compressed_body) < len(response.body):
-                response.headers["content-encoding"] = "gzip"
-                response.headers["content-length"] = str(len(compressed_body))
-                response.body = compressed_body
-
-        return response
-
-
-class CacheMiddleware(BaseHTTPMiddleware):
-    """Simple in-memory cache middleware"""
-
-    def __init__(self, app: FastAPI, default_ttl: int = 300):
-        super().__init__(app)
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.default_ttl = default_ttl
-        self.lock = asyncio.Lock()
+        responder = _CompressionResponder(send, encoding, self.minimum_size, self.offload_size)
+        await self.app(scope, receive, responder.send)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Cache GET requests when appropriate
 
-        Args:
-            request: HTTP request
-            call_next: Next middleware/endpoint
+class _CompressionResponder:
+    """Per-response send wrapper that decides on and applies compression"""
 
-        Returns:
-            Cached or fresh HTTP response
-        """
-        # Only cache GET requests
-        if request.method != "GET":
-            return await call_next(request)
-
-        # Skip caching for certain paths
-        skip_paths = [
-            "/api/auth",
-            "/api/user",
-            "/docs",
-            "/redoc"
-        ]
-
-        if any(request.url.path.startswith(path) for path in skip_paths):
-            return await call_next(request)
-
-        # Generate cache key
-        cache_key = self._generate_cache_key(request)
-
-        # Check cache
-        async with self.lock:
-            cached_response = await self._get_cached_response(cache_key)
-
-        if cached_response:
-            # Return cached response
-            response = Response(
-                content=cached_response["body"],
-                status_code=cached_response["status_code"],
-                headers=cached_response["headers"]
+    def __init__(self, send: Send, encoding: str, minimum_size: int, offload_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+        self.start_message: Optional[Message] = None
+        self.content_type = ""
+        self.encoder = None
+        self.passthrough = False
+        self.flush_each_chunk = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                message["status"] < 200
+                or message["status"] in (204, 304)
+                or "content-encoding" in headers
+                or not is_compressible(content_type)
             )
-            response.headers["X-Cache"] = "HIT"
-            return response
-
-        # Get fresh response
-        response = await call_next(request)
-
-        # Cache successful responses
-        if response.status_code == 200 and hasattr(response, "body"):
-            async with self.lock:
-                await self._cache_response(cache_key, response)
-
-        response.headers["X-Cache"] = "MISS"
-        return response
-
-    def _generate_cache_key(self, request: Request) -> str:
-        """Generate cache key from request"""
-        # Include path and query parameters
-        key_parts = [
-            request.url.path,
-            str(sorted(request.query_params.items()))
-        ]
-
-        # Include user ID if authenticated (for user-specific caching)
-        auth_header = request.headers.get("authorization")
-        if auth_header:
-            # This would extract user ID from JWT in production
-            key_parts.append("authenticated")
-
-        return "|".join(key_parts)
-
-    async def _get_cached_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Get response from cache if not expired"""
-        if cache_key not in self.cache:
-            return None
+            if self.passthrough:
+                await self._send(message)
+            else:
+                # Held until the first body chunk shows whether compression pays off
+                self.start_message = message
+                self.content_type = content_type
+                self.flush_each_chunk = content_type.startswith("text/event-stream")
+            return
 
-        cached_item = self.cache[cache_key]
+        if message_type != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
 
-        # Check if expired
-        if datetime.utcnow() > cached_item["expires_at"]:
-            del self.cache[cache_key]
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.encoder is None:
+            if not more_body and len(body) < self.minimum_size:
+                # Small complete response: send as-is
+                self.passthrough = True
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+            await self._start_compressed()
+
+        data = await self._compress(body, more_body)
+        if data or not more_body:
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    async def _start_compressed(self):
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        content_length = headers.get("content-length")
+        level = compression_level(
+            self.encoding, self.content_type, int(content_length) if content_length else None
+        )
+        self.encoder = ENCODERS[self.encoding](level)
+
+        if "content-length" in headers:
+            del headers["content-length"]
+        headers["content-encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        await self._send(self.start_message)
+
+    async def _compress(self, body: bytes, more_body: bool) -> bytes:
+        def run() -> bytes:
+            data = self.encoder.compress(body)
+            if not more_body:
+                return data + self.encoder.finish()
+            if self.flush_each_chunk:
+                return data + self.encoder.flush()
+            return data
+
+        if len(body) >= self.offload_size:
+            return await asyncio.to_thread(run)
+        return run()
+
+
+HTTP_CACHE_PREFIX = "planning_explorer:http:"
+
+# Cacheable GET routes and their TTLs in seconds (None = default_ttl);
+# longest prefix wins
+ROUTE_TTLS: Dict[str, Optional[int]] = {
+    "/api/v1/stats": 600,
+    "/api/v1/stats/locations": 900,
+    "/api/v1/pseo": None,
+    "/api/v1/aggregations": 600,
+}
+
+# Vary headers the cache key already accounts for
+KEYED_VARY_HEADERS = {"accept-encoding", "authorization", "cookie"}
+
+# Response headers not replayed from the cache
+UNCACHED_HEADERS = {"date", "x-cache", "age", "set-cookie"}
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag.removeprefix("W/") for tag in if_none_match.split(","))
+
+
+@dataclass
+class CachedResponse:
+    """A stored GET response"""
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    etag: str
+    stored_at: float
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers)
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "status": self.status,
+            "headers": [[k.decode("latin-1"), v.decode("latin-1")] for k, v in self.headers],
+            "body": base64.b64encode(self.body).decode("ascii"),
+            "etag": self.etag,
+            "stored_at": self.stored_at,
+            "expires_at": self.expires_at,
+        })
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CachedResponse":
+        data = json.loads(raw)
+        return cls(
+            status=data["status"],
+            headers=[(k.encode("latin-1"), v.encode("latin-1")) for k, v in data["headers"]],
+            body=base64.b64decode(data["body"]),
+            etag=data["etag"],
+            stored_at=data["stored_at"],
+            expires_at=data["expires_at"],
+        )
+
+
+class ResponseLRU:
+    """LRU of cached responses bounded by total size in bytes"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() >= entry.expires_at:
+            self.pop(key)
             return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CachedResponse):
+        self.pop(key)
+        if entry.size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.current_bytes += entry.size
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted.size
+
+    def pop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry.size
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
-        return cached_item
 
-    async def _cache_response(self, cache_key: str, response: Response):
-        """Cache response with TTL"""
-        if not hasattr(response, "body"):
+class CacheMiddleware:
+    """
+    Pure ASGI HTTP cache for GET routes listed in the TTL table.
+
+    Eligible responses are buffered (up to `max_body_size`), given a strong
+    content-hash ETag and stored in a size-bounded LRU, optionally mirrored
+    to the shared Redis tier. Entries are keyed on path, query, the
+    caller's auth identity and Accept-Encoding; conditional requests with
+    a matching If-None-Match get a 304.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_ttl: int = 300,
+        route_ttls: Optional[Dict[str, int]] = None,
+        max_bytes: Optional[int] = None,
+        max_body_size: Optional[int] = None,
+        shared: Optional[bool] = None
+    ):
+        self.app = app
+        self.default_ttl = default_ttl
+        # Longest prefix first
+        self.route_ttls = sorted((route_ttls or ROUTE_TTLS).items(), key=lambda item: -len(item[0]))
+        self.max_body_size = max_body_size or settings.http_cache_max_body
+        self.shared = settings.http_cache_shared if shared is None else shared
+        self.store = ResponseLRU(max_bytes or settings.http_cache_max_bytes)
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0, "stored": 0}
+
+    def _ttl_for(self, path: str) -> Optional[int]:
+        for prefix, ttl in self.route_ttls:
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return ttl or self.default_ttl
+        return None
+
+    def _cache_key(self, scope: Scope, headers: Headers) -> str:
+        """Path + query + auth identity + Accept-Encoding"""
+        credentials = headers.get("authorization") or headers.get("cookie") or ""
+        identity = hashlib.sha256(credentials.encode()).hexdigest()[:32] if credentials else "anonymous"
+        encodings = ",".join(sorted(e.strip() for e in headers.get("accept-encoding", "").lower().split(",") if e.strip()))
+        query = "&".join(sorted(scope.get("query_string", b"").decode("latin-1").split("&")))
+        return f"{scope['path']}?{query}|{identity}|{encodings}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
             return
 
-        # Determine TTL based on endpoint
-        ttl = self.default_ttl
-
-        # Different TTLs for different endpoints
-        if "/api/search" in cache_key:
-            ttl = 60  # Search results change frequently
-        elif "/api/applications" in cache_key:
-            ttl = 300  # Application data is more stable
-        elif "/api/aggregations" in cache_key:
-            ttl = 600  # Aggregations can be cached longer
-
-        expires_at = datetime.utcnow() + timedelta(seconds=ttl)
-
-        self.cache[cache_key] = {
-            "body": response.body,
-            "status_code": response.status_code,
-            "headers": dict(response.headers),
-            "expires_at": expires_at
-        }
-
-        # Simple cache size management
-        if len(self.cache) > 1000:
-            # Remove oldest 20% of entries
-            sorted_items = sorted(
-                self.cache.items(),
-                key=lambda x: x[1]["expires_at"]
-            )
-            for key, _ in sorted_items[:200]:
-                del self.cache[key]
+        ttl = self._ttl_for(scope["path"])
+        if ttl is None:
+            await self.app(scope, receive, send)
+            return
 
+        headers = Headers(scope=scope)
+        key = self._cache_key(scope, headers)
+        bypass = "no-cache" in headers.get("cache-control", "").lower()
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers"""
+        entry = None if bypass else await self._lookup(key)
+        if entry is not None:
+            self.stats["hits"] += 1
+            await self._replay(entry, headers, send)
+            return
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Add security headers to responses
+        self.stats["misses"] += 1
+        recorder = _ResponseRecorder(send, self.max_body_size)
+        await self.app(scope, receive, recorder.send)
 
-        Args:
-            request: HTTP request
-            call_next: Next middleware/endpoint
+        if recorder.complete is None:
+            return
+        status, response_headers, body = recorder.complete
 
-        Returns:
-            Response with security headers
-        """
-        response = await call_next(request)
-
-        # Add security headers
-        security_headers = {
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "X-XSS-Protection": "1; mode=block",
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-            "Content-Security-Policy": (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline'; "
-                "style-src 'self' 'unsafe-inline'; "
-                "img-src 'self' data: https:; "
-                "connect-src 'self' https:; "
-                "font-src 'self' https:;"
-            )
-        }
+        if status != 200 or not self._storable(response_headers):
+            await send({"type": "http.response.start", "status": status, "headers": response_headers})
+            await send({"type": "http.response.body", "body": body})
+            return
 
-        for header, value in security_headers.items():
-            response.headers[header] = value
+        etag = Headers(raw=response_headers).get("etag") or f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        now = time.time()
+        entry = CachedResponse(
+            status=status,
+            headers=self._stored_headers(response_headers, etag, ttl, key),
+            body=body,
+            etag=etag,
+            stored_at=now,
+            expires_at=now + ttl
+        )
+
+        self.store.set(key, entry)
+        self.stats["stored"] += 1
+        if self.shared:
+            await self._share(key, entry, ttl)
+
+        await self._replay(entry, headers, send, cache_status="MISS")
+
+    @staticmethod
+    def _storable(headers: List[Tuple[bytes, bytes]]) -> bool:
+        response_headers = Headers(raw=headers)
+        cache_control = response_headers.get("cache-control", "").lower()
+        if "no-store" in cache_control or "set-cookie" in response_headers:
+            return False
+        vary = {v.strip().lower() for v in response_headers.get("vary", "").split(",") if v.strip()}
+        return vary <= KEYED_VARY_HEADERS
+
+    @staticmethod
+    def _stored_headers(raw: List[Tuple[bytes, bytes]], etag: str, ttl: int, key: str) -> List[Tuple[bytes, bytes]]:
+        headers = MutableHeaders(raw=[(k, v) for k, v in raw if k.decode("latin-1").lower() not in UNCACHED_HEADERS])
+        headers["etag"] = etag
+        if "cache-control" not in headers:
+            scope = "public" if "|anonymous|" in key else "private"
+            headers["cache-control"] = f"{scope}, max-age={ttl}"
+        headers.add_vary_header("Accept-Encoding")
+        if "|anonymous|" not in key:
+            headers.add_vary_header("Authorization")
+        return headers.raw
+
+    async def _replay(self, entry: CachedResponse, request_headers: Headers, send: Send, cache_status: str = "HIT"):
+        headers = MutableHeaders(raw=list(entry.headers))
+        headers["x-cache"] = cache_status
+        if cache_status == "HIT":
+            headers["age"] = str(int(time.time() - entry.stored_at))
+
+        if entry.status == 200 and etag_matches(request_headers.get("if-none-match"), entry.etag):
+            self.stats["not_modified"] += 1
+            for name in ("content-length", "content-type", "content-encoding"):
+                if name in headers:
+                    del headers[name]
+            await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
 
-        return response
+        await send({"type": "http.response.start", "status": entry.status, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": entry.body})
 
+    async def _lookup(self, key: str) -> Optional[CachedResponse]:
+        entry = self.store.get(key)
+        if entry is not None or not self.shared:
+            return entry
 
-class ResponseTimeMiddleware(BaseHTTPMiddleware):
-    """Middleware to add response time headers and optimize slow responses"""
+        cache = get_cache_service()
+        if not cache or not cache.available:
+            return None
+        try:
+            raw = await cache.redis_client.get(f"{HTTP_CACHE_PREFIX}{key}")
+        except Exception as e:
+            logger.warning(f"HTTP cache Redis read failed: {str(e)}")
+            return None
+        if raw is None:
+            return None
+        entry = CachedResponse.from_json(raw)
+        if time.time() >= entry.expires_at:
+            return None
+        self.store.set(key, entry)
+        return entry
+
+    async def _share(self, key: str, entry: CachedResponse, ttl: int):
+        cache = get_cache_service()
+        if not cache or not cache.available:
+            return
+        try:
+            await cache.redis_client.setex(f"{HTTP_CACHE_PREFIX}{key}", ttl, entry.to_json())
+        except Exception as e:
+            logger.warning(f"HTTP cache Redis write failed: {str(e)}")
 
-    def __init__(self, app: FastAPI, slow_threshold_ms: int = 1000):
-        super().__init__(app)
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "entries": len(self.store), "bytes": self.store.current_bytes}
+
+
+class _ResponseRecorder:
+    """
+    Buffers a response for caching. Once the body exceeds the size cap the
+    buffered messages are released and the rest streams through uncached.
+    """
+
+    def __init__(self, send: Send, max_body_size: int):
+        self._send = send
+        self.max_body_size = max_body_size
+        self.start_message: Optional[Message] = None
+        self.chunks: List[bytes] = []
+        self.size = 0
+        self.streaming = False
+        self.complete: Optional[Tuple[int, List[Tuple[bytes, bytes]], bytes]] = None
+
+    async def send(self, message: Message) -> None:
+        if self.streaming:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        self.chunks.append(body)
+        self.size += len(body)
+
+        if self.size > self.max_body_size:
+            # Too large to cache: release what was held and stream the rest
+            self.streaming = True
+            await self._send(self.start_message)
+            more_body = message.get("more_body", False)
+            for index, chunk in enumerate(self.chunks):
+                last = index == len(self.chunks) - 1
+                await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body or not last})
+            self.chunks = []
+            return
+
+        if not message.get("more_body", False):
+            headers = [
+                (k, v) for k, v in self.start_message["headers"] if k.lower() != b"content-length"
+            ]
+            body = b"".join(self.chunks)
+            headers.append((b"content-length", str(len(body)).encode()))
+            self.complete = (self.start_message["status"], headers, body)
+
+
+# Security headers added to every response (pre-encoded once)
+SECURITY_HEADERS = [
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in {
+        "X-Content-Type-Options": "nosniff",
+        "X-Frame-Options": "DENY",
+        "X-XSS-Protection": "1; mode=block",
+        "Referrer-Policy": "strict-origin-when-cross-origin",
+        "Content-Security-Policy": (
+            "default-src 'self'; "
+            "script-src 'self' 'unsafe-inline'; "
+            "style-src 'self' 'unsafe-inline'; "
+            "img-src 'self' data: https:; "
+            "connect-src 'self' https:; "
+            "font-src 'self' https:;"
+        )
+    }.items()
+]
+_SECURITY_HEADER_NAMES = {name for name, _ in SECURITY_HEADERS}
+
+
+class SecurityHeadersMiddleware:
+    """Middleware to add security headers (pure ASGI)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [h for h in message.get("headers", []) if h[0].lower() not in _SECURITY_HEADER_NAMES]
+                message["headers"] = headers + SECURITY_HEADERS
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class ResponseTimeMiddleware:
+    """Middleware to add response time headers and log slow responses (pure ASGI)"""
+
+    def __init__(self, app: ASGIApp, slow_threshold_ms: int = 1000):
+        self.app = app
         self.slow_threshold_ms = slow_threshold_ms
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Track response times and optimize slow responses
+        Track response times
 
-        Args:
-            request: HTTP request
-            call_next: Next middleware/endpoint
-
-        Returns:
-            Response with timing headers
+        X-Process-Time is the time to the response start; the slow-response
+        warning uses the total time including the streamed body.
         """
-        import time
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
 
-        process_time_ms = round(process_time * 1000, 2)
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                process_time_ms = round((time.time() - start_time) * 1000, 2)
+                MutableHeaders(scope=message)["X-Process-Time"] = str(process_time_ms)
+            await send(message)
 
-        # Add timing headers
-        response.headers["X-Process-Time"] = str(process_time_ms)
+        await self.app(scope, receive, send_wrapper)
 
-        # Log slow responses
+        process_time_ms = round((time.time() - start_time) * 1000, 2)
         if process_time_ms > self.slow_threshold_ms:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(
-                f"Slow response: {request.method} {request.url.path} took {process_time_ms}ms"
+                f"Slow response: {scope['method']} {scope['path']} took {process_time_ms}ms"
             )
 
-        return response
+
+def setup_response_cache(app: FastAPI) -> None:
+    """
+    Set up the HTTP response cache
+
+    Must be registered before CORS, logging and rate limiting so it sits
+    inside them: hits still get CORS headers for the caller's Origin, are
+    logged and count against the caller's rate limit.
+
+    Args:
+        app: FastAPI application instance
+    """
+    # Conservative TTL for data freshness
+    app.add_middleware(CacheMiddleware, default_ttl=settings.cache_ttl)
 
 
 def setup_performance_middleware(app: FastAPI) -> None:
@@ -290,8 +684,5 @@ def setup_performance_middleware(app: FastAPI) -> None:
     # Add response time tracking
     app.add_middleware(ResponseTimeMiddleware, slow_threshold_ms=1000)
 
-    # Add caching (with conservative TTL for data freshness)
-    app.add_middleware(CacheMiddleware, default_ttl=settings.cache_ttl)
-
     # Add compression (should be last to compress final response)
     app.add_middleware(CompressionMiddleware, minimum_size=1024)
\ No newline at end of file
@@ -1,205 +1,240 @@
 """
 Rate limiting middleware for Planning Explorer API
+
+Limits use GCRA (generic cell rate algorithm): each key stores a single
+"theoretical arrival time", so state is O(1) per client and a check is
+a few arithmetic operations. With Redis available the check runs as an
+atomic Lua script so limits hold across all uvicorn workers; otherwise
+(or if Redis errors) an in-process limiter is used.
 """
+import logging
+import math
 import time
-import asyncio
-from typing import Dict, Optional
-from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 
-from fastapi import FastAPI, Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from fastapi import FastAPI, Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
+from app.db.supabase import supabase_client
+from app.middleware.auth import auth_middleware
+from app.middleware.error_handler import create_error_response
+from app.services.cache_service import get_cache_service
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_PREFIX = "planning_explorer:ratelimit:"
+
+# Paths that are never rate limited
+SKIP_PATHS = ("/docs", "/redoc", "/openapi.json", "/health", "/favicon.ico")
+
+# Per-endpoint caps (requests per period), applied on top of the caller's limit
+ENDPOINT_LIMITS = (
+    ("/api/v1/search", 50),
+    ("/api/v1/ai", 20),
+)
+
+# Atomic GCRA check. KEYS[1] = key; ARGV = emission interval (ms), period (ms).
+# Uses the Redis clock so all workers agree on "now".
+GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + tonumber(t[2]) / 1000
+local interval = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+local allow_at = new_tat - period
+if now < allow_at then
+    return {0, 0, math.ceil(allow_at - now), math.ceil(tat - now)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+return {1, math.floor((now - allow_at) / interval), 0, math.ceil(new_tat - now)}
+"""
+
+
+@dataclass
+class RateLimitResult:
+    """Outcome of a rate limit check"""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # seconds until the next request is allowed (0 if allowed)
+    reset_after: float  # seconds until the bucket is full again
 
 
 class RateLimiter:
-    """Simple in-memory rate limiter"""
-
-    def __init__(self):
-        self.requests: Dict[str, deque] = defaultdict(deque)
-        self.lock = asyncio.Lock()
-
-    async def is_allowed(
-        self,
-        key: str,
-        max_requests: int,
-        window_seconds: int
-    ) -> tuple[bool, int]:
+    """In-process GCRA limiter (one float per key, no lock)"""
+
+    def __init__(self, max_keys: int = 100000):
+        self.tats: Dict[str, float] = {}
+        self.max_keys = max_keys
+
+    def check(self, key: str, max_requests: int, window_seconds: float, now: Optional[float] = None) -> RateLimitResult:
         """
-        Check if request is allowed within rate limits
+        Count a request against `max_requests` per `window_seconds`
 
         Args:
             key: Unique identifier for rate limiting (IP, user ID, etc.)
-            max_requests: Maximum requests allowed in window
+            max_requests: Maximum requests allowed in window (also the burst size)
             window_seconds: Time window in seconds
 
         Returns:
-            Tuple of (is_allowed, remaining_requests)
+            RateLimitResult
         """
-        async with self.lock:
-            now = time.time()
-            window_start = now - window_seconds
+        now = time.monotonic() if now is None else now
+        interval = window_seconds / max_requests
 
-            # Get request history for this key
-            request_times = self.requests[key]
+        tat = max(self.tats.get(key, now), now)
+        new_tat = tat + interval
+        allow_at = new_tat - window_seconds
 
-            # Remove old requests outside the window
-            while request_times and request_times[0] < window_start:
-                request_times.popleft()
+        if now < allow_at:
+            return RateLimitResult(False, max_requests, 0, allow_at - now, tat - now)
 
-            # Check if we're within limits
-            current_requests = len(request_times)
-            remaining = max(0, max_requests - current_requests)
+        if key not in self.tats and len(self.tats) >= self.max_keys:
+            self._prune(now)
+        self.tats[key] = new_tat
+        return RateLimitResult(True, max_requests, int((now - allow_at) / interval), 0.0, new_tat - now)
 
-            if current_requests >= max_requests:
-                return False, 0
+    async def is_allowed(self, key: str, max_requests: int, window_seconds: float) -> RateLimitResult:
+        return self.check(key, max_requests, window_seconds)
 
-            # Add current request
-            request_times.append(now)
+    def _prune(self, now: float):
+        """Drop keys whose bucket has fully refilled (they carry no state)"""
+        self.tats = {key: tat for key, tat in self.tats.items() if tat > now}
 
-            return True, remaining - 1
 
-    async def get_reset_time(self, key: str, window_seconds: int) -> Optional[int]:
-        """
-        Get when the rate limit will reset
+class RedisRateLimiter:
+    """GCRA limiter shared across workers via the Redis cache service"""
 
-        Args:
-            key: Rate limit key
-            window_seconds: Window size in seconds
+    def __init__(self, fallback: RateLimiter):
+        self.fallback = fallback
+        self._script = None
+        self._script_client = None
 
-        Returns:
-            Unix timestamp when limit resets, or None if no limits
-        """
-        request_times = self.requests.get(key)
-        if not request_times:
-            return None
+    async def is_allowed(self, key: str, max_requests: int, window_seconds: float) -> RateLimitResult:
+        cache = get_cache_service()
+        if not cache or not cache.available:
+            return self.fallback.check(key, max_requests, window_seconds)
 
-        oldest_request = request_times[0]
-        reset_time = oldest_request + window_seconds
-        return int(reset_time)
+        if self._script_client is not cache.redis_client:
+            self._script = cache.redis_client.register_script(GCRA_SCRIPT)
+            self._script_client = cache.redis_client
 
+        period_ms = window_seconds * 1000
+        try:
+            allowed, remaining, retry_ms, reset_ms = await self._script(
+                keys=[f"{RATE_LIMIT_PREFIX}{key}"],
+                args=[period_ms / max_requests, period_ms]
+            )
+        except Exception as e:
+            logger.warning(f"Redis rate limit check failed, using local limiter: {str(e)}")
+            return self.fallback.check(key, max_requests, window_seconds)
+
+        return RateLimitResult(
+            bool(int(allowed)), max_requests, int(remaining), int(retry_ms) / 1000, int(reset_ms) / 1000
+        )
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware"""
 
-    def __init__(self, app: FastAPI):
-        super().__init__(app)
-        self.rate_limiter = RateLimiter()
+class RateLimitMiddleware:
+    """Rate limiting middleware (pure ASGI)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.local_limiter = RateLimiter()
+        self.rate_limiter = RedisRateLimiter(self.local_limiter) if settings.rate_limit_redis else self.local_limiter
         self.default_requests = settings.rate_limit_requests
         self.default_period = settings.rate_limit_period
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Apply rate limiting to requests
 
-        Args:
-            request: HTTP request
-            call_next: Next middleware/endpoint
-
-        Returns:
-            HTTP response
-
-        Raises:
-            HTTPException: If rate limit exceeded
+        Denied requests get a 429; allowed ones have X-Rate-Limit-* headers
+        added to the response.
         """
-        # Skip rate limiting for certain paths
-        skip_paths = [
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/health",
-            "/favicon.ico"
-        ]
-
-        if any(request.url.path.startswith(path) for path in skip_paths):
-            return await call_next(request)
-
-        # Determine rate limit key and limits
-        rate_limit_key, max_requests, window_seconds = self._get_rate_limit_params(request)
-
-        # Check rate limit
-        is_allowed, remaining = await self.rate_limiter.is_allowed(
-            key=rate_limit_key,
-            max_requests=max_requests,
-            window_seconds=window_seconds
-        )
-
-        if not is_allowed:
-            # Get reset time
-            reset_time = await self.rate_limiter.get_reset_time(rate_limit_key, window_seconds)
-
-            # Create rate limit exceeded response
-            headers = {
-                "X-Rate-Limit-Limit": str(max_requests),
-                "X-Rate-Limit-Remaining": "0",
-                "X-Rate-Limit-Reset": str(reset_time) if reset_time else "",
-                "Retry-After": str(window_seconds)
-            }
-
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Rate limit exceeded. Please try again later.",
-                headers=headers
+        if scope["type"] != "http" or scope["path"].startswith(SKIP_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        rate_limit_key, max_requests, window_seconds = await self._get_rate_limit_params(request)
+        result = await self.rate_limiter.is_allowed(rate_limit_key, max_requests, window_seconds)
+        reset_time = str(int(time.time() + result.reset_after))
+
+        if not result.allowed:
+            response = create_error_response(
+                status_code=429,
+                message="Rate limit exceeded. Please try again later.",
+                error_code="RATE_LIMIT_EXCEEDED",
+                request_id=scope.get("state", {}).get("request_id")
             )
-
-        # Process request
-        response = await call_next(request)
-
-        # Add rate limit headers to response
-        reset_time = await self.rate_limiter.get_reset_time(rate_limit_key, window_seconds)
-        response.headers["X-Rate-Limit-Limit"] = str(max_requests)
-        response.headers["X-Rate-Limit-Remaining"] = str(remaining)
-        if reset_time:
-            response.headers["X-Rate-Limit-Reset"] = str(reset_time)
-
-        return response
-
-    def _get_rate_limit_params(self, request: Request) -> tuple[str, int, int]:
+            response.headers["X-Rate-Limit-Limit"] = str(max_requests)
+            response.headers["X-Rate-Limit-Remaining"] = "0"
+            response.headers["X-Rate-Limit-Reset"] = reset_time
+            response.headers["Retry-After"] = str(math.ceil(result.retry_after))
+            await response(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Rate-Limit-Limit"] = str(max_requests)
+                headers["X-Rate-Limit-Remaining"] = str(result.remaining)
+                headers["X-Rate-Limit-Reset"] = reset_time
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _get_rate_limit_params(self, request: Request) -> Tuple[str, int, int]:
         """
         Get rate limiting parameters for the request
 
-        Args:
-            request: HTTP request
+        Authenticated callers are keyed on the verified JWT subject and get
+        their subscription tier's limit; everyone else is keyed on client IP.
 
         Returns:
             Tuple of (key, max_requests, window_seconds)
         """
-        # Check if user is authenticated
-        auth_header = request.headers.get("authorization")
-        user_id = None
-
-        if auth_header:
-            # Extract user ID from token (simplified)
-            # In production, this would properly decode the JWT
-            try:
-                # This is a placeholder - implement proper JWT parsing
-                user_id = "user_from_token"
-            except:
-                user_id = None
+        user_id = await self._get_token_subject(request)
 
         if user_id:
-            # Authenticated user rate limits (more generous)
-            # Different limits based on user tier would be implemented here
+            role = await self._get_user_role(user_id)
             rate_limit_key = f"user:{user_id}"
-            max_requests = self.default_requests * 2  # 2x limit for authenticated users
-            window_seconds = self.default_period
+            max_requests = settings.get_tier_limits("enterprise" if role == "admin" else role)["rate_limit"]
         else:
-            # Anonymous user rate limits (based on IP)
-            client_ip = self._get_client_ip(request)
-            rate_limit_key = f"ip:{client_ip}"
+            rate_limit_key = f"ip:{self._get_client_ip(request)}"
             max_requests = self.default_requests
-            window_seconds = self.default_period
 
         # Apply endpoint-specific limits
-        if request.url.path.startswith("/api/search"):
-            # Search endpoints might have different limits
-            max_requests = min(max_requests, 50)  # Max 50 searches per minute
-        elif request.url.path.startswith("/api/ai"):
-            # AI endpoints are more expensive
-            max_requests = min(max_requests, 20)  # Max 20 AI requests per minute
+        path = request.url.path
+        for prefix, endpoint_limit in ENDPOINT_LIMITS:
+            if path.startswith(prefix):
+                max_requests = min(max_requests, endpoint_limit)
+                rate_limit_key = f"{rate_limit_key}:{prefix}"
+                break
+
+        return rate_limit_key, max_requests, self.default_period
+
+    async def _get_token_subject(self, request: Request) -> Optional[str]:
+        """Subject of a bearer token AuthMiddleware can verify locally (None otherwise)"""
+        auth_header = request.headers.get("authorization", "")
+        scheme, _, token = auth_header.partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+        # Unverifiable tokens fall back to IP limits so a forged subject can't mint fresh buckets
+        claims = await auth_middleware.verify_claims(token)
+        return claims.get("sub") if claims else None
 
-        return rate_limit_key, max_requests, window_seconds
+    async def _get_user_role(self, user_id: str) -> str:
+        """Subscription role from the profile cache shared with AuthMiddleware"""
+        profile = await supabase_client.get_cached_user_profile(user_id)
+        return getattr(profile.role, "value", profile.role) if profile else "free"
 
     def _get_client_ip(self, request: Request) -> str:
         """Get client IP address"""
@@ -225,4 +260,4 @@ def setup_rate_limiting(app: FastAPI) -> None:
     Args:
         app: FastAPI application instance
     """
-    app.add_middleware(RateLimitMiddleware)
\ No newline at end of file
+    app.add_middleware(RateLimitMiddleware)
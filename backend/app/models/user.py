@@ -113,6 +113,8 @@ class SavedSearch(BaseModel):
     alert_frequency: Optional[AlertFrequency] = Field(None, description="Alert frequency")
     last_run: Optional[datetime] = Field(None, description="Last search execution")
     result_count: Optional[int] = Field(None, description="Last result count")
+    location_filters: Optional[Dict[str, Any]] = Field(None, description="Location-based filters")
+    run_cursor: Optional[Dict[str, Any]] = Field(None, description="Newest (last_changed, uid) seen by the last run")
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 import json
+import threading
 import numpy as np
 
 from app.core.ai_config import ai_config, AIModel, AIProvider
@@ -26,6 +27,9 @@ from app.models.planning import PlanningApplication
 
 logger = logging.getLogger(__name__)
 
+# Attributes of AIProcessor holding the lazily built AI components
+AI_COMPONENTS = ("opportunity_scorer", "document_summarizer", "embedding_service", "nlp_processor", "market_intelligence")
+
 
 class ProcessingMode(str, Enum):
     """AI processing modes"""
@@ -95,7 +99,7 @@ class AIProcessor:
 
     def __init__(self):
         self.config = ai_config
-        self._initialize_components()
+        self._components_lock = threading.Lock()
         self._processing_queue = asyncio.Queue()
         self._active_requests = {}
         self._stats = {
@@ -106,6 +110,20 @@ class AIProcessor:
             "cache_hits": 0
         }
 
+    def __getattr__(self, name: str) -> Any:
+        # Components are built on first access (or by the startup warmup):
+        # constructing them creates the provider SDK clients
+        if name in AI_COMPONENTS:
+            self.initialize_components()
+            return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def initialize_components(self) -> None:
+        """Build the AI components once (thread-safe; safe to call from a worker thread)"""
+        with self._components_lock:
+            if "market_intelligence" not in self.__dict__:
+                self._initialize_components()
+
     def _initialize_components(self) -> None:
         """Initialize AI processing components"""
         try:
@@ -253,6 +271,18 @@ class AIProcessor:
                     errors.append(f"Summarization failed: {str(e)}")
                     logger.error(f"Summarization error for {application.application_id}: {e}")
 
+            # Text Analysis (rule-based, same handler the process pool runs)
+            if "text_analysis" in enabled_features:
+                try:
+                    from app.services.cpu_tasks import analyze_text
+
+                    analysis = await asyncio.to_thread(analyze_text, application, context)
+                    results["text_analysis"] = analysis["result"]
+                    confidence_scores["text_analysis"] = analysis["confidence"]
+                except Exception as e:
+                    errors.append(f"Text analysis failed: {str(e)}")
+                    logger.error(f"Text analysis error for {application.application_id}: {e}")
+
             # Vector Embeddings
             if "embeddings" in enabled_features and self.embedding_service:
                 try:
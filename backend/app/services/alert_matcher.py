@@ -0,0 +1,360 @@
+"""
+Percolator-based Alert Matching Engine
+
+Each active UserAlert is compiled through SearchService into an ES query
+and registered as a percolator document in a dedicated index. New or
+updated applications are percolated in batches against every alert at
+once, so matching cost scales with the number of new documents rather
+than users x alerts. Matches are handed to NotificationService.
+
+Every uvicorn worker starts the matcher, but each sync and matching cycle
+runs under a shared WorkerLease so applications are percolated (and users
+notified) once per deployment.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.db.elasticsearch import es_client
+from app.db.supabase import supabase_client
+from app.models.user import UserAlert
+from app.services.cache_service import WorkerLease
+from app.services.notification_service import notification_service
+from app.services.search import search_service
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_DOC_ID = "__watermark__"
+
+# Large vectors are never referenced by alert queries
+PERCOLATE_SOURCE_EXCLUDES = ["*embedding*"]
+
+ALERT_FIELDS_MAPPING = {
+    "query": {"type": "percolator"},
+    "alert_id": {"type": "keyword"},
+    "user_id": {"type": "keyword"},
+    "alert_name": {"type": "keyword"},
+    "frequency": {"type": "keyword"},
+    "registered_at": {"type": "date"},
+    "watermark": {"type": "object", "enabled": False}
+}
+
+
+class AlertMatcher:
+    """
+    Registers alerts as percolator queries and matches new applications.
+
+    The matcher keeps a watermark (last_changed, uid) of the newest
+    application it has percolated; each cycle only reads documents past it.
+    """
+
+    def __init__(self, index: Optional[str] = None, batch_size: Optional[int] = None):
+        self.index = index or settings.alert_percolator_index
+        self.batch_size = batch_size or settings.alert_match_batch_size
+        self._task: Optional[asyncio.Task] = None
+        self._index_ready = False
+        self.stats = {"registered": 0, "documents_percolated": 0, "matches": 0, "notifications_sent": 0}
+
+    # ------------------------------------------------------------------
+    # Index and registration
+    # ------------------------------------------------------------------
+
+    async def ensure_index(self):
+        """
+        Create the percolator index.
+
+        Percolator queries are parsed against the index mapping, so the
+        applications index mapping and its analysis settings (the custom
+        address/postcode analyzers the mapping refers to) are copied in
+        alongside the alert fields.
+        """
+        if self._index_ready:
+            return
+
+        await es_client.ensure_connection()
+        client = es_client.client
+
+        if not await client.indices.exists(index=self.index):
+            mappings = await client.indices.get_mapping(index=es_client.index_name)
+            source_mapping = next(iter(mappings.values()))["mappings"]
+            properties = {**source_mapping.get("properties", {}), **ALERT_FIELDS_MAPPING}
+
+            source_settings = await client.indices.get_settings(index=es_client.index_name)
+            analysis = next(iter(source_settings.values()))["settings"]["index"].get("analysis")
+
+            await client.indices.create(
+                index=self.index,
+                settings={"analysis": analysis} if analysis else None,
+                mappings={"dynamic": False, "properties": properties}
+            )
+            logger.info(f"✅ Created alert percolator index '{self.index}'")
+
+        self._index_ready = True
+
+    async def compile_alert(self, alert: UserAlert) -> Dict[str, Any]:
+        """Compile alert criteria into the percolator query"""
+        return await search_service.compile_criteria_query(
+            query=alert.query,
+            filters=alert.filters,
+            location_filters=alert.location_filters
+        )
+
+    async def register_alert(self, alert: UserAlert) -> bool:
+        """Register (or replace) an alert's percolator query"""
+        if not alert.is_active:
+            return await self.unregister_alert(alert.alert_id)
+
+        try:
+            await self.ensure_index()
+            await es_client.client.index(
+                index=self.index,
+                id=alert.alert_id,
+                document={
+                    "query": await self.compile_alert(alert),
+                    "alert_id": alert.alert_id,
+                    "user_id": alert.user_id,
+                    "alert_name": alert.name,
+                    "frequency": getattr(alert.frequency, "value", alert.frequency),
+                    "registered_at": datetime.utcnow().isoformat()
+                }
+            )
+            self.stats["registered"] += 1
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to register alert {alert.alert_id}: {str(e)}")
+            return False
+
+    async def unregister_alert(self, alert_id: str) -> bool:
+        """Remove an alert's percolator query"""
+        try:
+            await self.ensure_index()
+            await es_client.client.delete(index=self.index, id=alert_id)
+            return True
+        except Exception as e:
+            logger.debug(f"Alert {alert_id} was not registered: {str(e)}")
+            return False
+
+    async def sync_alerts(self, page_size: int = 500) -> int:
+        """Register every active alert from Supabase (startup/backfill)"""
+        registered = 0
+        offset = 0
+        while True:
+            alerts = await supabase_client.get_active_alerts(limit=page_size, offset=offset)
+            results = await asyncio.gather(*(self.register_alert(alert) for alert in alerts))
+            registered += sum(results)
+            if len(alerts) < page_size:
+                break
+            offset += page_size
+
+        logger.info(f"✅ Registered {registered} alerts for percolation")
+        return registered
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    async def percolate(self, documents: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Match a batch of application documents against all alerts at once.
+
+        Returns:
+            alert_id -> {"alert": registration fields, "slots": matched document indexes}
+        """
+        if not documents:
+            return {}
+
+        await self.ensure_index()
+
+        matches: Dict[str, Dict[str, Any]] = {}
+        search_after = None
+        while True:
+            body: Dict[str, Any] = {
+                "query": {"percolate": {"field": "query", "documents": documents}},
+                "_source": ["alert_id", "user_id", "alert_name", "frequency"],
+                "size": 500,
+                "sort": [{"alert_id": "asc"}]
+            }
+            if search_after:
+                body["search_after"] = search_after
+
+            response = await es_client.client.search(index=self.index, body=body)
+            hits = response["hits"]["hits"]
+
+            for hit in hits:
+                slots = hit.get("fields", {}).get("_percolator_document_slot", [0])
+                matches[hit["_source"]["alert_id"]] = {"alert": hit["_source"], "slots": slots}
+
+            if len(hits) < body["size"]:
+                break
+            search_after = hits[-1]["sort"]
+
+        self.stats["documents_percolated"] += len(documents)
+        self.stats["matches"] += sum(len(m["slots"]) for m in matches.values())
+        return matches
+
+    async def process_documents(self, documents: List[Dict[str, Any]]) -> int:
+        """Percolate documents and notify the owners of matching alerts"""
+        matches = await self.percolate(documents)
+
+        async def notify(match: Dict[str, Any]) -> bool:
+            alert = match["alert"]
+            matched = [documents[slot] for slot in match["slots"]]
+            return await notification_service.send_alert_notification(
+                user_id=alert["user_id"],
+                alert_name=alert["alert_name"],
+                alert_id=alert["alert_id"],
+                new_applications_count=len(matched),
+                sample_applications=[summarize_application(doc) for doc in matched[:5]]
+            )
+
+        results = await asyncio.gather(*(notify(m) for m in matches.values()), return_exceptions=True)
+        sent = sum(1 for r in results if r is True)
+        self.stats["notifications_sent"] += sent
+        return sent
+
+    async def process_new_applications(self, lease: Optional[WorkerLease] = None) -> int:
+        """
+        Percolate every application changed since the watermark.
+
+        With a lease, it is renewed before each batch and the cycle stops
+        if another worker has taken it over.
+        """
+        await self.ensure_index()
+        watermark = await self._load_watermark()
+        if watermark is None:
+            # First run: start from now rather than alerting on history
+            await self._save_watermark(await self._latest_position())
+            return 0
+
+        processed = 0
+        while True:
+            if lease is not None and not await lease.extend():
+                logger.warning("Alert matching lease lost, stopping cycle")
+                break
+
+            response = await es_client.client.search(
+                index=es_client.index_name,
+                body={
+                    "query": {"range": {"last_changed": {"gte": watermark[0]}}},
+                    "sort": [{"last_changed": "asc"}, {"uid.keyword": "asc"}],
+                    "search_after": watermark,
+                    "size": self.batch_size,
+                    "_source": {"excludes": PERCOLATE_SOURCE_EXCLUDES}
+                }
+            )
+            hits = response["hits"]["hits"]
+            if not hits:
+                break
+
+            await self.process_documents([hit["_source"] for hit in hits])
+            processed += len(hits)
+
+            watermark = hits[-1]["sort"]
+            await self._save_watermark(watermark)
+
+            if len(hits) < self.batch_size:
+                break
+
+        if processed:
+            logger.info(f"Percolated {processed} new/updated applications against alerts")
+        return processed
+
+    async def _latest_position(self) -> List[Any]:
+        response = await es_client.client.search(
+            index=es_client.index_name,
+            body={
+                "query": {"exists": {"field": "last_changed"}},
+                "sort": [{"last_changed": "desc"}, {"uid.keyword": "desc"}],
+                "size": 1,
+                "_source": False
+            }
+        )
+        hits = response["hits"]["hits"]
+        return hits[0]["sort"] if hits else [0, ""]
+
+    async def _load_watermark(self) -> Optional[List[Any]]:
+        try:
+            document = await es_client.client.get(index=self.index, id=WATERMARK_DOC_ID)
+            return document["_source"]["watermark"]["position"]
+        except Exception:
+            return None
+
+    async def _save_watermark(self, position: List[Any]):
+        await es_client.client.index(
+            index=self.index,
+            id=WATERMARK_DOC_ID,
+            document={"watermark": {"position": position, "updated_at": datetime.utcnow().isoformat()}}
+        )
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """Sync alerts and start the periodic matching loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        try:
+            async with WorkerLease("alert_matcher:sync", settings.alert_match_lease_seconds) as lease:
+                if lease.held:
+                    await self.sync_alerts()
+        except Exception as e:
+            logger.error(f"Alert sync failed: {str(e)}")
+
+        while True:
+            try:
+                async with WorkerLease("alert_matcher", settings.alert_match_lease_seconds) as lease:
+                    if lease.held:
+                        await self.process_new_applications(lease)
+            except Exception as e:
+                logger.error(f"Alert matching cycle failed: {str(e)}")
+            await asyncio.sleep(settings.alert_match_interval)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "index": self.index, "running": self._task is not None}
+
+
+def summarize_application(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact application summary for notifications"""
+    return {
+        "application_id": document.get("uid") or document.get("name") or document.get("reference"),
+        "address": document.get("address"),
+        "description": (document.get("description") or "")[:200],
+        "authority": document.get("area_name"),
+        "url": document.get("url")
+    }
+
+
+# Global matcher instance (started in main.py)
+alert_matcher = AlertMatcher()
+
+
+async def init_alert_matcher():
+    """
+    Start background alert matching.
+
+    Should be called during application startup.
+    """
+    if settings.alert_matching_enabled:
+        await alert_matcher.start()
+
+
+async def shutdown_alert_matcher():
+    """
+    Stop background alert matching.
+
+    Should be called during application shutdown.
+    """
+    await alert_matcher.stop()
@@ -7,21 +7,32 @@ document analysis, embedding generation, and market intelligence updates.
 
 import asyncio
 import logging
+import os
+import socket
 import time
 from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
+from app.core.config import settings
 from app.services.ai_processor import ai_processor, ProcessingMode, ProcessingResult, BatchProcessingResult
+from app.services.cpu_tasks import CPU_TASKS, init_worker, run_chunk
 from app.services.search import search_service
+from app.services.task_store import TaskStore, get_task_store
 from app.models.planning import PlanningApplication
 
 logger = logging.getLogger(__name__)
 
+QUEUE_POLL_SECONDS = 1.0      # idle workers re-check the shared queue this often
+HEARTBEAT_SECONDS = 2.0       # running tasks renew their claim and publish progress
+STORE_SWEEP_SECONDS = 60.0    # expired-record purge and stats refresh
+
 
 class TaskStatus(str, Enum):
     """Background task statuses"""
@@ -40,6 +51,12 @@ class TaskPriority(str, Enum):
     URGENT = "urgent"
 
 
+class ExecutionMode(str, Enum):
+    """Where a task's work runs"""
+    ASYNC = "async"      # on the event loop (I/O-bound AI calls)
+    PROCESS = "process"  # in the process pool (pure-CPU features only)
+
+
 @dataclass
 class BackgroundTask:
     """Background processing task"""
@@ -61,22 +78,44 @@ class BackgroundTask:
     callback_url: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
+    execution_mode: ExecutionMode = ExecutionMode.ASYNC
+    cpu_time_seconds: float = 0.0
+
+
+_ENUM_FIELDS = {
+    "status": TaskStatus,
+    "priority": TaskPriority,
+    "processing_mode": ProcessingMode,
+    "execution_mode": ExecutionMode
+}
+_DATETIME_FIELDS = ("created_at", "started_at", "completed_at")
+_FINISHED_STATUSES = (TaskStatus.COMPLETED.value, TaskStatus.FAILED.value, TaskStatus.CANCELLED.value)
 
 
 class BackgroundProcessor:
     """
     Background AI processing service for handling long-running AI tasks
+
+    Task records, the queue and results live in the durable task store
+    (see task_store.py), so every uvicorn worker shares one queue and can
+    answer status/result lookups for tasks another worker ran.
     """
 
     def __init__(self, max_workers: int = 5, max_concurrent_tasks: int = 10):
         self.max_workers = max_workers
         self.max_concurrent_tasks = max_concurrent_tasks
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
 
-        # Task management
+        # Process pool for pure-CPU task types, created on first use
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+        # Task management: the store holds every task; self.tasks only the
+        # ones this process is running
+        self._store: Optional[TaskStore] = None
         self.tasks: Dict[str, BackgroundTask] = {}
-        self.task_queue = asyncio.PriorityQueue()
-        self.active_tasks: Dict[str, asyncio.Task] = {}
+        self._running: Dict[str, asyncio.Task] = {}  # task_id -> processing coroutine, for cancellation
+        self._task_available = asyncio.Event()
+        self._store_counts: Dict[str, int] = {}
+        self._consumer_prefix = f"{socket.gethostname()}-{os.getpid()}"
 
         # Statistics
         self.stats = {
@@ -84,12 +123,22 @@ class BackgroundProcessor:
             "tasks_completed": 0,
             "tasks_failed": 0,
             "total_processing_time": 0,
-            "average_processing_time": 0
+            "average_processing_time": 0,
+            "cpu_time_seconds": 0.0,
+            "cpu_time_by_feature": {}
         }
 
         # Start background workers
         self._workers_running = False
         self._worker_tasks: List[asyncio.Task] = []
+        self._sweeper_task: Optional[asyncio.Task] = None
+
+    @property
+    def store(self) -> TaskStore:
+        """Shared task store, opened on first use"""
+        if self._store is None:
+            self._store = get_task_store("background")
+        return self._store
 
     async def start_workers(self):
         """Start background worker tasks"""
@@ -102,6 +151,7 @@ class BackgroundProcessor:
         for i in range(self.max_workers):
             worker_task = asyncio.create_task(self._worker(f"worker-{i}"))
             self._worker_tasks.append(worker_task)
+        self._sweeper_task = asyncio.create_task(self._sweep_store())
 
         logger.info(f"Started {self.max_workers} background AI processing workers")
 
@@ -112,13 +162,23 @@ class BackgroundProcessor:
 
         self._workers_running = False
 
-        # Cancel worker tasks
+        # Cancel worker tasks; tasks they were running stay claimed in the
+        # store and are redelivered after the visibility timeout
         for worker_task in self._worker_tasks:
             worker_task.cancel()
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
 
         # Wait for workers to stop
         await asyncio.gather(*self._worker_tasks, return_exceptions=True)
         self._worker_tasks.clear()
+        if self._sweeper_task is not None:
+            await asyncio.gather(self._sweeper_task, return_exceptions=True)
+            self._sweeper_task = None
+
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
 
         logger.info("Stopped background AI processing workers")
 
@@ -135,6 +195,9 @@ class BackgroundProcessor:
         """
         Submit applications for background AI processing
 
+        Tasks whose features are all pure-CPU (see cpu_tasks.CPU_TASKS) run
+        in the process pool so they don't hold the event loop.
+
         Returns:
             Task ID for tracking the processing job
         """
@@ -150,16 +213,15 @@ class BackgroundProcessor:
             features=features or [],
             context=context or {},
             user_id=user_id,
-            callback_url=callback_url
+            callback_url=callback_url,
+            execution_mode=self._select_execution_mode(features)
         )
 
-        self.tasks[task_id] = task
+        await self.store.save(task_id, self._task_to_record(task))
+        await self.store.enqueue(task_id, self._get_priority_value(priority))
+        self._task_available.set()
         self.stats["tasks_created"] += 1
 
-        # Add to priority queue
-        priority_value = self._get_priority_value(priority)
-        await self.task_queue.put((priority_value, time.time(), task_id))
-
         logger.info(f"Submitted background task {task_id} for {len(application_ids)} applications")
         return task_id
 
@@ -170,11 +232,11 @@ class BackgroundProcessor:
         user_id: Optional[str] = None,
         callback_url: Optional[str] = None
     ) -> str:
-        """Submit batch opportunity scoring task"""
+        """Submit batch opportunity scoring task (runs in the process pool)"""
         return await self.submit_application_processing(
             application_ids=application_ids,
             processing_mode=ProcessingMode.BATCH,
-            features=["opportunity_scoring", "embeddings"],
+            features=["opportunity_scoring"],
             priority=priority,
             user_id=user_id,
             callback_url=callback_url,
@@ -200,123 +262,102 @@ class BackgroundProcessor:
         )
 
     async def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
-        """Get status of a background task"""
-        task = self.tasks.get(task_id)
-        if not task:
+        """Get status of a background task (from any worker)"""
+        record = await self.store.load(task_id)
+        if not record:
             return None
 
-        return {
-            "task_id": task.task_id,
-            "task_type": task.task_type,
-            "status": task.status.value,
-            "priority": task.priority.value,
-            "progress": task.progress,
-            "application_count": len(task.application_ids),
-            "processing_mode": task.processing_mode.value,
-            "features": task.features,
-            "created_at": task.created_at.isoformat(),
-            "started_at": task.started_at.isoformat() if task.started_at else None,
-            "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-            "error_message": task.error_message,
-            "retry_count": task.retry_count,
-            "result_summary": self._get_result_summary(task) if task.result else None
-        }
+        return self._status_from_record(record)
 
     async def get_task_result(self, task_id: str) -> Optional[Any]:
-        """Get result of a completed background task"""
-        task = self.tasks.get(task_id)
-        if not task or task.status != TaskStatus.COMPLETED:
+        """Get result of a completed background task, as stored (plain JSON data)"""
+        record = await self.store.load(task_id)
+        if not record or record["status"] != TaskStatus.COMPLETED.value:
             return None
 
-        return task.result
+        return await self.store.load_result(task_id)
 
     async def cancel_task(self, task_id: str) -> bool:
         """Cancel a pending or running background task"""
-        task = self.tasks.get(task_id)
-        if not task:
-            return False
-
-        if task.status in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]:
-            task.status = TaskStatus.CANCELLED
-
-            # Cancel active task if running
-            if task_id in self.active_tasks:
-                self.active_tasks[task_id].cancel()
-
-            logger.info(f"Cancelled background task {task_id}")
-            return True
+        record = await self.store.load(task_id)
+
+        while record and record["status"] in [TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value]:
+            # A queued entry is dropped when claimed; a worker in another
+            # process running the task sees the status on its next heartbeat.
+            # The update is conditional so a task that just finished stays finished.
+            cancelled = await self.store.finish(task_id, {
+                "status": TaskStatus.CANCELLED.value,
+                "completed_at": datetime.utcnow().isoformat()
+            }, expected_status=record["status"])
+            if cancelled:
+                self._cancel_running(task_id)
+                logger.info(f"Cancelled background task {task_id}")
+                return True
+            record = await self.store.load(task_id)
 
         return False
 
     async def get_user_tasks(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get background tasks for a specific user"""
-        user_tasks = [
-            task for task in self.tasks.values()
-            if task.user_id == user_id
-        ]
-
-        # Sort by creation time (newest first)
-        user_tasks.sort(key=lambda t: t.created_at, reverse=True)
-
-        return [
-            await self.get_task_status(task.task_id)
-            for task in user_tasks[:limit]
-        ]
+        """Get background tasks for a specific user (newest first)"""
+        records = await self.store.list_for_user(user_id, limit)
+        return [self._status_from_record(record) for record in records]
 
     async def cleanup_old_tasks(self, max_age_hours: int = 24):
-        """Clean up old completed/failed tasks"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-
-        tasks_to_remove = []
-        for task_id, task in self.tasks.items():
-            if (task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED] and
-                task.created_at < cutoff_time):
-                tasks_to_remove.append(task_id)
+        """Clean up expired tasks and finished tasks older than max_age_hours"""
+        removed = await self.store.purge(finished_before=time.time() - max_age_hours * 3600)
 
-        for task_id in tasks_to_remove:
-            del self.tasks[task_id]
-
-        if tasks_to_remove:
-            logger.info(f"Cleaned up {len(tasks_to_remove)} old background tasks")
+        if removed:
+            logger.info(f"Cleaned up {removed} old background tasks")
 
     def get_service_stats(self) -> Dict[str, Any]:
         """Get background processing service statistics"""
-        active_count = len([t for t in self.tasks.values() if t.status == TaskStatus.IN_PROGRESS])
-        pending_count = len([t for t in self.tasks.values() if t.status == TaskStatus.PENDING])
+        counts = self._store_counts
 
         return {
             "service_status": "running" if self._workers_running else "stopped",
             "workers_count": len(self._worker_tasks),
             "max_workers": self.max_workers,
-            "active_tasks": active_count,
-            "pending_tasks": pending_count,
-            "total_tasks": len(self.tasks),
-            "queue_size": self.task_queue.qsize(),
+            "active_tasks": len(self.tasks),
+            "pending_tasks": counts.get(TaskStatus.PENDING.value, 0),
+            "total_tasks": sum(count for status, count in counts.items() if status != "queued"),
+            "queue_size": counts.get("queued", 0),
+            "process_workers": settings.background_process_workers,
+            "task_store": type(self.store).__name__,
             "statistics": self.stats
         }
 
     # Private methods
 
     async def _worker(self, worker_name: str):
-        """Background worker task"""
+        """Background worker task: claims tasks from the shared queue"""
+        consumer = f"{self._consumer_prefix}-{worker_name}"
         logger.info(f"Background worker {worker_name} started")
 
         while self._workers_running:
             try:
-                # Get next task from queue (with timeout)
-                try:
-                    priority, timestamp, task_id = await asyncio.wait_for(
-                        self.task_queue.get(), timeout=1.0
-                    )
-                except asyncio.TimeoutError:
+                self._task_available.clear()
+                task_id = await self.store.claim(consumer)
+                if task_id is None:
+                    try:
+                        await asyncio.wait_for(self._task_available.wait(), timeout=QUEUE_POLL_SECONDS)
+                    except asyncio.TimeoutError:
+                        pass
                     continue
 
-                task = self.tasks.get(task_id)
-                if not task or task.status != TaskStatus.PENDING:
+                record = await self.store.load(task_id)
+                if not record or record["status"] in _FINISHED_STATUSES:
+                    # Cancelled while queued, or expired
+                    await self.store.ack(task_id)
+                    continue
+
+                task = self._record_to_task(record)
+                if task.status == TaskStatus.IN_PROGRESS:
+                    # Redelivered: the worker that claimed it stopped renewing the claim
+                    await self._handle_task_error(task, "Worker stopped while processing the task")
                     continue
 
                 # Process the task
-                await self._process_task(task, worker_name)
+                await self._process_task(task, worker_name, consumer)
 
             except asyncio.CancelledError:
                 break
@@ -326,12 +367,42 @@ class BackgroundProcessor:
 
         logger.info(f"Background worker {worker_name} stopped")
 
-    async def _process_task(self, task: BackgroundTask, worker_name: str):
-        """Process a background task"""
+    async def _process_task(self, task: BackgroundTask, worker_name: str, consumer: str):
+        """Process a background task, renewing its claim while it runs"""
+        self.tasks[task.task_id] = task
+        work = asyncio.create_task(self._run_task(task, worker_name))
+        self._running[task.task_id] = work
+        heartbeat = asyncio.create_task(self._heartbeat(task, consumer))
+        try:
+            await work
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling() or task.status != TaskStatus.CANCELLED:
+                raise  # Worker shutdown: the claim lapses and the task is redelivered
+            await self.store.ack(task.task_id)
+            logger.info(f"Task {task.task_id} cancelled while running")
+        finally:
+            heartbeat.cancel()
+            self._running.pop(task.task_id, None)
+            self.tasks.pop(task.task_id, None)
+
+    def _cancel_running(self, task_id: str):
+        """Stop this process's coroutine for a task cancelled in the store"""
+        task = self.tasks.get(task_id)
+        work = self._running.get(task_id)
+        if task is not None and work is not None:
+            task.status = TaskStatus.CANCELLED
+            work.cancel()
+
+    async def _run_task(self, task: BackgroundTask, worker_name: str):
         try:
             task.status = TaskStatus.IN_PROGRESS
             task.started_at = datetime.utcnow()
             task.progress = 0.1
+            await self.store.update(task.task_id, {
+                "status": task.status.value,
+                "started_at": task.started_at.isoformat(),
+                "progress": task.progress
+            })
 
             logger.info(f"Worker {worker_name} processing task {task.task_id}")
 
@@ -348,7 +419,9 @@ class BackgroundProcessor:
             task.progress = 0.2
 
             # Process with AI
-            if len(applications) == 1:
+            if task.execution_mode == ExecutionMode.PROCESS:
+                task.result = await self._run_in_process_pool(task, applications)
+            elif len(applications) == 1:
                 # Single application processing
                 result = await ai_processor.process_application(
                     applications[0],
@@ -370,17 +443,28 @@ class BackgroundProcessor:
 
             task.progress = 0.9
 
+            # Complete task, unless it was cancelled in the meantime
+            task.status = TaskStatus.COMPLETED
+            task.completed_at = datetime.utcnow()
+            task.progress = 1.0
+            completed = await self.store.finish(
+                task.task_id,
+                self._task_to_record(task),
+                result=task.result,
+                expected_status=TaskStatus.IN_PROGRESS.value
+            )
+            await self.store.ack(task.task_id)
+            if not completed:
+                task.status = TaskStatus.CANCELLED
+                logger.info(f"Task {task.task_id} was cancelled before it completed")
+                return
+
             # Update statistics
             processing_time = (datetime.utcnow() - task.started_at).total_seconds()
             self.stats["total_processing_time"] += processing_time
             self.stats["tasks_completed"] += 1
             self._update_average_processing_time()
 
-            # Complete task
-            task.status = TaskStatus.COMPLETED
-            task.completed_at = datetime.utcnow()
-            task.progress = 1.0
-
             logger.info(f"Task {task.task_id} completed successfully in {processing_time:.2f}s")
 
             # Send callback if provided
@@ -390,25 +474,159 @@ class BackgroundProcessor:
         except Exception as e:
             await self._handle_task_error(task, str(e))
 
+    async def _heartbeat(self, task: BackgroundTask, consumer: str):
+        """Renew the task's claim, publish progress and pick up cancellation from other workers"""
+        interval = min(HEARTBEAT_SECONDS, self.store.visibility_timeout / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.store.touch(task.task_id, consumer)
+                record = await self.store.load(task.task_id)
+                if record and record["status"] == TaskStatus.CANCELLED.value:
+                    self._cancel_running(task.task_id)
+                    return
+                await self.store.update(task.task_id, {
+                    "progress": task.progress,
+                    "cpu_time_seconds": task.cpu_time_seconds
+                })
+            except Exception as e:
+                logger.warning(f"Heartbeat for task {task.task_id} failed: {e}")
+
+    async def _sweep_store(self):
+        """Purge expired task records and refresh the counts reported in stats"""
+        while True:
+            try:
+                removed = await self.store.purge()
+                if removed:
+                    logger.info(f"Purged {removed} expired background tasks")
+                self._store_counts = await self.store.counts()
+            except Exception as e:
+                logger.warning(f"Task store sweep failed: {e}")
+            await asyncio.sleep(STORE_SWEEP_SECONDS)
+
+    def _select_execution_mode(self, features: Optional[List[str]]) -> ExecutionMode:
+        """Run in the process pool when every requested feature is pure-CPU"""
+        if settings.background_process_workers > 0 and features and all(f in CPU_TASKS for f in features):
+            return ExecutionMode.PROCESS
+        return ExecutionMode.ASYNC
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Process pool, created on first use (spawned, so no loop state is forked)"""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=settings.background_process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+                initargs=(settings.background_process_nice,)
+            )
+            logger.info(f"Started process pool with {settings.background_process_workers} workers")
+        return self._process_pool
+
+    async def _run_in_process_pool(
+        self,
+        task: BackgroundTask,
+        applications: List[PlanningApplication]
+    ) -> BatchProcessingResult:
+        """Dispatch applications to the process pool in chunks and collect the results"""
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        pool = self._get_process_pool()
+        chunk_size = max(1, settings.background_cpu_chunk_size)
+
+        chunks = [applications[i:i + chunk_size] for i in range(0, len(applications), chunk_size)]
+        window = 2 * max(1, settings.background_process_workers)
+        chunk_results: Dict[int, List[ProcessingResult]] = {}
+        pending: Dict[asyncio.Future, int] = {}
+        next_chunk = 0
+
+        try:
+            while next_chunk < len(chunks) or pending:
+                # Bounded number of chunks in flight: payloads are serialised just
+                # before dispatch, so that work is spread over the run
+                while next_chunk < len(chunks) and len(pending) < window:
+                    payloads = [app.model_dump(exclude_none=True) for app in chunks[next_chunk]]
+                    future = loop.run_in_executor(pool, run_chunk, task.features, payloads, task.context)
+                    pending[future] = next_chunk
+                    next_chunk += 1
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    chunk = future.result()
+                    self._record_cpu_time(task, chunk["cpu_time"])
+                    chunk_results[pending.pop(future)] = [
+                        self._outcome_to_result(task, outcome) for outcome in chunk["outcomes"]
+                    ]
+
+                task.progress = 0.2 + 0.7 * len(chunk_results) / len(chunks)
+                if task.status == TaskStatus.CANCELLED:
+                    break
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool for the retry
+            self._process_pool = None
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+
+        results = [result for index in sorted(chunk_results) for result in chunk_results[index]]
+        successful_count = sum(1 for r in results if r.success)
+        return BatchProcessingResult(
+            request_id=task.task_id,
+            total_applications=len(applications),
+            successful_count=successful_count,
+            failed_count=len(results) - successful_count,
+            processing_time_ms=int((time.time() - start_time) * 1000),
+            results=results,
+            summary_stats=ai_processor._generate_batch_summary_stats(results),
+            generated_at=datetime.utcnow()
+        )
+
+    def _outcome_to_result(self, task: BackgroundTask, outcome: Dict[str, Any]) -> ProcessingResult:
+        """Per-application outcome from a worker as a ProcessingResult"""
+        return ProcessingResult(
+            request_id=f"{task.task_id}_{outcome['application_id']}",
+            application_id=outcome["application_id"],
+            processing_mode=task.processing_mode,
+            features_processed=list(outcome["results"].keys()),
+            results=outcome["results"],
+            processing_time_ms=outcome["processing_time_ms"],
+            success=not outcome["errors"],
+            errors=outcome["errors"],
+            warnings=[],
+            confidence_scores=outcome["confidence_scores"],
+            generated_at=datetime.utcnow()
+        )
+
+    def _record_cpu_time(self, task: BackgroundTask, cpu_time: float):
+        """Attribute worker CPU time to the task and its features"""
+        task.cpu_time_seconds += cpu_time
+        self.stats["cpu_time_seconds"] += cpu_time
+        by_feature = self.stats["cpu_time_by_feature"]
+        key = "+".join(task.features)
+        by_feature[key] = by_feature.get(key, 0.0) + cpu_time
+
     async def _handle_task_error(self, task: BackgroundTask, error_message: str):
         """Handle task processing error"""
         task.error_message = error_message
         task.retry_count += 1
+        await self.store.ack(task.task_id)
 
         if task.retry_count <= task.max_retries:
             # Retry the task
             task.status = TaskStatus.PENDING
             task.progress = 0.0
+            await self.store.update(task.task_id, self._task_to_record(task))
 
             # Add back to queue with lower priority
             priority_value = self._get_priority_value(task.priority) + task.retry_count
-            await self.task_queue.put((priority_value, time.time(), task.task_id))
+            await self.store.enqueue(task.task_id, priority_value)
 
             logger.warning(f"Task {task.task_id} failed, retrying ({task.retry_count}/{task.max_retries}): {error_message}")
         else:
             # Mark as failed
             task.status = TaskStatus.FAILED
             task.completed_at = datetime.utcnow()
+            await self.store.finish(task.task_id, self._task_to_record(task))
             self.stats["tasks_failed"] += 1
 
             logger.error(f"Task {task.task_id} failed permanently: {error_message}")
@@ -431,6 +649,44 @@ class BackgroundProcessor:
         }
         return priority_map.get(priority, 3)
 
+    def _task_to_record(self, task: BackgroundTask) -> Dict[str, Any]:
+        """Task as a store record; the result itself is stored separately"""
+        record = {f.name: getattr(task, f.name) for f in fields(BackgroundTask) if f.name != "result"}
+        record["result_summary"] = self._get_result_summary(task)
+        return record
+
+    def _record_to_task(self, record: Dict[str, Any]) -> BackgroundTask:
+        """Rebuild a task from its store record (without the result)"""
+        values = {f.name: record[f.name] for f in fields(BackgroundTask) if f.name in record}
+        for name, enum in _ENUM_FIELDS.items():
+            values[name] = enum(values[name])
+        for name in _DATETIME_FIELDS:
+            if values.get(name):
+                values[name] = datetime.fromisoformat(values[name])
+        return BackgroundTask(**values)
+
+    def _status_from_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Status response for a store record"""
+        return {
+            "task_id": record["task_id"],
+            "task_type": record["task_type"],
+            "status": record["status"],
+            "priority": record["priority"],
+            "progress": record["progress"],
+            "application_count": len(record["application_ids"]),
+            "processing_mode": record["processing_mode"],
+            "features": record["features"],
+            "created_at": record["created_at"],
+            "started_at": record.get("started_at"),
+            "completed_at": record.get("completed_at"),
+            "error_message": record.get("error_message"),
+            "retry_count": record["retry_count"],
+            "execution_mode": record["execution_mode"],
+            "cpu_time_seconds": round(record.get("cpu_time_seconds", 0.0), 3),
+            "user_id": record.get("user_id"),
+            "result_summary": record.get("result_summary")
+        }
+
     def _get_result_summary(self, task: BackgroundTask) -> Optional[Dict[str, Any]]:
         """Get summary of task results"""
         if not task.result:
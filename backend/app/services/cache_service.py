@@ -7,6 +7,7 @@ to avoid redundant scraping of planning portals.
 
 import json
 import logging
+import uuid
 from typing import Optional, Dict
 from datetime import timedelta
 
@@ -265,6 +266,89 @@ class CacheService:
             }
 
 
+# Lease scripts only touch the key while it still holds this worker's token
+EXTEND_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class WorkerLease:
+    """
+    Named lease shared by all uvicorn workers (Redis SET NX PX).
+
+    Background loops that must run once per deployment rather than once per
+    worker take the lease before each cycle and skip the cycle when another
+    worker holds it. The lease expires on its own if the holder dies.
+
+    Without Redis there is nothing to coordinate through, so the lease is
+    always granted (single-worker and local deployments).
+
+    Usage:
+        async with WorkerLease("alert_matcher", 600) as lease:
+            if lease.held:
+                ...
+    """
+
+    def __init__(self, name: str, ttl_seconds: float):
+        self.key = f"planning_explorer:lease:{name}"
+        self.ttl_ms = int(ttl_seconds * 1000)
+        self.token = uuid.uuid4().hex
+        self.held = False
+        self._client = None
+
+    async def acquire(self) -> bool:
+        cache = get_cache_service()
+        if not cache or not cache.available:
+            self.held = True
+            return True
+
+        self._client = cache.redis_client
+        try:
+            self.held = bool(await self._client.set(self.key, self.token, nx=True, px=self.ttl_ms))
+        except Exception as e:
+            logger.warning(f"Failed to acquire lease {self.key}: {str(e)}")
+            self.held = False
+        return self.held
+
+    async def extend(self) -> bool:
+        """Renew the TTL; False if the lease expired and was taken over"""
+        if self.held and self._client is not None:
+            try:
+                self.held = bool(await self._client.eval(
+                    EXTEND_LEASE_SCRIPT, 1, self.key, self.token, self.ttl_ms
+                ))
+            except Exception as e:
+                logger.warning(f"Failed to extend lease {self.key}: {str(e)}")
+                self.held = False
+        return self.held
+
+    async def release(self):
+        if self.held and self._client is not None:
+            try:
+                await self._client.eval(RELEASE_LEASE_SCRIPT, 1, self.key, self.token)
+            except Exception as e:
+                logger.warning(f"Failed to release lease {self.key}: {str(e)}")
+        self.held = False
+        self._client = None
+
+    async def __aenter__(self) -> "WorkerLease":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.release()
+
+
 # Global cache instance (initialized in main.py)
 cache_service: Optional[CacheService] = None
 
@@ -3,11 +3,14 @@ Cache warming service for Content Discovery statistics
 Preloads popular authority stats on application startup
 """
 import asyncio
+import logging
+
+from app.core.config import settings
 from app.services.elasticsearch_stats import get_authority_stats_cached
-from app.data.uk_authorities import LONDON_BOROUGHS, GREATER_MANCHESTER
+
+logger = logging.getLogger(__name__)
 
 # Top 20 UK authorities by planning application volume
-# Using data from uk_authorities.py for consistency
 POPULAR_AUTHORITIES = [
     # Top London Boroughs
     "Westminster",
@@ -38,29 +41,35 @@ async def warm_cache_on_startup():
     """
     Pre-populate cache with popular authority stats
 
-    This runs on application startup to ensure the most frequently
-    accessed pages are immediately available from cache.
+    Runs as a background task after startup (see StartupManager.start_warmup)
+    so the most frequently accessed pages are served from cache without
+    delaying the first request. Up to CACHE_WARM_CONCURRENCY authorities are
+    queried at once.
 
     Expected cache hit rate after warming: 95%+ for top authorities
     """
-    print("🔥 Warming cache for popular authorities...")
+    logger.info("Warming cache for popular authorities...")
+    semaphore = asyncio.Semaphore(settings.cache_warm_concurrency)
 
-    success_count = 0
-    fail_count = 0
+    async def warm(authority: str) -> bool:
+        async with semaphore:
+            try:
+                await get_authority_stats_cached(authority)
+                logger.debug(f"Cached: {authority}")
+                return True
+            except Exception as e:
+                logger.warning(f"Failed to cache {authority}: {str(e)}")
+                return False
 
-    for authority in POPULAR_AUTHORITIES:
-        try:
-            await get_authority_stats_cached(authority)
-            success_count += 1
-            print(f"✅ Cached: {authority}")
-        except Exception as e:
-            fail_count += 1
-            print(f"❌ Failed to cache {authority}: {str(e)}")
+    results = await asyncio.gather(*(warm(authority) for authority in POPULAR_AUTHORITIES))
+    success_count = sum(results)
 
-    print(f"\n✅ Cache warming complete: {success_count}/{len(POPULAR_AUTHORITIES)} authorities cached")
+    logger.info(f"Cache warming complete: {success_count}/{len(POPULAR_AUTHORITIES)} authorities cached")
 
-    if fail_count > 0:
-        print(f"⚠️  {fail_count} authorities failed to cache")
+    if success_count < len(POPULAR_AUTHORITIES):
+        logger.warning(f"{len(POPULAR_AUTHORITIES) - success_count} authorities failed to cache")
+    if success_count == 0:
+        raise RuntimeError("No authority stats could be cached")
 
 
 async def invalidate_stats_cache():
@@ -74,7 +83,7 @@ async def invalidate_stats_cache():
     cache_size_before = len(stats_cache)
     stats_cache.clear()
 
-    print(f"✅ Cache invalidated: {cache_size_before} entries cleared")
+    logger.info(f"Cache invalidated: {cache_size_before} entries cleared")
 
 
 async def get_cache_stats():
@@ -0,0 +1,118 @@
+"""
+CPU-bound AI task functions for the background process pool
+
+Everything here runs inside worker processes: functions are module level
+(so they pickle), take plain-dict application payloads, and build the AI
+components they need once per process. Nothing here performs I/O.
+"""
+
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.models.planning import PlanningApplication
+
+logger = logging.getLogger(__name__)
+
+# Per-process component instances
+_opportunity_scorer = None
+
+
+def init_worker(niceness: int) -> None:
+    """Process pool initializer: run below the API's CPU priority"""
+    if niceness and hasattr(os, "nice"):
+        try:
+            os.nice(niceness)
+        except OSError as e:
+            logger.warning(f"Could not lower CPU worker priority: {e}")
+
+
+def _get_opportunity_scorer():
+    global _opportunity_scorer
+    if _opportunity_scorer is None:
+        from app.ai.opportunity_scorer import OpportunityScorer
+        _opportunity_scorer = OpportunityScorer()
+    return _opportunity_scorer
+
+
+def score_opportunity(application: PlanningApplication, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Opportunity score, shaped like AIProcessor's opportunity_scoring result"""
+    result = _get_opportunity_scorer().score_application_sync(application, context)
+    return {
+        "result": {
+            "opportunity_score": result.opportunity_score,
+            "approval_probability": result.approval_probability,
+            "confidence_score": result.confidence_score,
+            "breakdown": result.breakdown,
+            "rationale": result.rationale,
+            "risk_factors": result.risk_factors,
+            "recommendations": result.recommendations
+        },
+        "confidence": result.confidence_score
+    }
+
+
+def analyze_text(application: PlanningApplication, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Rule-based text analysis of the application (no LLM call)"""
+    from app.ai.summarizer import DocumentSummarizer
+
+    content = DocumentSummarizer._prepare_application_content(application)
+    return {
+        "result": {
+            "complexity_score": DocumentSummarizer._calculate_complexity_score(content),
+            "sentiment": DocumentSummarizer._analyze_sentiment(content),
+            "extracted_entities": DocumentSummarizer._extract_entities(content)
+        },
+        "confidence": 0.6
+    }
+
+
+# Feature name -> per-application handler. Tasks whose features are all
+# listed here can run in the process pool.
+CPU_TASKS: Dict[str, Callable[[PlanningApplication, Optional[Dict[str, Any]]], Dict[str, Any]]] = {
+    "opportunity_scoring": score_opportunity,
+    "text_analysis": analyze_text,
+}
+
+
+def run_chunk(
+    features: List[str],
+    payloads: List[Dict[str, Any]],
+    context: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Process one chunk of applications in a worker process.
+
+    Returns per-application outcomes plus the CPU time the chunk used.
+    """
+    cpu_started = time.process_time()
+    outcomes = []
+
+    for payload in payloads:
+        started = time.perf_counter()
+        outcome = {
+            "application_id": payload.get("application_id"),
+            "results": {},
+            "confidence_scores": {},
+            "errors": []
+        }
+        try:
+            application = PlanningApplication.model_validate(payload)
+        except Exception as e:
+            outcome["errors"].append(f"Invalid application payload: {e}")
+            application = None
+
+        if application is not None:
+            for feature in features:
+                try:
+                    handled = CPU_TASKS[feature](application, context)
+                    outcome["results"][feature] = handled["result"]
+                    outcome["confidence_scores"][feature] = handled["confidence"]
+                except Exception as e:
+                    outcome["errors"].append(f"{feature} failed: {e}")
+
+        outcome["processing_time_ms"] = int((time.perf_counter() - started) * 1000)
+        outcomes.append(outcome)
+
+    return {"outcomes": outcomes, "cpu_time": time.process_time() - cpu_started}
@@ -0,0 +1,173 @@
+"""
+Pooled SMTP Email Sender
+
+Keeps a small pool of authenticated SMTP connections open and reuses them
+across messages instead of connecting, negotiating TLS and logging in per
+email. Sends run in worker threads (smtplib is blocking) and are spaced by
+a token bucket so bursts stay under the relay's rate limits.
+"""
+
+import asyncio
+import logging
+import smtplib
+import ssl
+import time
+from email.message import Message
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token bucket: `rate` messages per second with bursts up to `burst`"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class SMTPConnectionPool:
+    """Rate-limited email delivery over reused SMTP connections"""
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: Optional[bool] = None,
+        pool_size: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        timeout: float = 30.0
+    ):
+        self.host = host if host is not None else settings.smtp_server
+        self.port = port or settings.smtp_port
+        self.username = username if username is not None else settings.smtp_username
+        self.password = password if password is not None else settings.smtp_password
+        self.use_tls = settings.smtp_use_tls if use_tls is None else use_tls
+        self.pool_size = pool_size or settings.smtp_pool_size
+        self.timeout = timeout
+
+        self.rate_limiter = RateLimiter(settings.smtp_rate_limit if rate_limit is None else rate_limit)
+        self._slots = asyncio.Queue()
+        for _ in range(self.pool_size):
+            self._slots.put_nowait(None)  # Connections are opened lazily
+
+        self.stats = {"sent": 0, "failed": 0, "connections_opened": 0}
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.host)
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            server.starttls(context=ssl.create_default_context())
+        if self.username and self.password:
+            server.login(self.username, self.password)
+        self.stats["connections_opened"] += 1
+        return server
+
+    def _send_blocking(self, server: Optional[smtplib.SMTP], message: Message) -> smtplib.SMTP:
+        """Send on `server` (opening one if needed); reconnects once if the relay dropped it"""
+        if server is not None:
+            try:
+                server.send_message(message)
+                return server
+            except smtplib.SMTPServerDisconnected:
+                server.close()
+
+        # A connection opened here is not yet known to the caller, so it is
+        # closed on failure rather than leaked
+        server = self._connect()
+        try:
+            server.send_message(message)
+        except Exception:
+            self._close_blocking(server)
+            raise
+        return server
+
+    @staticmethod
+    def _close_blocking(server: Optional[smtplib.SMTP]):
+        if server is None:
+            return
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    async def send(self, message: Message) -> bool:
+        """Send one message; returns False on failure (logged)"""
+        if not self.configured:
+            return False
+
+        await self.rate_limiter.acquire()
+        server = await self._slots.get()
+        try:
+            server = await asyncio.to_thread(self._send_blocking, server, message)
+            self.stats["sent"] += 1
+            return True
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.error(f"Failed to send email to {message.get('To')}: {str(e)}")
+            await asyncio.to_thread(self._close_blocking, server)
+            server = None
+            return False
+        finally:
+            self._slots.put_nowait(server)
+
+    async def close(self):
+        """Close all pooled connections"""
+        servers = []
+        while not self._slots.empty():
+            servers.append(self._slots.get_nowait())
+        await asyncio.gather(*(asyncio.to_thread(self._close_blocking, s) for s in servers if s is not None))
+        for _ in servers:
+            self._slots.put_nowait(None)
+
+
+# Global sender instance (created on first use)
+email_sender: Optional[SMTPConnectionPool] = None
+
+
+def get_email_sender() -> SMTPConnectionPool:
+    """
+    Get global pooled email sender.
+
+    Returns:
+        SMTPConnectionPool instance
+    """
+    global email_sender
+    if email_sender is None:
+        email_sender = SMTPConnectionPool()
+    return email_sender
+
+
+async def shutdown_email_sender():
+    """
+    Close pooled SMTP connections.
+
+    Should be called during application shutdown.
+    """
+    global email_sender
+    if email_sender:
+        await email_sender.close()
+        email_sender = None
@@ -0,0 +1,486 @@
+"""
+Background Enrichment Queue for Applicant/Agent Data
+
+Precomputes portal enrichment off the request path. A priority queue is fed
+by viewed reports, a periodic scan for new applications and (opt-in, via
+ENRICHMENT_SEARCH_HITS) the top hits of each search;
+workers scrape portals under per-domain politeness limits derived from
+PortalDetector and write results to the Redis CacheService and back into
+Elasticsearch. The report endpoint reads the precomputed data and only
+falls back to live scraping with a strict timeout.
+
+Every uvicorn worker runs a queue. Politeness limits are held in Redis so
+they apply per deployment rather than per worker, and the new-application
+scan runs in one worker per interval under a shared WorkerLease.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.db.elasticsearch import es_client
+from app.services.cache_service import WorkerLease, get_cache_service
+
+logger = logging.getLogger(__name__)
+
+# Lower value = served first
+PRIORITY_VIEWED = 0
+PRIORITY_NEW = 1
+PRIORITY_SEARCH_HIT = 2
+
+POLITENESS_PREFIX = "planning_explorer:politeness:"
+
+# A crashed worker's concurrency slot is reclaimed after this long
+SLOT_TTL_MS = 300_000
+
+# Take a per-domain concurrency slot. KEYS[1] = slot set; ARGV = token,
+# max concurrent, slot TTL (ms). Uses the Redis clock so all workers agree.
+ACQUIRE_SLOT_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + tonumber(t[2]) / 1000
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - tonumber(ARGV[3]))
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[1])
+    redis.call('PEXPIRE', KEYS[1], ARGV[3])
+    return 1
+end
+return 0
+"""
+
+# Reserve the next request start for a domain. KEYS[1] = next-start key;
+# ARGV[1] = min interval (ms). Returns how long to wait (ms) before starting.
+RESERVE_START_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + tonumber(t[2]) / 1000
+local start = tonumber(redis.call('GET', KEYS[1]))
+if not start or start < now then
+    start = now
+end
+local next_start = start + tonumber(ARGV[1])
+redis.call('SET', KEYS[1], tostring(next_start), 'PX', math.ceil(next_start - now) + 1)
+return math.ceil(start - now)
+"""
+
+ENRICHMENT_FIELDS = (
+    "applicant_name", "agent_name", "ward_name", "decided_date",
+    "n_documents", "n_statutory_days", "docs_url"
+)
+
+
+def _id_query(application_id: str) -> Dict:
+    """Same lookup get_application_by_id uses (uid, name or reference)"""
+    return {
+        "bool": {
+            "should": [
+                {"term": {"uid.keyword": application_id}},
+                {"term": {"name.keyword": application_id}},
+                {"term": {"reference.keyword": application_id}}
+            ],
+            "minimum_should_match": 1
+        }
+    }
+
+
+class PortalPoliteness:
+    """
+    Per-portal-domain concurrency and request spacing from PortalDetector.
+
+    With Redis available both limits are held there (atomic Lua scripts), so
+    they hold across all uvicorn workers; otherwise, or if Redis errors, they
+    are enforced in-process.
+    """
+
+    def __init__(self):
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_request: Dict[str, float] = {}
+
+    async def acquire(self, url: str) -> Tuple[Callable[[], Awaitable[None]], str]:
+        """
+        Wait for a concurrency slot and the domain's next request start.
+
+        Returns:
+            (release, domain) - await release() once the request is done
+        """
+        # Imported on first use: the enrichment agents pull in the scraping stack
+        from app.agents.enrichment.portal_detectors import PortalDetector
+
+        policy = PortalDetector.get_crawl_policy(url)
+        domain = policy["domain"]
+
+        cache = get_cache_service()
+        if cache and cache.available:
+            try:
+                return await self._acquire_shared(cache.redis_client, policy), domain
+            except Exception as e:
+                logger.warning(f"Shared politeness limits unavailable for {domain}, using local limits: {e}")
+        return await self._acquire_local(policy), domain
+
+    async def _acquire_shared(self, client, policy: Dict) -> Callable[[], Awaitable[None]]:
+        key = f"{POLITENESS_PREFIX}{policy['domain']}"
+        token = uuid.uuid4().hex
+        poll = max(policy["min_interval_ms"] / 1000, 0.1)
+
+        while not await client.eval(
+            ACQUIRE_SLOT_SCRIPT, 1, f"{key}:slots", token, policy["max_concurrent"], SLOT_TTL_MS
+        ):
+            await asyncio.sleep(poll)
+
+        async def release():
+            try:
+                await client.zrem(f"{key}:slots", token)
+            except Exception as e:
+                logger.warning(f"Failed to release politeness slot for {policy['domain']}: {e}")
+
+        try:
+            wait_ms = await client.eval(RESERVE_START_SCRIPT, 1, f"{key}:next", policy["min_interval_ms"])
+            if wait_ms > 0:
+                await asyncio.sleep(wait_ms / 1000)
+        except BaseException:
+            await release()
+            raise
+        return release
+
+    async def _acquire_local(self, policy: Dict) -> Callable[[], Awaitable[None]]:
+        domain = policy["domain"]
+        semaphore = self._semaphores.setdefault(domain, asyncio.Semaphore(policy["max_concurrent"]))
+        lock = self._locks.setdefault(domain, asyncio.Lock())
+
+        await semaphore.acquire()
+        async with lock:
+            wait = self._last_request.get(domain, 0) + policy["min_interval_ms"] / 1000 - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request[domain] = time.monotonic()
+
+        async def release():
+            semaphore.release()
+
+        return release
+
+
+class EnrichmentQueue:
+    """
+    Priority queue of applications awaiting enrichment.
+
+    Each application is queued at most once; re-submitting at a higher
+    priority (e.g. a search hit that is then viewed) promotes it.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_size: Optional[int] = None):
+        self.workers = workers or settings.enrichment_workers
+        self.max_size = max_size or settings.enrichment_queue_size
+        self.live_timeout = settings.enrichment_live_timeout
+        self.retry_after = settings.enrichment_retry_after
+
+        self._agent = None
+        self.politeness = PortalPoliteness()
+
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._pending: Dict[str, int] = {}  # application_id -> best queued priority
+        self._in_progress: Dict[str, asyncio.Task] = {}
+        # application_id -> last enrichment attempt (monotonic), oldest first
+        self._attempted: "OrderedDict[str, float]" = OrderedDict()
+        self._background: Set[asyncio.Task] = set()
+        self._tasks = []
+        self._seq = itertools.count()
+
+        self.stats = {
+            "submitted": 0, "dropped": 0, "enriched": 0, "failed": 0,
+            "live_hits": 0, "live_timeouts": 0
+        }
+
+    @property
+    def agent(self):
+        """ApplicantEnrichmentAgent, imported and built on first use"""
+        if self._agent is None:
+            from app.agents.enrichment.applicant_agent import ApplicantEnrichmentAgent
+            self._agent = ApplicantEnrichmentAgent()
+        return self._agent
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """Start worker tasks and the new-application scanner"""
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        if settings.enrichment_scan_interval > 0:
+            self._tasks.append(asyncio.create_task(self._scan_loop()))
+        logger.info(f"✅ Enrichment queue started ({self.workers} workers)")
+
+    async def stop(self):
+        """Cancel workers; queued work is dropped (it is only a cache warm-up)"""
+        for task in [*self._tasks, *self._background]:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._background, return_exceptions=True)
+        self._tasks = []
+        self._background.clear()
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def submit(self, application_id: str, url: Optional[str], priority: int = PRIORITY_SEARCH_HIT) -> bool:
+        """
+        Queue an application for enrichment (non-blocking).
+
+        Returns:
+            True if queued, False if skipped (no URL, already queued or full)
+        """
+        if not application_id or not url or application_id in self._in_progress:
+            return False
+
+        queued = self._pending.get(application_id)
+        if queued is not None and queued <= priority:
+            return False
+
+        if queued is None and len(self._pending) >= self.max_size:
+            self.stats["dropped"] += 1
+            return False
+
+        # A promoted entry leaves a stale copy behind; workers skip it
+        self._pending[application_id] = priority
+        self._queue.put_nowait((priority, next(self._seq), application_id, url))
+        self.stats["submitted"] += 1
+        return True
+
+    def submit_search_hits(self, results: Iterable[Any], limit: Optional[int] = None) -> int:
+        """
+        Queue the top search results (PlanningApplicationSummary objects).
+
+        Hits attempted within ENRICHMENT_RETRY_AFTER are skipped, so
+        repeated searches don't re-scrape portals that just failed.
+        """
+        limit = limit if limit is not None else settings.enrichment_search_hits
+        queued = 0
+        for result in itertools.islice(results, limit):
+            application_id = getattr(result, 'application_id', None)
+            if self.recently_attempted(application_id):
+                continue
+            if self.submit(application_id, getattr(result, 'url', None)):
+                queued += 1
+        return queued
+
+    def recently_attempted(self, application_id: Optional[str]) -> bool:
+        attempted_at = self._attempted.get(application_id)
+        return attempted_at is not None and time.monotonic() - attempted_at < self.retry_after
+
+    def _mark_attempted(self, application_id: str):
+        self._attempted[application_id] = time.monotonic()
+        self._attempted.move_to_end(application_id)
+        while len(self._attempted) > self.max_size:
+            self._attempted.popitem(last=False)
+
+    async def scan_new_applications(self, days: Optional[int] = None, size: int = 500) -> int:
+        """Queue recently submitted applications that have no enrichment yet"""
+        days = days or settings.enrichment_scan_days
+        response = await es_client.search(
+            query={
+                "bool": {
+                    "filter": [
+                        {"range": {"start_date": {"gte": f"now-{days}d/d"}}},
+                        {"exists": {"field": "url"}}
+                    ],
+                    "must_not": [{"exists": {"field": "enrichment"}}]
+                }
+            },
+            size=size,
+            source=["uid", "name", "reference", "url"],
+            sort=[{"start_date": {"order": "desc"}}]
+        )
+
+        queued = 0
+        for hit in response.get("hits", {}).get("hits", []):
+            source = hit["_source"]
+            application_id = source.get("uid") or source.get("name") or source.get("reference")
+            if self.submit(application_id, source.get("url"), PRIORITY_NEW):
+                queued += 1
+        return queued
+
+    async def _scan_loop(self):
+        interval = settings.enrichment_scan_interval * 60
+        while True:
+            try:
+                # Not released: the lease expiring paces scans to one per interval per deployment
+                if await WorkerLease("enrichment_scan", interval).acquire():
+                    queued = await self.scan_new_applications()
+                    if queued:
+                        logger.info(f"Queued {queued} new applications for enrichment")
+            except Exception as e:
+                logger.warning(f"New application scan failed: {e}")
+            await asyncio.sleep(interval)
+
+    # ------------------------------------------------------------------
+    # Consumers
+    # ------------------------------------------------------------------
+
+    async def _worker(self):
+        while True:
+            priority, _, application_id, url = await self._queue.get()
+            try:
+                if self._pending.get(application_id) != priority:
+                    continue  # Stale copy of a promoted entry
+                del self._pending[application_id]
+
+                if await self.get_precomputed(application_id):
+                    continue
+
+                await self._run(application_id, url)
+            except Exception as e:
+                logger.error(f"Background enrichment failed for {application_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _run(self, application_id: str, url: str) -> "asyncio.Task":
+        """Enrich once per application, sharing the task with concurrent callers"""
+        task = self._in_progress.get(application_id)
+        if task is None:
+            task = asyncio.create_task(self._enrich_and_store(application_id, url))
+            self._in_progress[application_id] = task
+            task.add_done_callback(lambda _: self._in_progress.pop(application_id, None))
+        return task
+
+    async def _enrich_and_store(self, application_id: str, url: str) -> Optional[Dict]:
+        self._mark_attempted(application_id)
+        release, domain = await self.politeness.acquire(url)
+        try:
+            result = await self.agent.enrich(url, application_id)
+        finally:
+            await release()
+
+        if not result.get("success"):
+            self.stats["failed"] += 1
+            logger.warning(f"Enrichment failed for {application_id} ({domain}): {result.get('error', 'no data')}")
+            return None
+
+        data = {field: result["data"].get(field) for field in ENRICHMENT_FIELDS}
+        await self.store(application_id, data)
+        self.stats["enriched"] += 1
+        return data
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    async def store(self, application_id: str, data: Dict):
+        """Write enrichment to Redis and into the application's ES document"""
+        cache_service = get_cache_service()
+        if cache_service and cache_service.available:
+            await cache_service.set_enrichment(application_id, data)
+
+        try:
+            response = await es_client.search(query=_id_query(application_id), size=1, source=False)
+            hits = response.get("hits", {}).get("hits", [])
+            if hits:
+                await es_client.update_document(
+                    hits[0]["_id"],
+                    {"enrichment": {**data, "enriched_at": datetime.utcnow().isoformat()}}
+                )
+        except Exception as e:
+            logger.warning(f"Failed to write enrichment to ES for {application_id}: {e}")
+
+    async def get_precomputed(self, application_id: str) -> Optional[Dict]:
+        """Read enrichment from Redis, falling back to the ES document"""
+        cache_service = get_cache_service()
+        if cache_service and cache_service.available:
+            cached = await cache_service.get_enrichment(application_id)
+            if cached:
+                return cached
+
+        try:
+            response = await es_client.search(
+                query=_id_query(application_id), size=1, source=["enrichment"]
+            )
+        except Exception as e:
+            logger.warning(f"Enrichment lookup failed for {application_id}: {e}")
+            return None
+
+        hits = response.get("hits", {}).get("hits", [])
+        enrichment = hits[0]["_source"].get("enrichment") if hits else None
+        if not enrichment:
+            return None
+
+        data = {field: enrichment.get(field) for field in ENRICHMENT_FIELDS}
+        if cache_service and cache_service.available:
+            await cache_service.set_enrichment(application_id, data)
+        return data
+
+    async def get_or_enrich(self, application_id: str, url: Optional[str], timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Precomputed enrichment, else live scraping bounded by `timeout`.
+
+        On timeout the scrape keeps running in the background so the next
+        view of the report is served from cache.
+        """
+        data = await self.get_precomputed(application_id)
+        if data or not url:
+            return data
+
+        task = self._run(application_id, url)
+        self._pending.pop(application_id, None)
+        try:
+            data = await asyncio.wait_for(asyncio.shield(task), timeout or self.live_timeout)
+            self.stats["live_hits"] += 1
+            return data
+        except asyncio.TimeoutError:
+            self.stats["live_timeouts"] += 1
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+            logger.info(f"Live enrichment for {application_id} exceeded {timeout or self.live_timeout}s, continuing in background")
+            return None
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            "queued": len(self._pending),
+            "in_progress": len(self._in_progress),
+            "workers": len(self._tasks)
+        }
+
+
+# Global queue instance (initialized in main.py)
+enrichment_queue: Optional[EnrichmentQueue] = None
+
+
+def get_enrichment_queue() -> Optional[EnrichmentQueue]:
+    """
+    Get global enrichment queue instance.
+
+    Returns:
+        EnrichmentQueue instance or None if not initialized
+    """
+    return enrichment_queue
+
+
+async def init_enrichment_queue():
+    """
+    Initialize and start the global enrichment queue.
+
+    Should be called during application startup, after the cache service.
+    """
+    global enrichment_queue
+    if not settings.enrichment_queue_enabled:
+        return
+    enrichment_queue = EnrichmentQueue()
+    await enrichment_queue.start()
+
+
+async def shutdown_enrichment_queue():
+    """
+    Stop the global enrichment queue.
+
+    Should be called during application shutdown.
+    """
+    global enrichment_queue
+    if enrichment_queue:
+        await enrichment_queue.stop()
+        enrichment_queue = None
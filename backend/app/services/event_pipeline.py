@@ -0,0 +1,211 @@
+"""
+Buffered Usage and Interaction Event Pipeline
+
+API usage records, user interactions and user events are appended to
+in-memory buffers on the request path (no I/O) and written to Supabase in
+bulk by a background task when a buffer reaches EVENT_BATCH_SIZE or every
+EVENT_FLUSH_INTERVAL seconds. Per-user api_calls_this_month increments
+are aggregated in memory and added once per user per flush through the
+atomic increment_api_calls RPC, so workers never overwrite each other's
+counts. Pending events are flushed on shutdown.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.db.supabase import supabase_client
+
+logger = logging.getLogger(__name__)
+
+API_USAGE_TABLE = "api_usage"
+INTERACTIONS_TABLE = "user_interactions"
+USER_EVENTS_TABLE = "user_events"
+
+
+def _serializable(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Datetimes and enums as JSON-friendly values for PostgREST"""
+    return {
+        key: value.isoformat() if isinstance(value, datetime)
+        else value.value if isinstance(value, Enum)
+        else value
+        for key, value in row.items()
+    }
+
+
+class EventPipeline:
+    """In-process buffer of usage/interaction events with bulk flushing"""
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_pending: Optional[int] = None
+    ):
+        self.batch_size = batch_size or settings.event_batch_size
+        self.flush_interval = flush_interval or settings.event_flush_interval
+        self.max_pending = max_pending or settings.event_max_pending
+
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._pending = 0
+        # user_id -> calls not yet added to api_calls_this_month
+        self._api_calls: Dict[str, int] = {}
+
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+        self.stats = {"enqueued": 0, "dropped": 0, "inserted": 0, "flushes": 0, "counter_updates": 0}
+
+    # ------------------------------------------------------------------
+    # Producers (non-blocking)
+    # ------------------------------------------------------------------
+
+    def enqueue(self, table: str, row: Dict[str, Any]) -> bool:
+        """Buffer a row for bulk insert; False if the pipeline is saturated"""
+        if self._pending >= self.max_pending:
+            self.stats["dropped"] += 1
+            return False
+
+        buffer = self._buffers.setdefault(table, [])
+        buffer.append(_serializable(row))
+        self._pending += 1
+        self.stats["enqueued"] += 1
+
+        if len(buffer) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    def record_api_usage(self, user_id: str, usage_data: Dict[str, Any]):
+        """Buffer an api_usage row and count the call against the user's monthly total"""
+        self.enqueue(API_USAGE_TABLE, {
+            **usage_data,
+            "user_id": user_id,
+            "created_at": datetime.utcnow()
+        })
+
+        self._api_calls[user_id] = self._api_calls.get(user_id, 0) + 1
+
+    def record_interaction(self, interaction: Dict[str, Any]):
+        """Buffer a user_interactions row"""
+        self.enqueue(INTERACTIONS_TABLE, interaction)
+
+    def record_user_event(self, user_id: str, event_data: Dict[str, Any]):
+        """Buffer a user_events row"""
+        self.enqueue(USER_EVENTS_TABLE, {
+            **event_data,
+            "user_id": user_id,
+            "created_at": datetime.utcnow()
+        })
+
+    def pending_api_calls(self, user_id: str) -> int:
+        """Calls counted in memory but not yet written to the user's profile"""
+        return self._api_calls.get(user_id, 0)
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    async def flush(self) -> int:
+        """Write all buffered events and counter increments"""
+        async with self._flush_lock:
+            buffers, self._buffers, self._pending = self._buffers, {}, 0
+            api_calls, self._api_calls = self._api_calls, {}
+
+            results = await asyncio.gather(*(
+                supabase_client.increment_api_calls(user_id, delta)
+                for user_id, delta in api_calls.items()
+            ), return_exceptions=True)
+
+            # Failed increments are added back so the next flush retries them
+            updated = 0
+            for (user_id, delta), result in zip(api_calls.items(), results):
+                if result is None or isinstance(result, BaseException):
+                    self._api_calls[user_id] = self._api_calls.get(user_id, 0) + delta
+                else:
+                    updated += 1
+
+            inserted = 0
+            for table, rows in buffers.items():
+                inserted += await supabase_client.bulk_insert(table, rows, chunk_size=self.batch_size)
+
+            self.stats["inserted"] += inserted
+            self.stats["counter_updates"] += updated
+            self.stats["flushes"] += 1
+            return inserted
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            if self._pending or self._api_calls:
+                try:
+                    await self.flush()
+                except Exception as e:
+                    logger.error(f"Event pipeline flush failed: {str(e)}")
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush loop and write everything still buffered"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "pending": self._pending, "pending_counters": len(self._api_calls)}
+
+
+# Global pipeline instance (initialized in main.py)
+event_pipeline: Optional[EventPipeline] = None
+
+
+def get_event_pipeline() -> Optional[EventPipeline]:
+    """
+    Get global event pipeline instance.
+
+    Returns:
+        EventPipeline instance or None if not initialized
+    """
+    return event_pipeline
+
+
+async def init_event_pipeline():
+    """
+    Initialize and start the global event pipeline.
+
+    Should be called during application startup.
+    """
+    global event_pipeline
+    if not settings.event_pipeline_enabled:
+        return
+    event_pipeline = EventPipeline()
+    await event_pipeline.start()
+
+
+async def shutdown_event_pipeline():
+    """
+    Flush pending events and stop the pipeline.
+
+    Should be called during application shutdown, after request handling stops.
+    """
+    global event_pipeline
+    if event_pipeline:
+        pipeline, event_pipeline = event_pipeline, None
+        await pipeline.stop()
@@ -0,0 +1,228 @@
+"""
+Content-Addressed LLM Response Cache
+
+Shared by LLMClient (agents), DocumentSummarizer and the pSEO
+ContentGenerator. Keys are a SHA-256 over the canonical request (model,
+system prompt, messages and sampling parameters), so they are stable across
+processes and restarts and two requests only share an answer when everything
+that could change it matches.
+
+Two tiers:
+  * an in-memory LRU bounded by bytes (LLM_CACHE_MAX_BYTES)
+  * an optional SQLite file (LLM_CACHE_PATH, empty disables) shared by the
+    workers on a host, bounded by LLM_CACHE_DISK_MAX_BYTES and expired
+    after LLM_CACHE_TTL_HOURS
+
+Entries are dicts with at least "content"; "cost_usd" and "tokens_used"
+record what the original call cost, which hits report as saved.
+
+Configured from the environment (not app settings) because the pSEO
+pipeline runs standalone.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Disk-tier size check every N writes
+PRUNE_EVERY_WRITES = 100
+
+
+def make_cache_key(
+    model: str,
+    messages: List[Dict[str, Any]],
+    system: Optional[str] = None,
+    **params: Any
+) -> str:
+    """SHA-256 of the canonical request; None-valued params are ignored"""
+    canonical = {
+        "model": model,
+        "system": system,
+        "messages": messages,
+        "params": {name: value for name, value in params.items() if value is not None},
+    }
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """Byte-bounded LRU over an optional SQLite tier, with hit/miss/cost-saved metrics"""
+
+    def __init__(
+        self,
+        max_bytes: int,
+        path: Optional[str] = None,
+        disk_max_bytes: int = 0,
+        ttl_seconds: int = 7 * 86400
+    ):
+        self.max_bytes = max_bytes
+        self.path = path
+        self.disk_max_bytes = disk_max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._memory: "OrderedDict[str, Tuple[int, float, Dict[str, Any]]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._writes = 0
+
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "tokens_saved": 0,
+            "cost_saved_usd": 0.0
+        }
+
+    # Memory tier
+
+    def _remember(self, key: str, entry: Dict[str, Any], size: int, expires_at: float):
+        if size > self.max_bytes:
+            return
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key)[0]
+        self._memory[key] = (size, expires_at, entry)
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_bytes:
+            _, (evicted_size, _, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted_size
+            self.stats["evictions"] += 1
+
+    # Disk tier
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS llm_cache_created ON llm_cache (created_at)")
+        return self._db
+
+    def _db_get(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._db_lock:
+            row = self._connect().execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def _db_set(self, key: str, value: str, expires_at: float):
+        with self._db_lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, size, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), time.time(), expires_at)
+            )
+            self._writes += 1
+            if self._writes % PRUNE_EVERY_WRITES == 0:
+                self._db_prune(db)
+            db.commit()
+
+    def _db_prune(self, db: sqlite3.Connection):
+        """Drop expired entries, then the oldest until under disk_max_bytes"""
+        db.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (time.time(),))
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        if self.disk_max_bytes and total > self.disk_max_bytes:
+            cutoff = None
+            for created_at, size in db.execute("SELECT created_at, size FROM llm_cache ORDER BY created_at"):
+                total -= size
+                cutoff = created_at
+                if total <= self.disk_max_bytes:
+                    break
+            db.execute("DELETE FROM llm_cache WHERE created_at <= ?", (cutoff,))
+
+    # Public API
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached entry for a key from make_cache_key, or None"""
+        hit = self._memory.get(key)
+        if hit is not None:
+            if hit[1] > time.time():
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return self._record_hit(hit[2])
+            self._memory_bytes -= self._memory.pop(key)[0]
+
+        if self.path:
+            try:
+                row = await asyncio.to_thread(self._db_get, key)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache read failed: {e}")
+                row = None
+            if row is not None:
+                value, expires_at = row
+                entry = json.loads(value)
+                self._remember(key, entry, len(value), expires_at)
+                self.stats["disk_hits"] += 1
+                return self._record_hit(entry)
+
+        self.stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, entry: Dict[str, Any]):
+        """Store an entry (a dict with "content", ideally "cost_usd" and "tokens_used")"""
+        value = json.dumps(entry, default=str)
+        expires_at = time.time() + self.ttl_seconds
+        self._remember(key, entry, len(value), expires_at)
+        self.stats["writes"] += 1
+
+        if self.path:
+            try:
+                await asyncio.to_thread(self._db_set, key, value, expires_at)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache write failed: {e}")
+
+    def _record_hit(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        self.stats["tokens_saved"] += entry.get("tokens_used", 0)
+        self.stats["cost_saved_usd"] += entry.get("cost_usd", 0.0)
+        return entry
+
+    def clear(self):
+        """Clear the memory tier (the disk tier is shared with other processes)"""
+        self._memory.clear()
+        self._memory_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        lookups = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "hits": hits,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "cost_saved_usd": round(self.stats["cost_saved_usd"], 4),
+            "entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "max_bytes": self.max_bytes,
+            "disk_path": self.path or None
+        }
+
+
+# Process-wide cache shared by all LLM callers
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache(
+            max_bytes=int(os.getenv('LLM_CACHE_MAX_BYTES', str(32 * 1024 * 1024))),
+            path=os.getenv('LLM_CACHE_PATH', './outputs/llm_cache.sqlite') or None,
+            disk_max_bytes=int(os.getenv('LLM_CACHE_DISK_MAX_BYTES', str(512 * 1024 * 1024))),
+            ttl_seconds=int(os.getenv('LLM_CACHE_TTL_HOURS', '168')) * 3600
+        )
+    return _llm_cache
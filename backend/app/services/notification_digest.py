@@ -0,0 +1,304 @@
+"""
+Notification Digests
+
+Buffers notifications per (user, channel) over a configurable window and
+delivers each buffer as one digest: a single rendered email per user, a
+single push, and in-app rows written to Supabase in one bulk insert across
+all users in the flush. User profiles and settings are looked up once per
+digest rather than once per event.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.db.supabase import supabase_client
+from app.models.user import UserProfile
+from app.services.email_sender import get_email_sender
+from app.services.notification_service import NotificationService, notification_service
+
+logger = logging.getLogger(__name__)
+
+# Channel placeholder resolved from the user's preferences at flush time
+PREFERRED_CHANNELS = "preferred"
+
+
+class NotificationDigester:
+    """Per-user, per-channel notification buffers flushed as digests"""
+
+    def __init__(
+        self,
+        service: Optional[NotificationService] = None,
+        window: Optional[int] = None,
+        max_items: Optional[int] = None
+    ):
+        self.service = service or notification_service
+        self.window = window if window is not None else settings.notification_digest_window
+        self.max_items = max_items or settings.notification_batch_size
+
+        self._buffers: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._opened: Dict[Tuple[str, str], float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        self.stats = {"buffered": 0, "digests": 0, "emails_sent": 0, "in_app_created": 0, "pushes_sent": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def add(
+        self,
+        user_id: str,
+        notification_type: str,
+        title: str,
+        message: str,
+        data: Optional[Dict[str, Any]] = None,
+        delivery_methods: Optional[List[str]] = None
+    ):
+        """Buffer a notification for the user's next digest"""
+        event = {
+            "type": notification_type,
+            "title": title,
+            "message": message,
+            "data": data or {},
+            "created_at": datetime.utcnow().isoformat()
+        }
+        for channel in delivery_methods or [PREFERRED_CHANNELS]:
+            key = (user_id, channel)
+            buffer = self._buffers.setdefault(key, [])
+            if not buffer:
+                self._opened[key] = time.monotonic()
+            buffer.append(event)
+            if len(buffer) >= self.max_items:
+                self._opened[key] = 0.0  # Full: due on the next tick
+        self.stats["buffered"] += 1
+
+    async def flush(self, force: bool = False) -> int:
+        """
+        Deliver every buffer whose window has elapsed (all buffers if `force`).
+
+        Returns:
+            Number of users a digest was delivered to
+        """
+        now = time.monotonic()
+        due = [key for key, opened in self._opened.items() if force or now - opened >= self.window]
+        if not due:
+            return 0
+
+        by_user: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        for key in due:
+            user_id, channel = key
+            del self._opened[key]
+            by_user.setdefault(user_id, {})[channel] = self._buffers.pop(key)
+
+        return await self._deliver(by_user)
+
+    async def _deliver(self, by_user: Dict[str, Dict[str, List[Dict[str, Any]]]]) -> int:
+        user_ids = list(by_user)
+        profiles = await asyncio.gather(
+            *(supabase_client.get_user_profile(u) for u in user_ids), return_exceptions=True
+        )
+        preferences = await asyncio.gather(
+            *(supabase_client.get_user_settings(u) for u in user_ids), return_exceptions=True
+        )
+
+        rows: List[Dict[str, Any]] = []
+        row_events: List[Tuple[str, Dict[str, Any]]] = []
+        sends = []
+        sender = get_email_sender()
+        delivered = 0
+
+        for user_id, profile, user_settings in zip(user_ids, profiles, preferences):
+            if isinstance(profile, Exception) or isinstance(user_settings, Exception):
+                error = profile if isinstance(profile, Exception) else user_settings
+                logger.error(f"Digest lookup failed for user {user_id}, keeping events buffered: {str(error)}")
+                self._requeue(user_id, by_user[user_id])
+                continue
+            if not profile:
+                logger.error(f"User profile not found for ID: {user_id}")
+                continue
+            delivered += 1
+
+            channels = self._resolve_channels(by_user[user_id], user_settings)
+
+            for event in channels.get('in_app', []):
+                rows.append(self.service.build_in_app_notification(
+                    user_id, event["type"], event["title"], event["message"], event["data"]
+                ))
+                row_events.append((user_id, event))
+
+            email_events = channels.get('email')
+            if email_events and settings.enable_email_notifications and sender.configured and profile.email:
+                title, content = self.render_digest(profile, email_events)
+                sends.append(("email", sender.send(self.service.build_email(profile.email, title, content))))
+
+            push_events = channels.get('push')
+            if push_events and settings.enable_push_notifications:
+                title, message = self._digest_summary(push_events)
+                sends.append(("push", self.service._send_push_notification(
+                    user_id, title, message, {"count": len(push_events)}
+                )))
+
+        created = await self._insert_in_app(rows, row_events)
+        results = await asyncio.gather(*(send for _, send in sends), return_exceptions=True)
+
+        self.stats["digests"] += delivered
+        self.stats["in_app_created"] += created
+        self.stats["emails_sent"] += sum(1 for (kind, _), r in zip(sends, results) if kind == "email" and r is True)
+        self.stats["pushes_sent"] += sum(1 for (kind, _), r in zip(sends, results) if kind == "push" and r is True)
+        return delivered
+
+    async def _insert_in_app(self, rows: List[Dict[str, Any]], row_events: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Bulk insert in-app rows, one request per chunk.
+
+        Each chunk is one insert (all or nothing), so the events of a failed
+        chunk go back into their users' in-app buffers for the next flush.
+        """
+        starts = range(0, len(rows), self.max_items)
+        counts = await asyncio.gather(
+            *(supabase_client.create_notifications(rows[start:start + self.max_items], chunk_size=self.max_items)
+              for start in starts),
+            return_exceptions=True
+        )
+
+        created = 0
+        failed: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        for start, count in zip(starts, counts):
+            if isinstance(count, Exception) or not count:
+                for user_id, event in row_events[start:start + self.max_items]:
+                    failed.setdefault(user_id, {}).setdefault('in_app', []).append(event)
+            else:
+                created += count
+
+        for user_id, buffers in failed.items():
+            logger.error(f"In-app digest insert failed for user {user_id}, keeping events buffered")
+            self._requeue(user_id, buffers)
+        return created
+
+    def _requeue(self, user_id: str, buffers: Dict[str, List[Dict[str, Any]]]):
+        """Put undelivered events back ahead of anything buffered since the flush"""
+        for channel, events in buffers.items():
+            key = (user_id, channel)
+            pending = self._buffers.get(key)
+            self._buffers[key] = events + (pending or [])
+            if not pending:
+                self._opened[key] = time.monotonic()
+
+    @staticmethod
+    def _resolve_channels(
+        buffers: Dict[str, List[Dict[str, Any]]],
+        user_settings: Any
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Expand preference-routed events using the same rules as send_notification"""
+        channels = {channel: list(events) for channel, events in buffers.items() if channel != PREFERRED_CHANNELS}
+        preferred = buffers.get(PREFERRED_CHANNELS)
+        if preferred:
+            methods = ['in_app']
+            if user_settings and getattr(user_settings, 'email_notifications', True):
+                methods.append('email')
+            if user_settings and getattr(user_settings, 'push_notifications', True):
+                methods.append('push')
+            for method in methods:
+                channels.setdefault(method, []).extend(preferred)
+        return channels
+
+    @staticmethod
+    def _digest_summary(events: List[Dict[str, Any]]) -> Tuple[str, str]:
+        if len(events) == 1:
+            return events[0]["title"], events[0]["message"]
+
+        alerts = [e for e in events if e["type"] == "alert"]
+        new_applications = sum(e["data"].get("new_applications_count", 0) for e in alerts)
+        title = f"{len(events)} new notifications from Planning Explorer"
+        message = f"You have {len(events)} new notifications"
+        if alerts:
+            message += f", including {new_applications} new planning applications across {len(alerts)} alert matches"
+        return title, message + "."
+
+    def render_digest(self, user_profile: UserProfile, events: List[Dict[str, Any]]) -> Tuple[str, Dict[str, str]]:
+        """Render one email for all buffered events (one template render)"""
+        title, message = self._digest_summary(events)
+        service = self.service
+
+        if len(events) == 1:
+            event = events[0]
+            html_details = service._format_notification_data(event["type"], event["data"])
+            text_details = service._format_notification_data_text(event["type"], event["data"])
+        else:
+            html_details = "".join(
+                f"<h3>{e['title']}</h3><p>{e['message']}</p>{service._format_notification_data(e['type'], e['data'])}"
+                for e in events
+            )
+            text_details = "\n".join(
+                f"{e['title']}\n{e['message']}\n{service._format_notification_data_text(e['type'], e['data'])}"
+                for e in events
+            )
+
+        return title, service.render_email(title, message, user_profile, html_details, text_details)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush loop and deliver everything still buffered"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush(force=True)
+
+    async def _run(self):
+        tick = max(1.0, min(self.window / 4, 30.0))
+        while True:
+            await asyncio.sleep(tick)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Notification digest flush failed: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "pending_buffers": len(self._buffers),
+            "pending_events": sum(len(b) for b in self._buffers.values())
+        }
+
+
+# Global digester instance (initialized in main.py)
+notification_digester: Optional[NotificationDigester] = None
+
+
+async def init_notification_digests():
+    """
+    Start digest buffering for NotificationService.
+
+    Should be called during application startup.
+    """
+    global notification_digester
+    if not settings.notification_digest_enabled:
+        return
+    notification_digester = NotificationDigester()
+    await notification_digester.start()
+    notification_service.digester = notification_digester
+
+
+async def shutdown_notification_digests():
+    """
+    Flush pending digests and stop buffering.
+
+    Should be called during application shutdown, before the email sender.
+    """
+    global notification_digester
+    if notification_digester:
+        notification_service.digester = None
+        await notification_digester.stop()
+        notification_digester = None
@@ -10,15 +10,71 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from email.mime.text import MIMEText as MimeText
 from email.mime.multipart import MIMEMultipart as MimeMultipart
-import smtplib
-import ssl
+from string import Template
 
 from app.core.config import settings
 from app.db.supabase import supabase_client
 from app.models.user import UserProfile
+from app.services.email_sender import get_email_sender
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; rendered with Template.substitute per email/digest
+EMAIL_HTML_TEMPLATE = Template("""
+            <!DOCTYPE html>
+            <html>
+            <head>
+                <meta charset="utf-8">
+                <title>$title</title>
+                <style>
+                    body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+                    .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+                    .header { background-color: #007bff; color: white; padding: 20px; text-align: center; }
+                    .content { padding: 20px; background-color: #f9f9f9; }
+                    .footer { padding: 20px; text-align: center; font-size: 12px; color: #666; }
+                    .button { background-color: #007bff; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; }
+                </style>
+            </head>
+            <body>
+                <div class="container">
+                    <div class="header">
+                        <h1>Planning Explorer</h1>
+                    </div>
+                    <div class="content">
+                        <h2>$title</h2>
+                        <p>Hello $name,</p>
+                        <p>$message</p>
+                        $details
+                        <p>Best regards,<br>The Planning Explorer Team</p>
+                    </div>
+                    <div class="footer">
+                        <p>You received this email because you have notifications enabled in your Planning Explorer account.</p>
+                        <p><a href="https://planningexplorer.uk/settings">Manage notification preferences</a></p>
+                    </div>
+                </div>
+            </body>
+            </html>
+            """)
+
+EMAIL_TEXT_TEMPLATE = Template("""
+            Planning Explorer Notification
+
+            $title
+
+            Hello $name,
+
+            $message
+
+            $details
+
+            Best regards,
+            The Planning Explorer Team
+
+            ---
+            You received this email because you have notifications enabled in your Planning Explorer account.
+            Manage your notification preferences: https://planningexplorer.uk/settings
+            """)
+
 
 class NotificationService:
     """Service for managing and delivering notifications"""
@@ -30,6 +86,8 @@ class NotificationService:
         self.smtp_password = settings.smtp_password
         self.smtp_use_tls = settings.smtp_use_tls
         self.from_email = settings.from_email
+        # NotificationDigester, set by init_notification_digests when digests are enabled
+        self.digester = None
 
     async def send_notification(
         self,
@@ -38,7 +96,8 @@ class NotificationService:
         title: str,
         message: str,
         data: Optional[Dict[str, Any]] = None,
-        delivery_methods: List[str] = None
+        delivery_methods: List[str] = None,
+        digest: bool = False
     ) -> bool:
         """
         Send notification to user via specified delivery methods
@@ -50,10 +109,17 @@ class NotificationService:
             message: Notification message
             data: Additional notification data
             delivery_methods: List of delivery methods (email, push, in_app)
+            digest: Buffer into the user's next digest instead of sending now
+                (when the digester is running)
 
         Returns:
-            True if at least one delivery method succeeded
+            True if at least one delivery method succeeded (or the
+            notification was queued for a digest)
         """
+        if digest and self.digester is not None and self.digester.running:
+            self.digester.add(user_id, notification_type, title, message, data, delivery_methods)
+            return True
+
         try:
             # Get user profile and preferences
             user_profile = await supabase_client.get_user_profile(user_id)
@@ -117,27 +183,67 @@ class NotificationService:
     ) -> bool:
         """Create in-app notification"""
         try:
-            notification_data = {
-                "user_id": user_id,
-                "type": notification_type,
-                "title": title,
-                "message": message,
-                "data": data or {},
-                "delivery_method": "in_app",
-                "is_read": False,
-                "is_sent": True,
-                "sent_at": datetime.utcnow().isoformat(),
-                "delivery_status": "sent"
-            }
-
-            # Use Supabase client to create notification
-            # This would need to be implemented in the Supabase client
-            return True  # Placeholder
+            notification_data = self.build_in_app_notification(
+                user_id, notification_type, title, message, data
+            )
+            return await supabase_client.create_notifications([notification_data]) > 0
 
         except Exception as e:
             logger.error(f"Failed to create in-app notification: {str(e)}")
             return False
 
+    @staticmethod
+    def build_in_app_notification(
+        user_id: str,
+        notification_type: str,
+        title: str,
+        message: str,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Row for the user_notifications table"""
+        return {
+            "user_id": user_id,
+            "type": notification_type,
+            "title": title[:200],
+            "message": message[:1000] if message else message,
+            "data": data or {},
+            "delivery_method": "in_app",
+            "is_read": False,
+            "is_sent": True,
+            "sent_at": datetime.utcnow().isoformat(),
+            "delivery_status": "sent"
+        }
+
+    def build_email(self, to_email: str, subject: str, email_content: Dict[str, str]) -> MimeMultipart:
+        """MIME message with text and HTML alternatives"""
+        msg = MimeMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = self.from_email
+        msg['To'] = to_email
+
+        msg.attach(MimeText(email_content['text'], 'plain'))
+        msg.attach(MimeText(email_content['html'], 'html'))
+        return msg
+
+    def render_email(
+        self,
+        title: str,
+        message: str,
+        user_profile: UserProfile,
+        html_details: str = "",
+        text_details: str = ""
+    ) -> Dict[str, str]:
+        """Render the precompiled email templates"""
+        values = {
+            "title": title,
+            "name": user_profile.full_name or 'there',
+            "message": message
+        }
+        return {
+            'html': EMAIL_HTML_TEMPLATE.substitute(values, details=html_details),
+            'text': EMAIL_TEXT_TEMPLATE.substitute(values, details=text_details)
+        }
+
     async def _send_email_notification(
         self,
         user_profile: UserProfile,
@@ -156,30 +262,12 @@ class NotificationService:
                 notification_type, title, message, data, user_profile
             )
 
-            # Create email message
-            msg = MimeMultipart('alternative')
-            msg['Subject'] = title
-            msg['From'] = self.from_email
-            msg['To'] = user_profile.email
-
-            # Add HTML content
-            html_part = MimeText(email_content['html'], 'html')
-            text_part = MimeText(email_content['text'], 'plain')
-
-            msg.attach(text_part)
-            msg.attach(html_part)
-
-            # Send email
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                if self.smtp_use_tls:
-                    server.starttls(context=context)
-                if self.smtp_username and self.smtp_password:
-                    server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
-
-            logger.info(f"Email sent successfully to {user_profile.email}")
-            return True
+            # Send over a pooled, rate-limited SMTP connection
+            msg = self.build_email(user_profile.email, title, email_content)
+            sent = await get_email_sender().send(msg)
+            if sent:
+                logger.info(f"Email sent successfully to {user_profile.email}")
+            return sent
 
         except Exception as e:
             logger.error(f"Failed to send email notification: {str(e)}")
@@ -213,66 +301,13 @@ class NotificationService:
     ) -> Dict[str, str]:
         """Get email template for notification type"""
         try:
-            # Basic email template
-            html_template = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="utf-8">
-                <title>{title}</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                    .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                    .header {{ background-color: #007bff; color: white; padding: 20px; text-align: center; }}
-                    .content {{ padding: 20px; background-color: #f9f9f9; }}
-                    .footer {{ padding: 20px; text-align: center; font-size: 12px; color: #666; }}
-                    .button {{ background-color: #007bff; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h1>Planning Explorer</h1>
-                    </div>
-                    <div class="content">
-                        <h2>{title}</h2>
-                        <p>Hello {user_profile.full_name or 'there'},</p>
-                        <p>{message}</p>
-                        {self._format_notification_data(notification_type, data)}
-                        <p>Best regards,<br>The Planning Explorer Team</p>
-                    </div>
-                    <div class="footer">
-                        <p>You received this email because you have notifications enabled in your Planning Explorer account.</p>
-                        <p><a href="https://planningexplorer.uk/settings">Manage notification preferences</a></p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
-
-            text_template = f"""
-            Planning Explorer Notification
-
-            {title}
-
-            Hello {user_profile.full_name or 'there'},
-
-            {message}
-
-            {self._format_notification_data_text(notification_type, data)}
-
-            Best regards,
-            The Planning Explorer Team
-
-            ---
-            You received this email because you have notifications enabled in your Planning Explorer account.
-            Manage your notification preferences: https://planningexplorer.uk/settings
-            """
-
-            return {
-                'html': html_template,
-                'text': text_template
-            }
+            return self.render_email(
+                title,
+                message,
+                user_profile,
+                html_details=self._format_notification_data(notification_type, data),
+                text_details=self._format_notification_data_text(notification_type, data)
+            )
 
         except Exception as e:
             logger.error(f"Failed to get email template: {str(e)}")
@@ -353,7 +388,8 @@ Report Details:
             notification_type="alert",
             title=title,
             message=message,
-            data=data
+            data=data,
+            digest=True
         )
 
     async def send_report_ready_notification(
@@ -3,23 +3,38 @@ pSEO Services Package
 Programmatic SEO content generation for 425 UK local planning authorities
 """
 
-# Optional imports - don't fail if playwright not installed
-try:
-    from .playwright_scraper import PlaywrightScraper
-except ImportError:
-    PlaywrightScraper = None
+import importlib
 
-try:
-    from .firecrawl_scraper import FirecrawlScraper
-except ImportError:
-    FirecrawlScraper = None
+# Exports are imported on first access so importing one pSEO module doesn't
+# load Playwright, Firecrawl and the Anthropic SDK
+_EXPORTS = {
+    'PlaywrightScraper': '.playwright_scraper',
+    'FirecrawlScraper': '.firecrawl_scraper',
+    'Context7Service': '.context7_service',
+    'ContentGenerator': '.content_generator',
+    'DataPipeline': '.data_pipeline',
+    'ScraperFactory': '.scraper_factory',
+    'pSEOOrchestrator': '.orchestrator',
+    'BatchProcessor': '.batch_processor',
+}
+
+# Optional - None if the scraper's dependency isn't installed
+_OPTIONAL = {'PlaywrightScraper', 'FirecrawlScraper'}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module, __name__), name)
+    except ImportError:
+        if name not in _OPTIONAL:
+            raise
+        value = None
+    globals()[name] = value
+    return value
 
-from .context7_service import Context7Service
-from .content_generator import ContentGenerator
-from .data_pipeline import DataPipeline
-from .scraper_factory import ScraperFactory
-from .orchestrator import pSEOOrchestrator
-from .batch_processor import BatchProcessor
 
 __all__ = [
     'PlaywrightScraper',
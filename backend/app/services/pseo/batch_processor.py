@@ -3,13 +3,17 @@ Batch Processor for All 425 Authorities
 Processes all authorities with rate limiting, progress tracking, and cost monitoring
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from elasticsearch import AsyncElasticsearch
 from datetime import datetime
 import asyncio
 import json
 import os
 from .orchestrator import pSEOOrchestrator
+from .bulk_indexer import BulkPageWriter
+from .browser_pool import BrowserPool
+from .context7_service import close_context7_client
+from .static_export import StaticPageExporter, iter_pages_from_dir
 
 
 class BatchProcessor:
@@ -23,9 +27,26 @@ class BatchProcessor:
         self.orchestrator = pSEOOrchestrator(es_client)
 
         # Configuration
-        self.max_concurrent = int(os.getenv('PSEO_MAX_CONCURRENT', '3'))
-        self.batch_size = int(os.getenv('PSEO_BATCH_SIZE', '10'))
+        self.max_concurrent = int(os.getenv('PSEO_MAX_CONCURRENT', '3'))  # scrapes / LLM calls in flight
+        self.batch_size = int(os.getenv('PSEO_BATCH_SIZE', '10'))  # progress report interval
         self.output_dir = os.getenv('PSEO_OUTPUT_DIR', './outputs/pseo')
+        self.incremental = os.getenv('PSEO_INCREMENTAL', 'true').lower() == 'true'
+        self.static_export = os.getenv('PSEO_STATIC_EXPORT', 'true').lower() == 'true'
+        self.use_browser_pool = os.getenv('PSEO_BROWSER_POOL', 'true').lower() == 'true'
+
+        # Per-stage concurrency limits. Scraping and LLM generation are the
+        # scarce resources and default to PSEO_MAX_CONCURRENT; ES extraction
+        # is cheap and defaults to 4.
+        self.stage_limits = {
+            'scrape': int(os.getenv('PSEO_SCRAPE_CONCURRENCY', str(self.max_concurrent))),
+            'extract': int(os.getenv('PSEO_EXTRACT_CONCURRENCY', '4')),
+            'generate': int(os.getenv('PSEO_GENERATE_CONCURRENCY', str(self.max_concurrent)))
+        }
+        self.orchestrator.set_stage_limits(self.stage_limits)
+
+        # Pages in flight. Defaults to the sum of the stage limits so every
+        # stage can be full at once and the stage limits, not the pool, bind.
+        self.workers = int(os.getenv('PSEO_WORKERS', str(sum(self.stage_limits.values()))))
 
         # Tracking
         self.results: List[Dict] = []
@@ -33,6 +54,10 @@ class BatchProcessor:
         self.start_time = None
         self.processed_count = 0
         self.failed_count = 0
+        self.completed_ids: Set[str] = set()
+        self.indexing_stats: Dict = {}
+        self.browser_pool_stats: Dict = {}
+        self._checkpoint_lock = asyncio.Lock()
 
     async def get_all_authorities(self) -> List[Dict]:
         """Fetch all 425 authorities from database"""
@@ -70,6 +95,12 @@ class BatchProcessor:
         """
         Process all authorities with rate limiting and cost control.
 
+        Authorities are fed through a continuous work queue: a fixed pool of
+        workers pulls the next authority as soon as a slot frees up, so one
+        slow scrape never holds back the rest of a batch. Stage-level limits
+        (scrape / ES extraction / LLM generation) are enforced inside the
+        orchestrator.
+
         Args:
             max_cost: Maximum total cost to spend (stops when reached)
             start_from: Resume from specific authority index
@@ -82,7 +113,9 @@ class BatchProcessor:
         print(f"BATCH pSEO GENERATION - Planning Explorer")
         print(f"{'='*80}")
         print(f"Start time: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Max concurrent: {self.max_concurrent}")
+        print(f"Workers: {self.workers}")
+        print(f"Stage limits: {self.stage_limits}")
+        print(f"Mode: {'incremental' if self.incremental else 'full regeneration'}")
         print(f"Max cost: ${max_cost if max_cost else 'No limit'}")
         print(f"{'='*80}\n")
 
@@ -93,6 +126,10 @@ class BatchProcessor:
             authorities = authorities[start_from:]
             print(f"Resuming from authority #{start_from + 1}")
 
+        if self.completed_ids:
+            authorities = [a for a in authorities if a['id'] not in self.completed_ids]
+            print(f"Skipping {len(self.completed_ids)} authorities already completed")
+
         if limit:
             authorities = authorities[:limit]
             print(f"Limited to {limit} authorities")
@@ -100,41 +137,65 @@ class BatchProcessor:
         total_authorities = len(authorities)
         print(f"Total authorities to process: {total_authorities}\n")
 
-        # Process in batches with concurrency limit
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-
-        for i in range(0, total_authorities, self.batch_size):
-            batch = authorities[i:i + self.batch_size]
-            batch_num = (i // self.batch_size) + 1
-
-            print(f"\n{'='*80}")
-            print(f"BATCH {batch_num}/{(total_authorities + self.batch_size - 1) // self.batch_size}")
-            print(f"Processing authorities {i + 1} to {min(i + self.batch_size, total_authorities)}")
-            print(f"{'='*80}\n")
-
-            # Process batch
-            tasks = [
-                self.process_single_authority(auth, semaphore, i + idx + 1, total_authorities)
-                for idx, auth in enumerate(batch)
-            ]
-
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            self.results.extend(batch_results)
-
-            # Check cost limit
-            if max_cost and self.total_cost >= max_cost:
-                print(f"\n⚠️  Cost limit reached: ${self.total_cost:.2f} >= ${max_cost}")
-                print(f"Stopping batch processing...")
-                break
-
-            # Progress update
-            self._print_progress_update()
-
-            # Save checkpoint
-            await self._save_checkpoint()
+        queue: asyncio.Queue = asyncio.Queue()
+        for idx, auth in enumerate(authorities):
+            queue.put_nowait((idx + 1, auth))
+
+        stop = asyncio.Event()
+
+        async def worker():
+            while not stop.is_set():
+                try:
+                    index, authority = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                result = await self.process_single_authority(authority, index, total_authorities)
+                await self._record_result(result)
+
+                # Check cost limit
+                if max_cost and self.total_cost >= max_cost and not stop.is_set():
+                    print(f"\n⚠️  Cost limit reached: ${self.total_cost:.2f} >= ${max_cost}")
+                    print(f"Stopping batch processing...")
+                    stop.set()
+
+                if len(self.results) % self.batch_size == 0:
+                    self._print_progress_update()
+
+        # Index pages in the background so generation never waits on ES
+        if self.es is not None:
+            self.orchestrator.bulk_writer = BulkPageWriter(self.es)
+            self.orchestrator.bulk_writer.start()
+
+        # Share a fixed set of browsers across all Playwright scrapes
+        browser_pool = BrowserPool() if self.use_browser_pool else None
+        self.orchestrator.scraper_factory.browser_pool = browser_pool
+
+        try:
+            workers = [asyncio.create_task(worker()) for _ in range(max(1, self.workers))]
+            await asyncio.gather(*workers)
+        finally:
+            if self.orchestrator.bulk_writer is not None:
+                self.indexing_stats = await self.orchestrator.bulk_writer.close()
+                self.orchestrator.bulk_writer = None
+            if browser_pool is not None:
+                self.browser_pool_stats = browser_pool.get_stats()
+                await browser_pool.close()
+                self.orchestrator.scraper_factory.browser_pool = None
+            await close_context7_client()
+
+        self._print_progress_update()
 
         # Final summary
         summary = self._generate_summary(total_authorities)
+
+        # Export stage: pre-render pages for static serving
+        if self.static_export:
+            exporter = StaticPageExporter()
+            summary['static_export'] = await asyncio.to_thread(
+                exporter.export_all, iter_pages_from_dir(self.output_dir)
+            )
+
         await self._save_summary(summary)
 
         return summary
@@ -142,50 +203,70 @@ class BatchProcessor:
     async def process_single_authority(
         self,
         authority: Dict,
-        semaphore: asyncio.Semaphore,
         index: int,
         total: int
     ) -> Dict:
-        """Process single authority with semaphore control"""
-
-        async with semaphore:
-            try:
-                print(f"[{index}/{total}] Processing {authority['name']}...")
+        """Process single authority (concurrency is bounded by the worker pool)"""
+
+        try:
+            print(f"[{index}/{total}] Processing {authority['name']}...")
+
+            # Generate page
+            page = await self.orchestrator.generate_page(authority, incremental=self.incremental)
+
+            if page.get('status') == 'failed':
+                raise RuntimeError(page.get('error', 'page generation failed'))
+
+            # Track results
+            metadata = page.get('metadata', {})
+            page_cost = metadata.get('generation_cost', 0)
+            skipped = page.get('status') == 'skipped'
+            self.total_cost += page_cost
+            self.processed_count += 1
+
+            result = {
+                "authority_id": authority['id'],
+                "authority_name": authority['name'],
+                "status": "success",
+                "skipped": skipped,
+                "timestamp": datetime.now().isoformat(),
+                "cost": page_cost,
+                "sections_reused": metadata.get('sections_reused', 0),
+                "cost_avoided": metadata.get('cost_avoided', 0),
+                "word_count": metadata.get('total_words', 0),
+                "scraper_used": 'none' if skipped else metadata.get('scraper_used', 'unknown')
+            }
 
-                # Generate page
-                page = await self.orchestrator.generate_page(authority)
+            if skipped:
+                print(f"  ⏭️  {authority['name']} unchanged - skipped (${result['cost_avoided']:.4f} avoided)")
+            else:
+                print(f"  ✅ {authority['name']} completed (${page_cost:.4f}, {result['word_count']} words, "
+                      f"{result['sections_reused']} sections reused)")
 
-                # Track results
-                page_cost = page.get('metadata', {}).get('generation_cost', 0)
-                self.total_cost += page_cost
-                self.processed_count += 1
+            return result
 
-                result = {
-                    "authority_id": authority['id'],
-                    "authority_name": authority['name'],
-                    "status": "success",
-                    "timestamp": datetime.now().isoformat(),
-                    "cost": page_cost,
-                    "word_count": page.get('metadata', {}).get('total_words', 0),
-                    "scraper_used": page.get('metadata', {}).get('scraper_used', 'unknown')
-                }
+        except Exception as e:
+            self.failed_count += 1
 
-                print(f"  ✅ {authority['name']} completed (${page_cost:.4f}, {result['word_count']} words)")
+            print(f"  ❌ {authority['name']} failed: {e}")
 
-                return result
+            return {
+                "authority_id": authority['id'],
+                "authority_name": authority['name'],
+                "status": "error",
+                "error": str(e),
+                "timestamp": datetime.now().isoformat()
+            }
 
-            except Exception as e:
-                self.failed_count += 1
+    async def _record_result(self, result: Dict):
+        """Record a finished authority and checkpoint immediately"""
 
-                print(f"  ❌ {authority['name']} failed: {e}")
+        self.results.append(result)
+        if result.get('status') == 'success':
+            self.completed_ids.add(result['authority_id'])
 
-                return {
-                    "authority_id": authority['id'],
-                    "authority_name": authority['name'],
-                    "status": "error",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat()
-                }
+        async with self._checkpoint_lock:
+            await self._save_checkpoint()
 
     def _print_progress_update(self):
         """Print progress update"""
@@ -241,6 +322,15 @@ class BatchProcessor:
                 "total_words": sum(r.get('word_count', 0) for r in successful),
                 "avg_words_per_page": sum(r.get('word_count', 0) for r in successful) / len(successful) if successful else 0
             },
+            "incremental": {
+                "enabled": self.incremental,
+                "pages_skipped": sum(1 for r in successful if r.get('skipped')),
+                "pages_generated": sum(1 for r in successful if not r.get('skipped')),
+                "sections_reused": sum(r.get('sections_reused', 0) for r in successful),
+                "cost_avoided": sum(r.get('cost_avoided', 0) for r in successful)
+            },
+            "indexing": self.indexing_stats,
+            "browser_pool": self.browser_pool_stats,
             "scraper_usage": {
                 "playwright": sum(1 for r in successful if r.get('scraper_used') == 'Playwright'),
                 "firecrawl": sum(1 for r in successful if r.get('scraper_used') == 'Firecrawl')
@@ -261,6 +351,7 @@ class BatchProcessor:
             "processed_count": self.processed_count,
             "failed_count": self.failed_count,
             "total_cost": self.total_cost,
+            "completed_ids": sorted(self.completed_ids),
             "results": self.results,
             "timestamp": datetime.now().isoformat()
         }
@@ -268,8 +359,11 @@ class BatchProcessor:
         checkpoint_file = f"{self.output_dir}/checkpoint.json"
         os.makedirs(self.output_dir, exist_ok=True)
 
-        with open(checkpoint_file, 'w') as f:
+        # Write-then-rename so a crash mid-write never corrupts the checkpoint
+        tmp_file = f"{checkpoint_file}.tmp"
+        with open(tmp_file, 'w') as f:
             json.dump(checkpoint, f, indent=2)
+        os.replace(tmp_file, checkpoint_file)
 
     async def _save_summary(self, summary: Dict):
         """Save final summary"""
@@ -289,6 +383,10 @@ class BatchProcessor:
         print(f"Success rate: {summary['statistics']['success_rate']:.1f}%")
         print(f"Total cost: ${summary['costs']['total_cost']:.2f}")
         print(f"Avg cost/page: ${summary['costs']['avg_cost_per_page']:.4f}")
+        if summary['incremental']['enabled']:
+            print(f"Pages skipped (unchanged): {summary['incremental']['pages_skipped']}")
+            print(f"Sections reused: {summary['incremental']['sections_reused']}")
+            print(f"Cost avoided: ${summary['incremental']['cost_avoided']:.2f}")
         print(f"Total time: {summary['batch_info']['elapsed_hours']:.2f} hours")
         print(f"Avg time/page: {summary['performance']['avg_time_per_page']:.1f} seconds")
         print(f"Summary saved to: {summary_file}")
@@ -310,14 +408,17 @@ class BatchProcessor:
         print(f"  Previous processed: {checkpoint['processed_count']}")
         print(f"  Previous cost: ${checkpoint['total_cost']:.2f}")
 
-        # Restore state
-        self.results = checkpoint['results']
-        self.processed_count = checkpoint['processed_count']
-        self.failed_count = checkpoint['failed_count']
+        # Restore state - only successful authorities are skipped, failures are retried
+        self.results = [r for r in checkpoint['results'] if r.get('status') == 'success']
+        self.completed_ids = set(
+            checkpoint.get('completed_ids') or [r['authority_id'] for r in self.results]
+        )
+        self.processed_count = len(self.results)
+        self.failed_count = 0
         self.total_cost = checkpoint['total_cost']
 
-        # Resume from where we left off
-        return await self.process_all_authorities(start_from=self.processed_count)
+        # Resume with exactly the authorities that have not completed yet
+        return await self.process_all_authorities()
 
 
 # CLI for batch processing
@@ -333,6 +434,7 @@ async def main():
     parser.add_argument('--max-cost', type=float, help='Maximum total cost')
     parser.add_argument('--start-from', type=int, default=0, help='Start from authority index')
     parser.add_argument('--resume', action='store_true', help='Resume from checkpoint')
+    parser.add_argument('--full', action='store_true', help='Regenerate every page, ignoring input fingerprints')
     parser.add_argument('--es-host', type=str, default='localhost:9200', help='Elasticsearch host')
 
     args = parser.parse_args()
@@ -342,6 +444,8 @@ async def main():
 
     # Create processor
     processor = BatchProcessor(es)
+    if args.full:
+        processor.incremental = False
 
     # Run batch
     if args.resume:
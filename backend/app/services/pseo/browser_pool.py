@@ -0,0 +1,188 @@
+"""
+Shared Playwright Browser Pool
+A fixed number of Chromium processes with recycled contexts, heavy-resource
+blocking and per-domain politeness limits for batch scraping
+"""
+
+from typing import Dict, List, Optional
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+import asyncio
+import os
+import time
+
+
+# Resource types that never affect the text we extract
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+
+# Analytics/tracking hosts blocked on every page
+BLOCKED_HOST_FRAGMENTS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'facebook.net', 'hotjar.com', 'clarity.ms',
+    'siteimprove', 'newrelic.com', 'nr-data.net', 'cookiebot.com',
+    'addthis.com', 'twitter.com/i/', 'youtube.com/embed'
+)
+
+
+class DomainPoliteness:
+    """Per-domain concurrency cap plus a minimum delay between requests"""
+
+    def __init__(self, max_concurrent: int, min_interval: float):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._last_request: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        domain = urlparse(url).netloc.lower()
+        semaphore = self._semaphores.setdefault(domain, asyncio.Semaphore(self.max_concurrent))
+        lock = self._locks.setdefault(domain, asyncio.Lock())
+
+        async with semaphore:
+            # Space out request starts for the same domain
+            async with lock:
+                wait = self._last_request.get(domain, 0) + self.min_interval - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._last_request[domain] = time.monotonic()
+            yield
+
+
+class BrowserPool:
+    """
+    Fixed pool of Chromium browsers shared by all PlaywrightScraper instances.
+
+    Contexts are handed out round-robin across browsers, reused (cookies
+    cleared) between authorities and recycled after `max_context_uses` to
+    keep memory bounded.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        contexts_per_browser: Optional[int] = None,
+        max_context_uses: Optional[int] = None,
+        block_resources: bool = True
+    ):
+        self.size = size or int(os.getenv('PSEO_BROWSER_POOL_SIZE', '2'))
+        self.contexts_per_browser = contexts_per_browser or int(os.getenv('PSEO_CONTEXTS_PER_BROWSER', '4'))
+        self.max_context_uses = max_context_uses or int(os.getenv('PSEO_CONTEXT_MAX_USES', '20'))
+        self.block_resources = block_resources
+
+        self.politeness = DomainPoliteness(
+            max_concurrent=int(os.getenv('PSEO_DOMAIN_CONCURRENCY', '2')),
+            min_interval=float(os.getenv('PSEO_DOMAIN_DELAY_MS', '500')) / 1000
+        )
+
+        self.browser_config = {
+            "headless": os.getenv('PSEO_PLAYWRIGHT_HEADLESS', 'true').lower() == 'true',
+            "args": [
+                "--no-sandbox",
+                "--disable-setuid-sandbox",
+                "--disable-dev-shm-usage",
+                "--disable-gpu"
+            ]
+        }
+        self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+        self._playwright = None
+        self._browsers: List = []
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._next_browser = 0
+        self._start_lock = asyncio.Lock()
+        self.stats = {"contexts_created": 0, "contexts_reused": 0, "requests_blocked": 0}
+
+    async def start(self):
+        """Launch the browsers (idempotent)"""
+        async with self._start_lock:
+            if self._playwright is not None:
+                return
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+            self._browsers = [
+                await self._playwright.chromium.launch(**self.browser_config)
+                for _ in range(self.size)
+            ]
+            self._slots = asyncio.Semaphore(self.size * self.contexts_per_browser)
+
+    async def close(self):
+        """Close every context, browser and the Playwright driver"""
+        while not self._idle.empty():
+            context, _ = self._idle.get_nowait()
+            await self._safe_close(context)
+        for browser in self._browsers:
+            await self._safe_close(browser)
+        self._browsers = []
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    @asynccontextmanager
+    async def context(self):
+        """Borrow a browser context for one authority"""
+        await self.start()
+
+        async with self._slots:
+            context, uses = await self._acquire()
+            healthy = True
+            try:
+                yield context
+            except Exception:
+                healthy = False
+                raise
+            finally:
+                await self._release(context, uses + 1, healthy)
+
+    async def _acquire(self):
+        if not self._idle.empty():
+            self.stats["contexts_reused"] += 1
+            return self._idle.get_nowait()
+
+        browser = self._browsers[self._next_browser % len(self._browsers)]
+        self._next_browser += 1
+
+        context = await browser.new_context(user_agent=self.user_agent)
+        if self.block_resources:
+            await context.route("**/*", self._route)
+        self.stats["contexts_created"] += 1
+        return context, 0
+
+    async def _release(self, context, uses: int, healthy: bool):
+        if not healthy or uses >= self.max_context_uses:
+            await self._safe_close(context)
+            return
+        try:
+            for page in context.pages:
+                await page.close()
+            await context.clear_cookies()
+        except Exception:
+            await self._safe_close(context)
+            return
+        self._idle.put_nowait((context, uses))
+
+    async def _route(self, route):
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+            fragment in request.url for fragment in BLOCKED_HOST_FRAGMENTS
+        ):
+            self.stats["requests_blocked"] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _safe_close(self, closeable):
+        try:
+            await closeable.close()
+        except Exception:
+            pass
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            "browsers": len(self._browsers),
+            "idle_contexts": self._idle.qsize()
+        }
@@ -0,0 +1,259 @@
+"""
+Bulk Indexing for pSEO Pages
+Streams pages into Elasticsearch through the bulk API: lazy file reading,
+byte-size chunking, concurrent requests and per-item error reporting.
+BulkPageWriter batches orchestrator saves in the background.
+"""
+
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from datetime import datetime
+from pathlib import Path
+import asyncio
+import json
+import os
+import time
+
+
+PSEO_INDEX = "pseo_pages"
+
+# (document id, serialized action line + source line)
+SerializedAction = Tuple[str, str]
+
+
+def iter_page_files(source_dir: str) -> Iterator[Dict]:
+    """Lazily load generated pages, skipping checkpoints, reports and failed stubs"""
+    for path in sorted(Path(source_dir).glob("*.json")):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                page = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"  ⚠ Unreadable page file {path.name}: {e}")
+            continue
+
+        if not isinstance(page, dict) or not page.get('authority_id') or not page.get('url_slug'):
+            continue
+        if page.get('status') == 'failed':
+            continue
+        yield page
+
+
+def serialize_page(page: Dict, index: str = PSEO_INDEX) -> SerializedAction:
+    """Serialize one page as an NDJSON index action (done once, reused for sizing)"""
+    doc_id = str(page['authority_id'])
+    action = json.dumps({"index": {"_index": index, "_id": doc_id}}, separators=(',', ':'))
+    source = json.dumps(page, ensure_ascii=False, separators=(',', ':'), default=str)
+    return doc_id, f"{action}\n{source}\n"
+
+
+class ActionChunker:
+    """Group serialized actions into chunks bounded by bytes and document count"""
+
+    def __init__(self, max_chunk_bytes: int, max_chunk_docs: int):
+        self.max_chunk_bytes = max_chunk_bytes
+        self.max_chunk_docs = max_chunk_docs
+        self._chunk: List[SerializedAction] = []
+        self._size = 0
+
+    def add(self, action: SerializedAction) -> Optional[List[SerializedAction]]:
+        """Add an action; returns the previous chunk when this one would overflow it"""
+        payload_size = len(action[1].encode('utf-8'))
+        full = None
+        if self._chunk and (self._size + payload_size > self.max_chunk_bytes
+                            or len(self._chunk) >= self.max_chunk_docs):
+            full = self.flush()
+        self._chunk.append(action)
+        self._size += payload_size
+        return full
+
+    def flush(self) -> Optional[List[SerializedAction]]:
+        chunk, self._chunk, self._size = self._chunk, [], 0
+        return chunk or None
+
+
+class BulkReport:
+    """Accumulated outcome of a bulk import"""
+
+    def __init__(self):
+        self.indexed = 0
+        self.failed = 0
+        self.chunks = 0
+        self.bytes_sent = 0
+        self.errors: List[Dict] = []
+        self.started = time.perf_counter()
+
+    def to_dict(self) -> Dict:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "indexed": self.indexed,
+            "failed": self.failed,
+            "chunks": self.chunks,
+            "bytes_sent": self.bytes_sent,
+            "elapsed_seconds": elapsed,
+            "docs_per_second": self.indexed / elapsed if elapsed > 0 else 0,
+            "errors": self.errors
+        }
+
+
+async def send_chunk(es_client, chunk: List[SerializedAction], report: BulkReport):
+    """Send one bulk request and record per-item results"""
+    body = "".join(payload for _, payload in chunk)
+    report.chunks += 1
+    report.bytes_sent += len(body.encode('utf-8'))
+
+    try:
+        response = await es_client.bulk(operations=body)
+    except Exception as e:
+        # Whole request failed - every item in it failed
+        report.failed += len(chunk)
+        report.errors.extend({"id": doc_id, "status": None, "error": str(e)} for doc_id, _ in chunk)
+        return
+
+    for (doc_id, _), item in zip(chunk, response.get('items', [])):
+        result = item.get('index', {})
+        if result.get('status', 500) < 300:
+            report.indexed += 1
+        else:
+            report.failed += 1
+            report.errors.append({
+                "id": doc_id,
+                "status": result.get('status'),
+                "error": result.get('error')
+            })
+
+
+async def bulk_index_pages(
+    es_client,
+    pages: Union[Iterable[Dict], AsyncIterator[Dict]],
+    index: str = PSEO_INDEX,
+    max_chunk_bytes: Optional[int] = None,
+    max_chunk_docs: Optional[int] = None,
+    concurrency: Optional[int] = None
+) -> Dict:
+    """
+    Stream pages into Elasticsearch with concurrent bulk requests.
+
+    Args:
+        es_client: AsyncElasticsearch client
+        pages: Pages to index (consumed lazily)
+        index: Target index
+        max_chunk_bytes: Max NDJSON bytes per bulk request
+        max_chunk_docs: Max documents per bulk request
+        concurrency: Max bulk requests in flight
+
+    Returns:
+        Report with indexed/failed counts and per-item errors
+    """
+    max_chunk_bytes = max_chunk_bytes or int(os.getenv('PSEO_BULK_CHUNK_BYTES', str(5 * 1024 * 1024)))
+    max_chunk_docs = max_chunk_docs or int(os.getenv('PSEO_BULK_CHUNK_DOCS', '500'))
+    concurrency = concurrency or int(os.getenv('PSEO_BULK_CONCURRENCY', '4'))
+
+    report = BulkReport()
+    in_flight: set = set()
+
+    async def submit(chunk: List[SerializedAction]):
+        # Backpressure: never hold more than `concurrency` chunks in memory
+        while len(in_flight) >= concurrency:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            in_flight.difference_update(done)
+        in_flight.add(asyncio.create_task(send_chunk(es_client, chunk, report)))
+
+    chunker = ActionChunker(max_chunk_bytes, max_chunk_docs)
+
+    async def add(page: Dict):
+        chunk = chunker.add(serialize_page(page, index))
+        if chunk:
+            await submit(chunk)
+
+    if hasattr(pages, '__aiter__'):
+        async for page in pages:
+            await add(page)
+    else:
+        for page in pages:
+            await add(page)
+
+    last = chunker.flush()
+    if last:
+        await submit(last)
+
+    if in_flight:
+        await asyncio.gather(*in_flight)
+
+    return report.to_dict()
+
+
+class BulkPageWriter:
+    """
+    Background bulk writer for generated pages.
+
+    submit() never waits on Elasticsearch: pages are queued and flushed in
+    bulk when `batch_size` pages are pending or `flush_interval` elapses.
+    """
+
+    def __init__(
+        self,
+        es_client,
+        index: str = PSEO_INDEX,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None
+    ):
+        self.es = es_client
+        self.index = index
+        self.batch_size = batch_size or int(os.getenv('PSEO_BULK_WRITER_BATCH', '20'))
+        self.flush_interval = flush_interval or float(os.getenv('PSEO_BULK_WRITER_INTERVAL', '5'))
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"submitted": 0, "indexed": 0, "failed": 0, "flushes": 0, "errors": []}
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def submit(self, page: Dict):
+        """Queue a page for indexing (non-blocking)"""
+        self.stats["submitted"] += 1
+        self._queue.put_nowait(page)
+
+    async def close(self) -> Dict:
+        """Flush everything still queued and stop the writer"""
+        if self._task is not None:
+            self._queue.put_nowait(None)
+            await self._task
+            self._task = None
+        return self.get_stats()
+
+    async def _run(self):
+        while True:
+            batch: List[Dict] = []
+            closing = False
+            deadline = asyncio.get_running_loop().time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    page = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if page is None:
+                    closing = True
+                    break
+                batch.append(page)
+
+            if batch:
+                await self._flush(batch)
+            if closing:
+                return
+
+    async def _flush(self, batch: List[Dict]):
+        report = await bulk_index_pages(self.es, batch, index=self.index, concurrency=1)
+        self.stats["flushes"] += 1
+        self.stats["indexed"] += report["indexed"]
+        self.stats["failed"] += report["failed"]
+        self.stats["errors"].extend(report["errors"])
+
+        print(f"  ✓ Bulk indexed {report['indexed']} pages"
+              + (f" ({report['failed']} failed)" if report['failed'] else ""))
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, "pending": self._queue.qsize(), "timestamp": datetime.now().isoformat()}
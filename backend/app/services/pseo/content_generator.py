@@ -5,11 +5,20 @@ Cost: ~$0.20 per page (6 AI-generated sections)
 """
 
 from typing import Dict, List, Optional
-import anthropic
+from contextvars import ContextVar
 import os
 from datetime import datetime
 import json
 
+from app.services.llm_cache import get_llm_cache, make_cache_key
+
+
+# Bump whenever a prompt template changes so stored sections are regenerated
+PROMPT_TEMPLATE_VERSION = "2025.10.1"
+
+# Cost accumulator for the section currently being generated (per asyncio task)
+_section_cost: ContextVar[Optional[List[float]]] = ContextVar('_section_cost', default=None)
+
 
 class ContentGenerator:
     """
@@ -18,6 +27,8 @@ class ContentGenerator:
     """
 
     def __init__(self):
+        import anthropic
+
         # Check for z.ai proxy or direct Anthropic
         self.base_url = os.getenv('ANTHROPIC_BASE_URL')
         self.auth_token = os.getenv('ANTHROPIC_AUTH_TOKEN')
@@ -37,6 +48,7 @@ class ContentGenerator:
             raise ValueError("Either ANTHROPIC_API_KEY or (ANTHROPIC_BASE_URL + ANTHROPIC_AUTH_TOKEN) must be set")
 
         self.model = "claude-sonnet-4-5-20250929"
+        self.prompt_version = PROMPT_TEMPLATE_VERSION
 
         # Token limits and costs
         self.max_tokens_per_section = {
@@ -53,6 +65,10 @@ class ContentGenerator:
         self.total_output_tokens = 0
         self.total_cost = 0.0
 
+        # Identical prompts (re-runs, unchanged authorities) are served from
+        # the shared LLM response cache
+        self.response_cache = get_llm_cache()
+
     async def generate_all_sections(
         self,
         authority: Dict,
@@ -60,25 +76,40 @@ class ContentGenerator:
         trends: Dict,
         scraped: Dict,
         external: Dict = None,
-        comparative: Dict = None
+        comparative: Dict = None,
+        reuse: Optional[Dict[str, str]] = None
     ) -> Dict:
         """
         Generate all AI content sections for an authority page.
 
+        Args:
+            reuse: Previously generated section text to keep instead of
+                   calling the model (section name -> text)
+
         Returns:
             Dict with all generated content sections
         """
 
+        reuse = reuse or {}
         generated = {}
+        section_costs = {}
+
+        async def section(name: str, generate, *args) -> None:
+            if name in reuse:
+                generated[name] = reuse[name]
+                return
+            token = _section_cost.set([])
+            try:
+                generated[name] = await generate(*args)
+                section_costs[name] = sum(_section_cost.get())
+            finally:
+                _section_cost.reset(token)
 
         # Generate each section
-        generated['introduction'] = await self.generate_introduction(
-            authority, metrics, scraped, external or {}
-        )
+        await section('introduction', self.generate_introduction,
+                      authority, metrics, scraped, external or {})
 
-        generated['data_insights'] = await self.generate_data_insights(
-            metrics, trends
-        )
+        await section('data_insights', self.generate_data_insights, metrics, trends)
 
         # Ensure local_plan and policies are dicts before passing
         local_plan = scraped.get('local_plan', {})
@@ -86,30 +117,27 @@ class ContentGenerator:
         policies = scraped.get('policies', {})
         policies = policies if isinstance(policies, dict) else {}
 
-        generated['policy_summary'] = await self.generate_policy_summary(
-            authority, local_plan, policies
-        )
+        await section('policy_summary', self.generate_policy_summary,
+                      authority, local_plan, policies)
 
         if comparative:
-            generated['comparative_analysis'] = await self.generate_comparative_analysis(
-                authority, metrics, comparative
-            )
+            await section('comparative_analysis', self.generate_comparative_analysis,
+                          authority, metrics, comparative)
 
-        generated['faq'] = await self.generate_faq(
-            authority, metrics, scraped
-        )
+        await section('faq', self.generate_faq, authority, metrics, scraped)
 
-        generated['future_outlook'] = await self.generate_future_outlook(
-            authority, trends, scraped
-        )
+        await section('future_outlook', self.generate_future_outlook,
+                      authority, trends, scraped)
 
-        # Calculate total cost for this page
-        page_cost = self._calculate_page_cost()
+        # Cost for this page only (self.total_cost accumulates across pages)
         generated['_metadata'] = {
             'generated_at': datetime.now().isoformat(),
             'total_words': self._count_total_words(generated),
-            'cost': page_cost,
-            'model': self.model
+            'cost': sum(section_costs.values()),
+            'section_costs': section_costs,
+            'sections_reused': sorted(name for name in reuse if name in generated),
+            'model': self.model,
+            'prompt_version': self.prompt_version
         }
 
         return generated
@@ -199,15 +227,7 @@ REQUIREMENTS:
 LENGTH: Exactly 900-1,100 words.
 FORMAT: Plain text with paragraph breaks between sections."""
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=self.max_tokens_per_section['introduction'],
-            temperature=0.7,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        self._track_usage(response.usage)
-        return response.content[0].text
+        return await self._complete('introduction', prompt, temperature=0.7)
 
     async def generate_data_insights(self, metrics: Dict, trends: Dict) -> str:
         """Generate 400-500 word data analysis insights"""
@@ -277,15 +297,7 @@ REQUIREMENTS:
 LENGTH: 400-500 words
 FORMAT: Flowing paragraphs with clear topic transitions"""
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=self.max_tokens_per_section['data_insights'],
-            temperature=0.6,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        self._track_usage(response.usage)
-        return response.content[0].text
+        return await self._complete('data_insights', prompt, temperature=0.6)
 
     async def generate_policy_summary(
         self,
@@ -366,15 +378,7 @@ REQUIREMENTS:
 LENGTH: 600-800 words
 FORMAT: Clear paragraphs with logical flow"""
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=self.max_tokens_per_section['policy_summary'],
-            temperature=0.6,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        self._track_usage(response.usage)
-        return response.content[0].text
+        return await self._complete('policy_summary', prompt, temperature=0.6)
 
     async def generate_comparative_analysis(
         self,
@@ -446,15 +450,7 @@ REQUIREMENTS:
 
 LENGTH: 500-600 words"""
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=self.max_tokens_per_section['comparative_analysis'],
-            temperature=0.6,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        self._track_usage(response.usage)
-        return response.content[0].text
+        return await self._complete('comparative_analysis', prompt, temperature=0.6)
 
     async def generate_faq(
         self,
@@ -509,15 +505,7 @@ A: Based on the last 12 months of data, planning applications in {authority['nam
 
 GENERATE ALL 15-18 Q&A PAIRS NOW:"""
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=self.max_tokens_per_section['faq'],
-            temperature=0.7,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        self._track_usage(response.usage)
-        return response.content[0].text
+        return await self._complete('faq', prompt, temperature=0.7)
 
     async def generate_future_outlook(
         self,
@@ -581,15 +569,33 @@ REQUIREMENTS:
 LENGTH: 500-600 words
 FORMAT: Forward-looking analytical narrative"""
 
+        return await self._complete('future_outlook', prompt, temperature=0.7)
+
+    async def _complete(self, section: str, prompt: str, temperature: float) -> str:
+        """Generate one section, via the shared response cache"""
+        max_tokens = self.max_tokens_per_section[section]
+        messages = [{"role": "user", "content": prompt}]
+        cache_key = make_cache_key(self.model, messages, max_tokens=max_tokens, temperature=temperature)
+
+        cached = await self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached["content"]
+
         response = self.client.messages.create(
             model=self.model,
-            max_tokens=self.max_tokens_per_section['future_outlook'],
-            temperature=0.7,
-            messages=[{"role": "user", "content": prompt}]
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=messages
         )
 
-        self._track_usage(response.usage)
-        return response.content[0].text
+        cost = self._track_usage(response.usage)
+        text = response.content[0].text
+        await self.response_cache.set(cache_key, {
+            "content": text,
+            "tokens_used": response.usage.input_tokens + response.usage.output_tokens,
+            "cost_usd": cost
+        })
+        return text
 
     # Helper methods for formatting data
 
@@ -640,8 +646,8 @@ FORMAT: Forward-looking analytical narrative"""
             return "No recent data"
         return "; ".join([f"{m.get('month', 'Unknown')}: {m.get('total_applications', 0)} apps" for m in months])
 
-    def _track_usage(self, usage):
-        """Track API usage and costs"""
+    def _track_usage(self, usage) -> float:
+        """Track API usage and costs; returns the cost of this call"""
         self.total_input_tokens += usage.input_tokens
         self.total_output_tokens += usage.output_tokens
 
@@ -654,6 +660,12 @@ FORMAT: Forward-looking analytical narrative"""
 
         self.total_cost += (input_cost + output_cost)
 
+        bucket = _section_cost.get()
+        if bucket is not None:
+            bucket.append(input_cost + output_cost)
+
+        return input_cost + output_cost
+
     def _calculate_page_cost(self) -> float:
         """Calculate total cost for current page"""
         return self.total_cost
@@ -672,7 +684,8 @@ FORMAT: Forward-looking analytical narrative"""
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
             "total_cost": round(self.total_cost, 4),
-            "avg_cost_per_page": round(self.total_cost, 4) if self.total_cost > 0 else 0
+            "avg_cost_per_page": round(self.total_cost, 4) if self.total_cost > 0 else 0,
+            "cache": self.response_cache.get_stats()
         }
 
     def reset_usage(self):
@@ -1,13 +1,181 @@
 """
 Context7 Service for Industry-Specific Planning Context
 FREE tier: 50 queries/day, no API key needed
+
+All calls go through a pooled async HTTP client with a concurrency cap.
+Successful responses land in a process-wide TTL cache (a byte-bounded
+in-memory LRU over SQLite), so they survive across authorities, orchestrator
+instances and runs, and identical in-flight queries share a single request.
 """
 
-from typing import Dict, List, Optional
-import requests
+from typing import Awaitable, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import json
 import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 
+import httpx
+
+
+class Context7Cache:
+    """
+    TTL cache shared by every Context7Service in the process.
+
+    Hot entries live in an LRU bounded by CONTEXT7_CACHE_MAX_BYTES; all
+    entries are persisted to SQLite so a new run (or another worker on the
+    same host) starts warm.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        self.path = path or os.getenv('CONTEXT7_CACHE_PATH', './outputs/pseo/context7_cache.sqlite')
+        self.ttl_seconds = ttl_seconds or int(os.getenv('CONTEXT7_CACHE_TTL_HOURS', '168')) * 3600
+        self.max_bytes = max_bytes or int(os.getenv('CONTEXT7_CACHE_MAX_BYTES', str(8 * 1024 * 1024)))
+        # key -> (size, expires_at, value), least recently used first
+        self._memory: "OrderedDict[str, Tuple[int, float, Dict]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS context7_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+        return self._db
+
+    def _db_get(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._db_lock:
+            row = self._connect().execute(
+                "SELECT value, expires_at FROM context7_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def _db_set(self, key: str, value: str, expires_at: float):
+        with self._db_lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO context7_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at)
+            )
+            db.commit()
+
+    def _remember(self, key: str, value: Dict, size: int, expires_at: float):
+        if size > self.max_bytes:
+            return
+        self._forget(key)
+        self._memory[key] = (size, expires_at, value)
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_bytes:
+            _, (evicted_size, _, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted_size
+
+    def _forget(self, key: str):
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry[0]
+
+    async def get(self, key: str) -> Optional[Dict]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            if entry[1] > time.time():
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self._forget(key)
+
+        try:
+            row = await asyncio.to_thread(self._db_get, key)
+        except sqlite3.Error as e:
+            print(f"Context7 cache read failed: {e}")
+            row = None
+        if row is not None:
+            raw, expires_at = row
+            value = json.loads(raw)
+            self._remember(key, value, len(raw), expires_at)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Dict):
+        raw = json.dumps(value, default=str)
+        expires_at = time.time() + self.ttl_seconds
+        self._remember(key, value, len(raw), expires_at)
+        try:
+            await asyncio.to_thread(self._db_set, key, raw, expires_at)
+        except sqlite3.Error as e:
+            print(f"Context7 cache write failed: {e}")
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+
+# Process-wide state shared by all Context7Service instances
+_shared_cache: Optional[Context7Cache] = None
+_http_client: Optional["asyncio.Task[httpx.AsyncClient]"] = None
+_http_loop: Optional[asyncio.AbstractEventLoop] = None
+_request_slots: Optional[asyncio.Semaphore] = None
+_in_flight: Dict[str, asyncio.Future] = {}
+
+
+def get_context7_cache() -> Context7Cache:
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = Context7Cache()
+    return _shared_cache
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(float(os.getenv('CONTEXT7_TIMEOUT', '10'))),
+        limits=httpx.Limits(
+            max_connections=int(os.getenv('CONTEXT7_MAX_CONNECTIONS', '10')),
+            max_keepalive_connections=5
+        )
+    )
+
+
+async def _get_http_client() -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    """Pooled keep-alive client (one per event loop)"""
+    global _http_client, _http_loop, _request_slots
+
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_loop is not loop:
+        # Building the client loads the SSL context (~200ms), so do it off the loop
+        _http_client = loop.create_task(asyncio.to_thread(_build_http_client))
+        _http_loop = loop
+        _request_slots = asyncio.Semaphore(int(os.getenv('CONTEXT7_MAX_CONCURRENT', '4')))
+        _in_flight.clear()
+
+    return await asyncio.shield(_http_client), _request_slots
+
+
+async def close_context7_client():
+    """Close the shared HTTP client (call on shutdown)"""
+    global _http_client
+    if _http_client is not None and _http_loop is asyncio.get_running_loop():
+        client = await _http_client
+        await client.aclose()
+    _http_client = None
+
 
 class Context7Service:
     """
@@ -18,14 +186,61 @@ class Context7Service:
 
     def __init__(self):
         self.api_key = os.getenv('CONTEXT7_API_KEY')  # Optional
-        self.base_url = "https://api.context7.com/v1"
+        self.base_url = os.getenv('CONTEXT7_BASE_URL', "https://api.context7.com/v1")
 
         # Free tier: No auth needed for public docs
         self.headers = {}
         if self.api_key:
             self.headers = {"Authorization": f"Bearer {self.api_key}"}
 
-        self.cache = {}  # Simple in-memory cache
+        self.cache = get_context7_cache()  # Shared across instances
+        self.api_calls = 0
+        self.deduplicated = 0
+
+    async def _query(self, path: str, payload: Dict, cache_key: Tuple) -> Optional[Dict]:
+        """
+        POST to Context7 through the shared cache, in-flight deduplication
+        and pooled client. Returns None on any failure (callers fall back).
+        """
+
+        key = hashlib.sha256(json.dumps([path, *cache_key], default=str).encode('utf-8')).hexdigest()
+
+        pending = _in_flight.get(key)
+        if pending is not None:
+            self.deduplicated += 1
+            return await asyncio.shield(pending)
+
+        # Registered before the (possibly disk) cache lookup so concurrent
+        # callers wait on this query instead of racing it to the API
+        future = asyncio.get_running_loop().create_future()
+        _in_flight[key] = future
+        try:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                future.set_result(cached)
+                return cached
+
+            data = await self._post(path, payload)
+            if data is not None:
+                await self.cache.set(key, data)
+            future.set_result(data)
+            return data
+        except BaseException:
+            # Waiters fall back to generic context, like the caller does
+            future.set_result(None)
+            raise
+        finally:
+            _in_flight.pop(key, None)
+
+    async def _post(self, path: str, payload: Dict) -> Optional[Dict]:
+        client, slots = await _get_http_client()
+        async with slots:
+            self.api_calls += 1
+            response = await client.post(f"{self.base_url}{path}", headers=self.headers, json=payload)
+
+        if response.status_code == 200:
+            return response.json()
+        return None
 
     async def get_planning_policy_context(self, authority_name: str, topic: str) -> Dict:
         """
@@ -39,29 +254,23 @@ class Context7Service:
             Dict with context, definitions, and relevant information
         """
 
-        cache_key = f"{authority_name}_{topic}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-
         query = f"{authority_name} planning {topic}"
 
         try:
             # Context7 provides up-to-date planning documentation context
-            response = requests.post(
-                f"{self.base_url}/context",
-                headers=self.headers,
-                json={
+            data = await self._query(
+                "/context",
+                {
                     "query": query,
                     "domain": "uk_planning",  # Specify UK planning domain
                     "include_sources": True,
                     "max_results": 5
                 },
-                timeout=10
+                cache_key=(authority_name, topic)
             )
 
-            if response.status_code == 200:
-                data = response.json()
-                result = {
+            if data is not None:
+                return {
                     "topic": topic,
                     "context": data.get('context', ''),
                     "definitions": data.get('definitions', []),
@@ -69,12 +278,8 @@ class Context7Service:
                     "retrieved_at": datetime.now().isoformat()
                 }
 
-                self.cache[cache_key] = result
-                return result
-
-            else:
-                # Fallback to generic context
-                return self._get_generic_planning_context(topic)
+            # Fallback to generic context
+            return self._get_generic_planning_context(topic)
 
         except Exception as e:
             print(f"Context7 error for {query}: {e}")
@@ -89,11 +294,10 @@ class Context7Service:
             "development management policies"
         ]
 
-        contexts = []
-        for topic in topics:
-            context = await self.get_planning_policy_context(authority_name, topic)
-            if context.get('context'):
-                contexts.append(context)
+        results = await asyncio.gather(*(
+            self.get_planning_policy_context(authority_name, topic) for topic in topics
+        ))
+        contexts = [context for context in results if context.get('context')]
 
         return {
             "authority": authority_name,
@@ -107,19 +311,17 @@ class Context7Service:
         query = f"UK planning {app_type} application requirements"
 
         try:
-            response = requests.post(
-                f"{self.base_url}/context",
-                headers=self.headers,
-                json={
+            data = await self._query(
+                "/context",
+                {
                     "query": query,
                     "domain": "uk_planning",
                     "format": "structured"
                 },
-                timeout=10
+                cache_key=("application_type", app_type)
             )
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 return {
                     "application_type": app_type,
                     "requirements": data.get('requirements', []),
@@ -139,19 +341,17 @@ class Context7Service:
         query = f"UK planning policy {policy_name} explanation"
 
         try:
-            response = requests.post(
-                f"{self.base_url}/explain",
-                headers=self.headers,
-                json={
+            data = await self._query(
+                "/explain",
+                {
                     "topic": policy_name,
                     "domain": "uk_planning_law",
                     "detail_level": "comprehensive"
                 },
-                timeout=10
+                cache_key=("policy", policy_name)
             )
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 return {
                     "policy": policy_name,
                     "explanation": data.get('explanation', ''),
@@ -186,27 +386,30 @@ class Context7Service:
             "contexts": {}
         }
 
+        # Independent lookups run concurrently (bounded by the shared client)
+        lookups: Dict[str, Awaitable] = {}
+
         # Get context for local plan
         if scraped_data.get('local_plan'):
-            enriched['contexts']['local_plan'] = await self.get_local_plan_context(
-                authority['name']
-            )
+            lookups['local_plan'] = self.get_local_plan_context(authority['name'])
 
         # Get context for policies
         if scraped_data.get('policies', {}).get('policy_areas'):
-            policy_contexts = []
-            for policy in scraped_data['policies']['policy_areas'][:5]:  # Top 5 policies
-                context = await self.get_policy_explanation(policy['name'])
-                policy_contexts.append(context)
-
-            enriched['contexts']['policies'] = policy_contexts
+            lookups['policies'] = asyncio.gather(*(
+                self.get_policy_explanation(policy['name'])
+                for policy in scraped_data['policies']['policy_areas'][:5]  # Top 5 policies
+            ))
 
         # Add general planning context
-        enriched['contexts']['general'] = await self.get_planning_policy_context(
+        lookups['general'] = self.get_planning_policy_context(
             authority['name'],
             "planning application process"
         )
 
+        results = await asyncio.gather(*lookups.values())
+        for name, result in zip(lookups, results):
+            enriched['contexts'][name] = list(result) if name == 'policies' else result
+
         return enriched
 
     def _get_generic_planning_context(self, topic: str) -> Dict:
@@ -292,6 +495,10 @@ class Context7Service:
 
         return {
             "cached_queries": len(self.cache),
+            "cache_hits": self.cache.hits,
+            "cache_misses": self.cache.misses,
+            "api_calls": self.api_calls,
+            "deduplicated": self.deduplicated,
             "api_key_configured": bool(self.api_key),
             "tier": "Premium" if self.api_key else "Free (50/day)"
         }
@@ -0,0 +1,163 @@
+"""
+Input Fingerprints for Incremental pSEO Regeneration
+Hashes every input that feeds a page so unchanged pages and sections can be reused
+"""
+
+from typing import Any, Dict, Optional
+from datetime import datetime, timedelta
+import hashlib
+import json
+
+
+FINGERPRINT_VERSION = 2
+
+# Which inputs each AI-generated section is built from
+SECTION_INPUTS = {
+    'introduction': ['authority', 'metrics', 'news', 'local_plan', 'external'],
+    'data_insights': ['metrics', 'trends'],
+    'policy_summary': ['authority', 'local_plan', 'policies'],
+    'comparative_analysis': ['authority', 'metrics', 'comparative'],
+    'faq': ['authority', 'metrics'],
+    'future_outlook': ['authority', 'trends', 'local_plan'],
+}
+
+# Where each generated section's text lives in an assembled page
+SECTION_PATHS = {
+    'introduction': ('introduction', 'content'),
+    'data_insights': ('data_dashboard', 'insights'),
+    'policy_summary': ('policy', 'content'),
+    'comparative_analysis': ('comparative', 'content'),
+    'faq': ('faq', 'content'),
+    'future_outlook': ('future_outlook', 'content'),
+}
+
+# Fetch-time stamps added by scrapers and services; they change on every
+# re-scrape without the content changing, so they never count as inputs
+VOLATILE_FIELDS = {'scraped_at', 'retrieved_at', 'generated_at', 'timestamp'}
+
+# Authority fields that reach the prompts
+AUTHORITY_FIELDS = ['id', 'name', 'type', 'region', 'area', 'geographic_type', 'website_url']
+
+
+def strip_volatile(payload: Any) -> Any:
+    """Copy of a JSON-like payload without VOLATILE_FIELDS at any depth"""
+    if isinstance(payload, dict):
+        return {k: strip_volatile(v) for k, v in payload.items() if k not in VOLATILE_FIELDS}
+    if isinstance(payload, (list, tuple)):
+        return [strip_volatile(item) for item in payload]
+    return payload
+
+
+def hash_payload(payload: Any) -> str:
+    """Stable SHA-256 of any JSON-like payload (key order independent)"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def hash_data_inputs(authority: Dict, planning_data: Dict, prompt_version: str) -> str:
+    """
+    Fingerprint everything known before scraping.
+
+    Covers the full Elasticsearch payload (metrics, trends, charts, etc.) so
+    a match means the page can be skipped without scraping or LLM calls.
+    """
+    return hash_payload({
+        'authority': {k: authority.get(k) for k in AUTHORITY_FIELDS},
+        'planning_data': strip_volatile(planning_data),
+        'prompt_version': prompt_version,
+    })
+
+
+def hash_inputs(
+    authority: Dict,
+    planning_data: Dict,
+    scraped: Dict,
+    external: Dict
+) -> Dict[str, str]:
+    """Hash each individual content input (ignoring fetch timestamps)"""
+
+    local_plan = scraped.get('local_plan', {})
+    policies = scraped.get('policies', {})
+
+    inputs = {
+        'authority': {k: authority.get(k) for k in AUTHORITY_FIELDS},
+        'metrics': planning_data.get('core_metrics', {}),
+        'trends': planning_data.get('trends', {}),
+        'comparative': planning_data.get('comparative', {}),
+        'news': scraped.get('news', [])[:10],
+        'local_plan': local_plan if isinstance(local_plan, dict) else {},
+        'policies': policies if isinstance(policies, dict) else {},
+        'external': external or {},
+    }
+    return {name: hash_payload(strip_volatile(value)) for name, value in inputs.items()}
+
+
+def hash_sections(input_hashes: Dict[str, str], prompt_version: str) -> Dict[str, str]:
+    """Combine input hashes into one fingerprint per generated section"""
+    return {
+        section: hash_payload({
+            'inputs': {name: input_hashes.get(name) for name in inputs},
+            'prompt_version': prompt_version,
+        })
+        for section, inputs in SECTION_INPUTS.items()
+    }
+
+
+def get_section_text(page: Dict, section: str) -> Optional[str]:
+    """Read a generated section's text back out of an assembled page"""
+    container, field = SECTION_PATHS[section]
+    value = page.get('sections', {}).get(container, {}).get(field)
+    return value if isinstance(value, str) and value else None
+
+
+def reusable_sections(previous_page: Optional[Dict], section_hashes: Dict[str, str]) -> Dict[str, str]:
+    """
+    Return previously generated section text whose fingerprint is unchanged.
+
+    Args:
+        previous_page: Last stored page for the authority (may be None)
+        section_hashes: Fingerprints computed for the current inputs
+
+    Returns:
+        Mapping of section name to reusable text
+    """
+    if not previous_page:
+        return {}
+
+    previous = previous_page.get('fingerprints', {})
+    if previous.get('version') != FINGERPRINT_VERSION:
+        return {}
+
+    reused = {}
+    for section, fingerprint in section_hashes.items():
+        if previous.get('sections', {}).get(section) != fingerprint:
+            continue
+        text = get_section_text(previous_page, section)
+        if text is not None:
+            reused[section] = text
+    return reused
+
+
+def is_page_unchanged(
+    previous_page: Optional[Dict],
+    data_hash: str,
+    rescrape_after: timedelta
+) -> bool:
+    """
+    True when the previous page was built from identical data inputs and its
+    scraped content is still within the rescrape window.
+    """
+    if not previous_page or previous_page.get('status') == 'failed':
+        return False
+
+    previous = previous_page.get('fingerprints', {})
+    if previous.get('version') != FINGERPRINT_VERSION or previous.get('data') != data_hash:
+        return False
+
+    scraped_at = previous.get('scraped_at')
+    if not scraped_at:
+        return False
+    try:
+        return datetime.now() - datetime.fromisoformat(scraped_at) < rescrape_after
+    except ValueError:
+        return False
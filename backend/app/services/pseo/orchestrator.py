@@ -4,8 +4,10 @@ Orchestrates all services to generate complete pSEO pages
 """
 
 from typing import Dict, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
+from contextlib import asynccontextmanager
 from elasticsearch import AsyncElasticsearch
+import asyncio
 import json
 import os
 
@@ -13,6 +15,15 @@ from .data_pipeline import DataPipeline
 from .scraper_factory import ScraperFactory
 from .context7_service import Context7Service
 from .content_generator import ContentGenerator
+from .bulk_indexer import BulkPageWriter
+from .fingerprint import (
+    FINGERPRINT_VERSION,
+    hash_data_inputs,
+    hash_inputs,
+    hash_sections,
+    is_page_unchanged,
+    reusable_sections
+)
 
 
 class pSEOOrchestrator:
@@ -31,11 +42,43 @@ class pSEOOrchestrator:
         self.output_dir = os.getenv('PSEO_OUTPUT_DIR', './outputs/pseo')
         self.min_word_count = int(os.getenv('PSEO_MIN_WORD_COUNT', '2500'))
         self.max_word_count = int(os.getenv('PSEO_MAX_WORD_COUNT', '3500'))
+        self.rescrape_after = timedelta(days=int(os.getenv('PSEO_RESCRAPE_DAYS', '7')))
+
+        # Optional per-stage concurrency limits ('extract', 'scrape', 'generate')
+        self.stage_limits: Dict[str, asyncio.Semaphore] = {}
+
+        # Optional background bulk writer; pages are indexed one by one without it
+        self.bulk_writer: Optional[BulkPageWriter] = None
+
+    def set_stage_limits(self, limits: Dict[str, int]):
+        """
+        Bound how many pages may be inside each pipeline stage at once.
+
+        Args:
+            limits: Mapping of stage name to max concurrent pages
+                    ('extract' = ES queries, 'scrape' = website scraping,
+                    'generate' = LLM content generation)
+        """
+        self.stage_limits = {
+            stage: asyncio.Semaphore(max(1, limit))
+            for stage, limit in limits.items()
+        }
+
+    @asynccontextmanager
+    async def _stage(self, name: str):
+        """Hold a slot for the given stage if a limit is configured"""
+        semaphore = self.stage_limits.get(name)
+        if semaphore is None:
+            yield
+            return
+        async with semaphore:
+            yield
 
     async def generate_page(
         self,
         authority: Dict,
-        force_scraper: Optional[str] = None
+        force_scraper: Optional[str] = None,
+        incremental: bool = False
     ) -> Dict:
         """
         Generate complete pSEO page for an authority.
@@ -43,9 +86,13 @@ class pSEOOrchestrator:
         Args:
             authority: Authority metadata
             force_scraper: Force specific scraper ('playwright' or 'firecrawl')
+            incremental: Compare input fingerprints with the stored page; skip
+                         the page when nothing changed, otherwise only
+                         regenerate sections whose inputs changed
 
         Returns:
-            Complete page data with all sections
+            Complete page data with all sections ('status' is 'skipped'
+            when the stored page was reused as-is)
         """
 
         print(f"\n{'='*60}")
@@ -61,6 +108,9 @@ class pSEOOrchestrator:
         }
 
         try:
+            previous_page = await self._load_previous_page(authority) if incremental else None
+            prompt_version = self.content_generator.prompt_version
+
             # Step 1: Extract data from Elasticsearch
             print("Step 1: Extracting planning data from Elasticsearch...")
             page_data['generation_log'].append({
@@ -70,12 +120,17 @@ class pSEOOrchestrator:
             })
 
             data_pipeline = DataPipeline(self.es, authority['id'])
-            planning_data = await data_pipeline.extract_all_data(authority)
+            async with self._stage('extract'):
+                planning_data = await data_pipeline.extract_all_data(authority)
 
             print(f"  ✓ Extracted core metrics: {bool(planning_data.get('core_metrics'))}")
             print(f"  ✓ Extracted trends: {bool(planning_data.get('trends'))}")
             print(f"  ✓ Extracted charts: {bool(planning_data.get('charts'))}")
 
+            data_hash = hash_data_inputs(authority, planning_data, prompt_version)
+            if incremental and is_page_unchanged(previous_page, data_hash, self.rescrape_after):
+                return self._skip_page(previous_page)
+
             # Step 2: Scrape authority website
             print("\nStep 2: Scraping authority website...")
             page_data['generation_log'].append({
@@ -88,7 +143,9 @@ class pSEOOrchestrator:
             scraper_type = 'Firecrawl' if 'Firecrawl' in str(type(scraper)) else 'Playwright'
             print(f"  Using {scraper_type} scraper...")
 
-            scraped_data = await scraper.scrape_authority()
+            async with self._stage('scrape'):
+                scraped_data = await scraper.scrape_authority()
+            scraped_at = datetime.now()
 
             print(f"  ✓ Scraped news: {len(scraped_data.get('news', []))} items")
             print(f"  ✓ Scraped local plan: {bool(scraped_data.get('local_plan'))}")
@@ -108,6 +165,12 @@ class pSEOOrchestrator:
 
             print(f"  ✓ Added context for {len(enriched_context.get('contexts', {}))} areas")
 
+            input_hashes = hash_inputs(authority, planning_data, scraped_data, enriched_context)
+            section_hashes = hash_sections(input_hashes, prompt_version)
+            reuse = reusable_sections(previous_page, section_hashes) if incremental else {}
+            if reuse:
+                print(f"  ✓ Reusing unchanged sections: {', '.join(sorted(reuse))}")
+
             # Step 4: Generate AI content with Claude
             print("\nStep 4: Generating AI content with Claude...")
             page_data['generation_log'].append({
@@ -116,14 +179,16 @@ class pSEOOrchestrator:
                 'timestamp': datetime.now().isoformat()
             })
 
-            generated_content = await self.content_generator.generate_all_sections(
-                authority=authority,
-                metrics=planning_data['core_metrics'],
-                trends=planning_data['trends'],
-                scraped=scraped_data,
-                external=enriched_context,
-                comparative=planning_data.get('comparative')
-            )
+            async with self._stage('generate'):
+                generated_content = await self.content_generator.generate_all_sections(
+                    authority=authority,
+                    metrics=planning_data['core_metrics'],
+                    trends=planning_data['trends'],
+                    scraped=scraped_data,
+                    external=enriched_context,
+                    comparative=planning_data.get('comparative'),
+                    reuse=reuse
+                )
 
             print(f"  ✓ Generated introduction: {len(generated_content['introduction'].split())} words")
             print(f"  ✓ Generated data insights: {len(generated_content['data_insights'].split())} words")
@@ -164,13 +229,32 @@ class pSEOOrchestrator:
 
             # Add metadata
             word_count = self._count_total_words(generated_content)
+            generation_meta = generated_content.get('_metadata', {})
+            previous_costs = (previous_page or {}).get('fingerprints', {}).get('section_costs', {})
+            section_costs = dict(generation_meta.get('section_costs', {}))
+            section_costs.update({name: previous_costs.get(name, 0) for name in reuse})
+            cost_avoided = sum(previous_costs.get(name, 0) for name in reuse)
+
             complete_page['metadata'] = {
                 'total_words': word_count,
                 'total_sections': len(complete_page['sections']),
                 'total_visualizations': 8,  # We have 8 chart types
                 'scraper_used': scraper_type,
-                'generation_cost': generated_content.get('_metadata', {}).get('cost', 0),
-                'meets_word_count': self.min_word_count <= word_count <= self.max_word_count
+                'generation_cost': generation_meta.get('cost', 0),
+                'meets_word_count': self.min_word_count <= word_count <= self.max_word_count,
+                'sections_reused': len(reuse),
+                'cost_avoided': cost_avoided
+            }
+
+            # Input fingerprints for the next incremental run
+            complete_page['fingerprints'] = {
+                'version': FINGERPRINT_VERSION,
+                'prompt_version': prompt_version,
+                'data': data_hash,
+                'inputs': input_hashes,
+                'sections': section_hashes,
+                'section_costs': section_costs,
+                'scraped_at': scraped_at.isoformat()
             }
 
             # Step 7: Save page
@@ -200,6 +284,44 @@ class pSEOOrchestrator:
             page_data['status'] = 'failed'
             return page_data
 
+    def _skip_page(self, previous_page: Dict) -> Dict:
+        """Reuse the stored page unchanged (no scraping, no LLM calls)"""
+
+        fingerprints = previous_page.get('fingerprints', {})
+        cost_avoided = sum(fingerprints.get('section_costs', {}).values())
+
+        print(f"  ✓ Inputs unchanged since {previous_page.get('generated_at')} - skipping page")
+
+        page = dict(previous_page)
+        page['status'] = 'skipped'
+        page['metadata'] = {
+            **previous_page.get('metadata', {}),
+            'generation_cost': 0,
+            'sections_reused': len(fingerprints.get('section_costs', {})),
+            'cost_avoided': cost_avoided
+        }
+        return page
+
+    async def _load_previous_page(self, authority: Dict) -> Optional[Dict]:
+        """Load the last stored page for an authority (ES first, then file)"""
+
+        if self.es is not None:
+            try:
+                result = await self.es.get(index="pseo_pages", id=authority['id'])
+                return result['_source']
+            except Exception:
+                pass
+
+        filename = f"{self.output_dir}/{self._create_slug(authority)}.json"
+        if os.path.exists(filename):
+            try:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                return None
+
+        return None
+
     def _assemble_page(
         self,
         authority: Dict,
@@ -402,7 +524,10 @@ class pSEOOrchestrator:
         """Save page to Elasticsearch and file system"""
 
         # Save to Elasticsearch for search (if available)
-        if self.es is not None:
+        if self.bulk_writer is not None:
+            self.bulk_writer.submit(page_data)
+            print(f"  ✓ Queued for bulk indexing")
+        elif self.es is not None:
             try:
                 await self.es.index(
                     index="pseo_pages",
@@ -413,15 +538,17 @@ class pSEOOrchestrator:
             except Exception as e:
                 print(f"  ⚠ ES save failed (will save to file only): {e}")
 
-        # Save to file system (always)
-        os.makedirs(self.output_dir, exist_ok=True)
+        # Save to file system (always) without blocking the event loop
         filename = f"{self.output_dir}/{page_data['url_slug']}.json"
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(page_data, f, indent=2, ensure_ascii=False)
+        await asyncio.to_thread(self._write_page_file, filename, page_data)
 
         print(f"  ✓ Saved to file: {filename}")
 
+    def _write_page_file(self, filename: str, page_data: Dict):
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(page_data, f, ensure_ascii=False, separators=(',', ':'))
+
     def get_generation_stats(self) -> Dict:
         """Get generation statistics"""
 
@@ -17,11 +17,14 @@ class PlaywrightScraper:
     Used for simple, static websites where we can define selectors.
     """
 
-    def __init__(self, authority: Dict):
+    def __init__(self, authority: Dict, browser_pool=None):
         self.authority = authority
         self.base_url = authority.get('website_url', '')
         self.scraped_content: Dict = {}
 
+        # Shared BrowserPool (batch runs); a private browser is launched without one
+        self.browser_pool = browser_pool
+
         # Browser configuration
         self.browser_config = {
             "headless": os.getenv('PSEO_PLAYWRIGHT_HEADLESS', 'true').lower() == 'true',
@@ -57,6 +60,10 @@ class PlaywrightScraper:
     async def scrape_authority(self) -> Dict:
         """Main entry point - scrape all relevant pages"""
 
+        if self.browser_pool is not None:
+            async with self.browser_pool.context() as context:
+                return await self._scrape_sections(context)
+
         async with async_playwright() as p:
             browser = await p.chromium.launch(**self.browser_config)
             context = await browser.new_context(
@@ -64,31 +71,45 @@ class PlaywrightScraper:
             )
 
             try:
-                # Scrape different sections in parallel
-                results = await asyncio.gather(
-                    self._scrape_news(context),
-                    self._scrape_local_plan(context),
-                    self._scrape_policies(context),
-                    self._scrape_committee(context),
-                    return_exceptions=True
-                )
-
-                self.scraped_content = {
-                    'news': results[0] if not isinstance(results[0], Exception) else [],
-                    'local_plan': results[1] if not isinstance(results[1], Exception) else {},
-                    'policies': results[2] if not isinstance(results[2], Exception) else {},
-                    'committee': results[3] if not isinstance(results[3], Exception) else {}
-                }
-
-            except Exception as e:
-                print(f"Error scraping {self.authority['name']}: {e}")
-                self.scraped_content = {'error': str(e)}
-
+                return await self._scrape_sections(context)
             finally:
                 await browser.close()
 
+    async def _scrape_sections(self, context) -> Dict:
+        """Scrape all sections using the given browser context"""
+
+        try:
+            # Scrape different sections in parallel
+            results = await asyncio.gather(
+                self._scrape_news(context),
+                self._scrape_local_plan(context),
+                self._scrape_policies(context),
+                self._scrape_committee(context),
+                return_exceptions=True
+            )
+
+            self.scraped_content = {
+                'news': results[0] if not isinstance(results[0], Exception) else [],
+                'local_plan': results[1] if not isinstance(results[1], Exception) else {},
+                'policies': results[2] if not isinstance(results[2], Exception) else {},
+                'committee': results[3] if not isinstance(results[3], Exception) else {}
+            }
+
+        except Exception as e:
+            print(f"Error scraping {self.authority['name']}: {e}")
+            self.scraped_content = {'error': str(e)}
+
         return self.scraped_content
 
+    async def _goto(self, page, url: str):
+        """Navigate, respecting per-domain politeness limits when pooled"""
+
+        if self.browser_pool is None:
+            return await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
+
+        async with self.browser_pool.politeness.slot(url):
+            return await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
+
     async def _scrape_news(self, context) -> List[Dict]:
         """Scrape planning news and press releases"""
 
@@ -107,7 +128,7 @@ class PlaywrightScraper:
         for path in news_paths:
             try:
                 url = f"{self.base_url}{path}"
-                response = await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
+                response = await self._goto(page, url)
 
                 if response and response.status == 200:
                     # Wait for content to load
@@ -219,7 +240,7 @@ class PlaywrightScraper:
         for path in plan_paths:
             try:
                 url = f"{self.base_url}{path}"
-                response = await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
+                response = await self._goto(page, url)
 
                 if response and response.status == 200:
                     await page.wait_for_load_state('networkidle', timeout=5000)
@@ -290,7 +311,7 @@ class PlaywrightScraper:
         for path in policy_paths:
             try:
                 url = f"{self.base_url}{path}"
-                response = await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
+                response = await self._goto(page, url)
 
                 if response and response.status == 200:
                     await page.wait_for_load_state('networkidle', timeout=5000)
@@ -355,7 +376,7 @@ class PlaywrightScraper:
         for path in committee_paths:
             try:
                 url = f"{self.base_url}{path}"
-                response = await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
+                response = await self._goto(page, url)
 
                 if response and response.status == 200:
                     await page.wait_for_load_state('networkidle', timeout=5000)
@@ -4,8 +4,17 @@ Automatically chooses Playwright (FREE) or Firecrawl (PAID) based on authority c
 """
 
 from typing import Dict, Optional
-from .playwright_scraper import PlaywrightScraper
-from .firecrawl_scraper import FirecrawlScraper
+
+
+# Scraper modules are imported on first use: they load Playwright / Firecrawl
+def _playwright_scraper(authority: Dict, browser_pool=None):
+    from .playwright_scraper import PlaywrightScraper
+    return PlaywrightScraper(authority, browser_pool)
+
+
+def _firecrawl_scraper(authority: Dict):
+    from .firecrawl_scraper import FirecrawlScraper
+    return FirecrawlScraper(authority)
 
 
 class ScraperFactory:
@@ -64,12 +73,15 @@ class ScraperFactory:
         'frequent_updates': 4
     }
 
-    def __init__(self):
+    def __init__(self, browser_pool=None):
         self.scraper_usage = {
             'playwright': 0,
             'firecrawl': 0
         }
 
+        # Optional shared BrowserPool handed to every PlaywrightScraper
+        self.browser_pool = browser_pool
+
     def create_scraper(
         self,
         authority: Dict,
@@ -89,18 +101,18 @@ class ScraperFactory:
         if force_type:
             if force_type == 'firecrawl':
                 self.scraper_usage['firecrawl'] += 1
-                return FirecrawlScraper(authority)
+                return _firecrawl_scraper(authority)
             else:
                 self.scraper_usage['playwright'] += 1
-                return PlaywrightScraper(authority)
+                return _playwright_scraper(authority, self.browser_pool)
 
         # Intelligent routing
         if self._should_use_firecrawl(authority):
             self.scraper_usage['firecrawl'] += 1
-            return FirecrawlScraper(authority)
+            return _firecrawl_scraper(authority)
         else:
             self.scraper_usage['playwright'] += 1
-            return PlaywrightScraper(authority)
+            return _playwright_scraper(authority, self.browser_pool)
 
     def _should_use_firecrawl(self, authority: Dict) -> bool:
         """
@@ -190,7 +202,7 @@ class ScraperFactory:
 
         # Try Playwright first (FREE)
         try:
-            playwright_scraper = PlaywrightScraper(authority)
+            playwright_scraper = _playwright_scraper(authority, self.browser_pool)
             results = await playwright_scraper.scrape_authority()
 
             # Check if results are valid
@@ -206,7 +218,7 @@ class ScraperFactory:
 
         # Fallback to Firecrawl
         try:
-            firecrawl_scraper = FirecrawlScraper(authority)
+            firecrawl_scraper = _firecrawl_scraper(authority)
             results = await firecrawl_scraper.scrape_authority()
             self.scraper_usage['firecrawl'] += 1
             return results
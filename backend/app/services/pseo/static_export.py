@@ -0,0 +1,434 @@
+"""
+Static pSEO Export
+Pre-renders every pSEO page into a static directory with precompressed
+variants, content-hash ETags, a slug -> file manifest and a sitemap.
+StaticPageStore serves pages from that manifest with an in-memory LRU.
+"""
+
+from typing import AsyncIterator, Dict, Iterable, Iterator, Optional
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from xml.sax.saxutils import escape
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+
+# Optional brotli support - gzip-only export if not installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# POSIX file locking for the manifest - unlocked on platforms without it
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+MANIFEST_FILE = "manifest.json"
+LOCK_FILE = ".manifest.lock"
+SITEMAP_FILE = "sitemap.xml"
+
+# Encodings in server preference order
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def render_page(page: Dict) -> bytes:
+    """Render the exact response body served by GET /pseo/{authority_slug}"""
+    envelope = {
+        "success": True,
+        "data": page,
+        "generated_at": page.get('generated_at'),
+        "metadata": page.get('metadata', {})
+    }
+    return json.dumps(envelope, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def iter_pages_from_dir(source_dir: str) -> Iterator[Dict]:
+    """Lazily yield generated pages from a directory of JSON files"""
+    for path in sorted(Path(source_dir).glob("*.json")):
+        with open(path, 'r', encoding='utf-8') as f:
+            page = json.load(f)
+        # Skip checkpoints/reports that live alongside the pages
+        if isinstance(page, dict) and page.get('url_slug') and page.get('sections'):
+            yield page
+
+
+async def iter_pages_from_es(es_client, index: str = "pseo_pages") -> AsyncIterator[Dict]:
+    """Lazily yield generated pages from Elasticsearch using a scroll"""
+    from elasticsearch.helpers import async_scan
+
+    async for hit in async_scan(es_client, index=index, query={"query": {"match_all": {}}}):
+        yield hit['_source']
+
+
+class StaticPageExporter:
+    """
+    Write pages to a static directory.
+
+    Each page becomes ``{slug}.{hash}.json`` plus ``.gz`` and (if brotli is
+    installed) ``.br`` variants. The manifest maps slugs and authority IDs
+    to those files together with the content ETag and sizes; each encoded
+    variant is served under its own ETag (see variant_etag).
+
+    Every manifest read-modify-write holds an exclusive file lock, so
+    concurrent exporters (pSEO workers, API regenerations) never drop each
+    other's entries.
+    """
+
+    def __init__(self, output_dir: Optional[str] = None):
+        self.output_dir = Path(output_dir or os.getenv('PSEO_STATIC_DIR', './outputs/pseo_static'))
+        self.manifest: Dict = {"pages": {}, "aliases": {}}
+        self._stats = {"exported": 0, "unchanged": 0, "bytes_raw": 0, "bytes_gzip": 0, "bytes_br": 0}
+
+    def load_manifest(self) -> Dict:
+        path = self.output_dir / MANIFEST_FILE
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        return self.manifest
+
+    def export_page(self, page: Dict) -> Dict:
+        """Render, hash and write one page; returns its manifest entry"""
+        slug = page['url_slug']
+        body = render_page(page)
+        digest = hashlib.sha256(body).hexdigest()
+        filename = f"{slug}.{digest[:16]}.json"
+
+        previous = self.manifest["pages"].get(slug)
+        if previous and previous.get("sha256") == digest and (self.output_dir / filename).exists():
+            self._stats["unchanged"] += 1
+            return previous
+
+        self._write(filename, body)
+        entry = {
+            "file": filename,
+            "sha256": digest,
+            "etag": f'"{digest[:32]}"',
+            "authority_id": page.get('authority_id'),
+            "generated_at": page.get('generated_at'),
+            "size": len(body),
+            "encodings": {}
+        }
+
+        gz = gzip.compress(body, compresslevel=9, mtime=0)
+        self._write(filename + ENCODING_SUFFIXES["gzip"], gz)
+        entry["encodings"]["gzip"] = len(gz)
+        self._stats["bytes_gzip"] += len(gz)
+
+        if brotli is not None:
+            br = brotli.compress(body, quality=11, mode=brotli.MODE_TEXT)
+            self._write(filename + ENCODING_SUFFIXES["br"], br)
+            entry["encodings"]["br"] = len(br)
+            self._stats["bytes_br"] += len(br)
+
+        self._stats["exported"] += 1
+        self._stats["bytes_raw"] += len(body)
+
+        if previous and previous.get("file") != filename:
+            self._remove_variants(previous["file"])
+
+        return entry
+
+    @contextmanager
+    def _manifest_lock(self):
+        """Exclusive lock held across a manifest read-modify-write"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.output_dir / LOCK_FILE, 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def export_all(self, pages: Iterable[Dict]) -> Dict:
+        """Export pages from any iterable (files, ES scroll results, ...)"""
+        with self._manifest_lock():
+            self.load_manifest()
+
+            for page in pages:
+                self._add(page)
+
+            return self.finalize()
+
+    async def export_all_async(self, pages: AsyncIterator[Dict]) -> Dict:
+        """Export pages from an async iterable such as iter_pages_from_es"""
+        with self._manifest_lock():
+            self.load_manifest()
+
+            async for page in pages:
+                self._add(page)
+
+            return self.finalize()
+
+    def update_page(self, page: Dict) -> bool:
+        """
+        Re-export one page into an existing export (after regeneration).
+
+        Returns False when there is no export to update.
+        """
+        if not (self.output_dir / MANIFEST_FILE).exists():
+            return False
+        with self._manifest_lock():
+            self.load_manifest()
+            self._add(page)
+            self.finalize()
+        return True
+
+    def remove_page(self, slug_or_id: str) -> bool:
+        """Drop a page (by slug or authority ID) so it is served from ES again"""
+        if not (self.output_dir / MANIFEST_FILE).exists():
+            return False
+        with self._manifest_lock():
+            self.load_manifest()
+            slug = slug_or_id if slug_or_id in self.manifest["pages"] else self.manifest["aliases"].get(slug_or_id)
+            entry = self.manifest["pages"].pop(slug, None) if slug else None
+            if entry is None:
+                return False
+
+            self.manifest["aliases"] = {k: v for k, v in self.manifest["aliases"].items() if v != slug}
+            self._remove_variants(entry["file"])
+            self.finalize()
+        return True
+
+    def remove_all(self) -> int:
+        """Empty the export; returns the number of pages removed"""
+        if not (self.output_dir / MANIFEST_FILE).exists():
+            return 0
+        with self._manifest_lock():
+            self.load_manifest()
+            pages = self.manifest["pages"]
+            for entry in pages.values():
+                self._remove_variants(entry["file"])
+
+            self.manifest = {"pages": {}, "aliases": {}}
+            self.finalize()
+        return len(pages)
+
+    def finalize(self) -> Dict:
+        """Write manifest and sitemap, returning export statistics"""
+        self.manifest["exported_at"] = datetime.now().isoformat()
+        self._write(MANIFEST_FILE, json.dumps(self.manifest, indent=2).encode('utf-8'))
+        write_sitemap(self.manifest, self.output_dir / SITEMAP_FILE)
+        return {**self._stats, "pages": len(self.manifest["pages"])}
+
+    def _add(self, page: Dict):
+        entry = self.export_page(page)
+        self.manifest["pages"][page['url_slug']] = entry
+        if page.get('authority_id'):
+            self.manifest["aliases"][str(page['authority_id'])] = page['url_slug']
+
+    def _write(self, filename: str, data: bytes):
+        """Atomic write so readers never see a partial file"""
+        path = self.output_dir / filename
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _remove_variants(self, filename: str):
+        for suffix in ("", *ENCODING_SUFFIXES.values()):
+            try:
+                (self.output_dir / (filename + suffix)).unlink()
+            except FileNotFoundError:
+                pass
+
+
+def iter_sitemap(manifest: Dict, base_url: str = "") -> Iterator[str]:
+    """Yield sitemap XML in chunks so large sitemaps never sit in memory"""
+    base_url = base_url.rstrip('/')
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    for slug, entry in sorted(manifest.get("pages", {}).items()):
+        loc = escape(f"{base_url}/planning-applications/{slug}/")
+        lastmod = (entry.get("generated_at") or "")[:10]
+        yield f"  <url><loc>{loc}</loc>"
+        if lastmod:
+            yield f"<lastmod>{lastmod}</lastmod>"
+        yield "</url>\n"
+    yield "</urlset>\n"
+
+
+def write_sitemap(manifest: Dict, path: Path, base_url: Optional[str] = None):
+    """Stream the sitemap to disk"""
+    base_url = base_url if base_url is not None else os.getenv('PSEO_SITE_URL', '')
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        for chunk in iter_sitemap(manifest, base_url):
+            f.write(chunk)
+    os.replace(tmp, path)
+
+
+def negotiate_encoding(accept_encoding: str, available: Iterable[str]) -> Optional[str]:
+    """Pick the best precompressed variant the client accepts"""
+    accepted = {}
+    for part in accept_encoding.lower().split(','):
+        name, _, params = part.strip().partition(';')
+        quality = 1.0
+        if params.strip().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+
+    for encoding in ENCODING_SUFFIXES:
+        if encoding in available and accepted.get(encoding, accepted.get('*', 0)) > 0:
+            return encoding
+    return None
+
+
+def variant_etag(etag: str, encoding: Optional[str]) -> str:
+    """Strong ETag for one encoding of a page ('"<hash>-gz"', '"<hash>-br"')"""
+    if not encoding:
+        return etag
+    return f'{etag[:-1]}-{ENCODING_SUFFIXES[encoding].lstrip(".")}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return any(tag.removeprefix('W/') == etag for tag in candidates)
+
+
+class StaticPageStore:
+    """
+    Serve exported pages from the manifest.
+
+    The manifest is re-read when its mtime changes so a new export is
+    picked up without a restart. Hot page bodies are kept in a bounded LRU
+    keyed by (file, encoding).
+    """
+
+    def __init__(self, static_dir: Optional[str] = None, max_entries: Optional[int] = None):
+        self.static_dir = Path(static_dir or os.getenv('PSEO_STATIC_DIR', './outputs/pseo_static'))
+        self.max_entries = max_entries or int(os.getenv('PSEO_STATIC_LRU_SIZE', '128'))
+        self._manifest: Dict = {"pages": {}, "aliases": {}}
+        self._manifest_mtime: Optional[float] = None
+        self._lru: "OrderedDict[tuple[str, Optional[str]], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _refresh_manifest(self):
+        path = self.static_dir / MANIFEST_FILE
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if mtime == self._manifest_mtime:
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        with self._lock:
+            self._manifest = manifest
+            self._manifest_mtime = mtime
+            self._lru.clear()
+
+    def lookup(self, slug: str) -> Optional[Dict]:
+        """Manifest entry for a slug or authority ID"""
+        self._refresh_manifest()
+        pages = self._manifest.get("pages", {})
+        entry = pages.get(slug)
+        if entry is None:
+            alias = self._manifest.get("aliases", {}).get(slug)
+            entry = pages.get(alias) if alias else None
+        return entry
+
+    async def read(self, entry: Dict, encoding: Optional[str]) -> Optional[bytes]:
+        """Read a page body (optionally precompressed) through the LRU; misses read off the event loop"""
+        key = (entry["file"], encoding)
+        with self._lock:
+            body = self._lru.get(key)
+            if body is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return body
+
+        filename = entry["file"] + (ENCODING_SUFFIXES[encoding] if encoding else "")
+        try:
+            body = await asyncio.to_thread((self.static_dir / filename).read_bytes)
+        except FileNotFoundError:
+            return None
+
+        with self._lock:
+            self.misses += 1
+            self._lru[key] = body
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+        return body
+
+    def sitemap(self, base_url: str = "") -> Iterator[str]:
+        """Stream a sitemap for the currently exported pages"""
+        self._refresh_manifest()
+        return iter_sitemap(self._manifest, base_url)
+
+    def get_stats(self) -> Dict:
+        return {
+            "pages": len(self._manifest.get("pages", {})),
+            "lru_entries": len(self._lru),
+            "lru_hits": self.hits,
+            "lru_misses": self.misses
+        }
+
+
+# CLI for static export
+async def main():
+    """CLI for exporting pSEO pages to static files"""
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Export pSEO pages to a static directory')
+    parser.add_argument('--source', choices=['files', 'es'], default='files', help='Where to read pages from')
+    parser.add_argument('--source-dir', type=str, default=os.getenv('PSEO_OUTPUT_DIR', './outputs/pseo'))
+    parser.add_argument('--output-dir', type=str, help='Static directory (default: PSEO_STATIC_DIR)')
+    parser.add_argument('--base-url', type=str, help='Absolute site URL for sitemap <loc> entries')
+
+    args = parser.parse_args()
+
+    if args.base_url is not None:
+        os.environ['PSEO_SITE_URL'] = args.base_url
+
+    exporter = StaticPageExporter(args.output_dir)
+
+    if args.source == 'es':
+        from elasticsearch import AsyncElasticsearch
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        es = AsyncElasticsearch(
+            [os.getenv('ELASTICSEARCH_NODE', 'http://localhost:9200')],
+            basic_auth=(os.getenv('ELASTICSEARCH_USERNAME', 'elastic'), os.getenv('ELASTICSEARCH_PASSWORD', '')),
+            verify_certs=False
+        )
+        try:
+            stats = await exporter.export_all_async(iter_pages_from_es(es))
+        finally:
+            await es.close()
+    else:
+        stats = exporter.export_all(iter_pages_from_dir(args.source_dir))
+
+    print(f"\n{'='*60}")
+    print("pSEO STATIC EXPORT")
+    print(f"{'='*60}")
+    print(f"Pages in manifest: {stats['pages']}")
+    print(f"Exported: {stats['exported']}  Unchanged: {stats['unchanged']}")
+    if stats['bytes_raw']:
+        print(f"Raw: {stats['bytes_raw']:,} B  gzip: {stats['bytes_gzip']:,} B  br: {stats['bytes_br']:,} B")
+    print(f"Output: {exporter.output_dir}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,132 @@
+"""
+Saved Search Execution
+
+Runs saved searches through SearchService and tracks a per-search cursor,
+the newest (last_changed, uid) seen by the previous run, so "new since
+last run" is a single range query instead of a diff of full result sets.
+Compiled ES queries are cached per saved search.
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Dict
+
+from app.db.elasticsearch import es_client
+from app.models.planning import SearchRequest
+from app.models.user import SavedSearch
+from app.services.search import search_service
+
+logger = logging.getLogger(__name__)
+
+CURSOR_SORT = [{"last_changed": {"order": "desc"}}, {"uid.keyword": {"order": "desc"}}]
+
+
+def cursor_filter(cursor: Dict[str, Any]) -> Dict[str, Any]:
+    """Documents strictly after a (last_changed, uid) cursor"""
+    return {
+        "bool": {
+            "should": [
+                {"range": {"last_changed": {"gt": cursor["last_changed"]}}},
+                {"bool": {"filter": [
+                    {"term": {"last_changed": cursor["last_changed"]}},
+                    {"range": {"uid.keyword": {"gt": cursor["uid"]}}}
+                ]}}
+            ],
+            "minimum_should_match": 1
+        }
+    }
+
+
+class SavedSearchRunner:
+    """Execute saved searches with compiled-query caching and run cursors"""
+
+    def __init__(self, cache_size: int = 1000):
+        self.cache_size = cache_size
+        # search_id -> (criteria fingerprint, compiled query)
+        self._compiled: "OrderedDict[str, tuple[str, Dict[str, Any]]]" = OrderedDict()
+
+    @staticmethod
+    def _fingerprint(saved_search: SavedSearch) -> str:
+        criteria = [saved_search.query, saved_search.filters, saved_search.location_filters]
+        return hashlib.sha256(json.dumps(criteria, sort_keys=True, default=str).encode()).hexdigest()
+
+    async def compiled_query(self, saved_search: SavedSearch) -> Dict[str, Any]:
+        """Compiled ES query for a saved search (recompiled when its criteria change)"""
+        fingerprint = self._fingerprint(saved_search)
+        cached = self._compiled.get(saved_search.search_id)
+        if cached and cached[0] == fingerprint:
+            self._compiled.move_to_end(saved_search.search_id)
+            return cached[1]
+
+        query = await search_service.compile_criteria_query(
+            query=saved_search.query,
+            filters=saved_search.filters,
+            location_filters=saved_search.location_filters
+        )
+        self._compiled[saved_search.search_id] = (fingerprint, query)
+        if len(self._compiled) > self.cache_size:
+            self._compiled.popitem(last=False)
+        return query
+
+    def invalidate(self, search_id: str):
+        self._compiled.pop(search_id, None)
+
+    async def run(
+        self,
+        saved_search: SavedSearch,
+        page: int = 1,
+        page_size: int = 20,
+        new_sample_size: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Execute a saved search.
+
+        Returns:
+            Dict with the search response, new-since-last-run count and sample,
+            and the updated cursor to store on the saved search
+        """
+        query = await self.compiled_query(saved_search)
+
+        request = SearchRequest(
+            query=saved_search.query,
+            filters=search_service.build_criteria_filters(saved_search.filters, saved_search.location_filters),
+            sort_by=saved_search.sort_by or "relevance",
+            sort_order=saved_search.sort_order or "desc",
+            page=page,
+            page_size=page_size
+        )
+        response = await search_service.search_applications(request, compiled_query=query)
+
+        cursor = saved_search.run_cursor or None
+        if cursor:
+            # Only documents past the cursor: cheap range query, newest first
+            new_response = await es_client.search(
+                query={"bool": {"must": [query], "filter": [cursor_filter(cursor)]}},
+                size=new_sample_size,
+                sort=CURSOR_SORT,
+                source=["uid", "name", "reference", "address", "description", "area_name", "last_changed"],
+                track_total_hits=True
+            )
+            new_hits = new_response["hits"]["hits"]
+            new_count = new_response["hits"]["total"]["value"]
+            newest = new_hits[0]["sort"] if new_hits else None
+        else:
+            # First run establishes the cursor
+            new_hits, new_count = [], None
+            latest = await es_client.search(query=query, size=1, sort=CURSOR_SORT, source=False)
+            newest = latest["hits"]["hits"][0]["sort"] if latest["hits"]["hits"] else None
+
+        if newest:
+            cursor = {"last_changed": newest[0], "uid": newest[1]}
+
+        return {
+            "response": response,
+            "new_since_last_run": new_count,
+            "new_applications": [hit["_source"] for hit in new_hits],
+            "cursor": cursor
+        }
+
+
+saved_search_runner = SavedSearchRunner()
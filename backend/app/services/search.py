@@ -27,6 +27,15 @@ DEVELOPMENT_TYPE_MAPPING = {
     # Note: ES also has "Other", "Trees", "Heritage", "Telecoms" - these don't map to model enums
 }
 
+# Alternative keys accepted in stored location filters
+LOCATION_FILTER_ALIASES = {
+    "latitude": "lat",
+    "longitude": "lon",
+    "lng": "lon",
+    "radius": "radius_km",
+    "authority": "authorities",
+}
+
 
 class SearchService:
     """Service for handling search operations"""
@@ -35,12 +44,17 @@ class SearchService:
         self.default_size = 20
         self.max_size = 100
 
-    async def search_applications(self, search_request: SearchRequest) -> SearchResponse:
+    async def search_applications(
+        self,
+        search_request: SearchRequest,
+        compiled_query: Optional[Dict[str, Any]] = None
+    ) -> SearchResponse:
         """
         Search planning applications with intelligent caching
 
         Args:
             search_request: Search parameters
+            compiled_query: Pre-built query for this request (skips query building)
 
         Returns:
             SearchResponse with results and metadata
@@ -61,7 +75,7 @@ class SearchService:
                 logger.debug("Cache manager not available for search results")
 
             # Build Elasticsearch query
-            query = await self._build_search_query(search_request)
+            query = compiled_query or await self._build_search_query(search_request)
 
             # Calculate pagination
             page = max(1, search_request.page)
@@ -568,6 +582,50 @@ class SearchService:
 
         return query
 
+    def build_criteria_filters(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        location_filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[SearchFilters]:
+        """
+        Build SearchFilters from stored criteria (saved searches, alerts)
+
+        Args:
+            filters: SearchFilters fields as a plain dict
+            location_filters: Location fields (lat/lon/radius_km, postcode, ward, authorities)
+
+        Returns:
+            SearchFilters, or None when no known filter is set
+        """
+        criteria = dict(filters or {})
+        for key, value in (location_filters or {}).items():
+            criteria[LOCATION_FILTER_ALIASES.get(key, key)] = value
+        if isinstance(criteria.get("authorities"), str):
+            criteria["authorities"] = [criteria["authorities"]]
+
+        known = {k: v for k, v in criteria.items() if k in SearchFilters.__fields__ and v is not None}
+        return SearchFilters(**known) if known else None
+
+    async def compile_criteria_query(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        location_filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Compile stored search criteria into an ES query
+
+        Args:
+            query: Free-text query
+            filters: SearchFilters fields as a plain dict
+            location_filters: Location fields (see build_criteria_filters)
+
+        Returns:
+            Elasticsearch query built through _build_filter_query
+        """
+        search_filters = self.build_criteria_filters(filters, location_filters)
+        return await self._build_search_query(SearchRequest(query=query, filters=search_filters))
+
     async def _build_filter_query(self, filters: SearchFilters) -> Optional[List[Dict[str, Any]]]:
         """Build filter query from search filters"""
         filter_clauses = []
@@ -0,0 +1,601 @@
+"""
+Durable Task Store for Background AI Jobs
+
+Task records, queue entries and results live outside process memory, so any
+uvicorn worker can answer a status or result lookup and tasks survive a
+restart. Two backends share one interface:
+
+  * SQLiteTaskStore - a WAL-mode SQLite file, for local and single-host runs
+  * RedisTaskStore  - Redis hashes plus one stream per priority level read
+                      through a consumer group, for multi-host deployments
+
+Queue entries are claimed with a visibility timeout: a claim that is not
+acked or touched within the timeout (its worker died) is handed to the next
+claimer. Results are stored as zlib-compressed JSON blobs; finished records
+and their results expire after TASK_RESULT_TTL, and at most
+TASK_STORE_MAX_FINISHED finished records are kept per namespace.
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+try:
+    import redis.asyncio as redis
+    from redis.exceptions import ResponseError, WatchError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+COMPRESS_LEVEL = 6
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoding for the dataclasses, models and enums results contain"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def encode_result(result: Any) -> bytes:
+    """Result as a compressed JSON blob"""
+    return zlib.compress(json.dumps(result, default=_json_default).encode(), COMPRESS_LEVEL)
+
+
+def decode_result(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob))
+
+
+def _encode_fields(fields: Dict[str, Any]) -> Dict[str, str]:
+    return {key: json.dumps(value, default=_json_default) for key, value in fields.items()}
+
+
+class TaskStore(ABC):
+    """
+    Durable task records, a priority queue with visibility timeouts and
+    compressed results, scoped to a namespace (e.g. "background", "agent_jobs").
+
+    Records are flat dicts of JSON-serialisable fields. Lower priority
+    values are claimed first.
+    """
+
+    def __init__(self, namespace: str, result_ttl: int, visibility_timeout: int, max_finished: int):
+        self.namespace = namespace
+        self.result_ttl = result_ttl
+        self.visibility_timeout = visibility_timeout
+        self.max_finished = max_finished
+
+    @abstractmethod
+    async def save(self, task_id: str, record: Dict[str, Any]) -> None:
+        """Create or replace a task record"""
+
+    @abstractmethod
+    async def update(self, task_id: str, fields: Dict[str, Any]) -> None:
+        """Set some fields of an existing record (other fields are untouched)"""
+
+    @abstractmethod
+    async def load(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Task record, or None if unknown or expired"""
+
+    @abstractmethod
+    async def finish(
+        self,
+        task_id: str,
+        fields: Dict[str, Any],
+        result: Any = None,
+        expected_status: Optional[str] = None
+    ) -> bool:
+        """
+        Final update: store the result (if any) and start the TTL.
+
+        With expected_status the update only applies if the record still has
+        that status (e.g. a task cancelled meanwhile is not marked completed).
+        Returns whether the update was applied.
+        """
+
+    @abstractmethod
+    async def load_result(self, task_id: str) -> Optional[Any]:
+        """Decoded result of a finished task"""
+
+    @abstractmethod
+    async def list_for_user(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """A user's task records, newest first"""
+
+    @abstractmethod
+    async def enqueue(self, task_id: str, priority: int) -> None:
+        """Make a task claimable"""
+
+    @abstractmethod
+    async def claim(self, consumer: str) -> Optional[str]:
+        """Next visible task id (highest priority first), hidden for the visibility timeout"""
+
+    @abstractmethod
+    async def touch(self, task_id: str, consumer: str) -> None:
+        """Extend a claim by another visibility timeout"""
+
+    @abstractmethod
+    async def ack(self, task_id: str) -> None:
+        """Remove a claimed task from the queue"""
+
+    @abstractmethod
+    async def purge(self, finished_before: Optional[float] = None) -> int:
+        """Drop expired records (and finished ones older than finished_before); returns count"""
+
+    @abstractmethod
+    async def counts(self) -> Dict[str, int]:
+        """Record counts by status plus the queue length"""
+
+    async def close(self) -> None:
+        pass
+
+
+class SQLiteTaskStore(TaskStore):
+    """
+    Task store in a WAL-mode SQLite file.
+
+    Every uvicorn worker on the host opens the same file; claims run in an
+    IMMEDIATE transaction so exactly one worker gets each task. Calls run in
+    a thread so the event loop never waits on the disk.
+    """
+
+    def __init__(self, path: str, namespace: str, **kwargs):
+        super().__init__(namespace, **kwargs)
+        self.path = path
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False, timeout=10, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    namespace TEXT NOT NULL, task_id TEXT NOT NULL, record TEXT NOT NULL,
+                    user_id TEXT, status TEXT, created_at REAL NOT NULL,
+                    finished_at REAL, expires_at REAL, result BLOB,
+                    PRIMARY KEY (namespace, task_id));
+                CREATE INDEX IF NOT EXISTS tasks_user ON tasks (namespace, user_id, created_at);
+                CREATE INDEX IF NOT EXISTS tasks_expiry ON tasks (expires_at);
+                CREATE TABLE IF NOT EXISTS task_queue (
+                    namespace TEXT NOT NULL, task_id TEXT NOT NULL, priority INTEGER NOT NULL,
+                    enqueued_at REAL NOT NULL, visible_at REAL NOT NULL, consumer TEXT,
+                    PRIMARY KEY (namespace, task_id));
+                CREATE INDEX IF NOT EXISTS task_queue_next ON task_queue (namespace, visible_at, priority, enqueued_at);
+            """)
+            self._db = db
+        return self._db
+
+    def _run(self, fn, *args):
+        with self._db_lock:
+            db = self._connect()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                value = fn(db, *args)
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+            return value
+
+    def _run_read(self, fn, *args):
+        with self._db_lock:
+            return fn(self._connect(), *args)
+
+    async def _call(self, fn, *args):
+        """Run fn(db, *args) in a write transaction"""
+        return await asyncio.to_thread(self._run, fn, *args)
+
+    async def _read(self, fn, *args):
+        """Run fn(db, *args) without taking the database write lock"""
+        return await asyncio.to_thread(self._run_read, fn, *args)
+
+    def _load(self, db: sqlite3.Connection, task_id: str) -> Optional[Dict[str, Any]]:
+        row = db.execute(
+            "SELECT record FROM tasks WHERE namespace = ? AND task_id = ? "
+            "AND (expires_at IS NULL OR expires_at > ?)",
+            (self.namespace, task_id, time.time())
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _write(self, db: sqlite3.Connection, task_id: str, record: Dict[str, Any]):
+        db.execute(
+            "INSERT INTO tasks (namespace, task_id, record, user_id, status, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (namespace, task_id) DO UPDATE SET "
+            "record = excluded.record, user_id = excluded.user_id, status = excluded.status",
+            (self.namespace, task_id, json.dumps(record, default=_json_default),
+             record.get("user_id"), record.get("status"), time.time())
+        )
+
+    def _update(self, db: sqlite3.Connection, task_id: str, fields: Dict[str, Any]):
+        record = self._load(db, task_id)
+        if record is not None:
+            record.update(fields)
+            self._write(db, task_id, record)
+
+    def _finish(
+        self,
+        db: sqlite3.Connection,
+        task_id: str,
+        fields: Dict[str, Any],
+        blob: Optional[bytes],
+        expected_status: Optional[str]
+    ) -> bool:
+        if expected_status is not None:
+            record = self._load(db, task_id)
+            if record is None or record.get("status") != expected_status:
+                return False
+        self._update(db, task_id, fields)
+        now = time.time()
+        db.execute(
+            "UPDATE tasks SET finished_at = ?, expires_at = ?, result = ? WHERE namespace = ? AND task_id = ?",
+            (now, now + self.result_ttl, blob, self.namespace, task_id)
+        )
+        return True
+
+    def _load_result(self, db: sqlite3.Connection, task_id: str) -> Optional[bytes]:
+        row = db.execute(
+            "SELECT result FROM tasks WHERE namespace = ? AND task_id = ? AND expires_at > ?",
+            (self.namespace, task_id, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def _list_for_user(self, db: sqlite3.Connection, user_id: str, limit: int) -> List[Dict[str, Any]]:
+        rows = db.execute(
+            "SELECT record FROM tasks WHERE namespace = ? AND user_id = ? "
+            "AND (expires_at IS NULL OR expires_at > ?) ORDER BY created_at DESC LIMIT ?",
+            (self.namespace, user_id, time.time(), limit)
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def _enqueue(self, db: sqlite3.Connection, task_id: str, priority: int):
+        now = time.time()
+        db.execute(
+            "INSERT OR REPLACE INTO task_queue (namespace, task_id, priority, enqueued_at, visible_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (self.namespace, task_id, priority, now, now)
+        )
+
+    def _claim(self, db: sqlite3.Connection, consumer: str) -> Optional[str]:
+        now = time.time()
+        row = db.execute(
+            "SELECT task_id FROM task_queue WHERE namespace = ? AND visible_at <= ? "
+            "ORDER BY priority, enqueued_at LIMIT 1",
+            (self.namespace, now)
+        ).fetchone()
+        if row is None:
+            return None
+        db.execute(
+            "UPDATE task_queue SET visible_at = ?, consumer = ? WHERE namespace = ? AND task_id = ?",
+            (now + self.visibility_timeout, consumer, self.namespace, row[0])
+        )
+        return row[0]
+
+    def _touch(self, db: sqlite3.Connection, task_id: str, consumer: str):
+        db.execute(
+            "UPDATE task_queue SET visible_at = ? WHERE namespace = ? AND task_id = ? AND consumer = ?",
+            (time.time() + self.visibility_timeout, self.namespace, task_id, consumer)
+        )
+
+    def _ack(self, db: sqlite3.Connection, task_id: str):
+        db.execute("DELETE FROM task_queue WHERE namespace = ? AND task_id = ?", (self.namespace, task_id))
+
+    def _purge(self, db: sqlite3.Connection, finished_before: Optional[float]) -> int:
+        removed = db.execute(
+            "DELETE FROM tasks WHERE namespace = ? AND (expires_at <= ? OR finished_at < ?)",
+            (self.namespace, time.time(), finished_before or 0)
+        ).rowcount
+        # Cap the number of finished records kept, oldest first
+        removed += db.execute(
+            "DELETE FROM tasks WHERE namespace = ? AND task_id IN ("
+            "SELECT task_id FROM tasks WHERE namespace = ? AND finished_at IS NOT NULL "
+            "ORDER BY finished_at DESC LIMIT -1 OFFSET ?)",
+            (self.namespace, self.namespace, self.max_finished)
+        ).rowcount
+        return removed
+
+    def _counts(self, db: sqlite3.Connection) -> Dict[str, int]:
+        counts = dict(db.execute(
+            "SELECT status, COUNT(*) FROM tasks WHERE namespace = ? "
+            "AND (expires_at IS NULL OR expires_at > ?) GROUP BY status",
+            (self.namespace, time.time())
+        ).fetchall())
+        counts["queued"] = db.execute(
+            "SELECT COUNT(*) FROM task_queue WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0]
+        return counts
+
+    async def save(self, task_id: str, record: Dict[str, Any]) -> None:
+        await self._call(self._write, task_id, record)
+
+    async def update(self, task_id: str, fields: Dict[str, Any]) -> None:
+        await self._call(self._update, task_id, fields)
+
+    async def load(self, task_id: str) -> Optional[Dict[str, Any]]:
+        return await self._read(self._load, task_id)
+
+    async def finish(
+        self,
+        task_id: str,
+        fields: Dict[str, Any],
+        result: Any = None,
+        expected_status: Optional[str] = None
+    ) -> bool:
+        blob = await asyncio.to_thread(encode_result, result) if result is not None else None
+        return await self._call(self._finish, task_id, fields, blob, expected_status)
+
+    async def load_result(self, task_id: str) -> Optional[Any]:
+        blob = await self._read(self._load_result, task_id)
+        return await asyncio.to_thread(decode_result, blob) if blob is not None else None
+
+    async def list_for_user(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+        return await self._read(self._list_for_user, user_id, limit)
+
+    async def enqueue(self, task_id: str, priority: int) -> None:
+        await self._call(self._enqueue, task_id, priority)
+
+    async def claim(self, consumer: str) -> Optional[str]:
+        return await self._call(self._claim, consumer)
+
+    async def touch(self, task_id: str, consumer: str) -> None:
+        await self._call(self._touch, task_id, consumer)
+
+    async def ack(self, task_id: str) -> None:
+        await self._call(self._ack, task_id)
+
+    async def purge(self, finished_before: Optional[float] = None) -> int:
+        return await self._call(self._purge, finished_before)
+
+    async def counts(self) -> Dict[str, int]:
+        return await self._read(self._counts)
+
+    async def close(self) -> None:
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+class RedisTaskStore(TaskStore):
+    """
+    Task store in Redis (6.2+).
+
+    Records are hashes of JSON-encoded fields, so concurrent field updates
+    (progress from the running worker, cancellation from another) don't
+    clobber each other. The queue is one stream per priority level read
+    through a consumer group: pending entries idle for longer than the
+    visibility timeout are taken over with XAUTOCLAIM, and touch resets an
+    entry's idle time with XCLAIM.
+    """
+
+    GROUP = "workers"
+    PRIORITY_LEVELS = 4
+
+    def __init__(self, redis_url: str, namespace: str, **kwargs):
+        super().__init__(namespace, **kwargs)
+        self.redis_url = redis_url
+        self.client = redis.from_url(redis_url, decode_responses=False)
+        self._groups_ready = False
+        self._claims: Dict[str, Tuple[str, bytes]] = {}  # task_id -> (stream, entry id)
+
+    def _key(self, *parts: str) -> str:
+        return ":".join(("tasks", self.namespace) + parts)
+
+    def _stream(self, priority: int) -> str:
+        return self._key("queue", str(min(max(priority, 1), self.PRIORITY_LEVELS)))
+
+    @property
+    def _streams(self) -> List[str]:
+        return [self._stream(p) for p in range(1, self.PRIORITY_LEVELS + 1)]
+
+    async def _ensure_groups(self):
+        if self._groups_ready:
+            return
+        for stream in self._streams:
+            try:
+                await self.client.xgroup_create(stream, self.GROUP, id="0", mkstream=True)
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+        self._groups_ready = True
+
+    @staticmethod
+    def _decode_record(raw: Dict[bytes, bytes]) -> Optional[Dict[str, Any]]:
+        if not raw:
+            return None
+        return {key.decode(): json.loads(value) for key, value in raw.items()}
+
+    async def save(self, task_id: str, record: Dict[str, Any]) -> None:
+        key = self._key("task", task_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=_encode_fields(record))
+            if record.get("user_id"):
+                user_key = self._key("user", str(record["user_id"]))
+                pipe.zadd(user_key, {task_id: time.time()})
+                pipe.zremrangebyrank(user_key, 0, -self.max_finished - 1)
+                pipe.expire(user_key, self.result_ttl)
+            await pipe.execute()
+
+    async def update(self, task_id: str, fields: Dict[str, Any]) -> None:
+        key = self._key("task", task_id)
+        if await self.client.exists(key):
+            await self.client.hset(key, mapping=_encode_fields(fields))
+
+    async def load(self, task_id: str) -> Optional[Dict[str, Any]]:
+        return self._decode_record(await self.client.hgetall(self._key("task", task_id)))
+
+    async def finish(
+        self,
+        task_id: str,
+        fields: Dict[str, Any],
+        result: Any = None,
+        expected_status: Optional[str] = None
+    ) -> bool:
+        key = self._key("task", task_id)
+        blob = await asyncio.to_thread(encode_result, result) if result is not None else None
+        async with self.client.pipeline(transaction=True) as pipe:
+            if expected_status is not None:
+                # WATCH aborts the transaction if the status changes before EXEC
+                await pipe.watch(key)
+                status = await pipe.hget(key, "status")
+                if status is None or json.loads(status) != expected_status:
+                    return False
+                pipe.multi()
+            pipe.hset(key, mapping=_encode_fields(fields))
+            pipe.expire(key, self.result_ttl)
+            if blob is not None:
+                pipe.set(self._key("result", task_id), blob, ex=self.result_ttl)
+            pipe.zadd(self._key("finished"), {task_id: time.time()})
+            try:
+                await pipe.execute()
+            except WatchError:
+                return False
+        return True
+
+    async def load_result(self, task_id: str) -> Optional[Any]:
+        blob = await self.client.get(self._key("result", task_id))
+        return await asyncio.to_thread(decode_result, blob) if blob is not None else None
+
+    async def list_for_user(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+        task_ids = await self.client.zrevrange(self._key("user", user_id), 0, limit - 1)
+        async with self.client.pipeline(transaction=False) as pipe:
+            for task_id in task_ids:
+                pipe.hgetall(self._key("task", task_id.decode()))
+            rows = await pipe.execute()
+        return [record for record in map(self._decode_record, rows) if record is not None]
+
+    async def enqueue(self, task_id: str, priority: int) -> None:
+        await self._ensure_groups()
+        await self.client.xadd(self._stream(priority), {"task_id": task_id})
+
+    async def claim(self, consumer: str) -> Optional[str]:
+        await self._ensure_groups()
+        idle_ms = self.visibility_timeout * 1000
+
+        for stream in self._streams:
+            # Entries whose claim lapsed (worker died) come first
+            _, entries, *_ = await self.client.xautoclaim(
+                stream, self.GROUP, consumer, min_idle_time=idle_ms, start_id="0-0", count=1
+            )
+            entries = [entry for entry in entries if entry[1]]  # Redis 6.2 returns deleted entries as nil
+            if not entries:
+                response = await self.client.xreadgroup(self.GROUP, consumer, {stream: ">"}, count=1)
+                entries = response[0][1] if response else []
+            if entries:
+                entry_id, fields = entries[0]
+                task_id = fields[b"task_id"].decode()
+                self._claims[task_id] = (stream, entry_id)
+                return task_id
+        return None
+
+    async def touch(self, task_id: str, consumer: str) -> None:
+        claim = self._claims.get(task_id)
+        if claim:
+            stream, entry_id = claim
+            await self.client.xclaim(stream, self.GROUP, consumer, 0, [entry_id], justid=True)
+
+    async def ack(self, task_id: str) -> None:
+        claim = self._claims.pop(task_id, None)
+        if claim:
+            stream, entry_id = claim
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.xack(stream, self.GROUP, entry_id)
+                pipe.xdel(stream, entry_id)
+                await pipe.execute()
+
+    async def purge(self, finished_before: Optional[float] = None) -> int:
+        # Records and results expire by TTL; this trims the finished index
+        # and enforces the finished-record cap and age cutoff
+        finished_key = self._key("finished")
+        stale = await self.client.zrangebyscore(finished_key, 0, time.time() - self.result_ttl)
+        if finished_before:
+            stale += await self.client.zrangebyscore(finished_key, 0, finished_before)
+        overflow = await self.client.zcard(finished_key) - self.max_finished
+        if overflow > 0:
+            stale += await self.client.zrange(finished_key, 0, overflow - 1)
+
+        task_ids = {task_id.decode() for task_id in stale}
+        if not task_ids:
+            return 0
+        async with self.client.pipeline(transaction=False) as pipe:
+            for task_id in task_ids:
+                pipe.delete(self._key("task", task_id), self._key("result", task_id))
+            pipe.zrem(finished_key, *task_ids)
+            await pipe.execute()
+        return len(task_ids)
+
+    async def counts(self) -> Dict[str, int]:
+        await self._ensure_groups()
+        counts = {"finished": await self.client.zcard(self._key("finished"))}
+        queued = 0
+        for stream in self._streams:
+            queued += await self.client.xlen(stream)
+        counts["queued"] = queued
+        return counts
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+# Process-wide stores, one per namespace
+_task_stores: Dict[str, TaskStore] = {}
+
+
+def create_task_store(namespace: str) -> TaskStore:
+    """Task store for the configured backend (TASK_STORE_BACKEND)"""
+    options = {
+        "result_ttl": settings.task_result_ttl,
+        "visibility_timeout": settings.task_visibility_timeout,
+        "max_finished": settings.task_store_max_finished,
+    }
+
+    if settings.task_store_backend == "redis":
+        redis_url = settings.task_store_redis_url or settings.redis_url
+        if REDIS_AVAILABLE and redis_url:
+            logger.info(f"Task store '{namespace}' using Redis streams")
+            return RedisTaskStore(redis_url, namespace, **options)
+        logger.warning("TASK_STORE_BACKEND=redis but redis is not installed or configured, using SQLite")
+
+    return SQLiteTaskStore(settings.task_store_path, namespace, **options)
+
+
+def get_task_store(namespace: str = "background") -> TaskStore:
+    """Process-wide task store for a namespace, created on first use"""
+    store = _task_stores.get(namespace)
+    if store is None:
+        store = _task_stores[namespace] = create_task_store(namespace)
+    return store
+
+
+async def shutdown_task_stores():
+    """Close all task store connections"""
+    for store in _task_stores.values():
+        try:
+            await store.close()
+        except Exception as e:
+            logger.warning(f"Error closing task store '{store.namespace}': {e}")
+    _task_stores.clear()
@@ -1,64 +1,60 @@
 #!/usr/bin/env python3
 """
 Bulk Import PSEO Pages to Elasticsearch
-Imports all JSON files from outputs/pseo/ into ES pseo_pages index
+Streams all JSON files from outputs/pseo/ into the ES pseo_pages index
+using byte-bounded bulk requests sent concurrently
 """
 
-import json
-import os
-import glob
+import argparse
 import asyncio
-from datetime import datetime
 from app.db.elasticsearch import es_client
+from app.services.pseo.bulk_indexer import bulk_index_pages, iter_page_files
 
 
-async def bulk_import():
+async def bulk_import(json_dir: str, chunk_bytes: int, chunk_docs: int, concurrency: int):
     """Import all PSEO JSON files to Elasticsearch"""
 
     print(f"\n{'='*80}")
     print(f"BULK IMPORT TO ELASTICSEARCH")
     print(f"{'='*80}\n")
+    print(f"Source: {json_dir}")
+    print(f"Chunk size: {chunk_bytes / 1024 / 1024:.1f} MB / {chunk_docs} docs, {concurrency} concurrent requests\n")
 
-    # Find all JSON files
-    json_dir = "outputs/pseo"
-    json_files = glob.glob(f"{json_dir}/*.json")
-    json_files = [f for f in json_files if not f.endswith('checkpoint.json')]
+    await es_client.ensure_connection()
 
-    print(f"Found {len(json_files)} PSEO pages to import\n")
+    try:
+        report = await bulk_index_pages(
+            es_client.client,
+            iter_page_files(json_dir),
+            max_chunk_bytes=chunk_bytes,
+            max_chunk_docs=chunk_docs,
+            concurrency=concurrency
+        )
+    finally:
+        await es_client.disconnect()
 
-    imported = 0
-    failed = 0
-
-    for json_file in json_files:
-        try:
-            # Load JSON
-            with open(json_file, 'r', encoding='utf-8') as f:
-                page_data = json.load(f)
-
-            authority_id = page_data.get('authority_id')
-            slug = page_data.get('url_slug')
-
-            # Import to ES
-            await es_client.client.index(
-                index="pseo_pages",
-                id=authority_id,
-                body=page_data
-            )
-
-            imported += 1
-            print(f"✅ [{imported}/{len(json_files)}] Imported: {slug}")
-
-        except Exception as e:
-            failed += 1
-            print(f"❌ Failed: {os.path.basename(json_file)} - {e}")
+    for error in report['errors']:
+        print(f"❌ Failed: {error['id']} (status {error['status']}) - {error['error']}")
 
     print(f"\n{'='*80}")
     print(f"IMPORT COMPLETE")
     print(f"{'='*80}")
-    print(f"Successfully imported: {imported}")
-    print(f"Failed: {failed}")
+    print(f"Successfully imported: {report['indexed']}")
+    print(f"Failed: {report['failed']}")
+    print(f"Bulk requests: {report['chunks']} ({report['bytes_sent'] / 1024 / 1024:.1f} MB)")
+    print(f"Elapsed: {report['elapsed_seconds']:.1f}s ({report['docs_per_second']:.0f} docs/s)")
     print(f"{'='*80}\n")
 
+    return report
+
 
 if __name__ == "__main__":
-    asyncio.run(bulk_import())
+    parser = argparse.ArgumentParser(description='Bulk import pSEO pages into Elasticsearch')
+    parser.add_argument('--dir', type=str, default='outputs/pseo', help='Directory of page JSON files')
+    parser.add_argument('--chunk-bytes', type=int, default=5 * 1024 * 1024, help='Max bytes per bulk request')
+    parser.add_argument('--chunk-docs', type=int, default=500, help='Max documents per bulk request')
+    parser.add_argument('--concurrency', type=int, default=4, help='Bulk requests in flight')
+    args = parser.parse_args()
+
+    report = asyncio.run(bulk_import(args.dir, args.chunk_bytes, args.chunk_docs, args.concurrency))
+    exit(0 if report['failed'] == 0 else 1)
@@ -97,7 +97,22 @@ mapping = {
                     "total_visualizations": {"type": "integer"},
                     "scraper_used": {"type": "keyword"},
                     "generation_cost": {"type": "float"},
-                    "meets_word_count": {"type": "boolean"}
+                    "meets_word_count": {"type": "boolean"},
+                    "sections_reused": {"type": "integer"},
+                    "cost_avoided": {"type": "float"}
+                }
+            },
+
+            # Input fingerprints for incremental regeneration
+            "fingerprints": {
+                "properties": {
+                    "version": {"type": "integer"},
+                    "prompt_version": {"type": "keyword"},
+                    "data": {"type": "keyword"},
+                    "inputs": {"type": "object", "enabled": False},
+                    "sections": {"type": "object", "enabled": False},
+                    "section_costs": {"type": "object", "enabled": False},
+                    "scraped_at": {"type": "date"}
                 }
             }
         }
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Authentication Cache Benchmark
+
+Measures AuthMiddleware.verify_token latency per request with simulated
+network round trips (PostgREST profile reads over an in-process httpx
+transport, a stubbed Supabase auth API) for:
+
+  * locally issued tokens (profile read per request vs cached)
+  * Supabase tokens (auth API + profile read per request vs local
+    HS256 verification with SUPABASE_JWT_SECRET + caches)
+
+"uncached" runs with the token/profile caches disabled and no Supabase
+JWT secret, i.e. the previous per-request behaviour. Also checks that a
+profile update is visible on the next request.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+os.environ.setdefault("ELASTICSEARCH_NODE", "http://stub:9200")
+os.environ.setdefault("ELASTICSEARCH_USERNAME", "stub")
+os.environ.setdefault("ELASTICSEARCH_PASSWORD", "stub")
+
+from jose import jwt
+
+from app.core.config import settings
+from app.db.postgrest import AsyncPostgrestClient
+from app.db.supabase import supabase_client
+from app.middleware.auth import AuthMiddleware
+
+SUPABASE_SECRET = "bench-supabase-jwt-secret"
+USER_ID = "5b0c2f3e-0000-4000-8000-000000000001"
+
+
+def profile_transport(latency: float, calls: dict) -> httpx.AsyncBaseTransport:
+    """user_profiles table behind a fixed round-trip latency"""
+    row = {"user_id": USER_ID, "email": "bench@example.com", "role": "free"}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls["db"] += 1
+        await asyncio.sleep(latency)
+        if request.method == "PATCH":
+            row.update(json.loads(request.content))
+        return httpx.Response(200, json=[row])
+
+    return httpx.MockTransport(handler)
+
+
+def install_stubs(latency: float) -> dict:
+    calls = {"db": 0, "auth_api": 0}
+    supabase_client.db = AsyncPostgrestClient("http://postgrest", transport=profile_transport(latency, calls))
+    supabase_client._last_health_check = time.time()
+
+    async def get_user_by_token(token):
+        calls["auth_api"] += 1
+        await asyncio.sleep(latency)
+        claims = jwt.get_unverified_claims(token)
+        return {"success": True, "user": SimpleNamespace(id=claims["sub"], email=claims["email"], user_metadata={})}
+
+    supabase_client.get_user_by_token = get_user_by_token
+    return calls
+
+
+def configure(cached: bool):
+    settings.auth_token_cache_size = 10000 if cached else 0
+    settings.user_profile_cache_ttl = 30 if cached else 0
+    settings.supabase_jwt_secret = SUPABASE_SECRET if cached else None
+    supabase_client._profiles.clear()
+
+
+async def time_verify(token: str, samples: int) -> float:
+    auth = AuthMiddleware()
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        await auth.verify_token(token)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+async def invalidation_check() -> str:
+    configure(cached=True)
+    auth = AuthMiddleware()
+    token = jwt.encode({"sub": USER_ID, "exp": int(time.time()) + 600}, settings.secret_key, algorithm=settings.algorithm)
+    before = (await auth.verify_token(token))["user_profile"].role
+    await supabase_client.update_user_profile(USER_ID, {"role": "professional"})
+    after = (await auth.verify_token(token))["user_profile"].role
+    await supabase_client.update_user_profile(USER_ID, {"role": "free"})
+    return f"role before update: {before}; next request after update: {after}"
+
+
+async def run(args):
+    calls = install_stubs(args.latency / 1000)
+    exp = int(time.time()) + 3600
+    tokens = {
+        "local token": jwt.encode({"sub": USER_ID, "exp": exp, "type": "access"},
+                                  settings.secret_key, algorithm=settings.algorithm),
+        "supabase token": jwt.encode({"sub": USER_ID, "exp": exp, "aud": "authenticated", "email": "bench@example.com"},
+                                     SUPABASE_SECRET, algorithm="HS256"),
+    }
+
+    print(f"\n{'='*66}")
+    print("AUTH CACHE BENCHMARK")
+    print(f"{'='*66}")
+    print(f"{args.latency:.0f} ms simulated round trip, {args.samples} sequential requests per token")
+    print(f"{'':16}{'uncached p50':>14}{'cached p50':>12}{'calls/req before':>19}{'after':>7}")
+    for name, token in tokens.items():
+        results = []
+        for cached in (False, True):
+            configure(cached)
+            calls.update(db=0, auth_api=0)
+            p50 = await time_verify(token, args.samples)
+            results.append((p50, (calls["db"] + calls["auth_api"]) / args.samples))
+        (before, before_calls), (after, after_calls) = results
+        print(f"{name:16}{before:>12.2f}ms{after:>10.3f}ms{before_calls:>19.2f}{after_calls:>7.2f}")
+
+    print(await invalidation_check())
+    await supabase_client.db.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark token verification and profile caching')
+    parser.add_argument('--latency', type=float, default=20.0, help='Simulated round trip in ms')
+    parser.add_argument('--samples', type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Background CPU Offload Benchmark
+
+Runs the real FastAPI app in-process (stubbed Elasticsearch) under an
+open-loop API load (fixed request rate, latency measured from the
+scheduled send time, so event-loop stalls show up as queueing) while a
+BackgroundProcessor batch-scores N planning applications, and reports
+API latency for:
+
+  * idle (no background work)
+  * batch scoring on the event loop (BACKGROUND_PROCESS_WORKERS=0,
+    the previous behaviour)
+  * batch scoring in the process pool (chunked dispatch)
+
+Application fetches are served from memory so only the scoring work
+competes with the API.
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+os.environ.setdefault("ELASTICSEARCH_NODE", "http://stub:9200")
+os.environ.setdefault("ELASTICSEARCH_USERNAME", "stub")
+os.environ.setdefault("ELASTICSEARCH_PASSWORD", "stub")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("RATE_LIMIT_REQUESTS", "100000000")
+os.environ.setdefault("TASK_STORE_PATH", os.path.join(tempfile.mkdtemp(), "task_store.sqlite"))
+
+import httpx
+
+from benchmark_middleware_stack import StubElasticsearch
+
+DESCRIPTIONS = [
+    "Erection of two storey rear extension and associated works",
+    "Change of use from office to 12 residential units with parking",
+    "Demolition of existing garage and erection of detached dwelling in conservation area",
+    "Installation of solar panels to listed building roof with heritage statement",
+    "Major mixed use development of 100 units, retail and office floorspace with drainage strategy",
+]
+DEVELOPMENT_TYPES = ["residential", "commercial", "industrial", "mixed_use", "change_of_use", "extension"]
+ENDPOINTS = [
+    ("GET", "/health", None),
+    ("POST", "/api/v1/search", {"query": "extension", "page": 1, "page_size": 20}),
+]
+
+
+def build_applications(count: int) -> Dict[str, "PlanningApplication"]:
+    from app.models.planning import PlanningApplication
+
+    rng = random.Random(7)
+    applications = {}
+    for i in range(count):
+        application_id = f"APP{i:06d}"
+        applications[application_id] = PlanningApplication(
+            application_id=application_id,
+            reference=f"24/{i:05d}/FUL",
+            authority=rng.choice(["Leeds", "York", "Hull", "Bradford"]),
+            address=f"{i} High Street",
+            postcode="LS1 1AA",
+            status=rng.choice(["submitted", "validated", "approved", "rejected"]),
+            description=rng.choice(DESCRIPTIONS) * rng.randint(1, 4),
+            development_type=rng.choice(DEVELOPMENT_TYPES),
+        )
+    return applications
+
+
+async def api_load(client: httpx.AsyncClient, rate: float, until) -> List[float]:
+    """Open-loop API load at `rate` requests/s until `until()` returns True"""
+    latencies: List[float] = []
+    in_flight = set()
+    rng = random.Random(1)
+
+    async def send(scheduled: float, method: str, path: str, payload):
+        await client.request(method, path, json=payload,
+                             headers={"x-forwarded-for": f"10.0.{rng.randint(0, 255)}.{rng.randint(1, 250)}"})
+        latencies.append((time.perf_counter() - scheduled) * 1000)
+
+    scheduled = time.perf_counter()
+    while not until():
+        # Send everything that fell due, including requests that queued
+        # up while the event loop was blocked
+        while scheduled <= time.perf_counter():
+            task = asyncio.create_task(send(scheduled, *rng.choice(ENDPOINTS)))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+            scheduled += 1 / rate
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+
+    await asyncio.gather(*in_flight)
+    return latencies
+
+
+async def run_scenario(client, applications, args, process_workers: Optional[int]) -> Dict[str, float]:
+    from app.core.config import settings
+    from app.services.background_processor import BackgroundProcessor, TaskStatus
+
+    if process_workers is None:
+        deadline = time.perf_counter() + args.idle_seconds
+        latencies = await api_load(client, args.rate, lambda: time.perf_counter() >= deadline)
+        return {"latencies": latencies}
+
+    settings.background_process_workers = process_workers
+    processor = BackgroundProcessor(max_workers=1)
+    await processor.start_workers()
+    finished = {TaskStatus.COMPLETED.value, TaskStatus.FAILED.value}
+
+    async def wait_for(task_id: str):
+        while (await processor.get_task_status(task_id))["status"] not in finished:
+            await asyncio.sleep(0.01)
+
+    pool_start_ms = 0.0
+    if process_workers:
+        # Spawn the pool before measuring (one-off cost per server process)
+        started = time.perf_counter()
+        await wait_for(await processor.submit_batch_scoring(list(applications)[:process_workers * 2]))
+        pool_start_ms = (time.perf_counter() - started) * 1000
+
+    task_id = await processor.submit_batch_scoring(list(applications))
+    started = time.perf_counter()
+    waiter = asyncio.create_task(wait_for(task_id))
+    latencies = await api_load(client, args.rate, waiter.done)
+    batch_s = time.perf_counter() - started
+
+    status = await processor.get_task_status(task_id)
+    result = await processor.get_task_result(task_id)
+    await processor.stop_workers()
+    return {
+        "latencies": latencies,
+        "batch_s": batch_s,
+        "cpu_s": status["cpu_time_seconds"],
+        "scored": result["successful_count"] if result else 0,
+        "pool_start_ms": pool_start_ms,
+    }
+
+
+async def run(args):
+    from app.core.config import settings
+    from app.db.elasticsearch import es_client
+    from app.main import app
+    from app.services.search import search_service
+
+    applications = build_applications(args.applications)
+    # The fixture applications stand in for Elasticsearch; keep them out of
+    # the collector's full scans so they don't add GC pauses a server wouldn't have
+    gc.collect()
+    gc.freeze()
+
+    async def get_application_by_id(application_id: str):
+        return applications.get(application_id)
+
+    search_service.get_application_by_id = get_application_by_id
+    es_client.client = StubElasticsearch()
+    es_client._is_connected = True
+
+    transport = httpx.ASGITransport(app=app, client=("10.0.0.1", 1234))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        warmup_until = time.perf_counter() + 0.5
+        await api_load(client, 100, lambda: time.perf_counter() >= warmup_until)  # route/cache warmup
+        scenarios = [
+            ("idle", None),
+            (f"batch in process pool x{args.workers}", args.workers),
+            # Last: the event-loop path leaves its results in the AI processing cache
+            ("batch on event loop", 0),
+        ]
+        rows = [(name, await run_scenario(client, applications, args, workers)) for name, workers in scenarios]
+
+    print(f"\n{'='*86}")
+    print("BACKGROUND CPU OFFLOAD BENCHMARK")
+    print(f"{'='*86}")
+    print(f"{args.applications} applications batch-scored, {args.rate:.0f} API requests/s "
+          f"(/health + search), {settings.background_cpu_chunk_size} applications per chunk")
+    print(f"{'scenario':<30}{'api p50':>9}{'api p99':>9}{'api max':>9}{'requests':>10}"
+          f"{'batch s':>9}{'task cpu s':>11}")
+    for name, row in rows:
+        latencies = sorted(row["latencies"])
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        batch = f"{row['batch_s']:.2f}" if "batch_s" in row else "-"
+        cpu = f"{row['cpu_s']:.2f}" if row.get("cpu_s") else "-"
+        print(f"{name:<30}{statistics.median(latencies):>9.2f}{p99:>9.2f}{latencies[-1]:>9.1f}"
+              f"{len(latencies):>10}{batch:>9}{cpu:>11}")
+    for name, row in rows:
+        if row.get("pool_start_ms"):
+            print(f"{name}: {row['scored']} scored; pool start (once per process) {row['pool_start_ms']:.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure API latency while a background batch scores applications')
+    parser.add_argument('--applications', type=int, default=10000)
+    parser.add_argument('--workers', type=int, default=2, help='Process pool size')
+    parser.add_argument('--rate', type=float, default=200.0, help='API requests per second')
+    parser.add_argument('--idle-seconds', type=float, default=3.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
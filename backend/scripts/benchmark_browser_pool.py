@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Browser Pool Benchmark
+
+Scrapes a local static test site (several ports = several "authority
+domains") twice: once with a fresh Chromium per authority (previous
+behaviour) and once through the shared BrowserPool. Reports wall time,
+pages/s and peak RSS of the browser processes (requires psutil).
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, List, Optional
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.pseo.browser_pool import BrowserPool
+from app.services.pseo.playwright_scraper import PlaywrightScraper
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+NEWS_ITEM = (
+    '<article class="news-item"><h3>Planning update {i}</h3><time>2025-10-0{d}</time>'
+    '<p>Committee decision on application {i}.</p><a href="/news/{i}">Read</a>'
+    '<img src="/img/{i}.jpg"></article>'
+)
+
+PAGE = """<!doctype html><html><head>
+<link rel="preload" href="/fonts/site.woff2" as="font" crossorigin>
+<script async src="https://www.googletagmanager.com/gtag/js"></script>
+</head><body><main>{body}</main></body></html>"""
+
+
+def build_site(root: Path):
+    """Write the pages PlaywrightScraper looks for, plus heavy assets"""
+    news = "".join(NEWS_ITEM.format(i=i, d=i % 9 + 1) for i in range(12))
+    pages = {
+        "planning/news/index.html": news,
+        "planning/local-plan/index.html": '<div class="plan-summary">Adopted Local Plan 2020-2035.</div>'
+                                          '<a href="/docs/local-plan.pdf">Adopted local-plan</a>',
+        "planning/planning-policy/index.html": '<h2>Housing policy</h2><p>35% affordable.</p>'
+                                               '<a href="/spd/design.pdf">Design SPD</a>',
+        "planning/planning-committee/index.html": '<span class="meeting-date">12 Nov 2025</span>'
+                                                  '<a href="/agenda.pdf">Agenda</a>',
+    }
+    for path, body in pages.items():
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(PAGE.format(body=body))
+
+    (root / "img").mkdir()
+    for i in range(12):
+        (root / "img" / f"{i}.jpg").write_bytes(b"\0" * 200_000)
+    (root / "fonts").mkdir()
+    (root / "fonts" / "site.woff2").write_bytes(b"\0" * 100_000)
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def start_servers(root: Path, count: int) -> List[ThreadingHTTPServer]:
+    servers = []
+    for _ in range(count):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=str(root)))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    return servers
+
+
+class RssSampler:
+    """Sample total RSS of this process's children (the browsers)"""
+
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self.peak = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        me = psutil.Process()
+        while True:
+            total = 0
+            for child in me.children(recursive=True):
+                try:
+                    total += child.memory_info().rss
+                except psutil.Error:
+                    pass
+            self.peak = max(self.peak, total)
+            await asyncio.sleep(self.interval)
+
+    def __enter__(self):
+        if psutil is not None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    def __exit__(self, *exc):
+        if self._task:
+            self._task.cancel()
+
+
+async def run(authorities: List[Dict], concurrency: int, pool: Optional[BrowserPool]) -> Dict:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def scrape(authority):
+        async with semaphore:
+            return await PlaywrightScraper(authority, pool).scrape_authority()
+
+    with RssSampler() as sampler:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(scrape(a) for a in authorities))
+        elapsed = time.perf_counter() - start
+
+    if pool is not None:
+        await pool.close()
+
+    return {
+        "elapsed": elapsed,
+        "pages_per_second": len(authorities) / elapsed,
+        "peak_rss_mb": sampler.peak / 1024 / 1024 if psutil else None,
+        "with_news": sum(1 for r in results if r.get('news'))
+    }
+
+
+def print_result(label: str, result: Dict):
+    rss = f"{result['peak_rss_mb']:.0f} MB" if result['peak_rss_mb'] is not None else "n/a (install psutil)"
+    print(f"{label:<22} {result['elapsed']:6.2f}s  {result['pages_per_second']:5.2f} authorities/s  "
+          f"peak browser RSS {rss}  ({result['with_news']} with news)")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Benchmark BrowserPool against per-authority browsers')
+    parser.add_argument('--authorities', type=int, default=24)
+    parser.add_argument('--domains', type=int, default=8, help='Local servers (distinct host:port)')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--pool-size', type=int, default=2)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build_site(root)
+        servers = start_servers(root, args.domains)
+
+        authorities = [
+            {
+                'id': f'auth-{i}',
+                'name': f'Authority {i}',
+                'website_url': f"http://127.0.0.1:{servers[i % len(servers)].server_address[1]}"
+            }
+            for i in range(args.authorities)
+        ]
+
+        baseline = await run(authorities, args.concurrency, None)
+        pooled = await run(authorities, args.concurrency, BrowserPool(size=args.pool_size))
+
+        for server in servers:
+            server.shutdown()
+
+    print(f"\n{'='*60}")
+    print("BROWSER POOL BENCHMARK")
+    print(f"{'='*60}")
+    print(f"Authorities: {args.authorities}  Domains: {args.domains}  Concurrency: {args.concurrency}")
+    print_result("Browser per authority", baseline)
+    print_result("Shared pool", pooled)
+    print(f"Speedup: {baseline['elapsed'] / pooled['elapsed']:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
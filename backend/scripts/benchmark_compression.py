@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Response Compression Benchmark
+
+Serves synthetic search-result JSON (buffered JSONResponse and a chunked
+StreamingResponse) through three stacks and reports bytes on the wire
+and p50/p99 latency for a concurrent mix of large and small requests:
+
+  * legacy     - previous BaseHTTPMiddleware that only compressed
+                 responses exposing `.body` (never true after call_next)
+  * buffered   - whole-body gzip.compress on the event loop
+  * streaming  - pure ASGI CompressionMiddleware (incremental, offloaded)
+
+Only encoders installed locally (gzip always; br/zstd if available) are
+negotiated.
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.middleware.performance import CompressionMiddleware, ENCODERS
+
+AUTHORITIES = ["Leeds", "York", "Hull", "Bradford", "Wakefield", "Sheffield", "Harrogate", "Selby"]
+
+
+def synthetic_results(count: int, rng: random.Random) -> Dict:
+    return {
+        "results": [
+            {
+                "application_id": f"APP/{rng.randint(10000, 99999)}/{i}",
+                "local_authority": rng.choice(AUTHORITIES),
+                "status": rng.choice(["Pending", "Approved", "Refused"]),
+                "proposal_description": " ".join(rng.choice(
+                    ["erection", "of", "two", "storey", "rear", "extension", "change", "use", "dwelling",
+                     "demolition", "existing", "garage", "single", "detached", "house", "associated", "works"]
+                ) for _ in range(rng.randint(20, 80))),
+                "relevance_score": round(rng.random(), 4),
+                "location": {"lat": 53 + rng.random(), "lon": -1.5 + rng.random()},
+            }
+            for i in range(count)
+        ],
+        "total": count,
+    }
+
+
+class LegacyCompressionMiddleware(BaseHTTPMiddleware):
+    """Previous implementation (checks hasattr(response, 'body'))"""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        response = await call_next(request)
+        if "gzip" not in request.headers.get("accept-encoding", "").lower():
+            return response
+        if hasattr(response, "body") and len(response.body) >= 1024:
+            compressed_body = gzip.compress(response.body)
+            if len(compressed_body) < len(response.body):
+                response.headers["content-encoding"] = "gzip"
+                response.headers["content-length"] = str(len(compressed_body))
+                response.body = compressed_body
+        return response
+
+
+class BufferedGzipMiddleware(BaseHTTPMiddleware):
+    """Reads the whole streamed body and gzips it on the event loop"""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        response = await call_next(request)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+        if "gzip" in request.headers.get("accept-encoding", "").lower() and len(body) >= 1024:
+            body = gzip.compress(body)
+            headers["content-encoding"] = "gzip"
+        return Response(content=body, status_code=response.status_code, headers=headers)
+
+
+def build_app(middleware, payload: Dict, small: Dict) -> FastAPI:
+    app = FastAPI()
+    body = json.dumps(payload).encode()
+
+    @app.get("/search")
+    async def search():
+        return JSONResponse(payload)
+
+    @app.get("/export")
+    async def export():
+        async def chunks():
+            for start in range(0, len(body), 64 * 1024):
+                yield body[start:start + 64 * 1024]
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    @app.get("/health")
+    async def health():
+        return small
+
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+async def run_stack(app: FastAPI, encoding: str, requests: int, concurrency: int) -> Dict[str, float]:
+    transport = httpx.ASGITransport(app=app)
+    headers = {"accept-encoding": encoding}
+    latencies: Dict[str, List[float]] = {"/search": [], "/export": [], "/health": []}
+    wire_bytes = {"/search": 0, "/export": 0}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one(path: str):
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(path, headers=headers)
+                latencies[path].append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+                if path in wire_bytes:
+                    wire_bytes[path] = response.num_bytes_downloaded
+
+        paths = ["/search", "/export", "/health", "/health"] * (requests // 4)
+        await asyncio.gather(*(one(path) for path in paths))
+
+    def p99(samples):
+        return sorted(samples)[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+    return {
+        "search_bytes": wire_bytes["/search"],
+        "export_bytes": wire_bytes["/export"],
+        "large_p50": statistics.median(latencies["/search"] + latencies["/export"]),
+        "large_p99": p99(latencies["/search"] + latencies["/export"]),
+        "small_p99": p99(latencies["/health"]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark streaming response compression')
+    parser.add_argument('--results', type=int, default=2000, help='Results per large response')
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, default=32)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    payload = synthetic_results(args.results, rng)
+    small = {"status": "healthy", "services": {"elasticsearch": "ok", "supabase": "ok"}}
+    encoding = ", ".join(list(ENCODERS)) + ", identity"
+
+    stacks = {
+        "legacy": LegacyCompressionMiddleware,
+        "buffered": BufferedGzipMiddleware,
+        "streaming": CompressionMiddleware,
+    }
+
+    print(f"\n{'='*78}")
+    print("RESPONSE COMPRESSION BENCHMARK")
+    print(f"{'='*78}")
+    print(f"Payload: {len(json.dumps(payload).encode()) / 1024:.0f} KiB JSON  Accept-Encoding: {encoding}")
+    print(f"{args.requests} requests (1/4 /search, 1/4 /export streamed, 1/2 small), concurrency {args.concurrency}")
+    print(f"{'stack':<11}{'search KiB':>11}{'export KiB':>11}{'large p50':>11}{'large p99':>11}{'small p99':>11}")
+    for name, middleware in stacks.items():
+        result = asyncio.run(run_stack(build_app(middleware, payload, small), encoding, args.requests, args.concurrency))
+        print(f"{name:<11}{result['search_bytes'] / 1024:>11.0f}{result['export_bytes'] / 1024:>11.0f}"
+              f"{result['large_p50']:>9.1f}ms{result['large_p99']:>9.1f}ms{result['small_p99']:>9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
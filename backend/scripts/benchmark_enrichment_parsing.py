@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Enrichment HTML Parsing Benchmark
+
+Compares the previous extractors (a fresh BeautifulSoup html.parser parse
+per field) with the single-parse ParsedPage index on saved Idox portal
+pages. Pass a directory of saved "details" pages with --pages-dir; without
+one, a synthetic Idox-style details page is generated. Also checks that
+both approaches extract the same values.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.agents.enrichment.applicant_agent import ApplicantEnrichmentAgent
+from app.agents.enrichment.utils.html_index import LXML_AVAILABLE
+from app.agents.enrichment.utils.validators import ApplicantDataValidator
+
+
+IDOX_URL = "https://publicaccess.example.gov.uk/online-applications/applicationDetails.do?activeTab=details&keyVal=ABC123"
+
+DETAIL_ROWS = [
+    ("Application Type", "Householder"), ("Case Officer", "Jane Doe"), ("Parish", "Town Ward"),
+    ("Ward", "Castle"), ("Applicant Name", "Mr John Smith"), ("Agent Name", "Acme Architects Ltd"),
+    ("Agent Company Name", "Acme Architects"), ("Agent Address", "1 High Street, Dover"),
+    ("Environmental Assessment Requested", "No"), ("Statutory Period", "56 days"),
+    ("Target Determination Date", "Fri 12 Dec 2025"), ("Decision Date", "Thu 11 Dec 2025"),
+]
+
+
+def synthetic_idox_page() -> str:
+    """Roughly the size and shape of a real Idox details tab"""
+    nav = "".join(f'<li><a href="/menu/{i}">Menu item {i}</a></li>' for i in range(150))
+    rows = "".join(f'<tr><th scope="row">{k}</th><td>{v}</td></tr>' for k, v in DETAIL_ROWS)
+    footer = "".join(f'<div class="footer-col"><span>Link {i}</span><a href="#">More</a></div>' for i in range(80))
+    return (
+        '<!DOCTYPE html><html><head><title>Details</title>'
+        + "".join(f'<script src="/js/{i}.js"></script>' for i in range(20))
+        + f'</head><body><ul id="nav">{nav}</ul>'
+        '<div id="tabs"><a href="?activeTab=summary">Summary</a><a href="?activeTab=details">Further Information</a>'
+        '<a href="?activeTab=documents">Documents (38)</a></div>'
+        f'<table id="applicationDetails">{rows}</table>'
+        f'<div id="footer">{footer}</div></body></html>'
+    )
+
+
+# --- Previous implementation (one html.parser parse per field) ---------------
+
+def legacy_table_value(html: str, label: str) -> Optional[str]:
+    soup = BeautifulSoup(html, 'html.parser')
+    for row in soup.find_all('tr'):
+        th = row.find('th')
+        td = row.find('td')
+        if th and td and label.lower() in th.get_text().lower():
+            return ApplicantDataValidator.clean(td.get_text().strip())
+        cells = row.find_all('td')
+        if len(cells) >= 2 and label.lower() in cells[0].get_text().lower():
+            return ApplicantDataValidator.clean(cells[1].get_text().strip())
+    return None
+
+
+def legacy_extract(html: str) -> Dict:
+    soup = BeautifulSoup(html, 'html.parser')
+    n_documents = None
+    docs_tab = soup.find(string=re.compile(r'Documents?\s*\(?\d+\)?', re.IGNORECASE))
+    if docs_tab:
+        n_documents = int(re.search(r'(\d+)', docs_tab).group(1))
+
+    BeautifulSoup(html, 'html.parser')  # _extract_statutory_days parsed (unused) too
+    statutory = legacy_table_value(html, "Statutory Period")
+    n_statutory_days = int(statutory.replace(' days', '')) if statutory and statutory.replace(' days', '').isdigit() else None
+
+    return {
+        "applicant_name": legacy_table_value(html, "Applicant Name"),
+        "agent_name": legacy_table_value(html, "Agent Name"),
+        "ward_name": legacy_table_value(html, "Ward"),
+        "decided_date": legacy_table_value(html, "Decision Date"),
+        "n_documents": n_documents,
+        "n_statutory_days": n_statutory_days,
+    }
+
+
+# --- Current implementation ---------------------------------------------------
+
+def current_extract(agent: ApplicantEnrichmentAgent, html: str) -> Dict:
+    from app.agents.enrichment.utils.html_index import ParsedPage
+
+    page = ParsedPage(html)
+    return {
+        "applicant_name": agent._extract_table_value(page, "Applicant Name"),
+        "agent_name": agent._extract_table_value(page, "Agent Name"),
+        "ward_name": agent._extract_table_value(page, "Ward"),
+        "decided_date": agent._extract_table_value(page, "Decision Date"),
+        "n_documents": agent._extract_document_count(page, IDOX_URL),
+        "n_statutory_days": agent._extract_statutory_days(page),
+    }
+
+
+def time_it(fn, pages: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            fn(html)
+    return (time.perf_counter() - start) / (repeat * len(pages)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark single-parse enrichment extraction')
+    parser.add_argument('--pages-dir', type=str, help='Directory of saved Idox details pages (*.html)')
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    if args.pages_dir:
+        pages = [p.read_text(encoding='utf-8', errors='replace') for p in sorted(Path(args.pages_dir).glob('*.html'))]
+        if not pages:
+            sys.exit(f"No .html files in {args.pages_dir}")
+    else:
+        pages = [synthetic_idox_page()]
+
+    agent = ApplicantEnrichmentAgent()
+
+    mismatches = 0
+    for html in pages:
+        legacy, current = legacy_extract(html), current_extract(agent, html)
+        if legacy != current:
+            mismatches += 1
+            print(f"Mismatch:\n  legacy:  {legacy}\n  current: {current}")
+
+    legacy_ms = time_it(legacy_extract, pages, args.repeat)
+    current_ms = time_it(lambda html: current_extract(agent, html), pages, args.repeat)
+
+    print(f"\n{'='*60}")
+    print("ENRICHMENT PARSING BENCHMARK")
+    print(f"{'='*60}")
+    print(f"Pages: {len(pages)} ({sum(len(p) for p in pages) / len(pages) / 1024:.0f} KB avg)  "
+          f"Parser: {'lxml' if LXML_AVAILABLE else 'html.parser'}")
+    print(f"Per-field parsing: {legacy_ms:7.2f} ms/page")
+    print(f"Single parse:      {current_ms:7.2f} ms/page")
+    print(f"Speedup: {legacy_ms / current_ms:.1f}x  Mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Middleware Stack Load Benchmark
+
+Runs the real FastAPI app (full middleware stack) in-process with
+Elasticsearch replaced by an in-memory stub, and drives it with a
+closed-loop load generator (N concurrent clients over an ASGI
+transport). Reports requests/s and p50/p99 latency for /health,
+POST /api/v1/search and /api/v1/stats/overview.
+
+Run once per revision to compare, e.g.:
+    python scripts/benchmark_middleware_stack.py --label before
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+os.environ.setdefault("ELASTICSEARCH_NODE", "http://stub:9200")
+os.environ.setdefault("ELASTICSEARCH_USERNAME", "stub")
+os.environ.setdefault("ELASTICSEARCH_PASSWORD", "stub")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("RATE_LIMIT_REQUESTS", "100000000")
+
+import httpx
+
+AUTHORITIES = ["Leeds", "York", "Hull", "Bradford", "Wakefield", "Sheffield"]
+
+
+class _StubNamespace:
+    async def health(self, **kwargs):
+        return {"status": "green"}
+
+    async def exists(self, **kwargs):
+        return True
+
+
+class StubElasticsearch:
+    """Answers search/count/get with canned documents (no network)"""
+
+    def __init__(self, seed: int = 1):
+        rng = random.Random(seed)
+        self.documents = [
+            {
+                "uid": f"{rng.randint(10, 99)}/{rng.randint(10000, 99999)}/FUL",
+                "reference": f"REF{i}",
+                "area_name": rng.choice(AUTHORITIES),
+                "description": "Erection of two storey rear extension and associated works",
+                "address": f"{i} High Street",
+                "postcode": "LS1 1AA",
+                "app_state": rng.choice(["Undecided", "Permitted", "Rejected"]),
+                "start_date": "2024-11-01",
+            }
+            for i in range(100)
+        ]
+        self.cluster = _StubNamespace()
+        self.indices = _StubNamespace()
+
+    async def ping(self, **kwargs):
+        return True
+
+    async def search(self, index=None, body=None, **kwargs):
+        size = (body or {}).get("size", 10)
+        return {
+            "took": 3,
+            "hits": {
+                "total": {"value": 12345, "relation": "eq"},
+                "hits": [{"_id": d["reference"], "_score": 1.0, "_source": d} for d in self.documents[:size]],
+            },
+            "aggregations": {},
+        }
+
+    async def count(self, index=None, body=None, **kwargs):
+        return {"count": 12345}
+
+    async def get(self, index=None, id=None, **kwargs):
+        return {"_id": id, "_source": self.documents[0]}
+
+
+ENDPOINTS = {
+    "/health": ("GET", None),
+    "/api/v1/search": ("POST", {"query": "extension", "page": 1, "page_size": 20}),
+    "/api/v1/stats/overview": ("GET", None),
+}
+
+
+async def load(client: httpx.AsyncClient, path: str, concurrency: int, duration: float) -> Dict[str, Any]:
+    method, payload = ENDPOINTS[path]
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors
+        rng = random.Random()
+        while time.perf_counter() < deadline:
+            # Many distinct clients, so per-IP endpoint caps don't turn the run into 429s
+            headers = {"accept-encoding": "gzip", "x-forwarded-for": f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.1"}
+            start = time.perf_counter()
+            response = await client.request(method, path, json=payload, headers=headers)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "errors": errors,
+        "requests": len(latencies),
+    }
+
+
+async def run(args):
+    from app.db.elasticsearch import es_client
+    from app.main import app
+
+    es_client.client = StubElasticsearch()
+    es_client._is_connected = True
+
+    transport = httpx.ASGITransport(app=app, client=("10.0.0.1", 1234))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up routes and caches
+        for path in ENDPOINTS:
+            await load(client, path, 4, 0.2)
+
+        print(f"\n{'='*72}")
+        print(f"MIDDLEWARE STACK LOAD BENCHMARK [{args.label}]")
+        print(f"{'='*72}")
+        print(f"{args.concurrency} concurrent clients, {args.duration:.0f}s per endpoint, stubbed Elasticsearch")
+        print(f"{'endpoint':<26}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>9}")
+        for path in ENDPOINTS:
+            result = await load(client, path, args.concurrency, args.duration)
+            print(f"{path:<26}{result['rps']:>10.0f}{result['p50']:>10.2f}{result['p99']:>10.2f}"
+                  f"{result['errors']:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test the middleware stack in-process')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds per endpoint')
+    parser.add_argument('--label', default='current')
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Notification Digest Benchmark
+
+Fires a burst of alert notifications at NotificationService and compares
+immediate delivery with digest delivery against a local SMTP sink. Reports
+emails sent, SMTP connections opened and Supabase insert requests. Supabase
+user lookups are stubbed; the SMTP traffic is real.
+
+    python scripts/benchmark_notification_digests.py --users 20 --events 300
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.db.supabase import supabase_client
+from app.models.user import UserProfile, UserSettings
+from app.services import email_sender as email_sender_module
+from app.services.email_sender import SMTPConnectionPool
+from app.services.notification_digest import NotificationDigester
+from app.services.notification_service import notification_service
+
+
+class SMTPSink:
+    """Minimal SMTP server that accepts and counts messages"""
+
+    def __init__(self):
+        self.messages = 0
+        self.connections = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        writer.write(b"220 sink ESMTP\r\n")
+        in_data = False
+        while line := await reader.readline():
+            if in_data:
+                if line == b".\r\n":
+                    in_data = False
+                    self.messages += 1
+                    writer.write(b"250 OK queued\r\n")
+                continue
+            command = line[:4].upper()
+            if command in (b"EHLO", b"HELO"):
+                writer.write(b"250 sink\r\n")
+            elif command == b"DATA":
+                in_data = True
+                writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+            elif command == b"QUIT":
+                writer.write(b"221 Bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"250 OK\r\n")
+            await writer.drain()
+        writer.close()
+
+
+def stub_supabase(users: int, inserts: list):
+    async def get_user_profile(user_id):
+        return UserProfile(user_id=user_id, email=f"{user_id}@example.com", full_name=f"User {user_id}")
+
+    async def get_user_settings(user_id):
+        return UserSettings(user_id=user_id)  # Defaults: in-app + email
+
+    async def create_notifications(rows, chunk_size=500):
+        inserts.append(len(rows))
+        return len(rows)
+
+    supabase_client.get_user_profile = get_user_profile
+    supabase_client.get_user_settings = get_user_settings
+    supabase_client.create_notifications = create_notifications
+
+
+async def burst(users: int, events: int):
+    for i in range(events):
+        await notification_service.send_alert_notification(
+            user_id=f"user{i % users}",
+            alert_name=f"Alert {i % 7}",
+            alert_id=f"alert-{i % 7}",
+            new_applications_count=3,
+            sample_applications=[]
+        )
+
+
+async def run(mode: str, users: int, events: int, port: int):
+    sink = SMTPSink()
+    server = await asyncio.start_server(sink.handle, "127.0.0.1", port)
+    inserts: list = []
+    stub_supabase(users, inserts)
+
+    sender = SMTPConnectionPool(host="127.0.0.1", port=port, use_tls=False, rate_limit=0)
+    email_sender_module.email_sender = sender
+
+    digester = None
+    if mode == "digest":
+        digester = NotificationDigester(window=3600)
+        await digester.start()
+        notification_service.digester = digester
+
+    start = time.perf_counter()
+    await burst(users, events)
+    if digester:
+        await digester.stop()
+        notification_service.digester = None
+    elapsed = time.perf_counter() - start
+
+    await sender.close()
+    server.close()
+    await server.wait_closed()
+    return {
+        "elapsed_ms": elapsed * 1000,
+        "emails": sink.messages,
+        "smtp_connections": sink.connections,
+        "insert_requests": len(inserts),
+        "in_app_rows": sum(inserts)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark notification digests')
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--events', type=int, default=300)
+    parser.add_argument('--port', type=int, default=8025)
+    args = parser.parse_args()
+
+    settings.enable_push_notifications = False
+    notification_service.smtp_server = "127.0.0.1"
+
+    immediate = asyncio.run(run("immediate", args.users, args.events, args.port))
+    digest = asyncio.run(run("digest", args.users, args.events, args.port))
+
+    print(f"\n{'='*60}")
+    print("NOTIFICATION DIGEST BENCHMARK")
+    print(f"{'='*60}")
+    print(f"Burst: {args.events} alert notifications for {args.users} users")
+    print(f"{'':18}{'immediate':>12}{'digest':>12}")
+    for key in ("elapsed_ms", "emails", "smtp_connections", "insert_requests", "in_app_rows"):
+        print(f"{key:18}{immediate[key]:>12.0f}{digest[key]:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
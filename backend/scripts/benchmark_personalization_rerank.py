@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Personalization Re-ranking Benchmark
+
+Compares the previous per-result personalization loop (one awaited score
+and factor call per result, then a Python sort) with the vectorized
+BatchReranker on synthetic 100-result pages, and checks that both produce
+the same scores and ordering.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.ai.personalization_ranker import BatchReranker
+
+AUTHORITIES = ["Leeds", "York", "Hull", "Bradford", "Wakefield", "Sheffield", "Harrogate", "Selby"]
+DEVELOPMENT_TYPES = ["Residential", "Commercial", "Industrial", "Retail", "Mixed_use", "Infrastructure", "Other"]
+APPLICATION_TYPES = ["householder", "full", "outline", "certificate_of_lawfulness", "reserved_matters"]
+
+
+def synthetic_page(size: int, rng: random.Random) -> List[Dict[str, Any]]:
+    return [
+        {
+            "application_id": f"APP/{i}",
+            "local_authority": rng.choice(AUTHORITIES),
+            "development_type": rng.choice(DEVELOPMENT_TYPES),
+            "application_type": rng.choice(APPLICATION_TYPES),
+            "status": rng.choice(["Pending", "Approved", "Refused"]),
+            "proposal_description": "x" * rng.randint(50, 900),
+            "relevance_score": round(rng.random(), 3),
+        }
+        for i in range(size)
+    ]
+
+
+def user(expertise: float):
+    profile = SimpleNamespace(preferred_authorities=["Leeds", "York"], expertise_level=expertise)
+    preferences = SimpleNamespace(content_preferences={
+        'residential': 0.5, 'commercial': 0.5, 'industrial': 0.3,
+        'retail': 0.4, 'mixed_use': 0.6, 'infrastructure': 0.3
+    })
+    return profile, preferences
+
+
+# --- Previous implementation (per-result awaits) ------------------------------
+
+async def legacy_score(result, user_profile, user_preferences) -> float:
+    score = 0.5
+    if result.get('local_authority', '') in user_profile.preferred_authorities:
+        score += 0.2
+    result_type = result.get('development_type', '').lower()
+    for content_type, preference in user_preferences.content_preferences.items():
+        if content_type in result_type:
+            score += preference * 0.1
+    if user_profile.expertise_level > 0.7:
+        if result.get('proposal_description', ''):
+            if len(result['proposal_description']) > 500:
+                score += 0.1
+    else:
+        if result.get('application_type') in ['householder', 'certificate_of_lawfulness']:
+            score += 0.1
+    return min(score, 1.0)
+
+
+async def legacy_factors(result, user_profile) -> List[str]:
+    factors = []
+    if result.get('local_authority') in user_profile.preferred_authorities:
+        factors.append(f"Matches your geographic focus on {result['local_authority']}")
+    if user_profile.expertise_level > 0.7:
+        factors.append("Detailed content suitable for your expertise level")
+    return factors
+
+
+async def legacy_rerank(results, user_profile, user_preferences):
+    out = []
+    for result in results:
+        result['personalization_score'] = await legacy_score(result, user_profile, user_preferences)
+        result['personalization_factors'] = await legacy_factors(result, user_profile)
+        out.append(result)
+    out.sort(key=lambda x: (x.get('personalization_score', 0) * 0.4 + x.get('relevance_score', 0) * 0.6), reverse=True)
+    return out
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    return sorted(samples)[min(len(samples) - 1, int(len(samples) * pct))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark vectorized personalization re-ranking')
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--pages', type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    pages = [synthetic_page(args.page_size, rng) for _ in range(args.pages)]
+    users = [user(0.4), user(0.9)]
+
+    mismatches = 0
+    for i, page in enumerate(pages[:50]):
+        profile, preferences = users[i % 2]
+        legacy = asyncio.run(legacy_rerank([dict(r) for r in page], profile, preferences))
+        batch = BatchReranker(profile, preferences).rerank([dict(r) for r in page])
+        if [r['application_id'] for r in legacy] != [r['application_id'] for r in batch] or any(
+            abs(a['personalization_score'] - b['personalization_score']) > 1e-9 for a, b in zip(legacy, batch)
+        ):
+            mismatches += 1
+
+    async def time_legacy():
+        samples = []
+        for i, page in enumerate(pages):
+            profile, preferences = users[i % 2]
+            start = time.perf_counter()
+            await legacy_rerank(page, profile, preferences)
+            samples.append((time.perf_counter() - start) * 1000)
+        return samples
+
+    legacy_ms = asyncio.run(time_legacy())
+
+    batch_ms = []
+    for i, page in enumerate(pages):
+        profile, preferences = users[i % 2]
+        start = time.perf_counter()
+        BatchReranker(profile, preferences).rerank(page)
+        batch_ms.append((time.perf_counter() - start) * 1000)
+
+    print(f"\n{'='*60}")
+    print("PERSONALIZATION RE-RANKING BENCHMARK")
+    print(f"{'='*60}")
+    print(f"Pages: {args.pages} x {args.page_size} results")
+    print(f"{'':14}{'median ms':>12}{'p95 ms':>12}")
+    print(f"{'per-result':14}{statistics.median(legacy_ms):>12.3f}{percentile(legacy_ms, 0.95):>12.3f}")
+    print(f"{'vectorized':14}{statistics.median(batch_ms):>12.3f}{percentile(batch_ms, 0.95):>12.3f}")
+    print(f"Speedup (median): {statistics.median(legacy_ms) / statistics.median(batch_ms):.1f}x  "
+          f"Ranking mismatches: {mismatches}/50")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Benchmark
+
+Compares the previous sliding-window limiter (deque of timestamps per key
+behind one asyncio.Lock) with the GCRA limiter:
+
+  * per-check overhead and state size for many clients
+  * middleware overhead per request (JWT subject decode + check)
+  * burst/refill behaviour
+  * with REDIS_URL set and reachable: the Lua-scripted limiter shared by
+    several simulated workers (limit must hold globally, not per worker)
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.middleware.rate_limit import RateLimiter, RedisRateLimiter, RateLimitMiddleware
+
+
+class LegacyRateLimiter:
+    """Previous implementation"""
+
+    def __init__(self):
+        self.requests = defaultdict(deque)
+        self.lock = asyncio.Lock()
+
+    async def is_allowed(self, key, max_requests, window_seconds):
+        async with self.lock:
+            now = time.time()
+            window_start = now - window_seconds
+            request_times = self.requests[key]
+            while request_times and request_times[0] < window_start:
+                request_times.popleft()
+            current_requests = len(request_times)
+            remaining = max(0, max_requests - current_requests)
+            if current_requests >= max_requests:
+                return False, 0
+            request_times.append(now)
+            return True, remaining - 1
+
+
+async def time_checks(limiter, keys: int, per_key: int, limit: int) -> float:
+    start = time.perf_counter()
+    for _ in range(per_key):
+        for k in range(keys):
+            await limiter.is_allowed(f"ip:{k}", limit, 60)
+    return (time.perf_counter() - start) * 1e6 / (keys * per_key)
+
+
+async def state_size(limiter_factory, keys: int, per_key: int, limit: int) -> int:
+    tracemalloc.start()
+    limiter = limiter_factory()
+    for _ in range(per_key):
+        for k in range(keys):
+            await limiter.is_allowed(f"ip:{k}", limit, 60)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def burst_check() -> str:
+    limiter = RateLimiter()
+    allowed = sum(limiter.check("k", 10, 60, now=0.0).allowed for _ in range(15))
+    denied = limiter.check("k", 10, 60, now=0.0)
+    refilled = limiter.check("k", 10, 60, now=6.0).allowed   # one emission interval later
+    return (f"burst of 15 at limit 10/60s -> {allowed} allowed; "
+            f"retry_after {denied.retry_after:.1f}s; after 6s allowed={refilled}")
+
+
+async def middleware_overhead(samples: int) -> float:
+    from jose import jwt
+    from app.core.config import settings
+    from starlette.requests import Request
+    from app.db.supabase import supabase_client
+
+    middleware = RateLimitMiddleware.__new__(RateLimitMiddleware)
+    middleware.local_limiter = RateLimiter()
+    middleware.rate_limiter = middleware.local_limiter
+    middleware.default_requests = settings.rate_limit_requests
+    middleware.default_period = settings.rate_limit_period
+
+    token = jwt.encode({"sub": "user-1", "type": "access"}, settings.secret_key, algorithm=settings.algorithm)
+
+    # Profile lookups are served from the shared profile cache; skip Supabase here
+    async def cached_profile(user_id):
+        return SimpleNamespace(role="professional")
+
+    supabase_client.get_cached_user_profile = cached_profile
+    scope = {
+        "type": "http", "method": "GET", "path": "/api/v1/applications", "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())], "client": ("127.0.0.1", 1),
+    }
+
+    timings = []
+    for _ in range(samples):
+        request = Request(scope)
+        start = time.perf_counter()
+        key, limit, period = await middleware._get_rate_limit_params(request)
+        await middleware.rate_limiter.is_allowed(key, limit, period)
+        timings.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(timings)
+
+
+async def redis_check(redis_url: str, workers: int, limit: int) -> str:
+    from app.services.cache_service import init_cache_service, get_cache_service, shutdown_cache_service
+
+    await init_cache_service(redis_url)
+    if not get_cache_service().available:
+        return "Redis not reachable - skipped"
+
+    key = f"bench:{time.time()}"
+    limiters = [RedisRateLimiter(RateLimiter()) for _ in range(workers)]
+    results = await asyncio.gather(*(
+        limiters[i % workers].is_allowed(key, limit, 60) for i in range(limit * 3)
+    ))
+    start = time.perf_counter()
+    for i in range(500):
+        await limiters[0].is_allowed(f"{key}:{i}", limit, 60)
+    per_check = (time.perf_counter() - start) * 1e6 / 500
+    await shutdown_cache_service()
+    return (f"{workers} workers, limit {limit}: {sum(r.allowed for r in results)} of {limit * 3} allowed "
+            f"(global); {per_check:.0f} us/check round trip")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark GCRA rate limiting')
+    parser.add_argument('--keys', type=int, default=5000)
+    parser.add_argument('--per-key', type=int, default=50)
+    parser.add_argument('--limit', type=int, default=200)
+    args = parser.parse_args()
+
+    legacy_us = asyncio.run(time_checks(LegacyRateLimiter(), args.keys, args.per_key, args.limit))
+    gcra_us = asyncio.run(time_checks(RateLimiter(), args.keys, args.per_key, args.limit))
+    legacy_bytes = asyncio.run(state_size(LegacyRateLimiter, args.keys, args.per_key, args.limit))
+    gcra_bytes = asyncio.run(state_size(RateLimiter, args.keys, args.per_key, args.limit))
+
+    print(f"\n{'='*60}")
+    print("RATE LIMITER BENCHMARK")
+    print(f"{'='*60}")
+    print(f"{args.keys} clients x {args.per_key} requests, limit {args.limit}/60s")
+    print(f"{'':18}{'us/check':>10}{'bytes/client':>14}")
+    print(f"{'deque + lock':18}{legacy_us:>10.2f}{legacy_bytes / args.keys:>14.0f}")
+    print(f"{'GCRA (local)':18}{gcra_us:>10.2f}{gcra_bytes / args.keys:>14.0f}")
+    print(f"Middleware overhead (JWT sub + tier + check): {asyncio.run(middleware_overhead(5000)):.1f} us/request")
+    print(burst_check())
+
+    redis_url = os.getenv("REDIS_URL")
+    print(asyncio.run(redis_check(redis_url, 4, 20)) if redis_url else "REDIS_URL not set - Redis check skipped")
+
+
+if __name__ == "__main__":
+    main()
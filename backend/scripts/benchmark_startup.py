@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Application Startup Benchmark
+
+Runs the real FastAPI lifespan in-process with Elasticsearch replaced by
+a stub that answers after a fixed latency (connect and every search),
+and reports:
+
+  * time to import app.main
+  * time until the lifespan yields (server accepting traffic)
+  * time until background warmup (stats cache, AI models) is finished
+  * per-component startup timings recorded by the startup manager
+
+Supabase/Redis are left unconfigured, so those initializers fail fast.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+os.environ.setdefault("ELASTICSEARCH_NODE", "http://stub:9200")
+os.environ.setdefault("ELASTICSEARCH_USERNAME", "stub")
+os.environ.setdefault("ELASTICSEARCH_PASSWORD", "stub")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+class _StubNamespace:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def health(self, **kwargs):
+        return {"status": "green"}
+
+    async def exists(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        return True
+
+    async def get_mapping(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        return {}
+
+
+# Empty authority-stats aggregations (shape expected by parse_authority_stats)
+EMPTY_AGGREGATIONS = {
+    "last_12_months": {"total": {"value": 0}, "approved": {"doc_count": 0}},
+    "monthly_trend": {"by_month": {"buckets": []}},
+    "top_app_types": {"types": {"buckets": []}},
+    "status_breakdown": {"statuses": {"buckets": []}},
+    "avg_decision_days": {"avg_days": {"value": None}},
+    "all_time_total": {"value": 0},
+    "active_applications": {"count": {"value": 0}},
+}
+
+
+class StubElasticsearch:
+    """Every call takes `latency` seconds and returns empty results"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.cluster = _StubNamespace(latency)
+        self.indices = _StubNamespace(latency)
+
+    async def search(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        return {"took": 1, "hits": {"total": {"value": 0, "relation": "eq"}, "hits": []},
+                "aggregations": EMPTY_AGGREGATIONS}
+
+    async def count(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        return {"count": 0}
+
+    async def index(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        return {"result": "created"}
+
+    async def get(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        raise KeyError("not found")
+
+    async def ping(self, **kwargs):
+        return True
+
+    async def close(self):
+        pass
+
+
+async def run(args):
+    latency = args.es_latency / 1000
+
+    started = time.perf_counter()
+    from app.main import app, lifespan
+    import_ms = (time.perf_counter() - started) * 1000
+
+    from app.core.startup import startup_manager
+    from app.db.elasticsearch import es_client
+
+    async def connect():
+        await asyncio.sleep(latency)
+        es_client.client = StubElasticsearch(latency)
+        es_client._is_connected = True
+        return True
+
+    es_client.connect = connect
+
+    started = time.perf_counter()
+    async with lifespan(app):
+        accepting_ms = (time.perf_counter() - started) * 1000
+        while not getattr(startup_manager, "warm", True):
+            await asyncio.sleep(0.005)
+        warm_ms = (time.perf_counter() - started) * 1000
+        timings = dict(getattr(startup_manager, "timings", {}))
+
+    print(f"\n{'='*60}")
+    print(f"APPLICATION STARTUP BENCHMARK [{args.label}]")
+    print(f"{'='*60}")
+    print(f"Elasticsearch latency {args.es_latency:.0f} ms per call")
+    print(f"{'import app.main':<34}{import_ms:>10.0f} ms")
+    print(f"{'lifespan -> accepting traffic':<34}{accepting_ms:>10.0f} ms")
+    print(f"{'lifespan -> warm':<34}{warm_ms:>10.0f} ms")
+    for component, ms in sorted(timings.items(), key=lambda item: -item[1]):
+        print(f"  {component:<32}{ms:>10.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure application startup time per component')
+    parser.add_argument('--es-latency', type=float, default=50.0, help='Stub Elasticsearch latency in ms')
+    parser.add_argument('--label', default='current')
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Async Supabase Access Benchmark
+
+Starts an in-memory PostgREST-compatible stub (aiohttp) with a fixed
+per-request latency, points the SupabaseClient at it through
+SUPABASE_REST_URL and measures:
+
+  * get_user_stats: four concurrent count queries vs. the previous
+    four sequential round trips
+  * a burst of concurrent profile reads over the bounded pool, plus the
+    worst event-loop stall observed while they run
+
+Also checks basic CRUD round trips against the stub.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from aiohttp import web
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+class PostgrestStub:
+    """Minimal PostgREST: eq/gte filters, order, limit/offset, count=exact, return=representation"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _match(self, request: web.Request) -> List[Dict[str, Any]]:
+        rows = self.tables.setdefault(request.match_info["table"], [])
+        for column, expr in request.query.items():
+            if column in ("select", "order", "limit", "offset", "on_conflict"):
+                continue
+            operator, _, value = expr.partition(".")
+            if operator == "eq":
+                rows = [r for r in rows if str(r.get(column)).lower() == value.lower()]
+            elif operator == "gte":
+                rows = [r for r in rows if str(r.get(column, "")) >= value]
+        return rows
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return self._respond(request, await request.read())
+        finally:
+            self.in_flight -= 1
+
+    def _respond(self, request: web.Request, body: bytes) -> web.Response:
+        table = self.tables.setdefault(request.match_info["table"], [])
+        prefer = request.headers.get("Prefer", "")
+
+        if request.method == "POST":
+            rows = json.loads(body)
+            rows = rows if isinstance(rows, list) else [rows]
+            table.extend(rows)
+            return web.json_response(rows, status=201)
+
+        matched = self._match(request)
+        if request.method == "PATCH":
+            for row in matched:
+                row.update(json.loads(body))
+            return web.json_response(matched)
+        if request.method == "DELETE":
+            self.tables[request.match_info["table"]] = [r for r in table if r not in matched]
+            return web.json_response(matched)
+
+        total = len(matched)
+        if "order" in request.query:
+            column, _, direction = request.query["order"].partition(".")
+            matched = sorted(matched, key=lambda r: str(r.get(column, "")), reverse=direction == "desc")
+        offset = int(request.query.get("offset", 0))
+        limit = int(request.query.get("limit", total))
+        matched = matched[offset:offset + limit]
+
+        headers = {"Content-Range": f"{offset}-{offset + len(matched) - 1}/{total if 'count=exact' in prefer else '*'}"}
+        if request.method == "HEAD":
+            return web.Response(headers=headers)
+        return web.json_response(matched, headers=headers)
+
+
+async def start_stub(stub: PostgrestStub) -> web.AppRunner:
+    app = web.Application()
+    app.router.add_route("*", "/{table}", stub.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+async def loop_stall_monitor(stop: asyncio.Event, samples: List[float]):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        samples.append((time.perf_counter() - start - 0.001) * 1000)
+
+
+async def run(args):
+    stub = PostgrestStub(latency=args.latency / 1000)
+    runner = await start_stub(stub)
+    port = runner.addresses[0][1]
+
+    os.environ["SUPABASE_REST_URL"] = f"http://127.0.0.1:{port}"
+    os.environ["SUPABASE_POOL_SIZE"] = str(args.pool_size)
+    from app.db.supabase import supabase_client
+
+    user_id = "user-1"
+    stub.tables["user_profiles"] = [{"user_id": user_id, "email": "a@example.com", "role": "free"}]
+    stub.tables["saved_searches"] = [{"search_id": f"s{i}", "user_id": user_id, "name": f"s{i}", "query": "q"} for i in range(7)]
+    stub.tables["user_alerts"] = [{"alert_id": f"a{i}", "user_id": user_id, "is_active": i % 2 == 0} for i in range(5)]
+    stub.tables["user_reports"] = [{"report_id": f"r{i}", "user_id": user_id} for i in range(3)]
+
+    # Correctness
+    profile = await supabase_client.update_user_profile(user_id, {"company": "Acme"})
+    inserted = await supabase_client.bulk_insert("api_usage", [
+        {"user_id": user_id, "endpoint": "/x", "created_at": datetime.utcnow().isoformat()} for _ in range(1200)
+    ])
+    stats = await supabase_client.get_user_stats(user_id)
+    deleted = await supabase_client.delete_saved_search("s0", user_id)
+    searches = await supabase_client.get_user_saved_searches(user_id, limit=3)
+    assert profile and profile.company == "Acme", profile
+    assert inserted == 1200, inserted
+    assert stats == {"saved_searches": 7, "active_alerts": 3, "reports_generated": 3, "api_calls_this_month": 1200}, stats
+    assert deleted and len(searches) == 3
+
+    # get_user_stats: sequential (previous behaviour) vs concurrent
+    async def sequential_stats():
+        for table in ("saved_searches", "user_alerts", "user_reports", "api_usage"):
+            await supabase_client._count(table, user_id)
+
+    timings = {}
+    for name, fn in (("sequential", sequential_stats), ("concurrent", lambda: supabase_client.get_user_stats(user_id))):
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            await fn()
+        timings[name] = (time.perf_counter() - start) * 1000 / args.rounds
+
+    # Burst of concurrent reads over the bounded pool
+    stub.max_in_flight = 0
+    stop, stalls = asyncio.Event(), []
+    monitor = asyncio.create_task(loop_stall_monitor(stop, stalls))
+    start = time.perf_counter()
+    profiles = await asyncio.gather(*(supabase_client.get_user_profile(user_id) for _ in range(args.burst)))
+    burst_ms = (time.perf_counter() - start) * 1000
+    stop.set()
+    await monitor
+
+    await supabase_client.disconnect()
+    await runner.cleanup()
+
+    print(f"\n{'='*60}")
+    print("ASYNC SUPABASE ACCESS BENCHMARK")
+    print(f"{'='*60}")
+    print(f"Stub latency: {args.latency:.0f} ms  Pool size: {args.pool_size}")
+    print(f"get_user_stats sequential: {timings['sequential']:.1f} ms")
+    print(f"get_user_stats concurrent: {timings['concurrent']:.1f} ms "
+          f"({timings['sequential'] / timings['concurrent']:.1f}x)")
+    print(f"{args.burst} concurrent profile reads: {burst_ms:.1f} ms, "
+          f"{sum(p is not None for p in profiles)} ok, max in flight {stub.max_in_flight}")
+    print(f"Worst event-loop stall during burst: {max(stalls or [0]):.1f} ms")
+    print("CRUD checks: passed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the async Supabase access layer against a local stub')
+    parser.add_argument('--latency', type=float, default=20.0, help='Stub latency per request (ms)')
+    parser.add_argument('--pool-size', type=int, default=20)
+    parser.add_argument('--burst', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Import-Time Budget Check
+
+Imports each target module in a fresh interpreter with
+``python -X importtime`` and reports:
+
+  * total import time per target against its budget
+  * self time grouped by top-level package (where the time goes)
+  * the slowest app.* modules by cumulative time
+
+Exits non-zero when a target exceeds its budget, so it can run in CI:
+    python scripts/profile_imports.py
+    python scripts/profile_imports.py --budget app.main=2500 --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Budgets in ms for a cold import (fresh interpreter, warm bytecode cache)
+BUDGETS: Dict[str, float] = {
+    "app.main": 3500,
+    "app.db.elasticsearch": 1000,
+    "app.services.pseo.orchestrator": 800,
+    # What scripts/bulk_ai_processor.py and scripts/data_migration.py import
+    "app.services.ai_processor": 1000,
+    "app.services.search": 1000,
+}
+
+ENV_DEFAULTS = {
+    "ELASTICSEARCH_NODE": "http://stub:9200",
+    "ELASTICSEARCH_USERNAME": "stub",
+    "ELASTICSEARCH_PASSWORD": "stub",
+}
+
+
+def profile(module: str) -> List[Tuple[str, int, int]]:
+    """Return (module, self_us, cumulative_us) rows from -X importtime"""
+    env = {**ENV_DEFAULTS, **os.environ}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [env.get("PYTHONPATH"), str(BACKEND_DIR)]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def report(module: str, rows: List[Tuple[str, int, int]], budget: float, top: int) -> bool:
+    total_ms = next(cum for name, _, cum in rows if name == module) / 1000
+    within = total_ms <= budget
+
+    print(f"\n{module}: {total_ms:.0f} ms (budget {budget:.0f} ms) {'OK' if within else 'OVER BUDGET'}")
+
+    by_package = defaultdict(int)
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+    print(f"  {'self time by package':<44}{'ms':>8}")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {package:<44}{self_us / 1000:>8.1f}")
+
+    app_rows = [(name, cum) for name, _, cum in rows if name.startswith("app.") and name != module]
+    print(f"  {'slowest app modules (cumulative)':<44}{'ms':>8}")
+    for name, cum in sorted(app_rows, key=lambda item: -item[1])[:top]:
+        print(f"  {name:<44}{cum / 1000:>8.1f}")
+
+    return within
+
+
+def parse_budgets(overrides: List[str]) -> Dict[str, float]:
+    budgets = dict(BUDGETS)
+    for override in overrides:
+        module, _, ms = override.partition("=")
+        budgets[module] = float(ms)
+    return budgets
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check module import times against budgets')
+    parser.add_argument('--budget', action='append', default=[], metavar='MODULE=MS',
+                        help='Add or override a budget (repeatable)')
+    parser.add_argument('--top', type=int, default=10, help='Rows per breakdown')
+    args = parser.parse_args()
+
+    over = []
+    for module, budget in parse_budgets(args.budget).items():
+        if not report(module, profile(module), budget, args.top):
+            over.append(module)
+
+    if over:
+        print(f"\nImport-time budget exceeded: {', '.join(over)}")
+        sys.exit(1)
+    print("\nAll import-time budgets met")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for Planning Explorer backend tests
+
+Unit tests run without live services: Settings requires Elasticsearch
+credentials at import time, so placeholders are provided here and every
+test that would reach ES, Supabase or Redis uses an in-memory fake.
+"""
+
+import os
+
+os.environ.setdefault("ELASTICSEARCH_NODE", "http://localhost:9200")
+os.environ.setdefault("ELASTICSEARCH_USERNAME", "test")
+os.environ.setdefault("ELASTICSEARCH_PASSWORD", "test")
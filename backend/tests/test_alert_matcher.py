@@ -0,0 +1,192 @@
+"""
+Unit tests for percolator alert registration, sync and matching
+"""
+
+import pytest
+
+from app.models.user import UserAlert
+from app.services import alert_matcher as matcher_module
+from app.services.alert_matcher import WATERMARK_DOC_ID, AlertMatcher
+
+pytestmark = pytest.mark.unit
+
+ANALYSIS = {"analyzer": {"address_analyzer": {"type": "custom", "tokenizer": "standard"}}}
+
+
+class FakeIndices:
+    def __init__(self):
+        self.created = {}
+
+    async def exists(self, index):
+        return index in self.created
+
+    async def get_mapping(self, index):
+        return {index: {"mappings": {"properties": {"address": {"type": "text", "analyzer": "address_analyzer"}}}}}
+
+    async def get_settings(self, index):
+        return {index: {"settings": {"index": {"number_of_shards": "1", "analysis": ANALYSIS}}}}
+
+    async def create(self, index, mappings, settings=None):
+        self.created[index] = {"mappings": mappings, "settings": settings}
+
+
+class FakeES:
+    """Just enough of AsyncElasticsearch for the percolator index"""
+
+    def __init__(self, applications=None):
+        self.indices = FakeIndices()
+        self.documents = {}
+        self.applications = applications or []
+
+    async def index(self, index, id, document):
+        self.documents[id] = document
+
+    async def delete(self, index, id):
+        del self.documents[id]
+
+    async def get(self, index, id):
+        return {"_source": self.documents[id]}
+
+    async def search(self, index, body):
+        if "percolate" in body["query"]:
+            hits = []
+            for doc_id, doc in sorted(self.documents.items()):
+                if doc_id == WATERMARK_DOC_ID:
+                    continue
+                term = doc["query"]["match"]["description"]
+                slots = [i for i, app in enumerate(body["query"]["percolate"]["documents"]) if term in app["description"]]
+                if slots:
+                    hits.append({"_source": doc, "fields": {"_percolator_document_slot": slots}})
+            return {"hits": {"hits": hits}}
+
+        position = body.get("search_after")
+        ordered = sorted(self.applications, key=lambda a: (a["last_changed"], a["uid"]))
+        if "search_after" in body:
+            ordered = [a for a in ordered if [a["last_changed"], a["uid"]] > list(position)]
+        order = body["sort"][0]["last_changed"]
+        if (order["order"] if isinstance(order, dict) else order) == "desc":
+            ordered.reverse()
+        return {"hits": {"hits": [
+            {"_source": a, "sort": [a["last_changed"], a["uid"]]} for a in ordered[:body["size"]]
+        ]}}
+
+
+class FakeESClient:
+    index_name = "planning_applications"
+
+    def __init__(self, client):
+        self.client = client
+
+    async def ensure_connection(self):
+        pass
+
+
+class FakeSupabase:
+    def __init__(self, alerts):
+        self.alerts = alerts
+
+    async def get_active_alerts(self, limit, offset):
+        return self.alerts[offset:offset + limit]
+
+
+class FakeNotifications:
+    def __init__(self):
+        self.sent = []
+
+    async def send_alert_notification(self, **kwargs):
+        self.sent.append(kwargs)
+        return True
+
+
+def alert(alert_id: str, term: str, active: bool = True) -> UserAlert:
+    return UserAlert(alert_id=alert_id, user_id=f"user-{alert_id}", name=f"Alert {alert_id}", query=term, is_active=active)
+
+
+def application(uid: str, last_changed: int, description: str) -> dict:
+    return {"uid": uid, "last_changed": last_changed, "description": description, "area_name": "Camden"}
+
+
+@pytest.fixture
+def es(monkeypatch):
+    fake = FakeES()
+    monkeypatch.setattr(matcher_module, "es_client", FakeESClient(fake))
+
+    async def compile_criteria_query(query, filters, location_filters):
+        return {"match": {"description": query}}
+
+    monkeypatch.setattr(matcher_module.search_service, "compile_criteria_query", compile_criteria_query)
+    return fake
+
+
+@pytest.fixture
+def notifications(monkeypatch):
+    fake = FakeNotifications()
+    monkeypatch.setattr(matcher_module, "notification_service", fake)
+    return fake
+
+
+async def test_percolator_index_copies_mapping_and_analysis(es):
+    matcher = AlertMatcher(index="alerts", batch_size=10)
+    await matcher.ensure_index()
+
+    created = es.indices.created["alerts"]
+    assert created["settings"] == {"analysis": ANALYSIS}
+    properties = created["mappings"]["properties"]
+    assert properties["address"]["analyzer"] == "address_analyzer"
+    assert properties["query"] == {"type": "percolator"}
+
+
+async def test_sync_registers_active_alerts_across_pages(es, monkeypatch):
+    alerts = [alert(str(i), "extension") for i in range(5)]
+    monkeypatch.setattr(matcher_module, "supabase_client", FakeSupabase(alerts))
+
+    matcher = AlertMatcher(index="alerts", batch_size=10)
+
+    assert await matcher.sync_alerts(page_size=2) == 5
+    assert set(es.documents) == {str(i) for i in range(5)}
+    assert es.documents["0"]["query"] == {"match": {"description": "extension"}}
+
+
+async def test_deactivated_alert_is_unregistered(es):
+    matcher = AlertMatcher(index="alerts", batch_size=10)
+    await matcher.register_alert(alert("loft", "loft"))
+
+    await matcher.register_alert(alert("loft", "loft", active=False))
+
+    assert "loft" not in es.documents
+
+
+async def test_new_applications_are_matched_once(es, notifications):
+    matcher = AlertMatcher(index="alerts", batch_size=2)
+    await matcher.register_alert(alert("ext", "extension"))
+    await matcher.register_alert(alert("loft", "loft"))
+
+    es.applications = [application("a1", 1, "rear extension")]
+    assert await matcher.process_new_applications() == 0  # first run only sets the watermark
+
+    es.applications += [
+        application("a2", 2, "single storey extension"),
+        application("a3", 3, "loft conversion"),
+        application("a4", 4, "side extension"),
+    ]
+    assert await matcher.process_new_applications() == 3
+    assert await matcher.process_new_applications() == 0
+
+    # One notification per matching alert per percolated batch of two
+    assert sorted(n["alert_id"] for n in notifications.sent) == ["ext", "ext", "loft"]
+    assert sum(n["new_applications_count"] for n in notifications.sent) == 3
+
+
+async def test_cycle_stops_when_lease_is_lost(es, notifications):
+    class LostLease:
+        async def extend(self):
+            return False
+
+    matcher = AlertMatcher(index="alerts", batch_size=2)
+    await matcher.register_alert(alert("ext", "extension"))
+    es.applications = [application("a1", 1, "rear extension")]
+    await matcher.process_new_applications()
+
+    es.applications.append(application("a2", 2, "side extension"))
+    assert await matcher.process_new_applications(LostLease()) == 0
+    assert notifications.sent == []
@@ -0,0 +1,123 @@
+"""
+Unit tests for background task cancellation
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import background_processor as processor_module
+from app.services.background_processor import BackgroundProcessor, TaskStatus
+from app.services.task_store import SQLiteTaskStore
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+async def processor(tmp_path, monkeypatch):
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def get_application_by_id(application_id):
+        return {"application_id": application_id}
+
+    async def process_application(application, mode, features, context):
+        started.set()
+        await release.wait()
+        return {"application_id": application["application_id"]}
+
+    monkeypatch.setattr(processor_module.search_service, "get_application_by_id", get_application_by_id)
+    monkeypatch.setattr(processor_module.ai_processor, "process_application", process_application)
+
+    background = BackgroundProcessor(max_workers=1)
+    background._store = SQLiteTaskStore(
+        str(tmp_path / "tasks.sqlite"), "background",
+        result_ttl=3600, visibility_timeout=30, max_finished=100
+    )
+    background.started, background.release = started, release
+    await background.start_workers()
+    yield background
+    await background.stop_workers()
+    await background._store.close()
+
+
+async def wait_for_status(background, task_id, status, timeout=5.0):
+    async def poll():
+        while (await background.get_task_status(task_id))["status"] != status:
+            await asyncio.sleep(0.02)
+    await asyncio.wait_for(poll(), timeout)
+
+
+async def test_task_completes(processor):
+    task_id = await processor.submit_application_processing(["app-1"])
+    await asyncio.wait_for(processor.started.wait(), 5)
+    processor.release.set()
+
+    await wait_for_status(processor, task_id, TaskStatus.COMPLETED.value)
+    assert await processor.get_task_result(task_id) == {"application_id": "app-1"}
+
+
+async def test_cancel_stops_running_task(processor):
+    task_id = await processor.submit_application_processing(["app-1"])
+    await asyncio.wait_for(processor.started.wait(), 5)
+
+    assert await processor.cancel_task(task_id)
+    await asyncio.sleep(0.05)
+
+    assert task_id not in processor._running
+    processor.release.set()
+    await asyncio.sleep(0.05)
+    assert (await processor.get_task_status(task_id))["status"] == TaskStatus.CANCELLED.value
+    assert await processor.get_task_result(task_id) is None
+
+
+async def test_cancel_from_another_process_is_picked_up_by_heartbeat(processor, monkeypatch):
+    monkeypatch.setattr(processor_module, "HEARTBEAT_SECONDS", 0.05)
+    task_id = await processor.submit_application_processing(["app-1"])
+    await asyncio.wait_for(processor.started.wait(), 5)
+
+    # Another worker process marks the task cancelled in the shared store
+    assert await processor.store.finish(task_id, {"status": "cancelled"}, expected_status="in_progress")
+
+    async def stopped():
+        while task_id in processor._running:
+            await asyncio.sleep(0.02)
+    await asyncio.wait_for(stopped(), 5)
+    assert (await processor.get_task_status(task_id))["status"] == TaskStatus.CANCELLED.value
+
+
+async def test_finished_task_cannot_be_cancelled(processor):
+    task_id = await processor.submit_application_processing(["app-1"])
+    processor.release.set()
+    await wait_for_status(processor, task_id, TaskStatus.COMPLETED.value)
+
+    assert not await processor.cancel_task(task_id)
+    assert (await processor.get_task_status(task_id))["status"] == TaskStatus.COMPLETED.value
+
+
+async def test_text_analysis_runs_outside_the_process_pool(monkeypatch):
+    # With no process pool (or mixed with async features) the task runs
+    # through AIProcessor, which must still produce the CPU-only features
+    from app.models.planning import PlanningApplication
+    from app.services import cache_manager as cache_module
+    from app.services.ai_processor import AIProcessor
+
+    async def cache_get(*args, **kwargs):
+        return None
+
+    async def cache_set(*args, **kwargs):
+        return True
+
+    monkeypatch.setattr(cache_module.cache_manager, "get", cache_get)
+    monkeypatch.setattr(cache_module.cache_manager, "set", cache_set)
+
+    application = PlanningApplication(
+        application_id="app-1", reference="23/0001/FUL", authority="Dover",
+        address="1 High Street, Dover", status="submitted",
+        description="Erection of a two storey rear extension and loft conversion"
+    )
+    result = await AIProcessor().process_application(application, features=["text_analysis", "market_context"])
+
+    assert result.success, result.errors
+    assert set(result.results["text_analysis"]) == {"complexity_score", "sentiment", "extracted_entities"}
+    assert result.confidence_scores["text_analysis"] == 0.6
@@ -0,0 +1,115 @@
+"""
+Unit tests for materialized behavior profiles shared through Redis
+"""
+
+import asyncio
+
+import pytest
+from redis.exceptions import WatchError
+
+from app.ai.user_analytics import BehaviorProfileStore
+
+pytestmark = pytest.mark.unit
+
+
+class FakePipeline:
+    """WATCH/MULTI/EXEC over FakeAsyncRedis with per-key versions"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.watched = {}
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.watched, self.commands = {}, []
+
+    async def watch(self, key):
+        self.watched[key] = self.redis.versions.get(key, 0)
+
+    async def get(self, key):
+        await asyncio.sleep(0)  # let other workers interleave
+        return await self.redis.get(key)
+
+    def multi(self):
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value))
+
+    async def execute(self):
+        await asyncio.sleep(0)
+        changed = any(self.redis.versions.get(key, 0) != version for key, version in self.watched.items())
+        self.watched = {}
+        if changed:
+            self.commands = []
+            raise WatchError("watched key changed")
+        for key, value in self.commands:
+            await self.redis.set(key, value)
+        self.commands = []
+
+
+class FakeAsyncRedis:
+    """Minimal redis.asyncio stand-in for GET/SET and optimistic transactions"""
+
+    def __init__(self):
+        self.data = {}
+        self.versions = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+INTERACTION = {
+    "interaction_type": "search",
+    "timestamp": "2024-03-01T10:00:00",
+    "context": {"query": "solar farm", "filters": {"authority": "Camden"}},
+}
+
+
+async def test_every_worker_reads_the_latest_profile():
+    redis = FakeAsyncRedis()
+    first_worker = BehaviorProfileStore(redis)
+    second_worker = BehaviorProfileStore(redis)
+
+    await first_worker.rebuild("user-1", [INTERACTION])
+    assert await second_worker.record("user-1", INTERACTION)
+
+    assert (await first_worker.get("user-1")).total == 2
+
+
+async def test_concurrent_updates_from_workers_are_not_lost():
+    redis = FakeAsyncRedis()
+    workers = [BehaviorProfileStore(redis) for _ in range(3)]
+    await workers[0].rebuild("user-1", [])
+
+    results = await asyncio.gather(*(
+        worker.record("user-1", INTERACTION) for worker in workers for _ in range(3)
+    ))
+
+    assert all(results)
+    assert (await workers[0].get("user-1")).total == 9
+
+
+async def test_unknown_users_are_skipped_until_rebuilt():
+    store = BehaviorProfileStore(FakeAsyncRedis())
+
+    assert await store.record("user-2", INTERACTION) is False
+    assert await store.get("user-2") is None
+
+
+async def test_local_profiles_without_redis():
+    store = BehaviorProfileStore()
+    await store.rebuild("user-3", [INTERACTION])
+
+    assert await store.record("user-3", INTERACTION)
+    assert (await store.get("user-3")).total == 2
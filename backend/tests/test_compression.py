@@ -0,0 +1,106 @@
+"""
+Unit tests for response compression negotiation and streaming
+"""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from app.middleware import performance
+from app.middleware.performance import (
+    CompressionMiddleware,
+    compression_level,
+    is_compressible,
+    negotiate_encoding,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def all_encoders(monkeypatch):
+    """Negotiate as if zstandard and brotli were installed"""
+    encoders = {"zstd": object, "br": object, "gzip": performance._GzipEncoder}
+    monkeypatch.setattr(performance, "ENCODERS", encoders)
+
+
+def test_prefers_server_order_at_equal_quality(all_encoders):
+    assert negotiate_encoding("gzip, br, zstd") == "zstd"
+    assert negotiate_encoding("gzip, br") == "br"
+
+
+def test_client_quality_wins(all_encoders):
+    assert negotiate_encoding("zstd;q=0.5, gzip;q=0.9") == "gzip"
+    assert negotiate_encoding("br;q=0, gzip") == "gzip"
+    assert negotiate_encoding("*;q=0.1, zstd;q=0") == "br"
+
+
+def test_nothing_acceptable(all_encoders):
+    assert negotiate_encoding("") is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("gzip;q=bogus") is None
+
+
+def test_content_types_and_levels():
+    assert is_compressible("application/json; charset=utf-8")
+    assert is_compressible("application/problem+json")
+    assert not is_compressible("image/png")
+
+    assert compression_level("gzip", "text/html", 10_000) == 6
+    assert compression_level("gzip", "application/json", 10_000) == 5
+    assert compression_level("gzip", "application/json", None) == 3
+
+
+def make_app(body: bytes, content_type: bytes = b"application/json", chunks: int = 1, headers=None):
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode()), *(headers or [])],
+        })
+        size = len(body) // chunks
+        for i in range(chunks):
+            part = body[i * size:] if i == chunks - 1 else body[i * size:(i + 1) * size]
+            await send({"type": "http.response.body", "body": part, "more_body": i < chunks - 1})
+    return app
+
+
+async def fetch(app, accept_encoding="gzip"):
+    transport = httpx.ASGITransport(app=CompressionMiddleware(app, minimum_size=1024))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        request = client.build_request("GET", "/", headers={"Accept-Encoding": accept_encoding})
+        return await client.send(request, stream=True)
+
+
+async def test_large_json_is_gzipped_while_streaming():
+    body = json.dumps({"results": [{"id": i, "address": "1 High Street"} for i in range(500)]}).encode()
+    response = await fetch(make_app(body, chunks=4))
+    raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert gzip.decompress(raw) == body
+    assert len(raw) < len(body)
+
+
+async def test_small_responses_pass_through():
+    response = await fetch(make_app(b'{"ok": true}'))
+    assert "content-encoding" not in response.headers
+    assert b"".join([chunk async for chunk in response.aiter_raw()]) == b'{"ok": true}'
+
+
+async def test_uncompressible_or_encoded_responses_pass_through():
+    png = await fetch(make_app(b"\x89PNG" * 1000, content_type=b"image/png"))
+    assert "content-encoding" not in png.headers
+
+    encoded = await fetch(make_app(b"x" * 4096, headers=[(b"content-encoding", b"br")]))
+    assert encoded.headers["content-encoding"] == "br"
+
+
+async def test_client_without_accept_encoding_gets_identity():
+    response = await fetch(make_app(b"x" * 4096), accept_encoding="")
+    assert "content-encoding" not in response.headers
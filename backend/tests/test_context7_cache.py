@@ -0,0 +1,31 @@
+"""
+Unit tests for the Context7 response cache
+"""
+
+import pytest
+
+from app.services.pseo.context7_service import Context7Cache
+
+pytestmark = pytest.mark.unit
+
+
+async def test_memory_tier_is_bounded_and_falls_back_to_disk(tmp_path):
+    cache = Context7Cache(path=str(tmp_path / "context7.sqlite"), ttl_seconds=60, max_bytes=200)
+    for name in ("a", "b", "c"):
+        await cache.set(name, {"content": name * 60})
+
+    assert len(cache) == 2
+    assert cache._memory_bytes <= 200
+    assert "a" not in cache._memory
+    assert await cache.get("a") == {"content": "a" * 60}
+
+
+async def test_recently_used_entries_survive_eviction(tmp_path):
+    cache = Context7Cache(path=str(tmp_path / "context7.sqlite"), ttl_seconds=60, max_bytes=200)
+    await cache.set("a", {"content": "a" * 60})
+    await cache.set("b", {"content": "b" * 60})
+    await cache.get("a")
+    await cache.set("c", {"content": "c" * 60})
+
+    assert "a" in cache._memory
+    assert "b" not in cache._memory
@@ -0,0 +1,95 @@
+"""
+Unit tests for the async Context7 client against a local stub server
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services.pseo import context7_service
+from app.services.pseo.context7_service import Context7Cache, Context7Service, close_context7_client
+
+pytestmark = pytest.mark.unit
+
+STUB_LATENCY = 0.2
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    requests_served = 0
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        time.sleep(STUB_LATENCY)
+        StubHandler.requests_served += 1
+
+        body = json.dumps({"context": f"Stub context for {payload.get('query')}"}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+async def stub_context7(tmp_path, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    StubHandler.requests_served = 0
+
+    monkeypatch.setenv('CONTEXT7_BASE_URL', f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setenv('CONTEXT7_MAX_CONCURRENT', '8')
+    monkeypatch.setattr(context7_service, '_shared_cache', Context7Cache(path=str(tmp_path / 'context7.sqlite')))
+    monkeypatch.setattr(context7_service, '_http_client', None)
+    yield StubHandler
+    await close_context7_client()
+    server.shutdown()
+    server.server_close()
+
+
+async def heartbeat(interval: float, lags: list):
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def test_requests_never_block_the_event_loop(stub_context7):
+    service = Context7Service()
+    lags: list = []
+    beat = asyncio.create_task(heartbeat(0.01, lags))
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        service.get_planning_policy_context("Camden", f"topic {n}") for n in range(8)
+    ))
+    elapsed = time.perf_counter() - start
+    beat.cancel()
+
+    assert all(result["context"].startswith("Stub context") for result in results)
+    assert stub_context7.requests_served == 8
+    assert elapsed < 8 * STUB_LATENCY  # served concurrently, not one after another
+    assert max(lags) < 0.1  # a blocking call would stall the loop for STUB_LATENCY
+
+
+async def test_identical_concurrent_requests_are_deduplicated(stub_context7):
+    service = Context7Service()
+
+    results = await asyncio.gather(*(
+        service.get_planning_policy_context("Camden", "affordable housing") for _ in range(10)
+    ))
+
+    assert stub_context7.requests_served == 1
+    assert service.api_calls == 1
+    assert service.deduplicated == 9
+    assert len({result["context"] for result in results}) == 1
+
+    # A new instance is served from the shared cache
+    assert (await Context7Service().get_planning_policy_context("Camden", "affordable housing"))["context"]
+    assert stub_context7.requests_served == 1
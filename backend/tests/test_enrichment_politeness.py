@@ -0,0 +1,137 @@
+"""
+Unit tests for the enrichment queue: politeness limits shared across
+workers, search-hit submission and lazy loading of the scraping stack
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.agents.enrichment.portal_detectors import PortalDetector
+from app.services import enrichment_queue
+from app.services.enrichment_queue import (
+    ACQUIRE_SLOT_SCRIPT,
+    RESERVE_START_SCRIPT,
+    EnrichmentQueue,
+    PortalPoliteness,
+)
+
+pytestmark = pytest.mark.unit
+
+POLICY = {"domain": "publicaccess.dover.gov.uk", "max_concurrent": 1, "min_interval_ms": 200}
+
+
+class FakeAsyncRedis:
+    """Evaluates the politeness scripts in Python, like a single Redis would"""
+
+    def __init__(self):
+        self.slots = {}
+        self.next_start = {}
+
+    async def eval(self, script, numkeys, key, *args):
+        now = time.monotonic() * 1000
+        if script == ACQUIRE_SLOT_SCRIPT:
+            token, limit, ttl = args
+            held = {t: at for t, at in self.slots.get(key, {}).items() if at > now - ttl}
+            self.slots[key] = held
+            if len(held) < limit:
+                held[token] = now
+                return 1
+            return 0
+        if script == RESERVE_START_SCRIPT:
+            start = max(self.next_start.get(key, now), now)
+            self.next_start[key] = start + args[0]
+            return int(start - now)
+        raise AssertionError("unexpected script")
+
+    async def zrem(self, key, token):
+        self.slots.get(key, {}).pop(token, None)
+
+
+class FakeCache:
+    available = True
+
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+
+
+@pytest.fixture
+def shared_redis(monkeypatch):
+    redis = FakeAsyncRedis()
+    monkeypatch.setattr(enrichment_queue, "get_cache_service", lambda: FakeCache(redis))
+    monkeypatch.setattr(PortalDetector, "get_crawl_policy", classmethod(lambda cls, url: POLICY))
+    return redis
+
+
+async def test_concurrency_slot_is_shared_between_workers(shared_redis):
+    first_worker, second_worker = PortalPoliteness(), PortalPoliteness()
+
+    release, domain = await first_worker.acquire("https://publicaccess.dover.gov.uk/a")
+    assert domain == POLICY["domain"]
+
+    waiting = asyncio.create_task(second_worker.acquire("https://publicaccess.dover.gov.uk/b"))
+    await asyncio.sleep(0.3)
+    assert not waiting.done()
+
+    await release()
+    second_release, _ = await asyncio.wait_for(waiting, 1)
+    await second_release()
+
+
+async def test_request_spacing_is_shared_between_workers(shared_redis):
+    workers = [PortalPoliteness(), PortalPoliteness()]
+
+    started = time.monotonic()
+    for worker in workers:
+        release, _ = await worker.acquire("https://publicaccess.dover.gov.uk/a")
+        await release()
+
+    assert time.monotonic() - started >= 0.19
+
+
+async def test_local_limits_without_redis(monkeypatch):
+    monkeypatch.setattr(enrichment_queue, "get_cache_service", lambda: None)
+    monkeypatch.setattr(PortalDetector, "get_crawl_policy", classmethod(lambda cls, url: POLICY))
+    politeness = PortalPoliteness()
+
+    release, _ = await politeness.acquire("https://publicaccess.dover.gov.uk/a")
+    waiting = asyncio.create_task(politeness.acquire("https://publicaccess.dover.gov.uk/b"))
+    await asyncio.sleep(0.05)
+    assert not waiting.done()
+
+    await release()
+    second_release, _ = await asyncio.wait_for(waiting, 1)
+    await second_release()
+
+
+def hits(*ids):
+    return [SimpleNamespace(application_id=i, url=f"https://publicaccess.dover.gov.uk/{i}") for i in ids]
+
+
+def test_search_hits_are_opt_in():
+    queue = EnrichmentQueue(workers=1, max_size=10)
+    assert queue.submit_search_hits(hits("a", "b")) == 0
+
+
+def test_recently_attempted_search_hits_are_skipped():
+    queue = EnrichmentQueue(workers=1, max_size=10)
+    queue._mark_attempted("a")
+
+    assert queue.submit_search_hits(hits("a", "b"), limit=5) == 1
+    assert set(queue._pending) == {"b"}
+
+    queue.retry_after = 0
+    assert queue.submit_search_hits(hits("a"), limit=5) == 1
+
+
+def test_import_does_not_load_the_scraping_stack():
+    code = (
+        "import sys, app.services.enrichment_queue; "
+        "assert 'app.agents.enrichment.applicant_agent' not in sys.modules; "
+        "assert 'bs4' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,115 @@
+"""
+Unit tests for the buffered usage/interaction event pipeline
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import event_pipeline as pipeline_module
+from app.services.event_pipeline import API_USAGE_TABLE, INTERACTIONS_TABLE, EventPipeline
+
+pytestmark = pytest.mark.unit
+
+
+class FakeSupabase:
+    """Records bulk inserts and counter increments instead of calling PostgREST"""
+
+    def __init__(self):
+        self.inserted = {}
+        self.counters = {}
+        self.increment_calls = 0
+
+    async def bulk_insert(self, table, rows, chunk_size=500):
+        self.inserted.setdefault(table, []).extend(rows)
+        return len(rows)
+
+    async def increment_api_calls(self, user_id, delta=1):
+        await asyncio.sleep(0)
+        self.increment_calls += 1
+        self.counters[user_id] = self.counters.get(user_id, 0) + delta
+        return self.counters[user_id]
+
+
+@pytest.fixture
+def supabase(monkeypatch):
+    fake = FakeSupabase()
+    monkeypatch.setattr(pipeline_module, "supabase_client", fake)
+    return fake
+
+
+async def test_flush_bulk_inserts_and_aggregates_counters(supabase):
+    pipeline = EventPipeline(batch_size=100, flush_interval=60, max_pending=1000)
+    for _ in range(3):
+        pipeline.record_api_usage("alice", {"endpoint": "/api/v1/search"})
+    pipeline.record_api_usage("bob", {"endpoint": "/api/v1/ai"})
+    pipeline.record_interaction({"user_id": "alice", "interaction_type": "view"})
+
+    assert pipeline.pending_api_calls("alice") == 3
+
+    inserted = await pipeline.flush()
+
+    assert inserted == 5
+    assert len(supabase.inserted[API_USAGE_TABLE]) == 4
+    assert len(supabase.inserted[INTERACTIONS_TABLE]) == 1
+    assert supabase.counters == {"alice": 3, "bob": 1}
+    assert supabase.increment_calls == 2
+    assert pipeline.pending_api_calls("alice") == 0
+    assert pipeline.get_stats()["pending"] == 0
+
+
+async def test_concurrent_pipelines_never_lose_increments(supabase):
+    """Two workers flushing for the same user add deltas rather than overwrite"""
+    workers = [EventPipeline(batch_size=100, flush_interval=60, max_pending=1000) for _ in range(2)]
+    for worker in workers:
+        for _ in range(5):
+            worker.record_api_usage("alice", {"endpoint": "/api/v1/search"})
+
+    await asyncio.gather(*(worker.flush() for worker in workers))
+
+    assert supabase.counters["alice"] == 10
+
+
+async def test_failed_increments_are_retried_on_next_flush(supabase, monkeypatch):
+    pipeline = EventPipeline(batch_size=100, flush_interval=60, max_pending=1000)
+    for _ in range(2):
+        pipeline.record_api_usage("alice", {"endpoint": "/api/v1/search"})
+    pipeline.record_api_usage("bob", {"endpoint": "/api/v1/search"})
+
+    increment = supabase.increment_api_calls
+
+    async def failing_for_alice(user_id, delta=1):
+        if user_id == "alice":
+            raise ConnectionError("PostgREST unavailable")
+        return await increment(user_id, delta)
+
+    monkeypatch.setattr(supabase, "increment_api_calls", failing_for_alice)
+    await pipeline.flush()
+
+    assert supabase.counters == {"bob": 1}
+    assert pipeline.pending_api_calls("alice") == 2
+
+    pipeline.record_api_usage("alice", {"endpoint": "/api/v1/search"})
+    monkeypatch.setattr(supabase, "increment_api_calls", increment)
+    await pipeline.flush()
+
+    assert supabase.counters == {"alice": 3, "bob": 1}
+    assert pipeline.pending_api_calls("alice") == 0
+
+
+async def test_saturated_pipeline_drops_events(supabase):
+    pipeline = EventPipeline(batch_size=100, flush_interval=60, max_pending=2)
+    assert pipeline.enqueue(INTERACTIONS_TABLE, {"n": 1})
+    assert pipeline.enqueue(INTERACTIONS_TABLE, {"n": 2})
+    assert not pipeline.enqueue(INTERACTIONS_TABLE, {"n": 3})
+    assert pipeline.get_stats()["dropped"] == 1
+
+
+async def test_stop_flushes_pending_events(supabase):
+    pipeline = EventPipeline(batch_size=100, flush_interval=60, max_pending=1000)
+    await pipeline.start()
+    pipeline.record_user_event("alice", {"event_type": "login"})
+
+    await pipeline.stop()
+
+    assert len(supabase.inserted["user_events"]) == 1
@@ -0,0 +1,131 @@
+"""
+Unit tests for the HTTP response cache (ETag/304, keying, bounds)
+"""
+
+import httpx
+import pytest
+
+from app.middleware.performance import CacheMiddleware, CachedResponse, ResponseLRU, etag_matches
+
+pytestmark = pytest.mark.unit
+
+
+def make_app(calls, headers=None, body=b'{"total": 42}'):
+    async def app(scope, receive, send):
+        calls.append(scope["path"])
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json"), *(headers or [])],
+        })
+        await send({"type": "http.response.body", "body": body})
+    return app
+
+
+def client_for(app, **options):
+    cache = CacheMiddleware(app, route_ttls={"/api/v1/stats": 60}, shared=False, **options)
+    return cache, httpx.AsyncClient(transport=httpx.ASGITransport(app=cache), base_url="http://test")
+
+
+async def test_miss_then_hit_with_strong_etag():
+    calls = []
+    cache, client = client_for(make_app(calls))
+    async with client:
+        first = await client.get("/api/v1/stats")
+        second = await client.get("/api/v1/stats")
+
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert first.headers["etag"] == second.headers["etag"]
+    assert second.json() == {"total": 42}
+    assert second.headers["cache-control"] == "public, max-age=60"
+    assert calls == ["/api/v1/stats"]
+
+
+async def test_if_none_match_returns_304():
+    calls = []
+    _, client = client_for(make_app(calls))
+    async with client:
+        etag = (await client.get("/api/v1/stats")).headers["etag"]
+        response = await client.get("/api/v1/stats", headers={"If-None-Match": f"W/{etag}"})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+async def test_entries_are_keyed_per_caller_and_query():
+    calls = []
+    _, client = client_for(make_app(calls))
+    async with client:
+        await client.get("/api/v1/stats?b=2&a=1")
+        await client.get("/api/v1/stats?a=1&b=2")
+        private = await client.get("/api/v1/stats?a=1&b=2", headers={"Authorization": "Bearer alice"})
+
+    assert len(calls) == 2
+    assert private.headers["cache-control"].startswith("private")
+    assert "Authorization" in private.headers["vary"]
+
+
+async def test_uncacheable_responses_are_not_stored():
+    calls = []
+    _, client = client_for(make_app(calls, headers=[(b"set-cookie", b"session=1")]))
+    async with client:
+        await client.get("/api/v1/stats")
+        await client.get("/api/v1/stats")
+        await client.get("/api/v1/other")
+    assert calls == ["/api/v1/stats", "/api/v1/stats", "/api/v1/other"]
+
+
+async def test_unkeyed_vary_is_not_stored():
+    calls = []
+    _, client = client_for(make_app(calls, headers=[(b"vary", b"Origin")]))
+    async with client:
+        await client.get("/api/v1/stats")
+        await client.get("/api/v1/stats")
+    assert len(calls) == 2
+
+
+async def test_no_cache_request_bypasses_lookup():
+    calls = []
+    _, client = client_for(make_app(calls))
+    async with client:
+        await client.get("/api/v1/stats")
+        response = await client.get("/api/v1/stats", headers={"Cache-Control": "no-cache"})
+    assert response.headers["x-cache"] == "MISS"
+    assert len(calls) == 2
+
+
+async def test_oversized_bodies_stream_through_uncached():
+    calls = []
+    cache, client = client_for(make_app(calls, body=b"x" * 2048), max_body_size=1024)
+    async with client:
+        response = await client.get("/api/v1/stats")
+    assert len(response.content) == 2048
+    assert len(cache.store) == 0
+
+
+def entry(size: int) -> CachedResponse:
+    return CachedResponse(200, [], b"x" * size, '"e"', stored_at=0, expires_at=float("inf"))
+
+
+def test_lru_is_bounded_by_bytes():
+    lru = ResponseLRU(max_bytes=250)
+    lru.set("a", entry(100))
+    lru.set("b", entry(100))
+    lru.get("a")
+    lru.set("c", entry(100))
+
+    assert lru.get("b") is None
+    assert lru.get("a") is not None and lru.get("c") is not None
+    assert lru.current_bytes == 200
+
+    lru.set("huge", entry(1000))
+    assert lru.get("huge") is None
+
+
+def test_etag_matching():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches(None, '"b"')
+    assert not etag_matches('"c"', '"b"')
@@ -0,0 +1,78 @@
+"""
+Unit tests for the content-addressed LLM response cache
+"""
+
+import pytest
+
+from app.services.llm_cache import LLMResponseCache, make_cache_key
+
+pytestmark = pytest.mark.unit
+
+MESSAGES = [{"role": "user", "content": "Summarise application 24/0012/FUL"}]
+
+
+def test_key_is_stable_and_order_independent():
+    first = make_cache_key("claude-3-haiku", MESSAGES, system="You are a planner", temperature=0.2, max_tokens=500)
+    second = make_cache_key("claude-3-haiku", MESSAGES, system="You are a planner", max_tokens=500, temperature=0.2)
+
+    assert first == second
+    assert len(first) == 64
+
+
+def test_key_ignores_none_params_but_not_real_ones():
+    base = make_cache_key("claude-3-haiku", MESSAGES, temperature=0.2)
+
+    assert make_cache_key("claude-3-haiku", MESSAGES, temperature=0.2, top_p=None) == base
+    assert make_cache_key("claude-3-haiku", MESSAGES, temperature=0.7) != base
+    assert make_cache_key("claude-3-sonnet", MESSAGES, temperature=0.2) != base
+    assert make_cache_key("claude-3-haiku", MESSAGES, system="x", temperature=0.2) != base
+    assert make_cache_key("claude-3-haiku", [{"role": "user", "content": "other"}], temperature=0.2) != base
+
+
+async def test_memory_lru_is_bounded_by_bytes():
+    cache = LLMResponseCache(max_bytes=200)
+    for name in ("a", "b", "c"):
+        await cache.set(name, {"content": name * 60})
+
+    assert await cache.get("a") is None
+    assert await cache.get("c") == {"content": "c" * 60}
+    assert cache.get_stats()["memory_bytes"] <= 200
+    assert cache.get_stats()["evictions"] == 1
+
+
+async def test_recently_used_entries_survive_eviction():
+    cache = LLMResponseCache(max_bytes=200)
+    await cache.set("a", {"content": "a" * 60})
+    await cache.set("b", {"content": "b" * 60})
+    await cache.get("a")
+    await cache.set("c", {"content": "c" * 60})
+
+    assert await cache.get("a") is not None
+    assert await cache.get("b") is None
+
+
+async def test_oversized_entries_are_not_kept_in_memory():
+    cache = LLMResponseCache(max_bytes=50)
+    await cache.set("big", {"content": "x" * 500})
+    assert cache.get_stats()["entries"] == 0
+
+
+async def test_expired_entries_miss():
+    cache = LLMResponseCache(max_bytes=10_000, ttl_seconds=-1)
+    await cache.set("a", {"content": "stale"})
+    assert await cache.get("a") is None
+
+
+async def test_disk_tier_is_shared_across_instances(tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite")
+    writer = LLMResponseCache(max_bytes=10_000, path=path)
+    await writer.set("key", {"content": "Approved with conditions", "cost_usd": 0.002, "tokens_used": 120})
+
+    reader = LLMResponseCache(max_bytes=10_000, path=path)
+    assert (await reader.get("key"))["content"] == "Approved with conditions"
+    assert (await reader.get("key"))["content"] == "Approved with conditions"
+
+    stats = reader.get_stats()
+    assert stats["disk_hits"] == 1 and stats["memory_hits"] == 1
+    assert stats["tokens_saved"] == 240
+    assert stats["cost_saved_usd"] == pytest.approx(0.004)
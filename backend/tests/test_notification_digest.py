@@ -0,0 +1,73 @@
+"""
+Unit tests for notification digest delivery failures
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import notification_digest as digest_module
+from app.services.notification_digest import NotificationDigester
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def supabase(monkeypatch):
+    fake = SimpleNamespace(failing_lookups=set(), failing_inserts=0, inserted=[])
+
+    async def get_user_profile(user_id):
+        if user_id in fake.failing_lookups:
+            raise ConnectionError("profile lookup timed out")
+        return SimpleNamespace(id=user_id, email=None)
+
+    async def get_user_settings(user_id):
+        return None
+
+    async def create_notifications(rows, chunk_size=500):
+        if fake.failing_inserts:
+            fake.failing_inserts -= 1
+            return 0
+        fake.inserted.extend(rows)
+        return len(rows)
+
+    monkeypatch.setattr(digest_module.supabase_client, "get_user_profile", get_user_profile)
+    monkeypatch.setattr(digest_module.supabase_client, "get_user_settings", get_user_settings)
+    monkeypatch.setattr(digest_module.supabase_client, "create_notifications", create_notifications)
+    return fake
+
+
+def make_digester():
+    digester = NotificationDigester(window=0, max_items=10)
+    for user_id in ("user-1", "user-2"):
+        digester.add(user_id, "alert", "New match", f"Hello {user_id}", delivery_methods=["in_app"])
+    return digester
+
+
+async def test_failed_lookup_keeps_only_that_users_events(supabase):
+    supabase.failing_lookups.add("user-1")
+    digester = make_digester()
+
+    assert await digester.flush(force=True) == 1
+    assert [row["user_id"] for row in supabase.inserted] == ["user-2"]
+    assert digester.get_stats()["pending_events"] == 1
+
+    supabase.failing_lookups.clear()
+    assert await digester.flush(force=True) == 1
+    assert [row["user_id"] for row in supabase.inserted] == ["user-2", "user-1"]
+    assert digester.get_stats()["pending_events"] == 0
+
+
+async def test_failed_insert_rebuffers_in_app_events(supabase):
+    supabase.failing_inserts = 1
+    digester = make_digester()
+
+    await digester.flush(force=True)
+    assert supabase.inserted == []
+    assert digester.get_stats()["pending_events"] == 2
+
+    # Events buffered after the failed flush are delivered after the retried ones
+    digester.add("user-1", "alert", "Second match", "Again", delivery_methods=["in_app"])
+    await digester.flush(force=True)
+    assert [row["title"] for row in supabase.inserted if row["user_id"] == "user-1"] == ["New match", "Second match"]
+    assert digester.get_stats()["pending_events"] == 0
@@ -0,0 +1,60 @@
+"""
+Unit tests for the async PostgREST client, against an httpx MockTransport
+"""
+
+import json
+
+import httpx
+import pytest
+
+from app.db.postgrest import AsyncPostgrestClient, PostgrestError
+from app.db.supabase import SupabaseClient
+
+pytestmark = pytest.mark.unit
+
+BASE_URL = "http://supabase.test/rest/v1"
+
+
+def counter_transport(requests):
+    counters = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path != "/rest/v1/rpc/increment_api_calls":
+            return httpx.Response(404, json={"message": "not found", "code": "PGRST202"})
+        args = json.loads(request.content)
+        counters[args["p_user_id"]] = counters.get(args["p_user_id"], 0) + args["p_delta"]
+        return httpx.Response(200, json=counters[args["p_user_id"]])
+
+    return httpx.MockTransport(handler)
+
+
+async def test_rpc_posts_named_arguments_and_returns_scalar():
+    requests = []
+    client = AsyncPostgrestClient(BASE_URL, api_key="key", transport=counter_transport(requests))
+
+    response = await client.rpc("increment_api_calls", {"p_user_id": "u1", "p_delta": 3}).execute()
+
+    assert response.data == 3
+    assert requests[0].method == "POST"
+    assert requests[0].headers["apikey"] == "key"
+    assert json.loads(requests[0].content) == {"p_user_id": "u1", "p_delta": 3}
+    await client.aclose()
+
+
+async def test_rpc_errors_raise_postgrest_error():
+    client = AsyncPostgrestClient(BASE_URL, transport=counter_transport([]))
+
+    with pytest.raises(PostgrestError) as error:
+        await client.rpc("missing_function").execute()
+    assert error.value.status_code == 404
+    await client.aclose()
+
+
+async def test_supabase_increment_api_calls_accumulates():
+    supabase = SupabaseClient()
+    supabase.db = AsyncPostgrestClient(BASE_URL, transport=counter_transport([]))
+
+    assert await supabase.increment_api_calls("u1") == 1
+    assert await supabase.increment_api_calls("u1", 4) == 5
+    await supabase.disconnect()
@@ -0,0 +1,119 @@
+"""
+Unit tests for pSEO input fingerprints and section reuse
+"""
+
+import copy
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.pseo.fingerprint import (
+    FINGERPRINT_VERSION,
+    hash_data_inputs,
+    hash_inputs,
+    hash_sections,
+    is_page_unchanged,
+    reusable_sections,
+)
+
+pytestmark = pytest.mark.unit
+
+AUTHORITY = {"id": "camden", "name": "Camden", "type": "London Borough", "region": "London"}
+PLANNING_DATA = {
+    "core_metrics": {"total_applications": 1200, "approval_rate": 0.82},
+    "trends": {"monthly": [10, 12, 9]},
+    "comparative": {"rank": 4},
+}
+
+
+def scrape(scraped_at: str) -> dict:
+    return {
+        "news": [{"title": "New local plan consultation", "url": "https://camden.gov.uk/n1", "scraped_at": scraped_at}],
+        "local_plan": {"status": "adopted", "scraped_at": scraped_at},
+        "policies": {"items": ["H1", "D1"], "scraped_at": scraped_at},
+    }
+
+
+def external(retrieved_at: str) -> dict:
+    return {"context7": {"docs": ["NPPF 2023"], "retrieved_at": retrieved_at}}
+
+
+def page_for(section_hashes: dict, data_hash: str) -> dict:
+    return {
+        "status": "completed",
+        "generated_at": datetime.now().isoformat(),
+        "fingerprints": {
+            "version": FINGERPRINT_VERSION,
+            "data": data_hash,
+            "sections": section_hashes,
+            "scraped_at": datetime.now().isoformat(),
+        },
+        "sections": {
+            "introduction": {"content": "Camden intro"},
+            "data_dashboard": {"insights": "Camden insights"},
+            "policy": {"content": "Camden policy"},
+            "comparative": {"content": "Camden comparison"},
+            "faq": {"content": "Camden FAQ"},
+            "future_outlook": {"content": "Camden outlook"},
+        },
+    }
+
+
+def test_identical_rescrape_reuses_every_section():
+    first = hash_inputs(AUTHORITY, PLANNING_DATA, scrape("2026-01-01T09:00:00"), external("2026-01-01T09:00:01"))
+    second = hash_inputs(AUTHORITY, PLANNING_DATA, scrape("2026-02-01T17:30:00"), external("2026-02-01T17:30:05"))
+
+    assert first == second
+
+    previous = page_for(hash_sections(first, "v1"), "data")
+    reused = reusable_sections(previous, hash_sections(second, "v1"))
+    assert set(reused) == set(hash_sections(second, "v1"))
+    assert reused["introduction"] == "Camden intro"
+
+
+def test_changed_content_invalidates_dependent_sections_only():
+    scraped = scrape("2026-01-01T09:00:00")
+    before = hash_sections(hash_inputs(AUTHORITY, PLANNING_DATA, scraped, {}), "v1")
+
+    changed = copy.deepcopy(scraped)
+    changed["policies"]["items"].append("T1")
+    after = hash_sections(hash_inputs(AUTHORITY, PLANNING_DATA, changed, {}), "v1")
+
+    reused = reusable_sections(page_for(before, "data"), after)
+    assert "policy_summary" not in reused
+    assert "data_insights" in reused
+
+
+def test_prompt_version_invalidates_all_sections():
+    hashes = hash_inputs(AUTHORITY, PLANNING_DATA, scrape("2026-01-01T09:00:00"), {})
+    previous = page_for(hash_sections(hashes, "v1"), "data")
+    assert reusable_sections(previous, hash_sections(hashes, "v2")) == {}
+
+
+def test_old_fingerprint_version_is_not_reused():
+    hashes = hash_sections(hash_inputs(AUTHORITY, PLANNING_DATA, {}, {}), "v1")
+    previous = page_for(hashes, "data")
+    previous["fingerprints"]["version"] = FINGERPRINT_VERSION - 1
+    assert reusable_sections(previous, hashes) == {}
+
+
+def test_data_hash_ignores_key_order_and_timestamps():
+    reordered = {"comparative": {"rank": 4}, "trends": {"monthly": [10, 12, 9]},
+                 "core_metrics": {"approval_rate": 0.82, "total_applications": 1200},
+                 "generated_at": "2026-03-01T00:00:00"}
+    assert hash_data_inputs(AUTHORITY, PLANNING_DATA, "v1") == hash_data_inputs(AUTHORITY, reordered, "v1")
+    assert hash_data_inputs(AUTHORITY, PLANNING_DATA, "v1") != hash_data_inputs(AUTHORITY, PLANNING_DATA, "v2")
+
+
+def test_page_unchanged_within_rescrape_window():
+    data_hash = hash_data_inputs(AUTHORITY, PLANNING_DATA, "v1")
+    page = page_for({}, data_hash)
+
+    assert is_page_unchanged(page, data_hash, timedelta(days=7))
+    assert not is_page_unchanged(page, "other", timedelta(days=7))
+
+    page["fingerprints"]["scraped_at"] = (datetime.now() - timedelta(days=8)).isoformat()
+    assert not is_page_unchanged(page, data_hash, timedelta(days=7))
+
+    page["status"] = "failed"
+    assert not is_page_unchanged(page, data_hash, timedelta(days=30))
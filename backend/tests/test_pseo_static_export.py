@@ -0,0 +1,108 @@
+"""
+Unit tests for the static pSEO export and its manifest maintenance
+"""
+
+import gzip
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.pseo.static_export import (
+    MANIFEST_FILE,
+    StaticPageExporter,
+    StaticPageStore,
+    etag_matches,
+    negotiate_encoding,
+    variant_etag,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def make_page(slug: str, authority_id: str, intro: str = "Intro") -> dict:
+    return {
+        "url_slug": slug,
+        "authority_id": authority_id,
+        "generated_at": "2026-01-01T00:00:00",
+        "sections": {"introduction": {"content": intro}},
+    }
+
+
+@pytest.fixture
+def exported(tmp_path):
+    exporter = StaticPageExporter(str(tmp_path))
+    exporter.export_all([make_page("camden", "42"), make_page("leeds", "7")])
+    return tmp_path
+
+
+async def test_export_writes_precompressed_variants(exported):
+    store = StaticPageStore(str(exported))
+    entry = store.lookup("camden")
+
+    raw = await store.read(entry, None)
+    assert json.loads(raw)["data"]["url_slug"] == "camden"
+    assert gzip.decompress(await store.read(entry, "gzip")) == raw
+    assert store.lookup("42") == entry
+
+
+async def test_update_page_replaces_served_version(exported):
+    store = StaticPageStore(str(exported))
+    old_etag = store.lookup("camden")["etag"]
+
+    assert StaticPageExporter(str(exported)).update_page(make_page("camden", "42", intro="Regenerated"))
+
+    entry = store.lookup("camden")
+    assert entry["etag"] != old_etag
+    assert json.loads(await store.read(entry, None))["data"]["sections"]["introduction"]["content"] == "Regenerated"
+
+
+def test_remove_page_by_authority_id(exported):
+    assert StaticPageExporter(str(exported)).remove_page("42")
+
+    store = StaticPageStore(str(exported))
+    assert store.lookup("camden") is None
+    assert store.lookup("42") is None
+    assert store.lookup("leeds") is not None
+    assert not list(exported.glob("camden.*"))
+
+
+def test_remove_all_empties_manifest(exported):
+    assert StaticPageExporter(str(exported)).remove_all() == 2
+
+    manifest = json.loads((exported / MANIFEST_FILE).read_text())
+    assert manifest["pages"] == {} and manifest["aliases"] == {}
+    assert "<url>" not in (exported / "sitemap.xml").read_text()
+
+
+def test_no_export_is_left_alone(tmp_path):
+    exporter = StaticPageExporter(str(tmp_path / "missing"))
+    assert not exporter.update_page(make_page("camden", "42"))
+    assert not exporter.remove_page("camden")
+    assert not (tmp_path / "missing").exists()
+
+
+def test_concurrent_exporters_keep_each_others_entries(exported):
+    pages = [make_page(f"authority-{n}", str(100 + n)) for n in range(16)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(lambda page: StaticPageExporter(str(exported)).update_page(page), pages))
+
+    manifest = json.loads((exported / MANIFEST_FILE).read_text())
+    assert {page["url_slug"] for page in pages} <= set(manifest["pages"])
+    assert len(manifest["pages"]) == 18
+
+
+def test_negotiation_and_etags():
+    assert negotiate_encoding("gzip, br;q=0.5", {"gzip": 1, "br": 1}) == "br"
+    assert negotiate_encoding("br;q=0, gzip", {"gzip": 1, "br": 1}) == "gzip"
+    assert negotiate_encoding("identity", {"gzip": 1}) is None
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert not etag_matches('"xyz"', '"abc"')
+
+
+def test_each_encoding_has_its_own_etag():
+    etags = {variant_etag('"abc"', encoding) for encoding in (None, "gzip", "br")}
+
+    assert etags == {'"abc"', '"abc-gz"', '"abc-br"'}
+    assert not etag_matches(variant_etag('"abc"', "br"), variant_etag('"abc"', "gzip"))
@@ -0,0 +1,119 @@
+"""
+Unit tests for the in-process GCRA rate limiter
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from jose import jwt
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.db.supabase import supabase_client
+from app.middleware.rate_limit import RateLimiter, RateLimitMiddleware
+
+pytestmark = pytest.mark.unit
+
+
+def test_allows_burst_then_limits():
+    limiter = RateLimiter()
+    results = [limiter.check("client", 5, 10, now=100.0) for _ in range(6)]
+
+    assert [r.allowed for r in results] == [True] * 5 + [False]
+    assert [r.remaining for r in results[:5]] == [4, 3, 2, 1, 0]
+    # One cell is emitted every window / max_requests seconds
+    assert results[-1].retry_after == pytest.approx(2.0)
+    assert results[-1].reset_after == pytest.approx(10.0)
+
+
+def test_requests_replenish_at_the_emission_interval():
+    limiter = RateLimiter()
+    for _ in range(5):
+        limiter.check("client", 5, 10, now=100.0)
+
+    assert not limiter.check("client", 5, 10, now=101.9).allowed
+    assert limiter.check("client", 5, 10, now=102.0).allowed
+    assert not limiter.check("client", 5, 10, now=102.0).allowed
+
+    # A full window later the whole burst is available again
+    assert limiter.check("client", 5, 10, now=200.0).remaining == 4
+
+
+def test_denied_requests_do_not_consume_capacity():
+    limiter = RateLimiter()
+    for _ in range(5):
+        limiter.check("client", 5, 10, now=100.0)
+    for _ in range(50):
+        limiter.check("client", 5, 10, now=101.0)
+
+    assert limiter.check("client", 5, 10, now=102.0).allowed
+
+
+def test_keys_are_independent():
+    limiter = RateLimiter()
+    for _ in range(5):
+        limiter.check("alice", 5, 10, now=100.0)
+
+    assert not limiter.check("alice", 5, 10, now=100.0).allowed
+    assert limiter.check("bob", 5, 10, now=100.0).allowed
+
+
+def test_refilled_keys_are_pruned_when_full():
+    limiter = RateLimiter(max_keys=2)
+    limiter.check("a", 5, 10, now=100.0)
+    limiter.check("b", 5, 10, now=100.0)
+
+    limiter.check("c", 5, 10, now=200.0)
+
+    assert set(limiter.tats) == {"c"}
+
+
+def bearer_request(token: str) -> Request:
+    return Request({
+        "type": "http", "method": "GET", "path": "/api/v1/applications", "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())], "client": ("203.0.113.9", 1),
+    })
+
+
+@pytest.fixture
+def profiles(monkeypatch):
+    """Roles served from the shared profile cache; the uncached lookup must not be used"""
+    lookups = []
+
+    async def cached_profile(user_id):
+        lookups.append(user_id)
+        return SimpleNamespace(role="professional")
+
+    async def uncached_profile(user_id):
+        raise AssertionError("role lookups must go through the profile cache")
+
+    monkeypatch.setattr(supabase_client, "get_cached_user_profile", cached_profile)
+    monkeypatch.setattr(supabase_client, "get_user_profile", uncached_profile)
+    monkeypatch.setattr(settings, "supabase_jwt_secret", "supabase-test-secret")
+    return lookups
+
+
+async def test_supabase_tokens_get_their_tier_limit(profiles):
+    token = jwt.encode(
+        {"sub": "user-9", "aud": "authenticated", "exp": int(time.time()) + 600},
+        "supabase-test-secret", algorithm="HS256"
+    )
+    middleware = RateLimitMiddleware(app=None)
+
+    key, max_requests, _ = await middleware._get_rate_limit_params(bearer_request(token))
+
+    assert key == "user:user-9"
+    assert max_requests == settings.get_tier_limits("professional")["rate_limit"]
+    assert profiles == ["user-9"]
+
+
+async def test_unverifiable_tokens_are_limited_by_ip(profiles):
+    forged = jwt.encode({"sub": "user-9", "aud": "authenticated"}, "not-the-secret", algorithm="HS256")
+    middleware = RateLimitMiddleware(app=None)
+
+    key, max_requests, _ = await middleware._get_rate_limit_params(bearer_request(forged))
+
+    assert key == "ip:203.0.113.9"
+    assert max_requests == settings.rate_limit_requests
+    assert profiles == []
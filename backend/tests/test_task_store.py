@@ -0,0 +1,98 @@
+"""
+Unit tests for the durable task store (SQLite backend)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.task_store import SQLiteTaskStore, decode_result, encode_result
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+async def store(tmp_path):
+    task_store = SQLiteTaskStore(
+        str(tmp_path / "tasks.sqlite"), "test",
+        result_ttl=3600, visibility_timeout=30, max_finished=3
+    )
+    yield task_store
+    await task_store.close()
+
+
+async def test_claims_highest_priority_first(store):
+    await store.enqueue("low", 3)
+    await store.enqueue("high", 1)
+
+    assert await store.claim("worker-a") == "high"
+    assert await store.claim("worker-b") == "low"
+    assert await store.claim("worker-c") is None
+
+
+async def test_claimed_task_is_redelivered_after_visibility_timeout(store):
+    store.visibility_timeout = 0.2
+    await store.enqueue("task-1", 2)
+    assert await store.claim("worker-a") == "task-1"
+    assert await store.claim("worker-b") is None
+
+    # worker-a died: its claim lapses
+    await asyncio.sleep(0.3)
+    assert await store.claim("worker-b") == "task-1"
+
+
+async def test_touch_keeps_claim_and_ack_removes_entry(store):
+    store.visibility_timeout = 0.3
+    await store.enqueue("task-1", 2)
+    assert await store.claim("worker-a") == "task-1"
+
+    await asyncio.sleep(0.2)
+    await store.touch("task-1", "worker-a")
+    await asyncio.sleep(0.2)
+    assert await store.claim("worker-b") is None
+
+    await store.ack("task-1")
+    assert (await store.counts())["queued"] == 0
+
+
+async def test_records_update_and_results_round_trip(store):
+    await store.save("task-1", {"task_id": "task-1", "user_id": "alice", "status": "pending"})
+    await store.update("task-1", {"progress": 0.5})
+
+    assert await store.finish("task-1", {"status": "completed"}, result={"score": 0.9, "tags": ("a", "b")})
+
+    record = await store.load("task-1")
+    assert record["status"] == "completed" and record["progress"] == 0.5
+    assert await store.load_result("task-1") == {"score": 0.9, "tags": ["a", "b"]}
+    assert [r["task_id"] for r in await store.list_for_user("alice")] == ["task-1"]
+
+
+async def test_conditional_finish_does_not_overwrite_cancellation(store):
+    await store.save("task-1", {"task_id": "task-1", "status": "in_progress"})
+    assert await store.finish("task-1", {"status": "cancelled"}, expected_status="in_progress")
+
+    assert not await store.finish(
+        "task-1", {"status": "completed"}, result={"done": True}, expected_status="in_progress"
+    )
+    assert (await store.load("task-1"))["status"] == "cancelled"
+    assert await store.load_result("task-1") is None
+
+
+async def test_purge_caps_finished_records(store):
+    for i in range(5):
+        await store.save(f"task-{i}", {"task_id": f"task-{i}", "status": "pending"})
+        await store.finish(f"task-{i}", {"status": "completed"})
+
+    assert await store.purge() == 2
+    assert await store.load("task-0") is None
+    assert await store.load("task-4") is not None
+
+    assert await store.purge(finished_before=time.time() + 1) == 3
+
+
+def test_result_encoding_compresses():
+    result = {"summary": "planning " * 500}
+    blob = encode_result(result)
+    assert len(blob) < len("planning " * 500)
+    assert decode_result(blob) == result